@@ -20,8 +20,10 @@ New in v2.0.0: Complete pygame removal - wxPython-only audiogame
 """
 
 import logging
+import multiprocessing
 import sys
 import time
+from typing import Optional
 import wx
 
 # Application layer
@@ -228,7 +230,8 @@ class SolitarioController:
             screen_reader=self.screen_reader,
             settings=self.settings,
             on_new_game_request=self.show_new_game_dialog,
-            audio_manager=self.audio_manager  # pass audio manager for effects
+            audio_manager=self.audio_manager,  # pass audio manager for effects
+            on_replay_request=self.show_replay_dialog
         )
         log.debug_state("gameplay_controller_ready", {"status": "initialized"})
         
@@ -243,6 +246,7 @@ class SolitarioController:
         self.app: SolitarioWxApp = None
         self.frame: SolitarioFrame = None
         self.view_manager: ViewManager = None
+        self._replay_timer: Optional[wx.Timer] = None
         
         # v2.2.0: Register dependencies in container (bridge mode)
         self._register_dependencies()
@@ -336,6 +340,10 @@ class SolitarioController:
         1. Menu → Gameplay: Hide menu, show gameplay
         2. Gameplay → Gameplay (rematch): Hide gameplay, show gameplay
         
+        If a game was left unfinished (application closed mid-game), asks
+        first whether to resume it: the save is kept until the user
+        declines, since dealing a new game overwrites it.
+        
         Note:
             Uses show_panel() instead of push_view() (panel-swap pattern).
             
@@ -343,6 +351,32 @@ class SolitarioController:
             v2.0.1: Initial implementation for menu→gameplay
             v2.4.2: Added explicit panel hiding for rematch support (Bug #68)
         """
+        if self.engine.has_saved_game():
+            self.show_resume_game_dialog()
+            return
+        self._open_gameplay(resume=False)
+    
+    def show_resume_game_dialog(self) -> None:
+        """Offer to resume the saved game (non-blocking).
+        
+        Yes resumes it; no discards the save and deals a new game.
+        """
+        def on_resume_result(resume: bool):
+            if not resume:
+                self.engine.discard_saved_game()
+            self._open_gameplay(resume=resume)
+        
+        self.dialog_manager.show_resume_game_prompt_async(
+            callback=on_resume_result
+        )
+    
+    def _open_gameplay(self, resume: bool) -> None:
+        """Show the gameplay panel with the saved game or a new one.
+        
+        Args:
+            resume: Resume the saved game (a new game is dealt if it
+                cannot be restored)
+        """
         if self.view_manager:
             # CRITICAL: Hide current panel before showing gameplay
             # This handles both menu→gameplay AND rematch (gameplay→gameplay)
@@ -357,8 +391,10 @@ class SolitarioController:
 
             # Initialize game BEFORE showing panel so the first EVT_PAINT
             # already has a populated _board_state (avoids blank first frame)
-            self.engine.reset_game()
-            self.engine.new_game()
+            resumed = resume and self.engine.resume_game()
+            if not resumed:
+                self.engine.reset_game()
+                self.engine.new_game()
             self.gameplay_controller.refresh_board_state()
 
             # Show gameplay panel (logs transition internally)
@@ -373,7 +409,8 @@ class SolitarioController:
             
             if self.screen_reader:
                 self.screen_reader.tts.speak(
-                    "Nuova partita avviata! Usa H per l'aiuto comandi.",
+                    ("Partita ripresa!" if resumed else "Nuova partita avviata!")
+                    + " Usa H per l'aiuto comandi.",
                     interrupt=True
                 )
     
@@ -800,6 +837,29 @@ class SolitarioController:
             callback=on_new_game_result
         )
     
+    def show_replay_dialog(self) -> None:
+        """Confirm replaying with a game running (SHIFT+R, non-blocking).
+        
+        On confirmation the running game is abandoned through end_game()
+        (session recorded, save discarded, recording closed) with the
+        on_game_ended callback suppressed as in show_new_game_dialog(),
+        then its recording is replayed from the deal.
+        """
+        def on_replay_result(confirmed: bool):
+            if confirmed:
+                original_callback = self.engine.on_game_ended
+                self.engine.on_game_ended = None
+                from src.domain.models.game_end import EndReason
+                self.engine.end_game(EndReason.ABANDON_EXIT)
+                self.engine.on_game_ended = original_callback
+                
+                self._timer_expired_announced = False
+                self.gameplay_controller.replay_last_game()
+        
+        self.dialog_manager.show_replay_prompt_async(
+            callback=on_replay_result
+        )
+    
     def confirm_abandon_game(self, skip_dialog: bool = False) -> None:
         """Abandon game immediately without dialog (double-ESC from GameplayView).
         
@@ -813,8 +873,10 @@ class SolitarioController:
             )
             wx.MilliSleep(300)
         
-        # Reset game engine (clear cards, score, timer)
+        # Reset game engine (clear cards, score, timer); an abandoned
+        # game is not offered for resume
         log.debug_state("confirm_abandon_game", {"trigger": "double_esc"})
+        self.engine.discard_saved_game()
         self.engine.reset_game()
         
         self._timer_expired_announced = False
@@ -1015,6 +1077,21 @@ class SolitarioController:
     def _on_timer_tick(self) -> None:
         """Timer tick handler (called every 1 second)."""
         self._check_timer_expiration()
+        self.engine.poll_hint()
+        self.engine.poll_win_estimate()
+    
+    def _set_replay_timer(self, interval: Optional[float]) -> None:
+        """Run the replay timer every ``interval`` seconds, or stop it (None)."""
+        if self._replay_timer is None:
+            return
+        if interval is None:
+            self._replay_timer.Stop()
+        else:
+            self._replay_timer.Start(max(1, int(interval * 1000)))
+    
+    def _on_replay_timer(self, event: wx.TimerEvent) -> None:
+        """Replay timer handler (called at the replay step interval)."""
+        self.gameplay_controller.replay_tick()
     
     def _on_frame_close(self) -> None:
         """Frame close handler."""
@@ -1049,6 +1126,7 @@ class SolitarioController:
                     self.screen_reader.tts.speak("Chiusura in corso.", interrupt=True)
                     wx.MilliSleep(800)
                 
+                self.engine.shutdown()
                 sys.exit(0)
             else:
                 log.debug_state("quit_app", {"status": "cancelled"})
@@ -1114,6 +1192,12 @@ class SolitarioController:
             
             # Start timer (1 second interval)
             self.frame.start_timer(1000)
+            
+            # Replay playback has its own timer, running at the step
+            # interval of the replay speed only while a replay plays
+            self._replay_timer = wx.Timer(self.frame)
+            self.frame.Bind(wx.EVT_TIMER, self._on_replay_timer, self._replay_timer)
+            self.gameplay_controller.set_on_replay_timer(self._set_replay_timer)
         
         self.app = SolitarioWxApp(on_init_complete=on_init)
         
@@ -1167,7 +1251,11 @@ def main() -> None:
         log.app_started()
 
         controller = SolitarioController()
-        controller.run()
+        try:
+            controller.run()
+        finally:
+            # Stop the win estimate worker processes with the app
+            controller.engine.shutdown()
     except KeyboardInterrupt:
         sys.exit(0)
     except Exception as e:
@@ -1195,4 +1283,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Frozen (cx_Freeze) worker processes of the win estimate start here
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+analyze_winnability.py -- Analisi batch della vincibilità delle smazzate.
+
+Genera smazzate deterministiche da seed (lo stesso numero di smazzata
+usato in partita), le risolve con KlondikeSolver su più processi
+(ProcessPoolExecutor) con budget di tempo per smazzata e scrive i
+risultati in streaming su CSV o JSONL. A fine corsa stampa le
+statistiche per mazzo e livello di difficoltà: percentuale di vittorie,
+smazzate irrisolvibili, esiti sconosciuti e lunghezza media soluzione.
+
+Il numero di carte pescate per livello viene da DifficultyPreset; il
+solver assume riciclo degli scarti per inversione.
+
+Importa solo il domain layer (nessun wx o pygame): gira su macchine
+Linux headless.
+
+Uso:
+    python scripts/analyze_winnability.py --count 10000 --output results.csv
+    python scripts/analyze_winnability.py --deck neapolitan --levels 1 3 --output r.jsonl
+    python scripts/analyze_winnability.py --count 50000 --output results.csv --resume
+    python scripts/analyze_winnability.py --help
+
+Exit code: 0 se completato, 1 per argomenti non validi.
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+# Root del progetto nel path per importare src/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.domain.models.deck import FrenchDeck, NeapolitanDeck, ProtoDeck  # noqa: E402
+from src.domain.models.difficulty_preset import DifficultyPreset  # noqa: E402
+from src.domain.models.table import GameTable  # noqa: E402
+from src.domain.rules.solitaire_rules import SolitaireRules  # noqa: E402
+from src.domain.services.solver import KlondikeSolver, SolverStatus  # noqa: E402
+
+
+DECK_TYPES: Dict[str, type] = {"french": FrenchDeck, "neapolitan": NeapolitanDeck}
+
+FIELDS: List[str] = [
+    "deck", "level", "draw_count", "seed", "status", "moves", "nodes", "elapsed",
+]
+
+# Solver per processo, riusati tra smazzate (chiave: mazzo, carte pescate)
+_SOLVERS: Dict[Tuple[str, int], KlondikeSolver] = {}
+
+
+# --- Smazzate ---
+
+
+def deal_from_seed(deck_type: str, seed: int) -> GameTable:
+    """Crea la smazzata associata a un seed (la stessa di GameService.deal)."""
+    deck: ProtoDeck = DECK_TYPES[deck_type]()
+    deck.mischia(random.Random(seed))
+    return GameTable(deck)
+
+
+def analyze_deal(task: Tuple[str, int, int, int, float, int]) -> Dict[str, Any]:
+    """Risolve una smazzata (eseguita nei processi worker)."""
+    deck_type, level, draw_count, seed, time_limit, max_nodes = task
+    table = deal_from_seed(deck_type, seed)
+
+    solver = _SOLVERS.get((deck_type, draw_count))
+    if solver is None:
+        solver = KlondikeSolver(SolitaireRules(table.mazzo), draw_count)
+        _SOLVERS[(deck_type, draw_count)] = solver
+    solver.time_limit = time_limit
+    solver.max_nodes = max_nodes
+
+    result = solver.solve(table)
+    return {
+        "deck": deck_type,
+        "level": level,
+        "draw_count": draw_count,
+        "seed": seed,
+        "status": result.status.value,
+        "moves": len(result.moves),
+        "nodes": result.nodes,
+        "elapsed": round(result.elapsed, 4),
+    }
+
+
+# --- Output e ripresa ---
+
+
+def _is_jsonl(path: str) -> bool:
+    return path.endswith(".jsonl") or path.endswith(".json")
+
+
+def load_done(path: str) -> Tuple[Set[Tuple[str, int, int]], List[Dict[str, Any]]]:
+    """Legge i risultati già scritti (per --resume)."""
+    done: Set[Tuple[str, int, int]] = set()
+    rows: List[Dict[str, Any]] = []
+    if not os.path.isfile(path):
+        return done, rows
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if _is_jsonl(path):
+            records: Iterator[Dict[str, Any]] = (json.loads(line) for line in f if line.strip())
+        else:
+            records = csv.DictReader(f)
+        for record in records:
+            try:
+                row = {
+                    "deck": record["deck"],
+                    "level": int(record["level"]),
+                    "draw_count": int(record["draw_count"]),
+                    "seed": int(record["seed"]),
+                    "status": record["status"],
+                    "moves": int(record["moves"]),
+                    "nodes": int(record["nodes"]),
+                    "elapsed": float(record["elapsed"]),
+                }
+            except (KeyError, ValueError):
+                continue  # Riga troncata da un'interruzione
+            done.add((row["deck"], row["level"], row["seed"]))
+            rows.append(row)
+    return done, rows
+
+
+class ResultWriter:
+    """Scrive i risultati in streaming (CSV o JSONL) con flush per riga."""
+
+    def __init__(self, path: str, append: bool) -> None:
+        self.jsonl = _is_jsonl(path)
+        write_header = not (append and os.path.isfile(path) and os.path.getsize(path) > 0)
+        self._file = open(path, "a" if append else "w", encoding="utf-8", newline="")
+        self._csv: Optional[Any] = None
+        if not self.jsonl:
+            self._csv = csv.DictWriter(self._file, fieldnames=FIELDS)
+            if write_header:
+                self._csv.writeheader()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        if self._csv is not None:
+            self._csv.writerow(row)
+        else:
+            self._file.write(json.dumps(row) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+# --- Statistiche ---
+
+
+def summarize(rows: List[Dict[str, Any]]) -> List[str]:
+    """Statistiche per mazzo e livello."""
+    groups: Dict[Tuple[str, int, int], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault((row["deck"], row["level"], row["draw_count"]), []).append(row)
+
+    lines = [f"{'mazzo':<11} {'liv':>3} {'pesca':>5} {'smazzate':>8} "
+             f"{'vinc.%':>7} {'irris.%':>7} {'ignoto%':>7} {'mosse':>6}"]
+    for (deck, level, draw), group in sorted(groups.items()):
+        total = len(group)
+        won = [r for r in group if r["status"] == SolverStatus.WINNABLE.value]
+        lost = sum(1 for r in group if r["status"] == SolverStatus.UNWINNABLE.value)
+        unknown = total - len(won) - lost
+        avg_moves = sum(r["moves"] for r in won) / len(won) if won else 0.0
+        lines.append(
+            f"{deck:<11} {level:>3} {draw:>5} {total:>8} "
+            f"{100 * len(won) / total:>7.1f} {100 * lost / total:>7.1f} "
+            f"{100 * unknown / total:>7.1f} {avg_moves:>6.1f}"
+        )
+    return lines
+
+
+# --- CLI ---
+
+
+def build_tasks(args: argparse.Namespace, done: Set[Tuple[str, int, int]]) -> List[tuple]:
+    """Elenco delle smazzate da analizzare (escluse quelle già fatte)."""
+    decks = list(DECK_TYPES) if args.deck == "both" else [args.deck]
+    tasks = []
+    for deck_type in decks:
+        for level in args.levels:
+            draw_count = int(DifficultyPreset.get_preset(level).get_value("draw_count"))
+            for seed in range(args.start, args.start + args.count):
+                if (deck_type, level, seed) not in done:
+                    tasks.append((deck_type, level, draw_count, seed, args.time_limit, args.max_nodes))
+    return tasks
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Analisi batch della vincibilità delle smazzate per livello di difficoltà.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--deck", choices=["french", "neapolitan", "both"], default="french")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 3, 4, 5],
+                        choices=[1, 2, 3, 4, 5], help="Livelli DifficultyPreset da analizzare")
+    parser.add_argument("--start", type=int, default=0, help="Primo seed")
+    parser.add_argument("--count", type=int, default=1000, help="Numero di seed per livello")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--time-limit", type=float, default=5.0, help="Secondi per smazzata")
+    parser.add_argument("--max-nodes", type=int, default=200_000, help="Nodi per smazzata")
+    parser.add_argument("--output", required=True, help="File risultati (.csv o .jsonl)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Salta i seed già presenti nel file di output")
+    parser.add_argument("--progress-every", type=int, default=100,
+                        help="Stampa l'avanzamento ogni N smazzate")
+    return parser
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Esegue l'analisi e restituisce tutte le righe (vecchie e nuove)."""
+    done, rows = load_done(args.output) if args.resume else (set(), [])
+    tasks = build_tasks(args, done)
+    writer = ResultWriter(args.output, append=args.resume)
+    total = len(tasks)
+    started = time.monotonic()
+    completed = 0
+
+    try:
+        with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            # Finestra limitata di task in volo: memoria costante
+            pending: Set[Future] = set()
+            queue = iter(tasks)
+            window = max(1, args.workers) * 4
+            while True:
+                for task in queue:
+                    pending.add(executor.submit(analyze_deal, task))
+                    if len(pending) >= window:
+                        break
+                if not pending:
+                    break
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    row = future.result()
+                    writer.write(row)
+                    rows.append(row)
+                    completed += 1
+                    if completed % args.progress_every == 0 or completed == total:
+                        elapsed = time.monotonic() - started
+                        rate = completed / elapsed if elapsed else 0.0
+                        print(f"[{completed}/{total}] {rate:.1f} smazzate/s",
+                              file=sys.stderr, flush=True)
+    finally:
+        writer.close()
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.count <= 0 or args.progress_every <= 0:
+        print("Errore: --count e --progress-every devono essere positivi", file=sys.stderr)
+        return 1
+
+    rows = run(args)
+    for line in summarize(rows):
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
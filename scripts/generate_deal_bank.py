@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+generate_deal_bank.py -- Genera il banco di smazzate vincibili verificate.
+
+Per ogni mazzo e numero di carte pescate risolve le smazzate a partire
+da un seed iniziale (in parallelo, con budget per smazzata) finché non
+ne trova il numero richiesto di vincibili, poi scrive il file binario
+letto da GameEngine.new_game() (vedi src/infrastructure/storage/deal_bank.py).
+
+Il risultato è deterministico: per ogni sezione vengono salvati i primi
+N seed vincibili a partire da --start.
+
+Uso:
+    python scripts/generate_deal_bank.py --per-section 5000
+    python scripts/generate_deal_bank.py --deck french --draw 1 --per-section 200
+    python scripts/generate_deal_bank.py --output /tmp/deal_bank.bin --workers 8
+    python scripts/generate_deal_bank.py --help
+
+Exit code: 0 se il banco è completo, 1 se una sezione non ha raggiunto
+il numero richiesto entro --max-seeds (il file viene scritto comunque).
+"""
+
+import argparse
+import itertools
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Set
+
+# Root del progetto nel path per importare src/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from analyze_winnability import DECK_TYPES, analyze_deal  # noqa: E402
+from src.domain.services.solver import SolverStatus  # noqa: E402
+from src.infrastructure.storage.deal_bank import (  # noqa: E402
+    DEFAULT_BANK_PATH,
+    DealBankEntry,
+    difficulty_rating,
+    write_deal_bank,
+)
+
+
+def collect_section(
+    executor: Executor,
+    deck_type: str,
+    draw_count: int,
+    args: argparse.Namespace
+) -> List[DealBankEntry]:
+    """Cerca i primi --per-section seed vincibili di una sezione."""
+    found: Dict[int, DealBankEntry] = {}
+    pending: Set[Future] = set()
+    seeds = iter(range(args.start, args.start + args.max_seeds))
+    window = max(1, args.workers) * 4
+    exhausted = False
+
+    while True:
+        # Nuovi seed finché servono; quelli in volo vanno sempre completati
+        # (i seed più bassi decidono il risultato)
+        while not exhausted and len(found) < args.per_section and len(pending) < window:
+            seed = next(seeds, None)
+            if seed is None:
+                exhausted = True
+                break
+            task = (deck_type, 0, draw_count, seed, args.time_limit, args.max_nodes)
+            pending.add(executor.submit(analyze_deal, task))
+        if not pending:
+            break
+
+        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in finished:
+            row = future.result()
+            if row["status"] == SolverStatus.WINNABLE.value:
+                found[row["seed"]] = DealBankEntry(
+                    seed=row["seed"],
+                    deck_type=deck_type,
+                    draw_count=draw_count,
+                    solution_length=row["moves"],
+                    difficulty=difficulty_rating(row["nodes"]),
+                )
+        print(f"[{deck_type}/{draw_count}] {min(len(found), args.per_section)}/"
+              f"{args.per_section} smazzate vincibili", file=sys.stderr, flush=True)
+
+    return [found[seed] for seed in sorted(found)][:args.per_section]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Genera il banco binario di smazzate vincibili verificate.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--deck", choices=["french", "neapolitan", "both"], default="both")
+    parser.add_argument("--draw", type=int, nargs="+", default=[1, 2, 3], choices=[1, 2, 3],
+                        help="Numero di carte pescate (una sezione per valore)")
+    parser.add_argument("--per-section", type=int, default=1000,
+                        help="Smazzate vincibili per sezione")
+    parser.add_argument("--start", type=int, default=0, help="Primo seed")
+    parser.add_argument("--max-seeds", type=int, default=1_000_000,
+                        help="Seed massimi da provare per sezione")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--time-limit", type=float, default=5.0, help="Secondi per smazzata")
+    parser.add_argument("--max-nodes", type=int, default=200_000, help="Nodi per smazzata")
+    parser.add_argument("--output", default=str(DEFAULT_BANK_PATH), help="File del banco")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.per_section <= 0 or args.max_seeds <= 0:
+        print("Errore: --per-section e --max-seeds devono essere positivi", file=sys.stderr)
+        return 1
+
+    decks = list(DECK_TYPES) if args.deck == "both" else [args.deck]
+    entries: List[DealBankEntry] = []
+    complete = True
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        for deck_type, draw_count in itertools.product(decks, args.draw):
+            section = collect_section(executor, deck_type, draw_count, args)
+            complete = complete and len(section) == args.per_section
+            entries.extend(section)
+
+    written = write_deal_bank(args.output, entries)
+    print(f"Banco scritto: {args.output} ({written} smazzate)")
+    return 0 if complete else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+rate_deals.py -- Valutazione veloce della difficoltà delle smazzate.
+
+Calcola in blocco, senza solver, le caratteristiche strutturali delle
+smazzate di un intervallo di seed (Assi e 2 sepolti, Re sopra carte
+coperte, blocchi dello stesso colore, carte basse del mazzo visibili
+con la pescata scelta, mosse iniziali) e un punteggio di difficoltà
+euristico, poi stampa le soglie di punteggio che dividono le smazzate
+in livelli di pari numerosità (calibrazione di DifficultyPreset).
+
+Richiede numpy. Un milione di smazzate richiede circa 10 secondi.
+
+Uso:
+    python scripts/rate_deals.py --count 1000000 --draw 3
+    python scripts/rate_deals.py --deck neapolitan --levels 5 --json rating.json
+    python scripts/rate_deals.py --help
+
+Exit code: 0 se completato, 1 per argomenti non validi o numpy assente.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+# Root del progetto nel path per importare src/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.domain.services import deal_features  # noqa: E402
+
+
+def rate(args: argparse.Namespace) -> Dict[str, Any]:
+    """Valuta le smazzate e restituisce il rapporto."""
+    np = deal_features.np
+    started = time.perf_counter()
+    deals = deal_features.deals_from_seeds(range(args.start, args.start + args.count), args.deck)
+    features = deal_features.deal_features(deals, args.deck, args.draw)
+    scores = deal_features.difficulty_scores(features)
+    thresholds = deal_features.level_thresholds(scores, args.levels)
+    levels = deal_features.assign_levels(scores, thresholds)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "deck": args.deck,
+        "draw_count": args.draw,
+        "deals": args.count,
+        "seconds": round(elapsed, 3),
+        "features_mean": {name: round(float(values.mean()), 3) for name, values in features.items()},
+        "score_mean": round(float(scores.mean()), 3),
+        "thresholds": [round(float(t), 3) for t in thresholds],
+        "deals_per_level": np.bincount(levels, minlength=args.levels + 1)[1:].tolist(),
+    }
+
+
+def format_report(report: Dict[str, Any]) -> List[str]:
+    """Riepilogo leggibile del rapporto."""
+    lines = [
+        f"Smazzate: {report['deals']} ({report['deck']}, pescata {report['draw_count']}) "
+        f"in {report['seconds']:.2f} s",
+        "Medie: " + ", ".join(f"{k} {v}" for k, v in report["features_mean"].items()),
+        f"Punteggio medio: {report['score_mean']}",
+    ]
+    bounds = [None] + report["thresholds"] + [None]
+    for level, count in enumerate(report["deals_per_level"], start=1):
+        low, high = bounds[level - 1], bounds[level]
+        span = f"{'' if low is None else low} .. {'' if high is None else high}"
+        lines.append(f"Livello {level}: punteggio {span.strip()} ({count} smazzate)")
+    return lines
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Difficoltà euristica delle smazzate (vettoriale, senza solver).",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--deck", choices=["french", "neapolitan"], default="french")
+    parser.add_argument("--draw", type=int, choices=[1, 2, 3], default=3,
+                        help="Carte pescate per azione")
+    parser.add_argument("--count", type=int, default=100000, help="Numero di smazzate")
+    parser.add_argument("--start", type=int, default=0, help="Primo seed")
+    parser.add_argument("--levels", type=int, default=5, help="Livelli di difficoltà")
+    parser.add_argument("--json", metavar="PATH", help="Scrive il rapporto anche in JSON")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not deal_features.NUMPY_AVAILABLE:
+        print("Errore: numpy non installato (pip install numpy)", file=sys.stderr)
+        return 1
+    if args.count <= 0 or args.levels < 2 or args.start < 0:
+        print("Errore: --count positivo, --levels almeno 2, --start non negativo",
+              file=sys.stderr)
+        return 1
+
+    report = rate(args)
+    print("\n".join(format_report(report)))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+simulate_games.py -- Simulazione headless di partite complete.
+
+Gioca partite intere attraverso GameService, SolitaireRules e
+ScoringService (nessun wx, pygame o TTS) con una politica di gioco
+intercambiabile (random, greedy, solver), su più processi, e stampa:
+partite al secondo, percentili di latenza per mossa e per nuova partita
+(smazzata, azzeramento e avvio) ed esiti aggregati (vittorie, partite
+bloccate, punteggio medio).
+
+Serve come benchmark per le ottimizzazioni del motore e per validare
+modifiche a punteggio e difficoltà su grandi numeri di partite. Le
+smazzate sono quelle dei seed (riproducibili, vedi GameService.deal).
+
+Uso:
+    python scripts/simulate_games.py --games 100000 --workers 8
+    python scripts/simulate_games.py --policy random --draw 3 --shuffle
+    python scripts/simulate_games.py --policy solver --games 500 --json report.json
+    python scripts/simulate_games.py --help
+
+Exit code: 0 se completato, 1 per argomenti non validi.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from typing import List, Optional
+
+# Root del progetto nel path per importare src/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.domain.simulation import SimulationConfig, SimulationReport, run_simulation  # noqa: E402
+from src.domain.simulation.policies import POLICIES  # noqa: E402
+from src.domain.simulation.runner import DECK_TYPES  # noqa: E402
+
+
+def quiet_logs() -> None:
+    """Nasconde gli avvisi di gioco (penalità di riciclo) durante la simulazione."""
+    logging.getLogger("game").setLevel(logging.ERROR)
+
+
+def format_report(report: SimulationReport) -> List[str]:
+    """Riepilogo leggibile del rapporto."""
+    data = report.to_dict()
+    outcomes = ", ".join(f"{name} {count}" for name, count in sorted(data["outcomes"].items()))
+    latency = data["latency_us"]
+    return [
+        f"Partite: {data['games']} in {data['wall_seconds']:.2f} s "
+        f"({data['games_per_second']:.1f} partite/s)",
+        f"Esiti: {outcomes} (vittorie {100 * data['win_rate']:.1f}%)",
+        f"Medie per partita: azioni {data['mean_actions']}, mosse {data['mean_moves']}, "
+        f"ricicli {data['mean_recycles']}, carte in fondazione {data['mean_foundation_cards']}",
+        f"Punteggio: medio {data['mean_score']}, min {data['score_min']}, max {data['score_max']}",
+        "Latenza per azione (µs): " + ", ".join(f"{k} {v}" for k, v in latency.items()),
+        "Nuova partita (µs): " + ", ".join(f"{k} {v}" for k, v in data["deal_latency_us"].items()),
+    ]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Simulazione headless di partite complete con politiche di gioco.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--deck", choices=list(DECK_TYPES), default="french")
+    parser.add_argument("--draw", type=int, choices=[1, 2, 3], default=1,
+                        help="Carte pescate per azione")
+    parser.add_argument("--policy", choices=list(POLICIES), default="greedy")
+    parser.add_argument("--games", type=int, default=1000, help="Numero di partite")
+    parser.add_argument("--start", type=int, default=0, help="Primo seed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=200, help="Partite per task")
+    parser.add_argument("--max-actions", type=int, default=1000, help="Azioni massime per partita")
+    parser.add_argument("--shuffle", action="store_true", help="Riciclo scarti mescolato")
+    parser.add_argument("--level", type=int, choices=range(1, 6), default=1,
+                        help="Livello di difficoltà per il punteggio")
+    parser.add_argument("--no-scoring", action="store_true", help="Disattiva il punteggio")
+    parser.add_argument("--json", metavar="PATH", help="Scrive il rapporto anche in JSON")
+    parser.add_argument("--verbose", action="store_true", help="Mostra gli avvisi di gioco")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.games <= 0 or args.batch_size <= 0 or args.max_actions <= 0:
+        print("Errore: --games, --batch-size e --max-actions devono essere positivi",
+              file=sys.stderr)
+        return 1
+
+    config = SimulationConfig(
+        deck_type=args.deck,
+        draw_count=args.draw,
+        policy=args.policy,
+        shuffle_on_recycle=args.shuffle,
+        max_actions=args.max_actions,
+        scoring_enabled=not args.no_scoring,
+        difficulty_level=args.level,
+    )
+
+    def progress(report: SimulationReport) -> None:
+        print(f"{report.games}/{args.games} partite", file=sys.stderr, flush=True)
+
+    report = run_simulation(
+        config,
+        range(args.start, args.start + args.games),
+        workers=max(1, args.workers),
+        batch_size=args.batch_size,
+        progress=progress,
+        initializer=None if args.verbose else quiet_logs,
+    )
+
+    print("\n".join(format_report(report)))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report.to_dict(), f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
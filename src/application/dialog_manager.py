@@ -462,6 +462,51 @@ class SolitarioDialogManager:
             callback=_make_logged_callback("Nuova Partita", callback)
         )
     
+    def show_resume_game_prompt_async(self, callback: Callable[[bool], None]) -> None:
+        """Show saved game resume dialog (non-blocking).
+        
+        Args:
+            callback: Function called with result (True=resume, False=new game)
+        
+        Example:
+            >>> def on_result(resume):
+            ...     if resume:
+            ...         self.engine.resume_game()
+            ...     else:
+            ...         self.engine.discard_saved_game()
+            >>> dialog_manager.show_resume_game_prompt_async(on_result)
+        """
+        if not self.is_available:
+            return
+        
+        self.dialogs.show_yes_no_async(
+            title="Partita Salvata",
+            message="C'è una partita interrotta. Vuoi riprenderla?",
+            callback=_make_logged_callback("Partita Salvata", callback)
+        )
+    
+    def show_replay_prompt_async(self, callback: Callable[[bool], None]) -> None:
+        """Show replay confirmation dialog while a game is running (non-blocking).
+        
+        Args:
+            callback: Function called with result (True=abandon and replay, False=cancel)
+        
+        Example:
+            >>> def on_result(confirmed):
+            ...     if confirmed:
+            ...         self.engine.end_game(EndReason.ABANDON_EXIT)
+            ...         self.gameplay_controller.replay_last_game()
+            >>> dialog_manager.show_replay_prompt_async(on_result)
+        """
+        if not self.is_available:
+            return
+        
+        self.dialogs.show_yes_no_async(
+            title="Rivedi Partita",
+            message="Una partita è in corso. Vuoi abbandonarla e rivederla dall'inizio?",
+            callback=_make_logged_callback("Rivedi Partita", callback)
+        )
+    
     def show_exit_app_prompt_async(self, callback: Callable[[bool], None]) -> None:
         """Show exit confirmation dialog (non-blocking).
         
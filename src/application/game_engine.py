@@ -21,23 +21,36 @@ New in v1.4.2.1 (Bug Fix #3 - Phase 1-7/7 COMPLETE! + Bug #3.1 FIX):
 - Bug #3.1 FIX: Prevent double distribution on deck change
 """
 
-from typing import Optional, Tuple, Dict, Any, List, TYPE_CHECKING, Callable, Union
+import uuid
+from typing import Optional, Tuple, Dict, Any, List, Set, TYPE_CHECKING, Callable, Union
 
 from src.domain.models.table import GameTable
-from src.domain.models.deck import FrenchDeck, NeapolitanDeck
+from src.domain.models.deck import FrenchDeck, NeapolitanDeck, new_deal_seed
 from src.domain.models.pile import Pile
 from src.domain.models.card import Card
+from src.domain.models.game_events import CardRevealed, GameEvent, StockDrawn, TableReset
 from src.domain.services.game_service import GameService
 from src.domain.services.game_settings import GameSettings
 from src.domain.services.cursor_manager import CursorManager
 from src.domain.services.selection_manager import SelectionManager
 from src.domain.services.scoring_service import ScoringService
+from src.domain.services.saved_game import SavedGame
+from src.domain.services.replay import Replay, ReplayRecorder
+from src.domain.services.replay_player import ReplayPlayer
+from src.domain.services.hint_engine import Hint, HintEngine
+from src.domain.services.solver import SolverStatus
+from src.domain.services.stall_detector import StallDetector, StallStatus
+from src.domain.simulation.win_estimator import WinEstimate, WinEstimator
+from src.domain.rules.move_generator import MoveKind
 from src.infrastructure.config.scoring_config_loader import ScoringConfigLoader  # 🆕 MISSING
 from src.domain.rules.solitaire_rules import SolitaireRules
-from src.domain.models.scoring import ScoringConfig, ScoreWarningLevel  # ✅ v2.6.0: Added ScoreWarningLevel
+from src.domain.models.scoring import ScoringConfig, ScoreEventType, ScoreWarningLevel  # ✅ v2.6.0: Added ScoreWarningLevel
 from src.infrastructure.accessibility.screen_reader import ScreenReader
 from src.infrastructure.accessibility.tts_provider import create_tts_provider
 from src.infrastructure.storage.score_storage import ScoreStorage
+from src.infrastructure.storage.deal_bank import DealBank
+from src.infrastructure.storage.game_save_storage import GameSaveStorage
+from src.infrastructure.storage.replay_storage import ReplayStorage
 from src.presentation.game_formatter import GameFormatter
 from src.presentation.formatters.score_formatter import ScoreFormatter
 from src.infrastructure.logging import game_logger as log
@@ -83,6 +96,9 @@ class GameEngine:
         _options_open: Virtual options window state (v1.4.1)
     """
     
+    # Repeated cycles without progress before the loss is offered
+    STUCK_OFFER_CYCLES = 2
+    
     def __init__(
         self,
         table: GameTable,
@@ -98,6 +114,9 @@ class GameEngine:
         profile_service: Optional['ProfileService'] = None,  # 🆕 NEW v3.1.0
         audio_manager: Optional[object] = None,  # NEW v3.4.2: inject AudioManager for timer events
         timer_manager: Optional['TimerManager'] = None,  # NEW v3.4.2: optional external TimerManager
+        deal_bank: Optional[DealBank] = None,
+        save_storage: Optional[GameSaveStorage] = None,
+        replay_storage: Optional[ReplayStorage] = None,
     ):
         """Initialize game engine.
         
@@ -113,6 +132,12 @@ class GameEngine:
             dialog_provider: Optional dialog provider for native UI dialogs (NEW v1.6.0)
             on_game_ended: Optional callback when game ends, receives wants_rematch bool (NEW v1.6.2)
             profile_service: Optional profile service for statistics (NEW v3.1.0)
+            deal_bank: Optional bank of winnable deals (opened from the
+                default path on first use if not given)
+            save_storage: Optional storage of the in-progress game
+                (autosaved after every action when given)
+            replay_storage: Optional storage of game replays (every
+                new game is recorded when given)
         """
         self.table = table
         self.service = service
@@ -144,10 +169,45 @@ class GameEngine:
         # 🆕 NEW v3.1.0: Last session storage for "Ultima Partita" menu
         self.last_session_outcome: Optional['SessionOutcome'] = None
         
+        # Bank of verified-winnable deals (opened lazily by new_game)
+        self.deal_bank = deal_bank
+        self._deal_bank_checked = False
+        
+        # In-progress game autosave (disabled if None)
+        self.save_storage = save_storage
+        
+        # Replay recording of every new game (disabled if None)
+        self.replay_storage = replay_storage
+        self.replay_recorder: Optional[ReplayRecorder] = None
+        self.replay_id: Optional[str] = None
+        
+        # Background hint search (created on the first request)
+        self._hint_engine: Optional[HintEngine] = None
+        # Hint spoken by request_hint whose refinement poll_hint still owes
+        self._hint_pending: Optional[Hint] = None
+        
+        # Background win probability estimate (created on the first request)
+        self._win_estimator: Optional[WinEstimator] = None
+        # Started estimate whose figures poll_win_estimate still owes
+        self._win_estimate_pending = False
+        # Codes of the cards drawn this deal (known to the player even
+        # when back in the stock)
+        self._seen_cards: Set[int] = set()
+        
+        # Loss already offered for the current stuck position
+        self._stuck_loss_offered = False
+        
+        # Card turned face up by the last move (from the service events)
+        self._revealed_card: Optional[Card] = None
+        if isinstance(service, GameService):
+            service.subscribe(self._on_game_event)
+        
         # Configurable attributes with defaults (Phase 1/7)
         # These will be updated from settings in new_game()
         self.draw_count: int = 1  # Default: 1 carta
         self.shuffle_on_recycle: bool = False  # Default: si girano (no shuffle)
+        self.auto_complete_enabled: bool = True  # Finish won games in one batch
+        self.safe_auto_play: bool = False  # Send safe cards to the foundations
         
         # Virtual options window state (v1.4.1)
         self._options_open: bool = False
@@ -246,6 +306,8 @@ class GameEngine:
         
         # Create score storage (v2.0.0)
         score_storage = ScoreStorage()
+        save_storage = GameSaveStorage()
+        replay_storage = ReplayStorage()
         
         # Create infrastructure (optional)
         if screen_reader is None and audio_enabled:
@@ -271,20 +333,22 @@ class GameEngine:
             table, service, rules, cursor, selection, screen_reader,
             settings, score_storage, dialog_provider,
             on_game_ended=None,              # 🆕 Forward callback placeholder
-            profile_service=profile_service  # 🆕 Forward profile_service
+            profile_service=profile_service,  # 🆕 Forward profile_service
+            save_storage=save_storage,
+            replay_storage=replay_storage
         )
     
     # ========================================
     # GAME LIFECYCLE
     # ========================================
     
-    def new_game(self) -> None:
+    def new_game(self, seed: Optional[int] = None, use_deal_bank: Optional[bool] = None) -> None:
         """Start a new game with settings integration.
         
         Flow (Phase 5/7 - Bug #3 fix + Bug #3.1 fix):
         1. Check if deck_type changed → recreate deck if necessary
-        2. If deck unchanged → gather existing cards AND redistribute
-        3. If deck changed → skip redistribution (already dealt by GameTable)
+        2. Gather all cards from the table
+        3. Shuffle and deal again from the game seed
         4. Apply settings (draw count, shuffle mode, timer)
         5. Reset game state and cursor/selection
         6. Start game timer and announce
@@ -292,7 +356,20 @@ class GameEngine:
         Bug #3.1 Fix:
             When deck_type changes, _recreate_deck_and_table() creates
             a new GameTable, which automatically distributes cards in __init__().
-            We must NOT call distribuisci_carte() again to avoid crash.
+            We must NOT call distribuisci_carte() again without gathering
+            the cards first: GameTable.ridistribuisci() always gathers.
+        
+        Seeded deals:
+            Every game carries a seed (``service.deal_seed``), generated
+            when not given. The seed drives the shuffle and the shuffled
+            recycles, so the same seed replays the same game.
+        
+        Args:
+            seed: Deal number to play (None = random new deal)
+            use_deal_bank: Draw the deal from the bank of verified-winnable
+                deals for the current deck type and draw count. A missing
+                or exhausted bank falls back to a random deal.
+                None = only at difficulty levels 1-2.
         
         This method now properly consults GameSettings to:
         - Switch between French/Neapolitan decks dynamically
@@ -330,8 +407,6 @@ class GameEngine:
         #                 self.profile_service.record_session(crash_session)
         #             self.session_tracker.mark_recovered(orphan['session_id'])
         
-        deck_changed = False
-        
         # 1️⃣ Check if deck type changed (Phase 3 integration)
         if self.settings:
             # Detect current deck type
@@ -340,45 +415,25 @@ class GameEngine:
             
             # Deck type mismatch → recreate deck and table
             if current_is_neapolitan != should_be_neapolitan:
-                deck_changed = True
-                
                 # Log deck type change
                 old_deck = "neapolitan" if current_is_neapolitan else "french"
                 new_deck = "neapolitan" if should_be_neapolitan else "french"
                 log.settings_changed("deck_type", old_deck, new_deck)
                 
-                # ⚠️ IMPORTANT: This creates GameTable which already deals cards!
+                # ⚠️ IMPORTANT: This creates GameTable which already deals
+                # cards! They are gathered again by the seeded deal below.
                 self._recreate_deck_and_table(should_be_neapolitan)
         
-        # 2️⃣ If deck NOT changed: gather existing cards
-        if not deck_changed:
-            # Collect all cards from all piles
-            all_cards = []
-            for pile in self.table.pile_base:
-                all_cards.extend(pile.get_all_cards())
-                pile.clear()
-            for pile in self.table.pile_semi:
-                all_cards.extend(pile.get_all_cards())
-                pile.clear()
-            if self.table.pile_mazzo:
-                all_cards.extend(self.table.pile_mazzo.get_all_cards())
-                self.table.pile_mazzo.clear()
-            if self.table.pile_scarti:
-                all_cards.extend(self.table.pile_scarti.get_all_cards())
-                self.table.pile_scarti.clear()
-            
-            # ✅ BUG #54 FIX: Cover all cards before redistribution
-            # Reset card state to covered to prevent inheriting uncovered state from previous game
-            for card in all_cards:
-                card.set_cover()
-            
-            # Put cards back in deck and shuffle
-            self.table.mazzo.cards = all_cards
-            self.table.mazzo.mischia()
-            
-            # 3️⃣ Redistribute cards ONLY if deck unchanged
-            # ✅ BUG #3.1 FIX: Skip if deck_changed (already dealt by GameTable)
-            self.table.distribuisci_carte()
+        # 2️⃣ + 3️⃣ Gather all cards and deal again from the game seed
+        # (Bug #54 fix: ridistribuisci() covers every card first)
+        if use_deal_bank is None:
+            use_deal_bank = self.settings is not None and self.settings.difficulty_level <= 2
+        if seed is None and use_deal_bank:
+            seed = self._draw_bank_seed()
+        if seed is None:
+            seed = new_deal_seed()
+        self.service.deal(seed)
+        log.debug_state("deal_seed", {"seed": seed})
         
         # 4️⃣ Apply game settings (Phase 4 integration)
         # Configures: draw_count, shuffle_on_recycle, timer warning
@@ -395,8 +450,12 @@ class GameEngine:
         # ⚠️ CRITICAL: Reset selection (was missing in original!)
         self.selection.clear_selection()
         
-        # 6️⃣ Start game timer
+        # 6️⃣ Start game timer (the new game replaces any saved one)
         self.service.start_game()
+        self._cancel_hint()
+        self._cancel_win_estimate()
+        self._start_replay()
+        self._autosave()
         # Setup internal TimerManager (used for audio warnings/expired events)
         if self.settings and self.settings.max_time_game > 0:
             minutes = max(1, int(self.settings.max_time_game // 60))
@@ -422,6 +481,27 @@ class GameEngine:
                 interrupt=True
             )
     
+    def _draw_bank_seed(self) -> Optional[int]:
+        """Draw a winnable deal seed from the deal bank.
+        
+        Returns:
+            Seed, or None if the bank is missing or has no deal left
+            for the current deck type and draw count
+        """
+        if self.deal_bank is None and not self._deal_bank_checked:
+            self._deal_bank_checked = True
+            self.deal_bank = DealBank.open()
+        if self.deal_bank is None:
+            return None
+        
+        deck_type = "neapolitan" if isinstance(self.table.mazzo, NeapolitanDeck) else "french"
+        draw_count = self.settings.draw_count if self.settings else self.draw_count
+        entry = self.deal_bank.draw(deck_type, draw_count)
+        if entry is None:
+            log.warning_issued("DealBank", f"No bank deal left for {deck_type}/{draw_count}")
+            return None
+        return entry.seed
+    
     def reset_game(self) -> None:
         """Reset current game without redistributing cards."""
         self.service.reset_game()
@@ -441,6 +521,172 @@ class GameEngine:
         """
         return self.service.is_game_running
     
+    # ========================================
+    # SAVE / RESUME
+    # ========================================
+    
+    def save_game(self) -> bool:
+        """Save the in-progress game (compact binary blob).
+        
+        Cheap enough to run after every action (see ``_autosave``).
+        
+        Returns:
+            True if saved, False if no game is running, no storage is
+            configured or the write failed
+        """
+        if self.save_storage is None or not self.service.is_game_running:
+            return False
+        saved = SavedGame.capture(self.service, self.draw_count, self.shuffle_on_recycle)
+        return self.save_storage.save(saved.to_bytes())
+    
+    def _autosave(self) -> None:
+        """Save the game after an action (no-op without storage)."""
+        if self.save_storage is not None:
+            self.save_game()
+    
+    def has_saved_game(self) -> bool:
+        """Check if there is a saved game to resume."""
+        return self.save_storage is not None and self.save_storage.exists()
+    
+    def resume_game(self) -> bool:
+        """Resume the saved game in place of the current one.
+        
+        Restores table, counters, timer, recycle RNG and scoring events.
+        The deck is recreated if the saved game used another deck type;
+        cards per draw and recycle mode come from the save, not from the
+        current settings. The undo history starts empty.
+        
+        Returns:
+            True if resumed, False if there is no valid saved game
+        """
+        blob = self.save_storage.load() if self.save_storage else None
+        if blob is None:
+            return False
+        try:
+            saved = SavedGame.from_bytes(blob)
+        except ValueError as e:
+            log.error_occurred("GameEngine", "Invalid saved game discarded", e)
+            self.discard_saved_game()
+            return False
+        
+        is_neapolitan = isinstance(self.table.mazzo, NeapolitanDeck)
+        if is_neapolitan != (saved.deck_type == "neapolitan"):
+            self._recreate_deck_and_table(not is_neapolitan)
+        
+        # A resumed game does not start from its deal: not recorded
+        self._close_replay(finished=False)
+        saved.restore(self.service)
+        self.draw_count = saved.draw_per_click
+        self.shuffle_on_recycle = saved.shuffle_on_recycle
+        if not self.service.is_game_running:
+            self.service.start_game()
+        
+        self.cursor.pile_idx = 0
+        self.cursor.card_idx = 0
+        self.cursor.last_quick_pile = None
+        self.selection.clear_selection()
+        
+        if self.screen_reader:
+            self.screen_reader.tts.speak("Partita ripresa.", interrupt=True)
+        return True
+    
+    def discard_saved_game(self) -> None:
+        """Delete the saved game (finished or abandoned)."""
+        if self.save_storage is not None:
+            self.save_storage.delete()
+    
+    # ========================================
+    # REPLAY RECORDING
+    # ========================================
+    
+    def _start_replay(self) -> None:
+        """Record the game just dealt (no-op without replay storage).
+        
+        A replay still open (game left for a new one) is closed
+        without its end marker.
+        """
+        self._close_replay(finished=False)
+        if self.replay_storage is None:
+            return
+        replay_id = uuid.uuid4().hex
+        header = Replay(
+            deck_type="neapolitan" if isinstance(self.table.mazzo, NeapolitanDeck) else "french",
+            draw_per_click=self.draw_count,
+            shuffle_on_recycle=self.shuffle_on_recycle,
+            deal_seed=self.service.deal_seed,
+        )
+        self.replay_recorder = ReplayRecorder(self.replay_storage.appender(replay_id), header)
+        self.replay_id = replay_id
+        self.service.replay = self.replay_recorder
+    
+    def _close_replay(self, finished: bool) -> Optional[str]:
+        """Stop recording the current game.
+        
+        Args:
+            finished: Mark the replay as a complete game
+        
+        Returns:
+            Id of the closed replay (None if the game was not recorded)
+        """
+        recorder, replay_id = self.replay_recorder, self.replay_id
+        if recorder is None:
+            return None
+        if finished:
+            recorder.finish()
+        else:
+            recorder.close()
+        self.replay_recorder = None
+        self.replay_id = None
+        self.service.replay = None
+        return replay_id
+    
+    def load_replay(self, replay_id: str) -> Optional[Replay]:
+        """Read a recorded game (e.g. ``SessionOutcome.replay_id``).
+        
+        Returns:
+            Decoded replay, or None if missing or invalid
+        """
+        blob = self.replay_storage.load(replay_id) if self.replay_storage else None
+        if blob is None:
+            return None
+        try:
+            return Replay.from_bytes(blob)
+        except ValueError as e:
+            log.error_occurred("GameEngine", f"Invalid replay {replay_id}", e)
+            return None
+    
+    def open_replay(self, replay: Replay) -> Optional[ReplayPlayer]:
+        """Show a recorded game on the table, positioned at its deal.
+        
+        Replaces the current game (the deck is recreated if the replay
+        used another deck type). The returned player moves the table
+        through the game; playing on from a replayed position is a
+        normal game again.
+        
+        Args:
+            replay: Recorded game
+        
+        Returns:
+            Player of the replay, or None if it cannot be played
+        """
+        self._close_replay(finished=False)
+        is_neapolitan = isinstance(self.table.mazzo, NeapolitanDeck)
+        if is_neapolitan != (replay.deck_type == "neapolitan"):
+            self._recreate_deck_and_table(not is_neapolitan)
+        try:
+            player = ReplayPlayer(self.service, replay)
+        except ValueError as e:
+            log.error_occurred("GameEngine", "Replay cannot be played", e)
+            return None
+        
+        self.draw_count = replay.draw_per_click
+        self.shuffle_on_recycle = replay.shuffle_on_recycle
+        self.cursor.pile_idx = 0
+        self.cursor.card_idx = 0
+        self.cursor.last_quick_pile = None
+        self.selection.clear_selection()
+        return player
+    
     # ========================================
     # TIMER CALLBACKS (v3.4.2)
     # ========================================
@@ -951,6 +1197,16 @@ class GameEngine:
         
         return msg
     
+    def _on_game_event(self, event: GameEvent) -> None:
+        """Keep the card revealed by the move being executed and the drawn cards."""
+        if isinstance(event, CardRevealed) and not event.covered:
+            self._revealed_card = event.card
+        elif isinstance(event, StockDrawn) and not event.undone:
+            drawn = self.service.table.pile[11].cards[-event.card_count:]  # Waste
+            self._seen_cards.update(card.get_id for card in drawn if card.get_id is not None)
+        elif isinstance(event, TableReset):
+            self._seen_cards.clear()
+    
     def execute_move(self) -> Tuple[bool, str]:
         """Execute move with selected cards to cursor position.
         
@@ -986,7 +1242,8 @@ class GameEngine:
         if not dest_pile.is_empty():
             card_under = dest_pile.get_top_card()
         
-        # Execute move
+        # Execute move (a CardRevealed event sets the revealed card)
+        self._revealed_card = None
         success, message = self.service.move_card(
             origin_pile,
             dest_pile,
@@ -996,20 +1253,13 @@ class GameEngine:
         
         # On success: use detailed formatter
         if success:
-            # Check revealed card in origin
-            revealed_card = None
-            if not origin_pile.is_empty():
-                top = origin_pile.get_top_card()
-                if top and not top.get_covered:
-                    revealed_card = top
-            
             # Format detailed report
             message = GameFormatter.format_move_report(
                 moved_cards=cards,
                 origin_pile=origin_pile,
                 dest_pile=dest_pile,
                 card_under=card_under,
-                revealed_card=revealed_card
+                revealed_card=self._revealed_card
             )
             
             # Clear selection
@@ -1026,6 +1276,9 @@ class GameEngine:
         if self.screen_reader:
             self.screen_reader.tts.speak(message, interrupt=True)
         
+        if success:
+            self._after_action()
+        
         # Check victory
         if success and self.is_victory():
             self.end_game(is_victory=True)
@@ -1079,6 +1332,9 @@ class GameEngine:
         if self.screen_reader:
             self.screen_reader.tts.speak(message, interrupt=False)
         
+        if success:
+            self._after_action()
+        
         if success and self.is_victory():
             self.end_game(is_victory=True)
             if self.screen_reader:
@@ -1158,6 +1414,7 @@ class GameEngine:
                 # Remove auto-draw part from message (we handle it below)
                 recycle_only = recycle_announcement.split("Pescata automatica")[0].strip()
                 self.screen_reader.tts.speak(recycle_only, interrupt=False)
+            self._check_stuck_position()
         
         # Now draw cards (original logic)
         success, generic_msg, cards = self.service.draw_cards(count)
@@ -1176,6 +1433,9 @@ class GameEngine:
         if self.screen_reader:
             self.screen_reader.tts.speak(message, interrupt=False)
         
+        if success and self._after_action(moved_card=False):
+            self.end_game(is_victory=True)
+        
         return success, message
     
     def recycle_waste(self, shuffle: Optional[bool] = None) -> Tuple[bool, str]:
@@ -1235,6 +1495,10 @@ class GameEngine:
         
         if self.screen_reader:
             self.screen_reader.tts.speak(message, interrupt=False)
+        self._check_stuck_position()
+        
+        if self._after_action(moved_card=False):
+            self.end_game(is_victory=True)
         
         return success, message
     
@@ -1249,8 +1513,302 @@ class GameEngine:
         if self.screen_reader:
             self.screen_reader.tts.speak(message, interrupt=False)
         
+        if success and self._after_action():
+            self.end_game(is_victory=True)
+        
         return success, message
     
+    def auto_complete(self) -> Tuple[bool, str]:
+        """Finish the game by moving every card to the foundations.
+        
+        Available once stock and waste are empty and every tableau card
+        is face up. All the moves run as one batch with a single
+        announcement, then the game ends as a victory.
+        
+        Returns:
+            Tuple of (success, message)
+        """
+        if not self.service.can_auto_complete():
+            msg = "Completamento automatico non disponibile: ci sono ancora carte coperte o nel mazzo."
+            if self.screen_reader:
+                self.screen_reader.tts.speak(msg, interrupt=True)
+            return False, msg
+        
+        message = self._run_auto_complete()
+        if self.is_victory():
+            self.end_game(is_victory=True)
+        return True, message
+    
+    def _after_action(self, moved_card: bool = True) -> bool:
+        """Run the automatic follow-ups of a successful action.
+        
+        Safe auto-play (if enabled), then auto-complete (if enabled),
+        then autosave. Each automation speaks one aggregated message.
+        
+        Args:
+            moved_card: False after a draw or recycle, which leave cards
+                on the waste and so cannot win or enable auto-complete
+                by themselves
+        
+        Returns:
+            True if the game is now won (caller ends it)
+        """
+        self._cancel_hint()
+        self._cancel_win_estimate()
+        if self.safe_auto_play and self._run_safe_auto_play():
+            moved_card = True
+        if moved_card:
+            self._try_auto_complete()
+        self._autosave()
+        return moved_card and self.is_victory()
+    
+    def _run_safe_auto_play(self) -> List[Card]:
+        """Send the safe cards to the foundations and announce them once."""
+        cards = self.service.auto_play_safe()
+        if cards:
+            self.selection.clear_selection()
+            if self.screen_reader:
+                names = ", ".join(card.get_display_name() for card in cards)
+                self.screen_reader.tts.speak(
+                    f"Spostate automaticamente nelle fondazioni: {names}.",
+                    interrupt=False
+                )
+        return cards
+    
+    def _try_auto_complete(self) -> bool:
+        """Run auto-complete after an action if enabled and available.
+        
+        Returns:
+            True if the remaining cards were moved to the foundations
+        """
+        if not self.auto_complete_enabled or not self.service.can_auto_complete():
+            return False
+        self._run_auto_complete()
+        return True
+    
+    def _run_auto_complete(self) -> str:
+        """Move the remaining cards in one batch and announce it once."""
+        cards = self.service.auto_complete()
+        self.selection.clear_selection()
+        
+        message = f"Completamento automatico: {len(cards)} carte spostate nelle fondazioni."
+        log.debug_state("auto_complete", {"cards": len(cards)})
+        if self.screen_reader:
+            self.screen_reader.tts.speak(message, interrupt=False)
+        return message
+    
+    def _check_stuck_position(self) -> None:
+        """Announce a stock cycle without progress (after a recycle).
+        
+        With the ``offer_stuck_loss`` setting, a dead end (or repeated
+        cycles without progress) also asks once whether to close the
+        game as lost (EndReason.DEAD_END).
+        """
+        stall = getattr(self.service, "stall", None)
+        if not isinstance(stall, StallDetector) or not stall.status.is_stuck:
+            self._stuck_loss_offered = False
+            return
+        
+        message = GameFormatter.format_stuck_position(stall.status == StallStatus.DEAD_END)
+        if self.screen_reader:
+            self.screen_reader.tts.speak(message, interrupt=False)
+        
+        offer = (
+            getattr(self.settings, "offer_stuck_loss", False) is True
+            and self.dialogs is not None
+            and not self._stuck_loss_offered
+            and (stall.status == StallStatus.DEAD_END
+                 or stall.stalled_cycles >= self.STUCK_OFFER_CYCLES)
+        )
+        if not offer:
+            return
+        self._stuck_loss_offered = True
+        
+        def on_answer(confirmed: bool) -> None:
+            # Import EndReason locally to avoid circular dependency
+            from src.domain.models.game_end import EndReason
+            if confirmed and self.is_game_running():
+                self.end_game(EndReason.DEAD_END)
+        
+        self.dialogs.show_yes_no_async(
+            "Partita bloccata",
+            f"{message} Vuoi chiudere la partita come persa?",
+            on_answer
+        )
+    
+    # ========================================
+    # HINTS
+    # ========================================
+    
+    def request_hint(self) -> Tuple[bool, str]:
+        """Suggest a move for the current position.
+        
+        The best move is searched on a worker thread (see HintEngine)
+        and this call never waits for it: the first request speaks the
+        heuristic move at once and ``poll_hint`` announces the refined
+        move once the search ends, asking again on the same position
+        meanwhile gives the best move found so far. Every hint given is
+        recorded as a HINT_USED scoring event.
+        
+        Returns:
+            Tuple of (hint available, message)
+        """
+        if not self.is_game_running():
+            return False, "Nessuna partita in corso."
+        
+        state = self.service.get_compact_state()
+        engine = self._hint_engine
+        if engine is None or engine.rules is not self.rules or engine.draw_count != self.draw_count:
+            engine = self._hint_engine = HintEngine(self.rules, self.draw_count)
+        
+        hint = engine.best(state)
+        if hint is None:
+            hint = engine.start(state)
+        # The answer of the search still owed is spoken by poll_hint
+        self._hint_pending = hint if hint is not None and hint.status == SolverStatus.UNKNOWN else None
+        
+        if hint is None:
+            msg = "Nessuna mossa disponibile."
+        else:
+            msg = self._format_hint(hint)
+            if self.settings and self.settings.scoring_enabled and self.service.scoring:
+                self.service.scoring.record_event(ScoreEventType.HINT_USED, msg)
+            log.debug_state("hint", {"move": tuple(hint.move), "status": hint.status.value, "nodes": hint.nodes})
+        
+        if self.screen_reader:
+            self.screen_reader.tts.speak(msg, interrupt=True)
+        return hint is not None, msg
+    
+    def poll_hint(self) -> Optional[str]:
+        """Announce the refined hint once its search ends.
+        
+        Called on every UI timer tick: if the search started by
+        ``request_hint`` found another move or proved the position won
+        or lost, speaks the new hint.
+        
+        Returns:
+            Announcement made, or None if nothing was due
+        """
+        spoken, engine = self._hint_pending, self._hint_engine
+        if spoken is None or engine is None or engine.searching:
+            return None
+        
+        self._hint_pending = None
+        hint = engine.best(self.service.get_compact_state())
+        if hint is None or (hint.move, hint.status) == (spoken.move, spoken.status):
+            return None  # Cancelled meanwhile, or nothing better found
+        msg = self._format_hint(hint)
+        log.debug_state("hint", {"move": tuple(hint.move), "status": hint.status.value, "nodes": hint.nodes})
+        if self.screen_reader:
+            self.screen_reader.tts.speak(msg, interrupt=False)
+        return msg
+    
+    def _format_hint(self, hint: Hint) -> str:
+        """Spoken text of a hint."""
+        move = hint.move
+        piles = self.table.pile
+        origin, dest = piles[move.source], piles[move.target]
+        cards = [] if move.kind in (MoveKind.DRAW, MoveKind.RECYCLE) else origin.cards[-move.card_count:]
+        winning = {SolverStatus.WINNABLE: True, SolverStatus.UNWINNABLE: False}.get(hint.status)
+        return GameFormatter.format_hint(cards, origin, dest, winning)
+    
+    def _cancel_hint(self) -> None:
+        """Stop the hint search after the board changed."""
+        self._hint_pending = None
+        if self._hint_engine is not None:
+            self._hint_engine.cancel()
+    
+    # ========================================
+    # WIN PROBABILITY
+    # ========================================
+    
+    def request_win_probability(self) -> Tuple[bool, str]:
+        """Announce the estimated chance to win the current position.
+        
+        The estimate runs in the background (see WinEstimator) and this
+        call never waits for it: the first request announces that the
+        estimate started and ``poll_win_estimate`` speaks the figures
+        once it ends, asking again on the same position meanwhile gives
+        the figures reached so far. The next action cancels it.
+        
+        Returns:
+            Tuple of (estimate available, message)
+        """
+        if not self.is_game_running():
+            return False, "Nessuna partita in corso."
+        
+        deck_type = "neapolitan" if self.settings and self.settings.deck_type == "neapolitan" else "french"
+        estimator = self._win_estimator
+        if (
+            estimator is None or estimator.deck_type != deck_type
+            or estimator.draw_count != self.draw_count
+            or estimator.shuffle_on_recycle != self.shuffle_on_recycle
+        ):
+            if estimator is not None:
+                estimator.close()
+            estimator = self._win_estimator = WinEstimator(
+                deck_type, self.draw_count, shuffle_on_recycle=self.shuffle_on_recycle
+            )
+        
+        state = self.service.get_compact_state()
+        estimate = estimator.estimate(state)
+        if estimate is None:
+            estimator.start(state, self._seen_cards)
+            estimate = estimator.estimate(state)
+        # Figures still missing are spoken by poll_win_estimate
+        self._win_estimate_pending = estimate is not None and not estimate.finished
+        
+        msg = self._format_win_estimate(estimate)
+        if self.screen_reader:
+            self.screen_reader.tts.speak(msg, interrupt=True)
+        return estimate is not None and estimate.samples > 0, msg
+    
+    def poll_win_estimate(self) -> Optional[str]:
+        """Announce the win probability estimate once it ends.
+        
+        Called on every UI timer tick: speaks the final figures of the
+        estimate started by ``request_win_probability``, if any.
+        
+        Returns:
+            Announcement made, or None if nothing was due
+        """
+        if not self._win_estimate_pending or self._win_estimator is None:
+            return None
+        estimate = self._win_estimator.estimate()
+        if estimate is not None and not estimate.finished:
+            return None
+        
+        self._win_estimate_pending = False
+        if estimate is None or estimate.samples == 0:
+            return None  # Cancelled meanwhile, or nothing was played
+        msg = self._format_win_estimate(estimate)
+        if self.screen_reader:
+            self.screen_reader.tts.speak(msg, interrupt=False)
+        return msg
+    
+    def _format_win_estimate(self, estimate: Optional[WinEstimate]) -> str:
+        """Spoken text of an estimate (None or no samples = started)."""
+        if estimate is None:
+            return GameFormatter.format_win_estimate(0.0, 0.0, 1.0, 0, False)
+        log.debug_state("win_estimate", {"wins": estimate.wins, "samples": estimate.samples, "finished": estimate.finished})
+        return GameFormatter.format_win_estimate(
+            estimate.probability, estimate.low, estimate.high, estimate.samples, estimate.finished
+        )
+    
+    def _cancel_win_estimate(self) -> None:
+        """Stop the win probability estimate after the board changed."""
+        self._win_estimate_pending = False
+        if self._win_estimator is not None:
+            self._win_estimator.cancel()
+    
+    def shutdown(self) -> None:
+        """Stop the background searches before the application exits."""
+        self._cancel_hint()
+        self._win_estimate_pending = False
+        if self._win_estimator is not None:
+            self._win_estimator.close()
+            self._win_estimator = None
+    
     # ========================================
     # STATE QUERIES
     # ========================================
@@ -1341,6 +1899,12 @@ class GameEngine:
         # Extract boolean is_victory for compatibility with existing code
         is_victory_bool = end_reason.is_victory()
         
+        # A finished game cannot be resumed; its replay is complete
+        self.discard_saved_game()
+        self._cancel_hint()
+        self._cancel_win_estimate()
+        replay_id = self._close_replay(finished=True)
+        
         # ═══════════════════════════════════════════════════════════
         # STEP 1: Snapshot Statistics
         # ═══════════════════════════════════════════════════════════
@@ -1379,7 +1943,8 @@ class GameEngine:
                 elapsed_seconds=final_stats['elapsed_time'],
                 move_count=final_stats['move_count'],
                 is_victory=is_victory_bool,
-                timer_strict_mode=self.settings.timer_strict_mode if self.settings else True
+                timer_strict_mode=self.settings.timer_strict_mode if self.settings else True,
+                deal_seed=self.service.deal_seed
             )
         
         # ═══════════════════════════════════════════════════════════
@@ -1410,7 +1975,9 @@ class GameEngine:
                 final_score=final_score.total_score if final_score else 0,
                 difficulty_level=self.settings.difficulty_level if self.settings else 3,
                 deck_type=self.settings.deck_type if self.settings else "french",
-                move_count=final_stats['move_count']
+                deal_seed=self.service.deal_seed,
+                move_count=final_stats['move_count'],
+                replay_id=replay_id
             )
             
             # Store for "Ultima Partita" menu (v3.1.0 Phase 9.1)
@@ -1989,6 +2556,9 @@ class GameEngine:
         # CRITICAL: Correct attribute is shuffle_discards (not waste_shuffle!)
         self.shuffle_on_recycle = self.settings.shuffle_discards
         
+        # Safe auto-play after every move (off for stub settings)
+        self.safe_auto_play = getattr(self.settings, "safe_auto_play", False) is True
+        
         # 3️⃣ Timer warning (countdown not implemented)
         # max_time_game: -1 = OFF, 300-3600 = seconds (5-60 min)
         if self.settings.max_time_game > 0 and self.screen_reader:
@@ -2010,6 +2580,9 @@ class GameEngine:
     
     def _get_pile(self, idx: int) -> Optional[Pile]:
         """Get pile by index (0-12)."""
+        if isinstance(self.table, GameTable):
+            piles = self.table.pile
+            return piles[idx] if 0 <= idx < len(piles) else None
         if 0 <= idx <= 6:
             return self.table.pile_base[idx]
         elif 7 <= idx <= 10:
@@ -2087,6 +2660,7 @@ class GameEngine:
             "deck_type": self.settings.deck_type if self.settings else "french",
             "draw_count": self.draw_count,
             "shuffle_mode": "shuffle" if self.shuffle_on_recycle else "reverse",
+            "deal_seed": self.service.deal_seed,
             
             # Scoring (if enabled)
             "scoring_enabled": self.settings.scoring_enabled if self.settings else False,
@@ -10,11 +10,19 @@ New in v1.4.2.1 (Bug Fix):
 """
 
 import pygame
-from typing import Dict, Callable, Optional
+from typing import Any, Dict, Callable, Optional, Tuple
 
 from src.application.board_state import BoardState, CardView
 from src.application.game_engine import GameEngine
 from src.application.options_controller import OptionsWindowController
+from src.application.replay_playback import ReplayPlayback
+from src.domain.models.game_events import (
+    CardRevealed, CardsMoved, FoundationCompleted, GameEvent, StockDrawn, WasteRecycled
+)
+from src.domain.models.pile import Pile
+from src.domain.models.table import GameTable
+from src.domain.services.game_service import GameService
+from src.domain.services.replay import Replay
 from src.domain.services.game_settings import GameSettings
 from src.infrastructure.logging import game_logger as log
 
@@ -39,7 +47,8 @@ class GamePlayController:
         screen_reader,
         settings: Optional[GameSettings] = None,  # NEW PARAMETER (v1.4.2.1)
         on_new_game_request: Optional[Callable[[], None]] = None,  # NEW PARAMETER (v1.4.3)
-        audio_manager: Optional[object] = None  # NEW v3.4.0: AudioManager DI
+        audio_manager: Optional[object] = None,  # NEW v3.4.0: AudioManager DI
+        on_replay_request: Optional[Callable[[], None]] = None
     ):
         """Initialize gameplay controller.
         
@@ -53,12 +62,17 @@ class GamePlayController:
                 If None, starts directly (backward compatible)
                 If provided, callback should show confirmation dialog
             audio_manager: Optional AudioManager instance (DI, v3.4.0)
+            on_replay_request: Callback when user asks for a replay with game active
+                If None, the replay is refused while a game is running
+                If provided, callback should confirm, end the game and
+                call ``replay_last_game()``
         """
         self.engine = engine
         self.sr = screen_reader
         
         # Store callback for new game confirmation (v1.4.3)
         self.on_new_game_request = on_new_game_request
+        self.on_replay_request = on_replay_request
 
         # NEW v3.4.0: AudioManager DI
         self._audio = audio_manager
@@ -80,6 +94,18 @@ class GamePlayController:
 
         # Observer callback for visual board updates (Fase 2, v4.0.0)
         self._on_board_changed_callback: Callable[[BoardState], None] | None = None
+        
+        # CardView lists of the 13 piles, rebuilt only for the piles the
+        # service events marked as changed (all of them on a new table)
+        self._pile_views: list[list[CardView]] = [[] for _ in range(13)]
+        self._dirty_piles: set[int] = set(range(13))
+        self._observed_service: Optional[GameService] = None
+        self._observed_table: object = None
+        
+        # Playback of a recorded game (None when no replay is open)
+        self.replay_playback: Optional[ReplayPlayback] = None
+        # Starts the frame's replay timer (interval in seconds) or stops it (None)
+        self._on_replay_timer_callback: Optional[Callable[[Optional[float]], None]] = None
     
     def _vocalizza(self, text: str, interrupt: bool = True) -> None:
         """Wrapper for TTS with delay.
@@ -116,12 +142,85 @@ class GamePlayController:
         """Push the current board snapshot to the registered observer, if any."""
         self._notify_board_changed()
 
+    def set_on_replay_timer(self, callback: Optional[Callable[[Optional[float]], None]]) -> None:
+        """Register or remove the replay timer callback.
+
+        Args:
+            callback: Callable that receives the interval in seconds at
+                which ``replay_tick()`` must be called while a replay
+                plays, or None when the timer must stop.
+        """
+        self._on_replay_timer_callback = callback
+
+    def _sync_replay_timer(self) -> None:
+        """Run the replay timer at the step interval only while playing."""
+        if self._on_replay_timer_callback is None:
+            return
+        playback = self.replay_playback
+        if playback is not None and playback.playing:
+            self._on_replay_timer_callback(playback.step_interval)
+        else:
+            self._on_replay_timer_callback(None)
+
+    def _on_game_event(self, event: GameEvent) -> None:
+        """Mark the piles changed by a service event for the next snapshot."""
+        changed: Tuple[int, ...]
+        if isinstance(event, CardsMoved):
+            changed = (event.source, event.target)
+        elif isinstance(event, CardRevealed):
+            changed = (event.slot,)
+        elif isinstance(event, (StockDrawn, WasteRecycled)):
+            changed = (11, 12)
+        elif isinstance(event, FoundationCompleted):
+            return  # Its CardsMoved event already marked the foundation
+        else:
+            changed = ()  # TableReset: every pile
+        if not changed or min(changed) < 0:
+            self._dirty_piles.update(range(13))
+        else:
+            self._dirty_piles.update(changed)
+
+    def _watch_service(self) -> None:
+        """Follow the events of the current service and table.
+
+        A new service or table (deck type change) invalidates every
+        cached pile; services without events (stand-ins) are rescanned
+        at every snapshot.
+        """
+        service = self.engine.service
+        if service is not self._observed_service:
+            if self._observed_service is not None:
+                self._observed_service.unsubscribe(self._on_game_event)
+            self._observed_service = None
+            if isinstance(service, GameService):
+                service.subscribe(self._on_game_event)
+                self._observed_service = service
+            self._dirty_piles.update(range(13))
+        table = service.table
+        if table is not self._observed_table or self._observed_service is None:
+            self._observed_table = table
+            self._dirty_piles.update(range(13))
+
+    @staticmethod
+    def _table_pile(table: Any, index: int) -> Optional[Pile]:
+        """Pile of a table at a unified index 0-12 (None if missing)."""
+        if isinstance(table, GameTable):
+            return table.pile[index]
+        pile: Optional[Pile]
+        if index < 11:
+            group, index = (table.pile_base, index) if index < 7 else (table.pile_semi, index - 7)
+            pile = group[index] if index < len(group) else None
+        else:
+            pile = table.pile_scarti if index == 11 else table.pile_mazzo
+        return pile
+
     def _build_board_state(self) -> BoardState:
         """Create a BoardState snapshot from the current engine state.
 
         Reads piles from GameTable, cursor position from CursorManager, and
         selection info from SelectionManager. Converts domain.Card instances
-        into presentation-layer CardView objects.
+        into presentation-layer CardView objects; only the piles changed
+        since the last snapshot are converted again (see _on_game_event).
 
         Returns:
             BoardState with current game board reflected.
@@ -139,24 +238,20 @@ class GamePlayController:
                 suit_color=suit_color,
             )
 
-        # ---- Build 13 piles -------------------------------------------------
-        piles: list[list[CardView]] = [[] for _ in range(13)]
+        # ---- Build 13 piles (changed ones only) -----------------------------
+        # Cached lists are replaced, never mutated: earlier snapshots stay valid
+        views = self._pile_views
         try:
+            self._watch_service()
             table = self.engine.service.table
-            # Tableau piles 0-6
-            for i, pile in enumerate(table.pile_base):
-                piles[i] = [_to_card_view(c) for c in pile.cards]
-            # Foundation piles 7-10
-            for i, pile in enumerate(table.pile_semi):
-                piles[7 + i] = [_to_card_view(c) for c in pile.cards]
-            # Waste pile (index 11)
-            if table.pile_scarti is not None:
-                piles[11] = [_to_card_view(c) for c in table.pile_scarti.cards]
-            # Stock pile (index 12)
-            if table.pile_mazzo is not None:
-                piles[12] = [_to_card_view(c) for c in table.pile_mazzo.cards]
+            for i in sorted(self._dirty_piles):
+                pile = self._table_pile(table, i)
+                views[i] = [] if pile is None else [_to_card_view(c) for c in pile.cards]
+            self._dirty_piles.clear()
         except Exception:
-            pass
+            views[:] = [[] for _ in range(13)]
+            self._dirty_piles.update(range(13))
+        piles: list[list[CardView]] = list(views)
 
         # ---- Cursor position ------------------------------------------------
         cursor_pile_idx = 0
@@ -301,6 +396,10 @@ class GamePlayController:
         if pile is None:
             return None
         try:
+            table = self.engine.service.table
+            if isinstance(table, GameTable):
+                slot = table.pile_slot(pile)    # O(1) through Pile.slot
+                return slot if slot >= 0 else None
             # Updated names to match GameTable model
             tableau_piles = self.engine.service.table.pile_base
             for i, tableau_pile in enumerate(tableau_piles):
@@ -877,6 +976,18 @@ class GamePlayController:
         # Vocalize (hint will be None, so only message speaks)
         self._speak_with_hint(msg, hint)
     
+    def _request_hint(self) -> None:
+        """SHIFT+H: Suggest a move (searched in background by the engine)."""
+        log.info_query_requested("hint")
+        self.engine.request_hint()
+        # Message already vocalized by engine
+    
+    def _request_win_probability(self) -> None:
+        """SHIFT+V: Estimated chance to win (simulated in background by the engine)."""
+        log.info_query_requested("win_probability")
+        self.engine.request_win_probability()
+        # Message already vocalized by engine
+    
     def _get_settings(self) -> None:
         """I: Get current game settings with hint support (v1.5.0)."""
         log.info_query_requested("settings_info")
@@ -911,6 +1022,14 @@ F: posizione cursore.
 X: info carta.
 G: stato tavolo.
 R: report partita.
+SHIFT più H: suggerimento mossa.
+SHIFT più V: probabilità di vittoria.
+SHIFT più R: rivedi l'ultima partita, o chiudi il replay.
+Durante il replay:
+SHIFT più P: pausa o ripresa.
+SHIFT più freccia su o giù: velocità.
+SHIFT più freccia sinistra o destra: mossa precedente o successiva.
+SHIFT più Home o Fine: inizio o fine.
 N: nuova partita.
 O: apri finestra opzioni.
 ESC: abbandona partita."""
@@ -992,6 +1111,137 @@ ESC: abbandona partita."""
                 self._just_opened_options = True  # Prevent immediate close from key repeat
                 self._vocalizza(msg, interrupt=True)
     
+    # === REPLAY ===
+    
+    def start_replay(self, replay: Replay, speed: float = 1.0) -> bool:
+        """Open a recorded game on the table and start playing it.
+        
+        Playback advances on ``replay_tick()``, called by the timer
+        registered with ``set_on_replay_timer()`` at the step interval;
+        announcements are throttled at high speed.
+        
+        Args:
+            replay: Recorded game
+            speed: Playback speed (1-50x)
+        
+        Returns:
+            True if the replay is playing
+        """
+        player = self.engine.open_replay(replay)
+        if player is None:
+            self._vocalizza("Replay non disponibile.")
+            return False
+        self.replay_playback = ReplayPlayback(
+            player,
+            announce=lambda text: self._vocalizza(text, interrupt=False),
+            speed=speed,
+            on_step=self._notify_board_changed,
+        )
+        self._notify_board_changed()
+        self._vocalizza(f"Replay di {player.length} mosse, velocità {self.replay_playback.speed:g}x.")
+        self.replay_playback.play()
+        self._sync_replay_timer()
+        return True
+    
+    def replay_tick(self) -> None:
+        """Advance the open replay (no-op without one)."""
+        playback = self.replay_playback
+        if playback is not None:
+            playback.update()
+            if not playback.playing:
+                self._sync_replay_timer()  # Replay ended
+    
+    def toggle_replay_pause(self) -> None:
+        """Pause or resume the open replay."""
+        playback = self.replay_playback
+        if playback is None:
+            return
+        if playback.playing:
+            playback.pause()
+            self._vocalizza("Replay in pausa. " + playback.position_text() + ".")
+        else:
+            playback.play()
+            self._vocalizza("Replay ripreso.")
+        self._sync_replay_timer()
+    
+    def set_replay_speed(self, speed: float) -> None:
+        """Change the replay speed (clamped to 1-50x)."""
+        if self.replay_playback is not None:
+            self.replay_playback.speed = speed
+            self._sync_replay_timer()
+            self._vocalizza(f"Velocità {self.replay_playback.speed:g}x.")
+    
+    def replay_seek(self, position: int) -> None:
+        """Jump the open replay to the position after ``position`` moves."""
+        if self.replay_playback is not None:
+            self.replay_playback.seek(position)
+    
+    def stop_replay(self) -> None:
+        """Close the replay, leaving the table at the replayed position."""
+        if self.replay_playback is not None:
+            self.replay_playback.pause()
+            self.replay_playback = None
+            self._sync_replay_timer()
+            self._vocalizza("Replay chiuso.")
+    
+    # === REPLAY KEYS ===
+    
+    def replay_last_game(self) -> bool:
+        """Replay the last recorded game in place of the current one.
+        
+        Returns:
+            True if the replay is playing
+        """
+        storage = self.engine.replay_storage
+        replay_ids = storage.list_ids() if storage is not None else []
+        replay = self.engine.load_replay(replay_ids[-1]) if replay_ids else None
+        if replay is None:
+            self._vocalizza("Nessuna partita registrata.")
+            return False
+        return self.start_replay(replay)
+    
+    def _has_replay(self) -> bool:
+        """Whether SHIFT+R has something to do (open replay or recorded game)."""
+        if self.replay_playback is not None:
+            return True
+        storage = self.engine.replay_storage
+        return storage is not None and bool(storage.list_ids())
+    
+    def _toggle_replay(self) -> None:
+        """SHIFT+R: Replay the last recorded game, or close the open replay.
+        
+        A running game is never replaced silently: with ``on_replay_request``
+        the app confirms and ends it first, otherwise the replay is refused.
+        """
+        if self.replay_playback is not None:
+            self.stop_replay()
+            return
+        if self.engine.is_game_running():
+            if self.on_replay_request is not None:
+                self.on_replay_request()
+            else:
+                self._vocalizza("Partita in corso: abbandonala prima di rivedere un replay.")
+            return
+        self.replay_last_game()
+    
+    # The keys below are bound only while a replay is open; otherwise
+    # SHIFT+P/arrows/HOME/END fall through to the plain commands.
+    
+    def _replay_speed_key(self, factor: float) -> None:
+        """SHIFT+UP/DOWN: Double or halve the replay speed."""
+        if self.replay_playback is not None:
+            self.set_replay_speed(self.replay_playback.speed * factor)
+    
+    def _replay_step_key(self, delta: int) -> None:
+        """SHIFT+LEFT/RIGHT: Move the replay one move back or forward."""
+        if self.replay_playback is not None:
+            self.replay_seek(self.replay_playback.player.position + delta)
+    
+    def _replay_edge_key(self, end: bool) -> None:
+        """SHIFT+HOME/END: Jump to the start or the end of the replay."""
+        if self.replay_playback is not None:
+            self.replay_seek(self.replay_playback.player.length if end else 0)
+    
     # === OPTIONS WINDOW HANDLERS ===
     
     def _handle_options_events(self, event: pygame.event.Event) -> None:
@@ -1158,6 +1408,8 @@ ESC: abbandona partita."""
             - SHIFT+1-4: Jump to foundation pile
             - SHIFT+S: Jump to waste pile
             - SHIFT+M: Jump to stock pile
+            - SHIFT+H: Suggest a move
+            - SHIFT+V: Estimated win probability
             - Arrow keys: Cursor navigation
             - HOME/END: First/last card in pile
             - TAB: Jump to different pile type
@@ -1185,6 +1437,13 @@ ESC: abbandona partita."""
             - N: New game
             - O: Options window
             - CTRL+ALT+W: Debug force victory
+            
+            Replay (SHIFT+R with a recorded game, the rest while a replay is open):
+            - SHIFT+R: Replay the last recorded game / close the replay
+            - SHIFT+P: Pause or resume
+            - SHIFT+UP/DOWN: Double or halve the speed
+            - SHIFT+LEFT/RIGHT: Previous or next move
+            - SHIFT+HOME/END: Start or end of the game
         
         Note:
             Does not call event.Skip() - caller decides whether to propagate.
@@ -1237,6 +1496,53 @@ ESC: abbandona partita."""
             elif key_code in (ord('M'), ord('m')):
                 self._nav_pile_mazzo()
                 return True
+            
+            # SHIFT+H: Move hint (suggerimento), H help without a game
+            elif key_code in (ord('H'), ord('h')) and self.engine.is_game_running():
+                self._request_hint()
+                return True
+            
+            # SHIFT+V: Win probability (probabilità di vittoria)
+            elif key_code in (ord('V'), ord('v')):
+                self._request_win_probability()
+                return True
+            
+            # SHIFT+R: Replay last game / close replay (R report without replays)
+            elif key_code in (ord('R'), ord('r')) and self._has_replay():
+                self._toggle_replay()
+                return True
+            
+            # Replay controls: only while a replay is open, otherwise
+            # P draws and arrows/HOME/END move the cursor as usual
+            elif self.replay_playback is not None:
+                # SHIFT+P: Pause/resume replay
+                if key_code in (ord('P'), ord('p')):
+                    self.toggle_replay_pause()
+                    return True
+                
+                # SHIFT+UP/DOWN: Replay speed
+                elif key_code in (wx.WXK_UP, wx.WXK_NUMPAD_UP):
+                    self._replay_speed_key(2.0)
+                    return True
+                elif key_code in (wx.WXK_DOWN, wx.WXK_NUMPAD_DOWN):
+                    self._replay_speed_key(0.5)
+                    return True
+                
+                # SHIFT+LEFT/RIGHT: Replay previous/next move
+                elif key_code in (wx.WXK_LEFT, wx.WXK_NUMPAD_LEFT):
+                    self._replay_step_key(-1)
+                    return True
+                elif key_code in (wx.WXK_RIGHT, wx.WXK_NUMPAD_RIGHT):
+                    self._replay_step_key(1)
+                    return True
+                
+                # SHIFT+HOME/END: Replay start/end
+                elif key_code in (wx.WXK_HOME, wx.WXK_NUMPAD_HOME):
+                    self._replay_edge_key(end=False)
+                    return True
+                elif key_code in (wx.WXK_END, wx.WXK_NUMPAD_END):
+                    self._replay_edge_key(end=True)
+                    return True
         
         # ═══════════════════════════════════════════════════════════
         # PRIORITY 2: CTRL COMBINATIONS
@@ -1444,6 +1750,46 @@ ESC: abbandona partita."""
                 elif event.key == pygame.K_m:
                     self._nav_pile_mazzo()
                     return
+                # SHIFT+H: Suggerimento (H aiuto senza partita)
+                elif event.key == pygame.K_h and self.engine.is_game_running():
+                    self._request_hint()
+                    return
+                # SHIFT+V: Probabilità di vittoria
+                elif event.key == pygame.K_v:
+                    self._request_win_probability()
+                    return
+                # SHIFT+R: Rivedi ultima partita / chiudi replay (R senza replay)
+                elif event.key == pygame.K_r and self._has_replay():
+                    self._toggle_replay()
+                    return
+                # Comandi replay: solo con un replay aperto, altrimenti
+                # P pesca e frecce/HOME/FINE muovono il cursore
+                elif self.replay_playback is not None:
+                    # SHIFT+P: Pausa replay
+                    if event.key == pygame.K_p:
+                        self.toggle_replay_pause()
+                        return
+                    # SHIFT+SU/GIÙ: Velocità replay
+                    elif event.key == pygame.K_UP:
+                        self._replay_speed_key(2.0)
+                        return
+                    elif event.key == pygame.K_DOWN:
+                        self._replay_speed_key(0.5)
+                        return
+                    # SHIFT+SINISTRA/DESTRA: Mossa precedente/successiva
+                    elif event.key == pygame.K_LEFT:
+                        self._replay_step_key(-1)
+                        return
+                    elif event.key == pygame.K_RIGHT:
+                        self._replay_step_key(1)
+                        return
+                    # SHIFT+HOME/FINE: Inizio/fine replay
+                    elif event.key == pygame.K_HOME:
+                        self._replay_edge_key(end=False)
+                        return
+                    elif event.key == pygame.K_END:
+                        self._replay_edge_key(end=True)
+                        return
             
             # === COMANDI NORMALI ===
             if event.key in self.callback_dict:
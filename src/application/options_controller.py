@@ -40,7 +40,7 @@ class OptionsWindowController:
     Attributes:
         settings: Reference to GameSettings (domain service)
         dialog_manager: Optional SolitarioDialogManager for native dialogs (v1.6.1)
-        cursor_position: Current option index (0-4)
+        cursor_position: Current option index (0-10)
         is_open: Window state flag
         state: Current state ("CLOSED"/"OPEN_CLEAN"/"OPEN_DIRTY")
         original_settings: Snapshot of settings at window open
@@ -61,7 +61,7 @@ class OptionsWindowController:
         self.settings = settings
         self.dialog_manager = dialog_manager
         self._audio = audio_manager
-        self.cursor_position = 0  # Current option (0-4)
+        self.cursor_position = 0  # Current option (0-10)
         self.is_open = False
         self.state = "CLOSED"
         
@@ -214,7 +214,7 @@ class OptionsWindowController:
         Returns:
             TTS message with option name, value, and hint
         """
-        self.cursor_position = (self.cursor_position - 1) % 9
+        self.cursor_position = (self.cursor_position - 1) % len(OptionsFormatter.OPTION_NAMES)
         # AUDIO navigate
         if self._audio:
             try:
@@ -230,7 +230,7 @@ class OptionsWindowController:
         Returns:
             TTS message with option name, value, and hint
         """
-        self.cursor_position = (self.cursor_position + 1) % 9
+        self.cursor_position = (self.cursor_position + 1) % len(OptionsFormatter.OPTION_NAMES)
         # AUDIO navigate
         if self._audio:
             try:
@@ -241,19 +241,19 @@ class OptionsWindowController:
         return self._format_current_option(include_hint=True)
     
     def jump_to_option(self, index: int) -> str:
-        """Jump directly to option by number (1-8).
+        """Jump directly to option by number (1-11).
         
         Args:
-            index: Option index (0-7)
+            index: Option index (0-10)
         
         Returns:
             TTS message (concise, no hint)
         
         Example:
             >>> controller.jump_to_option(2)
-            "3 di 9: Carte Pescate, 1 Carta."
+            "3 di 11: Carte Pescate, 1 Carta."
         """
-        if 0 <= index <= 8:
+        if 0 <= index < len(OptionsFormatter.OPTION_NAMES):
             self.cursor_position = index
             return self._format_current_option(include_hint=False)
         else:
@@ -293,6 +293,8 @@ class OptionsWindowController:
             self._modify_scoring,        # 6: Sistema Punti (NEW)
             self._modify_timer_strict_mode,  # 7: Modalità Timer (v1.5.2.2)
             self._modify_score_warning_level,  # 8: Avvisi Soglie Punteggio (v2.6.1)
+            self._modify_safe_auto_play,   # 9: Spostamento Automatico Sicuro
+            self._modify_offer_stuck_loss,  # 10: Proposta di Resa per Partita Bloccata
         ]
         
         msg = handlers[self.cursor_position]()
@@ -402,7 +404,9 @@ class OptionsWindowController:
             "Suggerimenti comandi": self.settings.get_command_hints_display(),
             "Sistema Punti": self.settings.get_scoring_display(),
             "Modalità Timer": self.settings.get_timer_strict_mode_display(),
-            "Avvisi Soglie Punteggio": self.settings.get_score_warning_level_display()
+            "Avvisi Soglie Punteggio": self.settings.get_score_warning_level_display(),
+            "Spostamento automatico sicuro": self.settings.get_safe_auto_play_display(),
+            "Proposta di resa per partita bloccata": self.settings.get_offer_stuck_loss_display()
         }
         
         return OptionsFormatter.format_all_settings(settings_dict)
@@ -440,7 +444,9 @@ class OptionsWindowController:
             self.settings.get_command_hints_display,    # v1.5.0
             self.settings.get_scoring_display,          # NEW
             self.settings.get_timer_strict_mode_display, # v1.5.2.2
-            self.settings.get_score_warning_level_display # v2.6.1
+            self.settings.get_score_warning_level_display, # v2.6.1
+            self.settings.get_safe_auto_play_display,
+            self.settings.get_offer_stuck_loss_display
         ]
         
         value = value_getters[self.cursor_position]()
@@ -475,6 +481,8 @@ class OptionsWindowController:
             6: "scoring_enabled",
             7: "timer_strict_mode",
             8: "score_warning_level",  # v2.6.1 - Never locked
+            9: "safe_auto_play",
+            10: "offer_stuck_loss",
         }
         
         option_name = option_map.get(self.cursor_position)
@@ -506,6 +514,8 @@ class OptionsWindowController:
             6: "Sistema Punti",
             7: "Modalità Timer",
             8: "Avvisi Soglie Punteggio",
+            9: "Spostamento Automatico Sicuro",
+            10: "Proposta di Resa per Partita Bloccata",
         }
         
         option_name = option_names.get(self.cursor_position, "Opzione")
@@ -657,6 +667,24 @@ class OptionsWindowController:
             log.settings_changed("score_warning_level", old_value.name, new_value.name)
         return msg
     
+    def _modify_safe_auto_play(self) -> str:
+        """Toggle safe auto-play (Attivo <-> Disattivato)."""
+        success, msg = self.settings.toggle_safe_auto_play()
+        if not success:
+            return msg
+        return OptionsFormatter.format_option_changed(
+            OptionsFormatter.OPTION_NAMES[9], self.settings.get_safe_auto_play_display()
+        )
+    
+    def _modify_offer_stuck_loss(self) -> str:
+        """Toggle the loss offer for stuck positions (Attiva <-> Disattivata)."""
+        success, msg = self.settings.toggle_offer_stuck_loss()
+        if not success:
+            return msg
+        return OptionsFormatter.format_option_changed(
+            OptionsFormatter.OPTION_NAMES[10], self.settings.get_offer_stuck_loss_display()
+        )
+    
     # ========================================
     # STATE MANAGEMENT
     # ========================================
@@ -672,6 +700,8 @@ class OptionsWindowController:
             "command_hints": self.settings.command_hints_enabled,  # v1.5.0
             "timer_strict_mode": self.settings.timer_strict_mode,  # v1.5.2.2
             "score_warning_level": self.settings.score_warning_level,  # v2.6.1
+            "safe_auto_play": self.settings.safe_auto_play,
+            "offer_stuck_loss": self.settings.offer_stuck_loss,
             "display_mode": self.settings.display_mode,
             "visual_theme": self.settings.visual_theme,
         }
@@ -686,6 +716,8 @@ class OptionsWindowController:
         self.settings.command_hints_enabled = self.original_settings["command_hints"]  # v1.5.0
         self.settings.timer_strict_mode = self.original_settings["timer_strict_mode"]  # v1.5.2.2
         self.settings.score_warning_level = self.original_settings["score_warning_level"]  # v2.6.1
+        self.settings.safe_auto_play = self.original_settings.get("safe_auto_play", self.settings.safe_auto_play)
+        self.settings.offer_stuck_loss = self.original_settings.get("offer_stuck_loss", self.settings.offer_stuck_loss)
         self.settings.display_mode = self.original_settings.get("display_mode", self.settings.display_mode)
         self.settings.visual_theme = self.original_settings.get("visual_theme", self.settings.visual_theme)
     
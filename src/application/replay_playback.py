@@ -0,0 +1,187 @@
+"""Timed playback of recorded games.
+
+Drives a ReplayPlayer from a periodic tick (a timer running at
+``step_interval``) at 1x-50x speed. The number of actions due is
+computed from the elapsed time, so the playback speed does not depend
+on the tick rate; spoken announcements are throttled to one per ``ANNOUNCE_INTERVAL`` seconds
+(the latest action wins), so fast playback never floods the screen
+reader queue.
+"""
+
+import time
+from typing import Callable, Optional
+
+from src.domain.models.compact_table import WASTE_SLOT
+from src.domain.services.replay import ReplayAction, ReplayOp
+from src.domain.services.replay_player import ReplayPlayer
+
+
+class ReplayPlayback:
+    """Plays a replay over time with throttled announcements.
+
+    Attributes:
+        player: Replay player holding the position
+        playing: Whether playback is running (False when paused or ended)
+
+    Example:
+        >>> playback = ReplayPlayback(player, announce=speak, speed=10)
+        >>> playback.play()
+        >>> playback.update()   # From the periodic timer: plays due actions
+    """
+
+    MIN_SPEED = 1.0
+    MAX_SPEED = 50.0
+    SECONDS_PER_ACTION = 1.0    # At 1x
+    ANNOUNCE_INTERVAL = 1.0     # Minimum seconds between announcements
+
+    def __init__(
+        self,
+        player: ReplayPlayer,
+        announce: Callable[[str], None],
+        speed: float = 1.0,
+        on_step: Optional[Callable[[], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize paused playback.
+
+        Args:
+            player: Replay player (at any position)
+            announce: Speaks a message (e.g. TTS without interrupt)
+            speed: Playback speed (clamped to 1-50)
+            on_step: Called after every update that changed the position
+            clock: Time source in seconds (injectable for tests)
+        """
+        self.player = player
+        self.playing = False
+        self._announce_cb = announce
+        self._on_step = on_step
+        self._clock = clock
+        self._speed = self._clamp(speed)
+        self._last_tick = clock()
+        self._budget = 0.0
+        self._last_announce: Optional[float] = None
+
+    @classmethod
+    def _clamp(cls, speed: float) -> float:
+        return max(cls.MIN_SPEED, min(cls.MAX_SPEED, float(speed)))
+
+    @property
+    def speed(self) -> float:
+        """Playback speed (1-50x)."""
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        self._speed = self._clamp(value)
+
+    @property
+    def step_interval(self) -> float:
+        """Seconds between two actions at the current speed."""
+        return self.SECONDS_PER_ACTION / self._speed
+
+    # ========================================
+    # CONTROLS
+    # ========================================
+
+    def play(self) -> None:
+        """Start or resume playback."""
+        if self.player.at_end:
+            return
+        self.playing = True
+        self._last_tick = self._clock()
+        self._budget = 0.0
+
+    def pause(self) -> None:
+        """Pause playback."""
+        self.playing = False
+
+    def update(self) -> int:
+        """Play the actions due since the last update.
+
+        Returns:
+            Number of actions played
+        """
+        if not self.playing:
+            return 0
+        now = self._clock()
+        self._budget += (now - self._last_tick) * self._speed / self.SECONDS_PER_ACTION
+        self._last_tick = now
+
+        played = 0
+        action = None
+        player = self.player
+        while self._budget >= 1.0 and not player.at_end:
+            action = player.step()
+            self._budget -= 1.0
+            played += 1
+
+        if played:
+            if self._on_step:
+                self._on_step()
+            if player.at_end:
+                self.playing = False
+                self._announce(self.describe(action) + " Fine del replay.", force=True)
+            else:
+                self._announce(self.describe(action))
+        return played
+
+    def seek(self, position: int) -> int:
+        """Jump to the position after ``position`` actions and announce it.
+
+        Returns:
+            Position reached
+        """
+        position = self.player.seek(position)
+        self._budget = 0.0
+        if self._on_step:
+            self._on_step()
+        self._announce(self.position_text(), force=True)
+        return position
+
+    # ========================================
+    # ANNOUNCEMENTS
+    # ========================================
+
+    def _announce(self, text: str, force: bool = False) -> None:
+        """Speak unless another announcement was made too recently."""
+        now = self._clock()
+        if (not force and self._last_announce is not None
+                and now - self._last_announce < self.ANNOUNCE_INTERVAL):
+            return
+        self._last_announce = now
+        self._announce_cb(text)
+
+    def position_text(self) -> str:
+        """Current position, e.g. "Mossa 12 di 140"."""
+        return f"Mossa {self.player.position} di {self.player.length}"
+
+    def describe(self, action: Optional[ReplayAction]) -> str:
+        """Announcement of the last action played (at the current position)."""
+        prefix = self.position_text()
+        if action is None:
+            return prefix + "."
+        table = self.player.service.table
+        op = action.op
+        if op == ReplayOp.MOVE:
+            target = table.pile[action.target]
+            card = target.cards[-action.card_count] if target.get_card_count() >= action.card_count else None
+            name = card.get_display_name() if card else "carte"
+            return (f"{prefix}: {name} da {_pile_label(action.source)} "
+                    f"a {_pile_label(action.target)}.")
+        if op == ReplayOp.DRAW:
+            top = table.pile[WASTE_SLOT].get_top_card()
+            return f"{prefix}: pescata, {top.get_display_name()} sugli scarti." if top else f"{prefix}: pescata."
+        if op == ReplayOp.RECYCLE:
+            return f"{prefix}: scarti rimessi nel mazzo."
+        if op == ReplayOp.UNDO:
+            return f"{prefix}: mossa annullata."
+        return f"{prefix}: mossa ripetuta."
+
+
+def _pile_label(slot: int) -> str:
+    """Spoken name of a pile slot."""
+    if slot < 7:
+        return f"pila {slot + 1}"
+    if slot < 11:
+        return f"fondazione {slot - 6}"
+    return "scarti" if slot == WASTE_SLOT else "mazzo"
@@ -5,7 +5,7 @@ Provides a clean Card model compatible with both French and Neapolitan decks.
 """
 
 from enum import Enum
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
 class Suit(Enum):
@@ -58,6 +58,69 @@ class Rank(Enum):
         self.name_it = name_it
 
 
+class CardFace(NamedTuple):
+    """Immutable, interned identity of a deck card (flyweight).
+    
+    One instance exists per card of each deck type (52 French, 40
+    Neapolitan), built once by ``ProtoDeck.card_faces()`` and shared by
+    every Card created from it. Numeric fields are precomputed so rule
+    checks become integer comparisons instead of string properties.
+    
+    Face-up/face-down state is NOT part of the identity: it belongs to
+    the pile (see CompactTable) or to the legacy Card wrapper.
+    
+    Attributes:
+        card_id: Deck id, equal to the CompactTable card code
+        value: Numeric value (1 = Ace, King = 13 French / 10 Neapolitan)
+        suit_index: Index of the suit in deck.SUITES
+        color_bit: 1 for red suits, 0 for black suits
+        valore: Legacy string value (e.g. "Regina")
+        seme: Legacy suit name (e.g. "cuori")
+        nome: Display name (e.g. "Regina di cuori")
+        colore: Legacy color string ("rosso" or "blu")
+    """
+    
+    card_id: int
+    value: int
+    suit_index: int
+    color_bit: int
+    valore: str
+    seme: str
+    nome: str
+    colore: str
+    
+    @classmethod
+    def create(
+        cls,
+        card_id: int,
+        valore: str,
+        seme: str,
+        value: int,
+        suit_index: int
+    ) -> "CardFace":
+        """Build a card identity, deriving name and color.
+        
+        Args:
+            card_id: Deck id (suit_index * ranks_per_suit + value - 1)
+            valore: Legacy string value
+            seme: Legacy suit name
+            value: Numeric value
+            suit_index: Index of the suit in deck.SUITES
+            
+        Returns:
+            New CardFace
+        """
+        colore = Card._determine_color(seme)
+        return cls(
+            card_id, value, suit_index, 1 if colore == "rosso" else 0,
+            valore, seme, f"{valore} di {seme}", colore
+        )
+    
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"CardFace({self.card_id}, {self.nome!r})"
+
+
 class Card:
     """Represents a playing card.
     
@@ -92,6 +155,34 @@ class Card:
         self._valore_numerico: Optional[int] = None
         self._rank = rank
         self._suit = suit
+        self._face: Optional[CardFace] = None
+    
+    @classmethod
+    def from_face(cls, face: CardFace, coperta: bool = True) -> "Card":
+        """Create a Card bound to an interned identity.
+        
+        All legacy fields are copied from the precomputed face, skipping
+        the string formatting and color lookup done by the setters.
+        
+        Args:
+            face: Shared card identity (see ProtoDeck.card_faces)
+            coperta: Whether the card starts face-down
+            
+        Returns:
+            New Card instance with ``face`` set
+        """
+        card = cls(face.valore, face.seme, coperta)
+        card._nome = face.nome
+        card._id = face.card_id
+        card._colore = face.colore
+        card._valore_numerico = face.value
+        card._face = face
+        return card
+    
+    @property
+    def face(self) -> Optional[CardFace]:
+        """Interned identity (None for cards not created by a deck)."""
+        return self._face
     
     @property
     def rank(self) -> Optional[Rank]:
@@ -188,26 +279,32 @@ class Card:
     def set_name(self, name: str) -> None:
         """Set card name."""
         self._nome = name
+        self._face = None
     
     def set_id(self, card_id: int) -> None:
         """Set card ID."""
         self._id = card_id
+        self._face = None
     
     def set_suit(self, suit: str) -> None:
         """Set card suit."""
         self._seme = suit
+        self._face = None
     
     def set_str_value(self, value: str) -> None:
         """Set card string value."""
         self._valore = value
+        self._face = None
     
     def set_int_value(self, value: int) -> None:
         """Set card numeric value."""
         self._valore_numerico = value
+        self._face = None
     
     def set_color(self, color: str) -> None:
         """Set card color."""
         self._colore = color
+        self._face = None
     
     def set_cover(self) -> None:
         """Cover the card (face-down)."""
@@ -0,0 +1,290 @@
+"""Compact integer-encoded table state.
+
+Alternative representation of a GameTable meant for high-volume work
+(solver, hints, batch analysis) where pushing Card objects around is too
+slow. Every card is a small int and every pile is a bytearray:
+
+- Card code: ``suit_index * ranks_per_suit + (value - 1)``
+  French 0..51, Neapolitan 0..39 (same order as ``deck.crea()`` ids)
+- Face-up flag: bit 7 of the stored byte (``code | FACE_UP``)
+- Pile order: bottom to top, like ``Pile.cards``
+
+Pile slots follow the unified ``GameTable.pile`` layout:
+- [0-6]: Tableau, [7-10]: Foundations (suit i on slot 7 + i),
+  [11]: Waste, [12]: Stock
+
+Conversion to and from GameTable is lossless (card order and face-up
+state), so callers can snapshot a live game, work on the compact copy
+and write the result back.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from src.domain.models.card import Card
+from src.domain.models.deck import ProtoDeck
+from src.domain.models.table import GameTable
+
+
+FACE_UP = 0x80
+"""Bit set on a stored byte when the card is face-up."""
+
+CODE_MASK = 0x7F
+"""Mask extracting the card code from a stored byte."""
+
+TABLEAU_SLOTS = range(0, 7)
+FOUNDATION_SLOTS = range(7, 11)
+WASTE_SLOT = 11
+STOCK_SLOT = 12
+PILE_COUNT = 13
+
+_RED_SUITS = ("cuori", "quadri", "coppe", "denari")
+
+
+class CardEncoding:
+    """Integer encoding of the cards of one deck type.
+
+    Instances are immutable and shared per deck class (see ``for_deck``).
+
+    Attributes:
+        ranks_per_suit: Cards per suit (13 French, 10 Neapolitan)
+        suit_count: Number of suits (always 4)
+        card_count: Total cards in the deck (52 or 40)
+        red_suits: Tuple of bools, True if suit index is red
+    """
+
+    __slots__ = ("ranks_per_suit", "suit_count", "card_count", "red_suits")
+
+    _cache: Dict[type, "CardEncoding"] = {}
+
+    def __init__(self, ranks_per_suit: int, suits: Sequence[str]) -> None:
+        """Initialize an encoding.
+
+        Args:
+            ranks_per_suit: Number of values per suit
+            suits: Suit names in deck order (deck.SUITES)
+        """
+        self.ranks_per_suit = ranks_per_suit
+        self.suit_count = len(suits)
+        self.card_count = ranks_per_suit * len(suits)
+        self.red_suits = tuple(suit in _RED_SUITS for suit in suits)
+
+    @classmethod
+    def for_deck(cls, deck: ProtoDeck) -> "CardEncoding":
+        """Get the shared encoding for a deck's type.
+
+        Args:
+            deck: FrenchDeck or NeapolitanDeck instance
+
+        Returns:
+            Cached CardEncoding for the deck class
+        """
+        key = type(deck)
+        encoding = cls._cache.get(key)
+        if encoding is None:
+            encoding = cls(len(deck.VALUES), deck.SUITES)
+            cls._cache[key] = encoding
+        return encoding
+
+    def encode(self, suit_index: int, value: int) -> int:
+        """Encode a card from suit index and numeric value (1-based)."""
+        return suit_index * self.ranks_per_suit + value - 1
+
+    def value_of(self, code: int) -> int:
+        """Numeric value (1 = Ace) of a card code (face-up bit ignored)."""
+        return (code & CODE_MASK) % self.ranks_per_suit + 1
+
+    def suit_of(self, code: int) -> int:
+        """Suit index of a card code (face-up bit ignored)."""
+        return (code & CODE_MASK) // self.ranks_per_suit
+
+    def is_red(self, code: int) -> bool:
+        """True if the card code belongs to a red suit."""
+        return self.red_suits[(code & CODE_MASK) // self.ranks_per_suit]
+
+
+class CompactTable:
+    """Array-backed snapshot of a full table.
+
+    Attributes:
+        encoding: Card encoding for the deck type
+        piles: 13 bytearrays (see module docstring for slot layout)
+
+    Example:
+        >>> state = CompactTable.from_table(table)
+        >>> state.move(11, 7, 1)           # waste -> first foundation
+        >>> state.to_table(table)          # write back into Pile/Card objects
+    """
+
+    __slots__ = ("encoding", "piles")
+
+    def __init__(
+        self,
+        encoding: CardEncoding,
+        piles: Optional[List[bytearray]] = None
+    ) -> None:
+        """Initialize a compact table.
+
+        Args:
+            encoding: Card encoding for the deck type
+            piles: Optional list of 13 bytearrays (empty piles if None)
+        """
+        self.encoding = encoding
+        self.piles: List[bytearray] = (
+            piles if piles is not None else [bytearray() for _ in range(PILE_COUNT)]
+        )
+
+    # ========================================
+    # CONVERSION
+    # ========================================
+
+    @staticmethod
+    def encode_card(card: Card) -> int:
+        """Encode a Card (id + face-up state) as a stored byte.
+
+        Args:
+            card: Card created by a deck (must have an id)
+
+        Returns:
+            Card code with FACE_UP bit if the card is uncovered
+
+        Raises:
+            ValueError: If the card has no id (not created by a deck)
+        """
+        card_id = card.get_id
+        if card_id is None:
+            raise ValueError(f"Carta senza id non codificabile: {card}")
+        return card_id if card.get_covered else card_id | FACE_UP
+
+    @classmethod
+    def from_table(cls, table: GameTable) -> "CompactTable":
+        """Build a compact snapshot of a GameTable.
+
+        Args:
+            table: Source game table
+
+        Returns:
+            New CompactTable with the same card order and face-up state
+        """
+        encode = cls.encode_card
+        piles = [
+            bytearray(encode(card) for card in pile.cards)
+            for pile in table.pile
+        ]
+        return cls(CardEncoding.for_deck(table.mazzo), piles)
+
+    def to_table(self, table: GameTable) -> None:
+        """Write this state back into a GameTable's Pile/Card objects.
+
+        Reuses the Card instances already on the table (looked up by id),
+        so references held elsewhere (selection, cursor) stay valid.
+
+        Args:
+            table: Target game table (same deck type as this state)
+
+        Raises:
+            ValueError: If a card code has no matching Card on the table
+        """
+        cards_by_id: Dict[Optional[int], Card] = {}
+        for pile in table.pile:
+            for card in pile.cards:
+                cards_by_id[card.get_id] = card
+        for card in table.mazzo.cards:
+            cards_by_id[card.get_id] = card
+
+        for pile, data in zip(table.pile, self.piles):
+            pile.clear()
+            for byte in data:
+                found = cards_by_id.get(byte & CODE_MASK)
+                if found is None:
+                    raise ValueError(f"Codice carta sconosciuto: {byte & CODE_MASK}")
+                if byte & FACE_UP:
+                    found.set_uncover()
+                else:
+                    found.set_cover()
+                pile.aggiungi_carta(found)
+
+    def copy(self) -> "CompactTable":
+        """Get an independent copy (piles are duplicated)."""
+        return CompactTable(self.encoding, [bytearray(p) for p in self.piles])
+
+    def key(self) -> bytes:
+        """Exact byte key of the position (usable as dict key)."""
+        return b"\xff".join(bytes(p) for p in self.piles)
+
+    # ========================================
+    # QUERIES
+    # ========================================
+
+    def top(self, slot: int) -> int:
+        """Stored byte of the top card of a pile, or -1 if empty."""
+        pile = self.piles[slot]
+        return pile[-1] if pile else -1
+
+    def first_face_up(self, slot: int) -> int:
+        """Index of the first face-up card (pile length if none)."""
+        pile = self.piles[slot]
+        for i, byte in enumerate(pile):
+            if byte & FACE_UP:
+                return i
+        return len(pile)
+
+    def foundation_count(self) -> int:
+        """Total number of cards on the foundations."""
+        piles = self.piles
+        return len(piles[7]) + len(piles[8]) + len(piles[9]) + len(piles[10])
+
+    def is_won(self) -> bool:
+        """True if every card is on the foundations."""
+        return self.foundation_count() == self.encoding.card_count
+
+    # ========================================
+    # MUTATIONS (unchecked: validate with SolitaireRules first)
+    # ========================================
+
+    def move(self, source: int, target: int, count: int = 1) -> bool:
+        """Move the top ``count`` cards from source to target.
+
+        Uncovers the new top card of a tableau source pile, like
+        GameService.move_card does.
+
+        Args:
+            source: Source slot
+            target: Target slot
+            count: Number of cards to move
+
+        Returns:
+            True if a face-down card was revealed on the source pile
+        """
+        src = self.piles[source]
+        self.piles[target] += src[-count:]
+        del src[-count:]
+        if src and source < 7 and not src[-1] & FACE_UP:
+            src[-1] |= FACE_UP
+            return True
+        return False
+
+    def draw(self, count: int = 1) -> int:
+        """Draw up to ``count`` cards from stock to waste (face-up).
+
+        Returns:
+            Number of cards actually drawn
+        """
+        stock = self.piles[STOCK_SLOT]
+        waste = self.piles[WASTE_SLOT]
+        drawn = min(count, len(stock))
+        for _ in range(drawn):
+            waste.append(stock.pop() | FACE_UP)
+        return drawn
+
+    def recycle(self) -> int:
+        """Turn the waste back into the stock (reverse order, face-down).
+
+        Returns:
+            Number of cards recycled
+        """
+        waste = self.piles[WASTE_SLOT]
+        stock = self.piles[STOCK_SLOT]
+        recycled = len(waste)
+        stock.extend(byte & CODE_MASK for byte in reversed(waste))
+        waste.clear()
+        return recycled
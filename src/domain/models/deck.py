@@ -4,10 +4,23 @@ Migrated from legacy scr/decks.py with all v1.3.3 fixes.
 Supports French (52 cards) and Neapolitan (40 cards) decks.
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import random
 
-from src.domain.models.card import Card
+from src.domain.models.card import Card, CardFace
+
+
+# Deal seeds are drawn from [0, MAX_DEAL_SEED)
+MAX_DEAL_SEED = 2 ** 32
+
+
+def new_deal_seed() -> int:
+    """Generate a random deal seed (OS entropy, not the global RNG).
+    
+    Returns:
+        Seed in [0, MAX_DEAL_SEED)
+    """
+    return random.SystemRandom().randrange(MAX_DEAL_SEED)
 
 
 class ProtoDeck:
@@ -29,6 +42,9 @@ class ProtoDeck:
     VALUES: List[str] = []
     FIGURE_VALUES: Dict[str, int] = {}
     
+    # Interned identities, filled per subclass by card_faces()
+    _card_faces: Optional[Tuple[CardFace, ...]] = None
+    
     def __init__(self) -> None:
         """Initialize an empty deck."""
         self.cards: List[Card] = []
@@ -52,6 +68,33 @@ class ProtoDeck:
         """
         return []
     
+    @classmethod
+    def card_faces(cls) -> Tuple[CardFace, ...]:
+        """Get the interned card identities for this deck type.
+        
+        Built once per deck class and shared by every deck instance, so
+        ``crea()`` only wraps existing identities instead of formatting
+        names and resolving colors for each card.
+        
+        Returns:
+            Tuple of CardFace indexed by card id (suit-major order)
+        """
+        faces = cls.__dict__.get("_card_faces")
+        if faces is None:
+            faces = tuple(
+                CardFace.create(
+                    suit_index * len(cls.VALUES) + value_index,
+                    valore,
+                    seme,
+                    cls.FIGURE_VALUES.get(valore) or int(valore),
+                    suit_index
+                )
+                for suit_index, seme in enumerate(cls.SUITES)
+                for value_index, valore in enumerate(cls.VALUES)
+            )
+            cls._card_faces = faces
+        return faces
+    
     def inserisci_carte(self, carte_aggiuntive: List[Card]) -> None:
         """Insert additional cards into the deck.
         
@@ -73,7 +116,7 @@ class ProtoDeck:
             List of removed cards
         """
         carte_rimosse = self.cards[:n]
-        self.cards = self.cards[n:]
+        del self.cards[:n]
         return carte_rimosse
     
     def pesca(self) -> Card:
@@ -129,9 +172,22 @@ class ProtoDeck:
         """
         return deck.SUITES
     
-    def mischia(self) -> None:
-        """Shuffle the cards in the deck."""
-        random.shuffle(self.cards)
+    def mischia(self, rng: Optional[random.Random] = None) -> None:
+        """Shuffle the cards in the deck.
+        
+        Args:
+            rng: Generator of a seeded deal. Cards are first put back in
+                id order, so the result depends only on the generator
+                state. If None, the global ``random`` module is used.
+        
+        Example:
+            >>> deck.mischia(random.Random(1234))  # Always deal #1234
+        """
+        if rng is None:
+            random.shuffle(self.cards)
+            return
+        self.cards.sort(key=lambda card: -1 if card.get_id is None else card.get_id)
+        rng.shuffle(self.cards)
     
     def is_french_deck(self) -> bool:
         """Check if this is a French deck.
@@ -225,31 +281,13 @@ class NeapolitanDeck(ProtoDeck):
     def crea(self) -> List[Card]:
         """Create the Neapolitan deck of 40 cards.
         
-        Creates all combinations of suits and values, assigning proper
-        numeric values to each card including figure cards.
+        Wraps the interned identities from ``card_faces()``, which carry
+        the precomputed numeric values (figure cards included).
         
         Returns:
             List of 40 Card objects
         """
-        semi = self.SUITES
-        valori = self.VALUES
-        mazzo: List[Card] = []
-        i = 0
-        
-        for seme in semi:
-            for valore in valori:
-                carta = Card(valore, seme)
-                carta.set_name(f"{valore} di {seme}")
-                
-                if valore in ["Regina", "Cavallo", "Re", "Asso"]:
-                    carta.set_int_value(int(self.FIGURE_VALUES[valore]))
-                else:
-                    carta.set_int_value(int(valore))
-                
-                carta.set_id(i)
-                carta.set_color(carta._determine_color(seme))
-                mazzo.append(carta)
-                i += 1
+        mazzo = [Card.from_face(face) for face in self.card_faces()]
         
         self.cards = mazzo
         return mazzo
@@ -284,31 +322,13 @@ class FrenchDeck(ProtoDeck):
     def crea(self) -> List[Card]:
         """Create the French deck of 52 cards.
         
-        Creates all combinations of suits and values, assigning proper
-        numeric values to each card including figure cards.
+        Wraps the interned identities from ``card_faces()``, which carry
+        the precomputed numeric values (figure cards included).
         
         Returns:
             List of 52 Card objects
         """
-        semi = self.SUITES
-        valori = self.VALUES
-        mazzo: List[Card] = []
-        i = 0
-        
-        for seme in semi:
-            for valore in valori:
-                carta = Card(valore, seme)
-                carta.set_name(f"{valore} di {seme}")
-                
-                if valore in ["Jack", "Regina", "Re", "Asso"]:
-                    carta.set_int_value(int(self.FIGURE_VALUES[valore]))
-                else:
-                    carta.set_int_value(int(valore))
-                
-                carta.set_id(i)
-                carta.set_color(carta._determine_color(seme))
-                mazzo.append(carta)
-                i += 1
+        mazzo = [Card.from_face(face) for face in self.card_faces()]
         
         self.cards = mazzo
         return mazzo
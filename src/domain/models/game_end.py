@@ -40,6 +40,12 @@ class EndReason(Enum):
     TIMEOUT_STRICT = "timeout_strict"
     """Time limit expired in STRICT mode (auto-stop)."""
     
+    # ========================================
+    # STUCK POSITIONS
+    # ========================================
+    DEAD_END = "dead_end"
+    """Player accepted a loss after a stock cycle with no possible move."""
+    
     def is_victory(self) -> bool:
         """Check if reason represents a victory."""
         return self in (EndReason.VICTORY, EndReason.VICTORY_OVERTIME)
@@ -0,0 +1,96 @@
+"""Typed events published by GameService for every table change.
+
+Each event describes one change, so a subscriber (board view, counters,
+announcements) updates only what the change touched instead of
+rescanning the table. Piles are referenced by their unified slot (see
+GameTable.pile): -1 marks a pile that is not part of the table.
+- [0-6]: Tableau, [7-10]: Foundations, [11]: Waste, [12]: Stock
+
+Undo and redo publish the same events as the actions they revert or
+replay (a move back, a card covered again, ``undone`` stock actions).
+
+Example:
+    >>> service.subscribe(print)
+    >>> service.move_card(tableau1, tableau2)
+    CardsMoved(source=0, target=1, card_count=1)
+    CardRevealed(slot=0, card=..., covered=False)
+"""
+
+from typing import NamedTuple, Union
+
+from src.domain.models.card import Card
+
+
+class CardsMoved(NamedTuple):
+    """Cards moved between two piles (tableau, foundations or waste).
+
+    Attributes:
+        source: Slot the cards left
+        target: Slot the cards are now on top of
+        card_count: Cards moved
+    """
+
+    source: int
+    target: int
+    card_count: int
+
+
+class CardRevealed(NamedTuple):
+    """Top card of a tableau pile turned face up (or down again by undo).
+
+    Attributes:
+        slot: Slot of the pile
+        card: Card turned
+        covered: True if the card was turned face down (undo)
+    """
+
+    slot: int
+    card: Card
+    covered: bool = False
+
+
+class StockDrawn(NamedTuple):
+    """Cards turned from the stock onto the waste (or back by undo).
+
+    Attributes:
+        card_count: Cards drawn
+        undone: True if the cards went back on the stock (undo)
+    """
+
+    card_count: int
+    undone: bool = False
+
+
+class WasteRecycled(NamedTuple):
+    """Waste turned over onto the stock (or back by undo).
+
+    Attributes:
+        card_count: Cards recycled
+        shuffled: Whether the recycle shuffled the waste
+        undone: True if the cards went back on the waste (undo)
+    """
+
+    card_count: int
+    shuffled: bool = False
+    undone: bool = False
+
+
+class FoundationCompleted(NamedTuple):
+    """A foundation received its last card (or lost it again).
+
+    Attributes:
+        slot: Slot of the foundation (7-10)
+        completed: False if a card left the complete foundation
+    """
+
+    slot: int
+    completed: bool = True
+
+
+class TableReset(NamedTuple):
+    """Whole table replaced (new deal or loaded position): rescan everything."""
+
+
+GameEvent = Union[
+    CardsMoved, CardRevealed, StockDrawn, WasteRecycled, FoundationCompleted, TableReset
+]
@@ -0,0 +1,111 @@
+"""Undo/redo history of game actions.
+
+Each action is stored as a small reversible delta instead of a table
+snapshot: undoing or redoing an action touches only the k cards it
+moved. Piles are referenced by their unified slot (see GameTable.pile):
+- [0-6]: Tableau, [7-10]: Foundations, [11]: Waste, [12]: Stock
+"""
+
+from enum import IntEnum
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.domain.models.scoring import ScoreEvent
+
+
+class DeltaKind(IntEnum):
+    """Kind of a recorded action."""
+
+    MOVE = 0
+    DRAW = 1
+    RECYCLE = 2
+
+
+class MoveDelta(NamedTuple):
+    """Reversible record of one action.
+
+    Attributes:
+        kind: DeltaKind of the action
+        source: Source pile slot
+        target: Target pile slot
+        card_count: Cards moved, drawn or recycled
+        revealed: Whether the move turned the new source top card face up
+        score_events: Scoring events recorded by the action
+        order: Recycle permutation (stock position -> waste position),
+            None for the default inversion
+    """
+
+    kind: DeltaKind
+    source: int
+    target: int
+    card_count: int
+    revealed: bool = False
+    score_events: Tuple[ScoreEvent, ...] = ()
+    order: Optional[Tuple[int, ...]] = None
+
+
+class MoveHistory:
+    """Unlimited undo/redo stacks of MoveDelta records.
+
+    Recording a new action discards the redo stack.
+
+    Example:
+        >>> history.record(delta)
+        >>> delta = history.pop_undo()   # Caller reverts it
+        >>> history.push_redo(delta)
+    """
+
+    __slots__ = ("_undo", "_redo")
+
+    def __init__(self) -> None:
+        """Initialize empty stacks."""
+        self._undo: List[MoveDelta] = []
+        self._redo: List[MoveDelta] = []
+
+    def record(self, delta: MoveDelta) -> None:
+        """Record a new action (clears the redo stack)."""
+        self._undo.append(delta)
+        self._redo.clear()
+
+    def pop_undo(self) -> Optional[MoveDelta]:
+        """Take the last action to undo (None if there is none)."""
+        return self._undo.pop() if self._undo else None
+
+    def pop_redo(self) -> Optional[MoveDelta]:
+        """Take the last undone action to redo (None if there is none)."""
+        return self._redo.pop() if self._redo else None
+
+    def push_undo(self, delta: MoveDelta) -> None:
+        """Put back a redone action (keeps the redo stack)."""
+        self._undo.append(delta)
+
+    def push_redo(self, delta: MoveDelta) -> None:
+        """Store an undone action for redo."""
+        self._redo.append(delta)
+
+    def clear(self) -> None:
+        """Forget all actions (new deal or position loaded)."""
+        self._undo.clear()
+        self._redo.clear()
+
+    def snapshot(self) -> Tuple[Tuple[MoveDelta, ...], Tuple[MoveDelta, ...]]:
+        """Copy of both stacks (deltas are immutable and shared)."""
+        return tuple(self._undo), tuple(self._redo)
+
+    def restore(self, snapshot: Tuple[Tuple[MoveDelta, ...], Tuple[MoveDelta, ...]]) -> None:
+        """Replace both stacks with a ``snapshot()`` copy."""
+        self._undo[:] = snapshot[0]
+        self._redo[:] = snapshot[1]
+
+    @property
+    def can_undo(self) -> bool:
+        """Whether an action can be undone."""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Whether an undone action can be redone."""
+        return bool(self._redo)
+
+    def __len__(self) -> int:
+        """Number of actions that can be undone."""
+        return len(self._undo)
@@ -5,6 +5,12 @@ Manages collections of cards for tableau, foundation, stock, and waste piles.
 
 New in v1.4.2.1 (Bug Fix #2):
 - assigned_suit attribute for foundation piles with fixed suit assignment
+
+Face-up boundary:
+- Every pile keeps face-down cards below face-up ones (tableau), or is
+  uniform (stock all down, waste/foundations all up). The index of the
+  first face-up card is tracked incrementally and re-validated in O(1)
+  on read, so flips done directly on Card objects are picked up too.
 """
 
 from typing import List, Optional
@@ -24,6 +30,10 @@ class Pile:
         pile_type: Type identifier ("base", "semi", "mazzo", "scarti")
         assigned_suit: Fixed suit for foundation piles (e.g., "Cuori", "Denari")
             NEW in v1.4.2.1: Used to validate ace placement on empty foundations
+        slot: Index in the unified GameTable.pile array (0-12), set by the
+            table; -1 for a pile not on a table
+    
+    The first face-up index is available via get_first_face_up_index().
     """
     
     def __init__(
@@ -46,6 +56,9 @@ class Pile:
         self.name: str = name
         self.pile_type: str = pile_type
         self.assigned_suit: Optional[str] = assigned_suit  # NEW (v1.4.2.1)
+        self.slot: int = -1
+        # Index of the first face-up card (== len(cards) if none)
+        self._face_up_index: int = 0
     
     def aggiungi_carta(self, card: Card) -> None:
         """Add a card to the top of the pile.
@@ -53,7 +66,10 @@ class Pile:
         Args:
             card: The card to add
         """
-        self.cards.append(card)
+        cards = self.cards
+        if self._face_up_index >= len(cards):
+            self._face_up_index = len(cards) + (1 if card.get_covered else 0)
+        cards.append(card)
     
     def rimuovi_carta(self) -> Optional[Card]:
         """Remove and return the top card from the pile.
@@ -63,7 +79,44 @@ class Pile:
         """
         if not self.cards:
             return None
-        return self.cards.pop()
+        card = self.cards.pop()
+        if self._face_up_index > len(self.cards):
+            self._face_up_index = len(self.cards)
+        return card
+    
+    def get_first_face_up_index(self) -> int:
+        """Get the index of the first face-up card.
+        
+        O(1) in normal play: the tracked index is checked against its two
+        neighbours and only rescanned if cards were flipped or the list was
+        edited behind the pile's back (e.g. a revealed tableau card).
+        
+        Returns:
+            Index of the first uncovered card, or pile size if none
+        """
+        cards = self.cards
+        index = self._face_up_index
+        size = len(cards)
+        if (
+            index > size
+            or (index < size and cards[index].get_covered)
+            or (index > 0 and not cards[index - 1].get_covered)
+        ):
+            index = size
+            for i, card in enumerate(cards):
+                if not card.get_covered:
+                    index = i
+                    break
+            self._face_up_index = index
+        return index
+    
+    def get_face_up_count(self) -> int:
+        """Get the number of face-up cards on top of the pile.
+        
+        Returns:
+            Number of uncovered cards (0 if none)
+        """
+        return len(self.cards) - self.get_first_face_up_index()
     
     def get_top_card(self) -> Optional[Card]:
         """Get the top card without removing it.
@@ -102,6 +155,7 @@ class Pile:
     def clear(self) -> None:
         """Remove all cards from the pile."""
         self.cards.clear()
+        self._face_up_index = 0
     
     def remove_last_card(self) -> Optional[Card]:
         """Remove and return the last card from the pile (same as rimuovi_carta).
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Any
+from typing import List, Any, Optional
 import uuid
 
 from src.domain.models.game_end import EndReason
@@ -113,6 +113,7 @@ class SessionOutcome:
     deck_type: str = "french"           # "french" | "neapolitan"
     draw_count: int = 1                 # 1-3 cards drawn
     shuffle_mode: str = "invert"        # "invert" | "random"
+    deal_seed: Optional[int] = None     # Deal number (None = legacy record)
     
     # ========================================
     # GAMEPLAY STATS (from GameService)
@@ -128,6 +129,7 @@ class SessionOutcome:
     # ========================================
     game_version: str = "2.7.0"         # App version
     notes: str = ""                      # User notes (future)
+    replay_id: Optional[str] = None     # Replay file (None = not recorded)
     
     @classmethod
     def create_new(cls, profile_id: str, **kwargs: Any) -> "SessionOutcome":  # type: ignore[misc]
@@ -163,13 +165,15 @@ class SessionOutcome:
             "deck_type": self.deck_type,
             "draw_count": self.draw_count,
             "shuffle_mode": self.shuffle_mode,
+            "deal_seed": self.deal_seed,
             "move_count": self.move_count,
             "draw_count_actions": self.draw_count_actions,
             "recycle_count": self.recycle_count,
             "foundation_cards": self.foundation_cards,
             "completed_suits": self.completed_suits,
             "game_version": self.game_version,
-            "notes": self.notes
+            "notes": self.notes,
+            "replay_id": self.replay_id
         }
     
     @classmethod
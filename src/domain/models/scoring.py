@@ -251,6 +251,7 @@ class FinalScore:
         victory_quality_multiplier: Quality multiplier for victory bonus (v2.0)
             Range: 0.0 (abandonment) - 1.34 (perfect)
             -1.0 = legacy score (sentinel value)
+        deal_seed: Seed of the deal played (None if unknown)
     """
     
     base_score: int
@@ -268,6 +269,7 @@ class FinalScore:
     recycle_count: int
     move_count: int
     victory_quality_multiplier: float = 0.0  # v2.0 NEW field
+    deal_seed: Optional[int] = None
     
     def get_breakdown(self) -> str:
         """Get Italian TTS-friendly breakdown of score components.
@@ -12,11 +12,19 @@ New in v1.4.2.1 (Bug Fix #2):
 - HOTFIX: Use deck.SUITES instead of deck.SEMI
 """
 
-from typing import List, Optional
+import random
+from itertools import islice
+from typing import List, Optional, Tuple
 
 from src.domain.models.deck import ProtoDeck, FrenchDeck, NeapolitanDeck
 from src.domain.models.card import Card
 from src.domain.models.pile import Pile
+from src.domain.models.talon import Talon
+from src.domain.models.zobrist import ZobristHasher
+
+
+# Attributes holding piles (assigning one refreshes GameTable.pile)
+_PILE_ATTRIBUTES = frozenset(("pile_base", "pile_semi", "pile_scarti", "pile_mazzo"))
 
 
 class GameTable:
@@ -33,8 +41,10 @@ class GameTable:
         mazzo: The deck being used for the game
         pile_base: List of 7 tableau piles (indices 0-6)
         pile_semi: List of 4 foundation piles (one per suit)
-        pile_mazzo: Stock pile for drawing cards
-        pile_scarti: Waste pile for discarded cards
+        pile_mazzo: Stock pile for drawing cards (view of ``talon``)
+        pile_scarti: Waste pile for discarded cards (view of ``talon``)
+        talon: Stock and waste stored as one card sequence
+        zobrist: Incremental position hash (rebuilt on every deal)
     """
     
     def __init__(self, deck: ProtoDeck) -> None:
@@ -66,17 +76,26 @@ class GameTable:
             for suit in deck_suits
         ]
         
-        # Stock pile (tallone coperto)
-        self.pile_mazzo: Optional[Pile] = None
-        # Waste pile (tallone scoperto)
-        self.pile_scarti: Optional[Pile] = None
+        # Stock (tallone coperto) and waste (tallone scoperto) share one
+        # card sequence: draws and recycles move a pointer
+        self.talon = Talon()
+        self.pile_mazzo: Optional[Pile] = self.talon.stock
+        self.pile_scarti: Optional[Pile] = self.talon.waste
+        # Every Card of the deck, reused by each new deal
+        self._card_pool: List[Card] = []
         self.distribuisci_carte()
     
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set an attribute; replacing a pile group refreshes ``pile``."""
+        if name in _PILE_ATTRIBUTES and self.__dict__.get(name) is not value:
+            self.__dict__["_piles"] = None
+        object.__setattr__(self, name, value)
+    
     @property
-    def pile(self) -> List[Pile]:
-        """Unified list of all piles for CursorManager compatibility.
+    def pile(self) -> Tuple[Pile, ...]:
+        """Unified array of all piles for CursorManager compatibility.
         
-        Returns list with indices:
+        Returns tuple with indices:
         - [0-6]: Tableau piles (pile_base)
         - [7-10]: Foundation piles (pile_semi)
         - [11]: Waste pile (pile_scarti)
@@ -88,24 +107,43 @@ class GameTable:
             table.pile[11] # Waste pile
             table.pile[12] # Stock pile
         
+        The tuple is built once and cached; every pile gets its index as
+        ``Pile.slot``, so ``pile_slot()`` is the O(1) inverse lookup.
+        Assigning ``pile_base``, ``pile_semi``, ``pile_scarti`` or
+        ``pile_mazzo`` rebuilds it on the next access.
+        
         Returns:
-            List of all 13 piles in order
+            Tuple of all 13 piles in order
         """
-        piles = []
-        
-        # Tableau piles (0-6)
-        piles.extend(self.pile_base)
-        
-        # Foundation piles (7-10)
-        piles.extend(self.pile_semi)
-        
-        # Waste pile (11)
-        piles.append(self.pile_scarti if self.pile_scarti else Pile(name="Scarti", pile_type="scarti"))
+        piles = self.__dict__.get("_piles")
+        if piles is None:
+            piles = self._index_piles()
+        return piles
+    
+    def _index_piles(self) -> Tuple[Pile, ...]:
+        """Build the unified pile array and number its piles."""
+        waste = self.__dict__.get("pile_scarti") or Pile(name="Scarti", pile_type="scarti")
+        stock = self.__dict__.get("pile_mazzo") or Pile(name="Mazzo", pile_type="mazzo")
+        piles = (*self.pile_base, *self.pile_semi, waste, stock)
+        for slot, pile in enumerate(piles):
+            pile.slot = slot
+        self.__dict__["_piles"] = piles
+        return piles
+    
+    def pile_slot(self, pile: Optional[Pile]) -> int:
+        """Unified slot of a pile of this table (O(1)).
         
-        # Stock pile (12)
-        piles.append(self.pile_mazzo if self.pile_mazzo else Pile(name="Mazzo", pile_type="mazzo"))
+        Args:
+            pile: Pile to locate
         
-        return piles
+        Returns:
+            Index in ``pile`` (0-12), or -1 if the pile is not on the table
+        """
+        piles = self.pile
+        slot = getattr(pile, "slot", -1)
+        if isinstance(slot, int) and 0 <= slot < len(piles) and piles[slot] is pile:
+            return slot
+        return -1
     
     def distribuisci_carte(self) -> None:
         """Distribute cards on the table at game start.
@@ -125,29 +163,45 @@ class GameTable:
         The last card in each pile is uncovered (face-up).
         Remaining cards are placed in the stock pile (pile_mazzo).
         
+        Cards are taken in a single pass from the top of the deck
+        (``mazzo.cards[0]`` first, as ``pesca()`` would), which is left
+        empty; the piles and the position hash are reused.
+        
         Fixes #25, #26: Prevents IndexError when switching decks by not
         hardcoding the number of cards remaining for stock.
         """
-        # Initialize stock and waste piles with names
-        self.pile_mazzo = Pile(name="Mazzo", pile_type="mazzo")
-        self.pile_scarti = Pile(name="Scarti", pile_type="scarti")
+        cards = self.mazzo.cards
+        self._card_pool[:] = cards
+        
+        self.pile_mazzo = self.talon.stock
+        self.pile_scarti = self.talon.waste
         
         # Distribute 28 cards to the 7 tableau piles
-        for i in range(7):
+        position = 0
+        for i, pile in enumerate(self.pile_base):
             for j in range(i + 1):
-                carta = self.mazzo.pesca()
+                carta = cards[position]
+                position += 1
                 # Last card in each pile is face-up
                 if j == i:
                     carta.set_uncover()
-                self.pile_base[i].aggiungi_carta(carta)
+                pile.aggiungi_carta(carta)
         
-        # Remaining cards go to stock pile (pile_mazzo)
+        # Remaining cards go to stock pile (pile_mazzo), face-down: the
+        # last card of the deck ends on top
         # French: 52 - 28 = 24 cards remain
         # Neapolitan: 40 - 28 = 12 cards remain
-        while len(self.mazzo.cards) > 0:
-            carta = self.mazzo.pesca()
-            carta.set_cover()  # Stock cards are face-down
-            self.pile_mazzo.aggiungi_carta(carta)
+        self.talon.reset(islice(reversed(cards), len(cards) - position))
+        cards.clear()
+        
+        # Position hash, kept up to date by GameService
+        card_count = len(self.mazzo.SUITES) * len(self.mazzo.VALUES)
+        zobrist = getattr(self, "zobrist", None)
+        if isinstance(zobrist, ZobristHasher) and zobrist.keys.card_count == card_count:
+            zobrist.recycle_count = 0
+            zobrist.rebuild(self.pile)
+        else:
+            self.zobrist = ZobristHasher.for_piles(self.pile, card_count)
     
     def put_to_base(self, card: Card, pile_index: int) -> bool:
         """Place a card on a tableau pile.
@@ -298,3 +352,36 @@ class GameTable:
         
         # Redistribute cards
         self.distribuisci_carte()
+    
+    def ridistribuisci(self, rng: Optional[random.Random] = None) -> None:
+        """Gather every card from the table, shuffle and deal again.
+        
+        Unlike ``reset()`` the same Card objects are reused: the cards
+        dealt last time are copied back into the deck list in place, no
+        pile is copied.
+        
+        Args:
+            rng: Generator of a seeded deal (see ``ProtoDeck.mischia``).
+                If None, the global ``random`` module is used.
+        
+        Example:
+            >>> table.ridistribuisci(random.Random(1234))  # Deal #1234
+        """
+        pool = self._card_pool
+        piles = self.pile
+        on_table = sum(pile.get_card_count() for pile in piles)
+        if on_table + len(self.mazzo.cards) != len(pool):
+            # Piles edited by hand: gather the cards actually on the table
+            pool[:] = self.mazzo.cards
+            for pile in piles:
+                pool.extend(pile.cards)
+        for pile in piles:
+            pile.clear()
+        
+        # Cards re-enter the deck covered (Bug #54: no inherited face state)
+        for card in pool:
+            card.set_cover()
+        
+        self.mazzo.cards[:] = pool
+        self.mazzo.mischia(rng)
+        self.distribuisci_carte()
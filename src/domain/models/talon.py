@@ -0,0 +1,464 @@
+"""Stock and waste stored as one card sequence.
+
+The talon keeps both piles in a single list cut by a split pointer:
+
+- ``cards[:split]``: waste, bottom to top
+- ``cards[split:]``: stock, top to bottom
+
+The waste top and the stock top meet at the split, so drawing a card
+only moves the pointer (and turns the card face up). Turning the waste
+over puts its first drawn card back on top of the stock, which is
+already the order of the list: a recycle resets the pointer and covers
+the cards, without copying, reversing or rebuilding any list. A
+shuffled recycle permutes the waste part in place.
+
+``stock`` and ``waste`` are Pile views of the two parts, so code using
+the Pile interface (``cards``, ``aggiungi_carta``, ``get_top_card``, ...)
+keeps working. Their ``cards`` is a live MutableSequence view in pile
+order (bottom to top) that reads the talon in place; slicing and
+concatenating it return plain lists.
+
+Example:
+    >>> talon = Talon()
+    >>> talon.stock.aggiungi_carta(card)
+    >>> talon.draw()            # Stock top face up on the waste
+    >>> talon.recycle()         # Waste turned over, O(1) list work
+"""
+
+import sys
+from abc import ABC, abstractmethod
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, MutableSequence, Optional, Sequence, SupportsIndex, Tuple, Union, overload
+
+from src.domain.models.card import Card
+from src.domain.models.pile import Pile
+
+
+class Talon:
+    """Stock and waste piles sharing one card list.
+
+    Attributes:
+        cards: Waste bottom to top, then stock top to bottom
+        split: Number of waste cards (index of the stock top)
+        stock: Pile view of the stock (pile_mazzo)
+        waste: Pile view of the waste (pile_scarti)
+    """
+
+    __slots__ = ("cards", "split", "stock", "waste")
+
+    def __init__(self) -> None:
+        """Initialize an empty talon."""
+        self.cards: List[Card] = []
+        self.split = 0
+        self.stock = StockPile(self)
+        self.waste = WastePile(self)
+
+    def reset(self, stock: Iterable[Card] = ()) -> None:
+        """Empty the talon and lay a new stock (reusing the list).
+
+        Args:
+            stock: Stock cards from top to bottom (turned face down)
+        """
+        cards = self.cards
+        cards.clear()
+        cards.extend(stock)
+        for card in cards:
+            card.set_cover()
+        self.split = 0
+        self._sync()
+
+    def draw(self) -> Card:
+        """Turn the stock top face up onto the waste (pointer move).
+
+        Returns:
+            Drawn card
+
+        Raises:
+            IndexError: If the stock is empty
+        """
+        card = self.cards[self.split]
+        card.set_uncover()
+        self.split += 1
+        self._sync()
+        return card
+
+    def undraw(self) -> Card:
+        """Put the waste top back face down on the stock (undo of a draw).
+
+        Returns:
+            Card put back
+
+        Raises:
+            IndexError: If the waste is empty
+        """
+        if not self.split:
+            raise IndexError("Scarti vuoti")
+        self.split -= 1
+        card = self.cards[self.split]
+        card.set_cover()
+        self._sync()
+        return card
+
+    def recycle(self, order: Optional[Sequence[int]] = None) -> int:
+        """Turn the waste over onto the stock.
+
+        Args:
+            order: Waste position of each new stock card from bottom to
+                top (shuffled recycle), None to invert the waste
+
+        Returns:
+            Number of recycled cards
+        """
+        cards = self.cards
+        count = self.split
+        for i in range(count):
+            cards[i].set_cover()
+        if order is not None:
+            waste = cards[:count]
+            cards[:count] = [waste[position] for position in reversed(order)]
+        self.split = 0
+        self._sync()
+        return count
+
+    def unrecycle(self, count: int, order: Optional[Sequence[int]] = None) -> None:
+        """Put the top ``count`` stock cards back on the waste (undo of a recycle).
+
+        Args:
+            count: Cards of the recycle
+            order: Order given to ``recycle`` (None if inverted)
+        """
+        cards = self.cards
+        start = self.split
+        end = start + count
+        if order is not None:
+            recycled = cards[start:end]
+            recycled.reverse()                  # Stock bottom to top
+            waste = list(recycled)
+            for card, position in zip(recycled, order):
+                waste[position] = card
+            cards[start:end] = waste
+        for i in range(start, end):
+            cards[i].set_uncover()
+        self.split = end
+        self._sync()
+
+    def _sync(self) -> None:
+        """Keep the face-up boundaries of the views (stock all face down)."""
+        self.stock._face_up_index = len(self.cards) - self.split
+        self.waste._face_up_index = 0
+
+
+class _PileCards(MutableSequence[Card]):
+    """Live view of the cards of a talon pile (bottom to top).
+
+    A MutableSequence: every method reads or writes the talon in place,
+    iteration walks it without copying and slicing copies only the cards
+    asked for. Concatenation (``view + list``, ``list + view``),
+    comparison and copies give plain lists.
+    """
+
+    __slots__ = ("_pile",)
+
+    def __init__(self, pile: "TalonPile") -> None:
+        self._pile = pile
+
+    def __len__(self) -> int:
+        return self._pile.get_size()
+
+    def __bool__(self) -> bool:
+        return self._pile.get_size() > 0
+
+    def __iter__(self) -> Iterator[Card]:
+        return self._pile._iter_cards(reverse=False)
+
+    def __reversed__(self) -> Iterator[Card]:
+        return self._pile._iter_cards(reverse=True)
+
+    def __contains__(self, value: object) -> bool:
+        return any(card is value or card == value for card in self)
+
+    @overload
+    def __getitem__(self, index: int) -> Card: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Card]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Card, List[Card]]:
+        pile = self._pile
+        cards = pile.talon.cards
+        if isinstance(index, slice):
+            positions = range(*index.indices(pile.get_size()))
+            return [cards[pile._talon_index(i)] for i in positions]
+        return cards[pile._position(index.__index__())]
+
+    @overload
+    def __setitem__(self, index: int, value: Card) -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice, value: Iterable[Card]) -> None: ...
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        pile = self._pile
+        if isinstance(index, slice):
+            cards = pile.get_all_cards()
+            cards[index] = value
+            pile._replace(cards)
+        else:
+            pile.talon.cards[pile._position(index.__index__())] = value
+
+    @overload
+    def __delitem__(self, index: int) -> None: ...
+
+    @overload
+    def __delitem__(self, index: slice) -> None: ...
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        pile = self._pile
+        if isinstance(index, slice):
+            cards = pile.get_all_cards()
+            del cards[index]
+            pile._replace(cards)
+        else:
+            pile._delete(pile._position(index.__index__()))
+
+    def insert(self, index: int, value: Card) -> None:
+        size = len(self)
+        position = index.__index__()
+        if position < 0:
+            position = max(position + size, 0)
+        self._pile._insert(min(position, size), value)
+
+    def append(self, value: Card) -> None:
+        self._pile._insert(len(self), value)
+
+    def extend(self, values: Iterable[Card]) -> None:
+        for card in list(values):
+            self.append(card)
+
+    def pop(self, index: int = -1) -> Card:
+        pile = self._pile
+        position = pile._position(index.__index__())
+        card = pile.talon.cards[position]
+        pile._delete(position)
+        return card
+
+    def remove(self, value: Card) -> None:
+        for i, card in enumerate(self):
+            if card == value:
+                del self[i]
+                return
+        raise ValueError("Carta non presente nella pila")
+
+    def clear(self) -> None:
+        self._pile._replace([])
+
+    def copy(self) -> List[Card]:
+        return self._pile.get_all_cards()
+
+    def index(self, value: Any, start: int = 0, stop: int = sys.maxsize) -> int:
+        return self.copy().index(value, start, stop)
+
+    def count(self, value: Any) -> int:
+        return sum(1 for card in self if card == value)
+
+    def reverse(self) -> None:
+        cards = self.copy()
+        cards.reverse()
+        self._pile._replace(cards)
+
+    def sort(self, *, key: Any = None, reverse: bool = False) -> None:
+        cards = self.copy()
+        cards.sort(key=key, reverse=reverse)
+        self._pile._replace(cards)
+
+    def __add__(self, other: Iterable[Card]) -> List[Card]:
+        return self.copy() + list(other)
+
+    def __radd__(self, other: Iterable[Card]) -> List[Card]:
+        return list(other) + self.copy()
+
+    def __mul__(self, times: int) -> List[Card]:
+        return self.copy() * times
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, _PileCards)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None  # type: ignore[assignment]  # Mutable, like list
+
+    def __reduce_ex__(self, protocol: SupportsIndex) -> Tuple[Any, ...]:
+        # Copies and pickles hold a plain list snapshot, not the talon
+        return list, (self.copy(),)
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+class TalonPile(Pile, ABC):
+    """Pile view of one part of a Talon.
+
+    Subclasses map pile positions (0 = bottom) to talon list indices.
+
+    Attributes:
+        talon: Talon holding the cards
+    """
+
+    def __init__(self, talon: Talon, name: str, pile_type: str) -> None:
+        """Initialize the view (before any card is added)."""
+        self.talon = talon
+        self._cards_view = _PileCards(self)
+        super().__init__(name=name, pile_type=pile_type)
+
+    # Not a list (Pile.cards is): a talon pile has no storage of its own
+    @property  # type: ignore[override]
+    def cards(self) -> MutableSequence[Card]:
+        """Live view of the cards, bottom to top."""
+        return self._cards_view
+
+    @cards.setter
+    def cards(self, value: Iterable[Card]) -> None:
+        self._replace(list(value))
+
+    def _position(self, index: int) -> int:
+        """Talon list index of a pile position (negative from the top)."""
+        size = self.get_size()
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Indice carta fuori dalla pila")
+        return self._talon_index(index)
+
+    @abstractmethod
+    def _talon_index(self, index: int) -> int:
+        """Talon list index of a valid pile position."""
+
+    @abstractmethod
+    def _iter_cards(self, reverse: bool) -> Iterator[Card]:
+        """Iterate the cards in place, bottom to top (top first if reverse)."""
+
+    @abstractmethod
+    def _insert(self, index: int, card: Card) -> None:
+        """Insert a card at a pile position (0 to size)."""
+
+    @abstractmethod
+    def _delete(self, talon_index: int) -> None:
+        """Remove the card at a talon list index."""
+
+    @abstractmethod
+    def _replace(self, cards: List[Card]) -> None:
+        """Replace every card of the pile (bottom to top)."""
+
+    def aggiungi_carta(self, card: Card) -> None:
+        """Add a card to the top of the pile."""
+        size = self.get_size()
+        if self._face_up_index >= size:
+            self._face_up_index = size + (1 if card.get_covered else 0)
+        self._insert(size, card)
+
+    def rimuovi_carta(self) -> Optional[Card]:
+        """Remove and return the top card (None if the pile is empty)."""
+        card = self.get_top_card()
+        if card is None:
+            return None
+        self._delete(self._talon_index(self.get_size() - 1))
+        if self._face_up_index > self.get_size():
+            self._face_up_index = self.get_size()
+        return card
+
+    def is_empty(self) -> bool:
+        """Check if the pile is empty."""
+        return self.get_size() == 0
+
+    def clear(self) -> None:
+        """Remove all cards from the pile."""
+        self._replace([])
+
+
+class WastePile(TalonPile):
+    """Waste view: ``talon.cards[:split]``."""
+
+    def __init__(self, talon: Talon) -> None:
+        super().__init__(talon, name="Scarti", pile_type="scarti")
+
+    def get_size(self) -> int:
+        """Get the number of cards in the pile."""
+        return self.talon.split
+
+    def get_top_card(self) -> Optional[Card]:
+        """Get the top card without removing it."""
+        talon = self.talon
+        return talon.cards[talon.split - 1] if talon.split else None
+
+    def get_all_cards(self) -> List[Card]:
+        """Get a copy of the cards, bottom to top."""
+        return self.talon.cards[:self.talon.split]
+
+    def _talon_index(self, index: int) -> int:
+        return index
+
+    def _iter_cards(self, reverse: bool) -> Iterator[Card]:
+        cards = self.talon.cards
+        if reverse:
+            return islice(reversed(cards), len(cards) - self.talon.split, None)
+        return islice(cards, self.talon.split)
+
+    def _insert(self, index: int, card: Card) -> None:
+        self.talon.cards.insert(index, card)
+        self.talon.split += 1
+
+    def _delete(self, talon_index: int) -> None:
+        del self.talon.cards[talon_index]
+        self.talon.split -= 1
+
+    def _replace(self, cards: List[Card]) -> None:
+        self.talon.cards[:self.talon.split] = cards
+        self.talon.split = len(cards)
+        self._face_up_index = 0
+
+
+class StockPile(TalonPile):
+    """Stock view: ``talon.cards[split:]`` read from the end."""
+
+    def __init__(self, talon: Talon) -> None:
+        super().__init__(talon, name="Mazzo", pile_type="mazzo")
+
+    def get_size(self) -> int:
+        """Get the number of cards in the pile."""
+        return len(self.talon.cards) - self.talon.split
+
+    def get_top_card(self) -> Optional[Card]:
+        """Get the top card without removing it."""
+        talon = self.talon
+        return talon.cards[talon.split] if talon.split < len(talon.cards) else None
+
+    def get_all_cards(self) -> List[Card]:
+        """Get a copy of the cards, bottom to top."""
+        cards = self.talon.cards[self.talon.split:]
+        cards.reverse()
+        return cards
+
+    def _talon_index(self, index: int) -> int:
+        return len(self.talon.cards) - 1 - index
+
+    def _iter_cards(self, reverse: bool) -> Iterator[Card]:
+        cards = self.talon.cards
+        if reverse:
+            return islice(cards, self.talon.split, None)
+        return islice(reversed(cards), len(cards) - self.talon.split)
+
+    def _insert(self, index: int, card: Card) -> None:
+        talon = self.talon
+        talon.cards.insert(len(talon.cards) - index, card)
+
+    def _delete(self, talon_index: int) -> None:
+        del self.talon.cards[talon_index]
+
+    def _replace(self, cards: List[Card]) -> None:
+        talon = self.talon
+        talon.cards[talon.split:] = cards[::-1]
+        self._face_up_index = len(cards)
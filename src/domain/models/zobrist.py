@@ -0,0 +1,294 @@
+"""Zobrist hashing of table positions.
+
+Each (card, location, depth, face-up) combination gets a fixed random
+64-bit key; a position hash is the XOR of the keys of every card on the
+table, so a move only touches the keys of the cards it changes.
+
+Locations are grouped as tableau, foundation, waste and stock. Tableau
+columns are hashed separately and combined through a non-linear mix:
+
+- ``value``: exact hash (column order matters)
+- ``canonical``: same combination without column salts, so positions
+  that only differ by the order of tableau columns hash the same
+
+Keys are generated from a fixed seed: hashes are stable across runs and
+processes (usable for caches shared by worker processes).
+"""
+
+import random
+from array import array
+from typing import Dict, Iterable, Sequence
+
+from src.domain.models.card import Card
+from src.domain.models.pile import Pile
+
+
+# Location groups of the key table
+LOC_TABLEAU = 0
+LOC_FOUNDATION = 1
+LOC_WASTE = 2
+LOC_STOCK = 3
+
+_MASK64 = (1 << 64) - 1
+_SEED = 0x5EED_C0DE
+_MAX_RECYCLES = 64
+
+
+def _mix(value: int) -> int:
+    """Non-linear 64-bit bijection (splitmix64 finalizer)."""
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+def _location(slot: int) -> int:
+    """Location group of a unified pile slot (see GameTable.pile)."""
+    if slot < 7:
+        return LOC_TABLEAU
+    if slot < 11:
+        return LOC_FOUNDATION
+    return LOC_WASTE if slot == 11 else LOC_STOCK
+
+
+class ZobristKeys:
+    """Random key tables for one deck size (shared, read-only).
+
+    Attributes:
+        card_count: Number of cards in the deck
+        keys: Flat array of card keys (see ``key``)
+        column_salts: Per-column salt for the exact hash
+        recycle_keys: Keys for the recycle counter
+    """
+
+    __slots__ = ("card_count", "keys", "column_salts", "recycle_keys")
+
+    _cache: Dict[int, "ZobristKeys"] = {}
+
+    def __init__(self, card_count: int) -> None:
+        """Generate the key tables.
+
+        Args:
+            card_count: Number of cards in the deck (52 or 40)
+        """
+        rng = random.Random(_SEED + card_count)
+        size = card_count * 4 * card_count * 2
+        self.card_count = card_count
+        self.keys = array("Q", (rng.getrandbits(64) for _ in range(size)))
+        self.column_salts = tuple(rng.getrandbits(64) for _ in range(7))
+        self.recycle_keys = tuple(rng.getrandbits(64) for _ in range(_MAX_RECYCLES))
+
+    @classmethod
+    def for_count(cls, card_count: int) -> "ZobristKeys":
+        """Get the shared key tables for a deck size."""
+        keys = cls._cache.get(card_count)
+        if keys is None:
+            keys = cls(card_count)
+            cls._cache[card_count] = keys
+        return keys
+
+    def key(self, code: int, slot: int, depth: int, face_up: bool) -> int:
+        """Key of a card at a given pile slot and depth.
+
+        Args:
+            code: Card id / compact code
+            slot: Unified pile slot (0-12)
+            depth: Position in the pile (0 = bottom)
+            face_up: Whether the card is uncovered
+
+        Returns:
+            64-bit key
+        """
+        count = self.card_count
+        index = ((code * 4 + _location(slot)) * count + depth) * 2 + face_up
+        return self.keys[index]
+
+
+class ZobristHasher:
+    """Incrementally maintained hash of one table.
+
+    Callers report every card that enters or leaves a pile (``toggle``,
+    ``toggle_run``, ``transfer``) and every flip (``flip``); direct edits
+    of ``Pile.cards`` must be followed by ``rebuild``. Cards without a
+    deck id are ignored.
+
+    Attributes:
+        keys: Shared key tables
+        columns: Hash of each tableau column
+        rest: Hash of foundations, waste and stock
+        recycle_count: Waste recycles (only in ``value_with_recycles``)
+
+    Example:
+        >>> hasher = ZobristHasher.for_piles(table.pile, 52)
+        >>> seen.add(hasher.canonical)
+    """
+
+    __slots__ = ("keys", "columns", "rest", "recycle_count")
+
+    def __init__(self, card_count: int) -> None:
+        """Initialize an empty-table hasher.
+
+        Args:
+            card_count: Number of cards in the deck (52 or 40)
+        """
+        self.keys = ZobristKeys.for_count(card_count)
+        self.columns = [0] * 7
+        self.rest = 0
+        self.recycle_count = 0
+
+    @classmethod
+    def for_piles(cls, piles: Sequence[Pile], card_count: int) -> "ZobristHasher":
+        """Build a hasher for the 13 unified piles of a table.
+
+        Args:
+            piles: Piles in GameTable.pile order
+            card_count: Number of cards in the deck
+
+        Returns:
+            Hasher initialized with the current position
+        """
+        hasher = cls(card_count)
+        hasher.rebuild(piles)
+        return hasher
+
+    # ========================================
+    # (RE)BUILD
+    # ========================================
+
+    def rebuild(self, piles: Sequence[Pile]) -> None:
+        """Recompute the hash from scratch (recycle count is kept).
+
+        Args:
+            piles: The 13 piles in GameTable.pile order
+        """
+        keys = self.keys.keys
+        count = self.keys.card_count
+        columns = [0] * 7
+        rest = 0
+        for slot, pile in enumerate(piles):
+            location = _location(slot)
+            value = 0
+            # Inlined ZobristKeys.key (a new deal hashes every card)
+            for depth, card in enumerate(pile.cards):
+                code = card.get_id
+                if code is not None:
+                    value ^= keys[((code * 4 + location) * count + depth) * 2 + (not card.get_covered)]
+            if slot < 7:
+                columns[slot] = value
+            else:
+                rest ^= value
+        self.columns = columns
+        self.rest = rest
+
+    def rebuild_compact(self, piles: Sequence[bytearray]) -> None:
+        """Recompute the hash from CompactTable piles.
+
+        Args:
+            piles: The 13 compact piles (bit 7 = face-up)
+        """
+        self.columns = [0] * 7
+        self.rest = 0
+        for slot, pile in enumerate(piles):
+            for depth, byte in enumerate(pile):
+                self._toggle_code(byte & 0x7F, slot, depth, bool(byte & 0x80))
+
+    # ========================================
+    # INCREMENTAL UPDATES
+    # ========================================
+
+    def _toggle_code(self, code: int, slot: int, depth: int, face_up: bool) -> None:
+        """XOR one card key in or out of the hash."""
+        key = self.keys.key(code, slot, depth, face_up)
+        if slot < 7:
+            self.columns[slot] ^= key
+        else:
+            self.rest ^= key
+
+    def toggle(self, card: Card, slot: int, depth: int) -> None:
+        """Add or remove a card at a pile position (XOR is its own inverse).
+
+        Args:
+            card: Card entering or leaving the position (current face state)
+            slot: Unified pile slot
+            depth: Position in the pile (0 = bottom)
+        """
+        code = card.get_id
+        if code is not None:
+            self._toggle_code(code, slot, depth, not card.get_covered)
+
+    def toggle_run(self, cards: Iterable[Card], slot: int, depth: int) -> None:
+        """Toggle consecutive cards of a pile starting at ``depth``."""
+        for offset, card in enumerate(cards):
+            self.toggle(card, slot, depth + offset)
+
+    def transfer(
+        self,
+        cards: Sequence[Card],
+        source: int,
+        source_depth: int,
+        target: int,
+        target_depth: int
+    ) -> None:
+        """Move consecutive cards between piles keeping their face state.
+
+        Args:
+            cards: Moved cards (bottom to top)
+            source: Source slot
+            source_depth: Depth of the first card in the source pile
+            target: Target slot
+            target_depth: Depth of the first card in the target pile
+        """
+        self.toggle_run(cards, source, source_depth)
+        self.toggle_run(cards, target, target_depth)
+
+    def flip(self, card: Card, slot: int, depth: int) -> None:
+        """Account for a card turned over in place."""
+        code = card.get_id
+        if code is not None:
+            keys = self.keys
+            delta = keys.key(code, slot, depth, False) ^ keys.key(code, slot, depth, True)
+            if slot < 7:
+                self.columns[slot] ^= delta
+            else:
+                self.rest ^= delta
+
+    # ========================================
+    # HASH VALUES
+    # ========================================
+
+    @property
+    def value(self) -> int:
+        """Exact 64-bit hash of the position."""
+        result = self.rest
+        for column, salt in zip(self.columns, self.keys.column_salts):
+            result ^= _mix(column ^ salt)
+        return result
+
+    @property
+    def canonical(self) -> int:
+        """Hash that ignores the order of tableau columns."""
+        result = self.rest
+        for column in self.columns:
+            result ^= _mix(column)
+        return result
+
+    def value_with_recycles(self, canonical: bool = False) -> int:
+        """Hash that also distinguishes the number of waste recycles.
+
+        Args:
+            canonical: Base on the column-order independent hash
+
+        Returns:
+            64-bit hash
+        """
+        base = self.canonical if canonical else self.value
+        return base ^ self.keys.recycle_keys[min(self.recycle_count, _MAX_RECYCLES - 1)]
+
+    def copy(self) -> "ZobristHasher":
+        """Get an independent copy (keys are shared)."""
+        clone = ZobristHasher.__new__(ZobristHasher)
+        clone.keys = self.keys
+        clone.columns = list(self.columns)
+        clone.rest = self.rest
+        clone.recycle_count = self.recycle_count
+        return clone
+
@@ -1,5 +1,11 @@
 """Domain rules package for Solitaire game."""
 
 from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.rules.move_generator import (
+    LegalMoveGenerator,
+    Move,
+    MoveKind,
+    apply_move,
+)
 
-__all__ = ["SolitaireRules"]
+__all__ = ["SolitaireRules", "LegalMoveGenerator", "Move", "MoveKind", "apply_move"]
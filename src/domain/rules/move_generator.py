@@ -0,0 +1,200 @@
+"""Legal move enumeration for Klondike.
+
+Lists every legal move of a position in a single pass over the table,
+working on the integer-encoded CompactTable state. Used as the common
+primitive for hints, auto-play, solvers and dead-end detection.
+
+Move records use the unified pile slots of GameTable.pile:
+- [0-6]: Tableau, [7-10]: Foundations, [11]: Waste, [12]: Stock
+"""
+
+from enum import IntEnum
+from typing import List, NamedTuple, Union
+
+from src.domain.models.compact_table import (
+    CODE_MASK,
+    FACE_UP,
+    STOCK_SLOT,
+    TABLEAU_SLOTS,
+    WASTE_SLOT,
+    CompactTable,
+)
+from src.domain.models.table import GameTable
+from src.domain.rules.solitaire_rules import SolitaireRules
+
+
+class MoveKind(IntEnum):
+    """Kind of a generated move."""
+
+    TABLEAU_TO_TABLEAU = 0
+    TABLEAU_TO_FOUNDATION = 1
+    WASTE_TO_FOUNDATION = 2
+    WASTE_TO_TABLEAU = 3
+    FOUNDATION_TO_TABLEAU = 4
+    DRAW = 5
+    RECYCLE = 6
+
+
+class Move(NamedTuple):
+    """Compact move record.
+
+    Attributes:
+        kind: MoveKind of the move
+        source: Source pile slot
+        target: Target pile slot
+        card_count: Cards moved (sequence length, cards drawn or recycled)
+    """
+
+    kind: MoveKind
+    source: int
+    target: int
+    card_count: int
+
+
+def apply_move(state: CompactTable, move: Move) -> bool:
+    """Apply a generated move to a compact state (no validation).
+
+    Args:
+        state: Compact state to mutate
+        move: Move produced by LegalMoveGenerator for this state
+
+    Returns:
+        True if a face-down tableau card was revealed
+    """
+    if move.kind == MoveKind.DRAW:
+        state.draw(move.card_count)
+        return False
+    if move.kind == MoveKind.RECYCLE:
+        state.recycle()
+        return False
+    return state.move(move.source, move.target, move.card_count)
+
+
+class LegalMoveGenerator:
+    """Enumerates all legal moves of a position.
+
+    Moves that leave the position unchanged (a King alone at the bottom
+    of a column moved to another empty column) are not reported.
+
+    Attributes:
+        rules: SolitaireRules providing the card-code predicates
+
+    Example:
+        >>> generator = LegalMoveGenerator(rules)
+        >>> moves = generator.generate(table, draw_count=3)
+        >>> [m for m in moves if m.kind == MoveKind.TABLEAU_TO_FOUNDATION]
+    """
+
+    def __init__(self, rules: SolitaireRules) -> None:
+        """Initialize the generator.
+
+        Args:
+            rules: Rules for the deck type being played
+        """
+        self.rules = rules
+
+    def generate(
+        self,
+        state: Union[CompactTable, GameTable],
+        draw_count: int = 1,
+        allow_recycle: bool = True
+    ) -> List[Move]:
+        """List the legal moves of a table.
+
+        Args:
+            state: CompactTable, or GameTable (converted first)
+            draw_count: Cards drawn per stock action (1 or 3)
+            allow_recycle: False if no waste recycles are left
+
+        Returns:
+            List of Move records (order: tableau sources, waste,
+            foundations, then stock action)
+        """
+        if isinstance(state, GameTable):
+            state = CompactTable.from_table(state)
+        return self.generate_compact(state, draw_count, allow_recycle)
+
+    def generate_compact(
+        self,
+        state: CompactTable,
+        draw_count: int = 1,
+        allow_recycle: bool = True
+    ) -> List[Move]:
+        """List the legal moves of a compact state.
+
+        Args:
+            state: Compact table state
+            draw_count: Cards drawn per stock action (1 or 3)
+            allow_recycle: False if no waste recycles are left
+
+        Returns:
+            List of Move records
+        """
+        can_stack = self.rules.can_stack_code
+        can_found = self.rules.can_found_code
+        ranks = state.encoding.ranks_per_suit
+        piles = state.piles
+        moves: List[Move] = []
+        append = moves.append
+
+        # Top card codes of tableau and foundations (-1 = empty)
+        tops = [pile[-1] & CODE_MASK if pile else -1 for pile in piles[:11]]
+
+        # ---- Tableau sources ----
+        for source in TABLEAU_SLOTS:
+            pile = piles[source]
+            if not pile or not pile[-1] & FACE_UP:
+                continue
+            top = tops[source]
+            foundation = top // ranks
+            if can_found(top, foundation, tops[7 + foundation]):
+                append(Move(MoveKind.TABLEAU_TO_FOUNDATION, source, 7 + foundation, 1))
+
+            # Walk down the valid face-up run, one candidate base per card
+            size = len(pile)
+            index = size - 1
+            while True:
+                code = pile[index] & CODE_MASK
+                for target in TABLEAU_SLOTS:
+                    if target == source:
+                        continue
+                    target_top = tops[target]
+                    if target_top < 0 and index == 0:
+                        continue  # Whole column onto an empty one: no-op
+                    if can_stack(code, target_top):
+                        append(Move(MoveKind.TABLEAU_TO_TABLEAU, source, target, size - index))
+                if index == 0:
+                    break
+                below = pile[index - 1]
+                if not below & FACE_UP or not can_stack(code, below & CODE_MASK):
+                    break
+                index -= 1
+
+        # ---- Waste source ----
+        waste = piles[WASTE_SLOT]
+        if waste:
+            code = waste[-1] & CODE_MASK
+            foundation = code // ranks
+            if can_found(code, foundation, tops[7 + foundation]):
+                append(Move(MoveKind.WASTE_TO_FOUNDATION, WASTE_SLOT, 7 + foundation, 1))
+            for target in TABLEAU_SLOTS:
+                if can_stack(code, tops[target]):
+                    append(Move(MoveKind.WASTE_TO_TABLEAU, WASTE_SLOT, target, 1))
+
+        # ---- Foundation sources ----
+        for source in range(7, 11):
+            code = tops[source]
+            if code < 0:
+                continue
+            for target in TABLEAU_SLOTS:
+                if can_stack(code, tops[target]):
+                    append(Move(MoveKind.FOUNDATION_TO_TABLEAU, source, target, 1))
+
+        # ---- Stock action ----
+        stock = piles[STOCK_SLOT]
+        if stock:
+            append(Move(MoveKind.DRAW, STOCK_SLOT, WASTE_SLOT, min(draw_count, len(stock))))
+        elif waste and allow_recycle:
+            append(Move(MoveKind.RECYCLE, WASTE_SLOT, STOCK_SLOT, len(waste)))
+
+        return moves
@@ -7,11 +7,89 @@ New in v1.4.2.1 (Bug Fix #2):
 - Foundation suit validation for aces on empty piles
 """
 
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from src.domain.models.deck import ProtoDeck
-from src.domain.models.card import Card
+from src.domain.models.card import Card, CardFace
 from src.domain.models.pile import Pile
+from src.domain.models.compact_table import CardEncoding
+
+
+class CompatibilityTables:
+    """Precomputed card-compatibility tables for one deck type.
+    
+    Built once per deck class (see ``for_deck``) from the interned card
+    identities, so rule checks become a single table lookup.
+    
+    Attributes:
+        faces: Interned identities of the deck (index = card code)
+        width: Row width of ``stack`` (card_count + 1)
+        stack: Bit matrix, ``stack[code * width + top + 1]`` is 1 if card
+            ``code`` can go on tableau top ``top`` (top -1 = empty pile)
+        foundation_next: Code following each card on its foundation
+            (-1 for Kings)
+        suits: Suit index of each card code
+        aces: Ace code per suit index
+        ace_codes: Set of Ace codes
+        king_codes: Set of King codes
+    """
+    
+    __slots__ = (
+        "faces", "width", "stack", "foundation_next", "suits",
+        "aces", "ace_codes", "king_codes",
+    )
+    
+    _cache: Dict[type, "CompatibilityTables"] = {}
+    
+    def __init__(self, faces: Tuple[CardFace, ...], king_value: Optional[int]) -> None:
+        """Build the tables.
+        
+        Args:
+            faces: Interned identities in card-code order
+            king_value: Numeric value of the King (None if the deck has none)
+        """
+        count = len(faces)
+        width = count + 1
+        stack = bytearray(count * width)
+        for face in faces:
+            row = face.card_id * width
+            stack[row] = face.value == king_value
+            for top in faces:
+                if face.color_bit != top.color_bit and face.value == top.value - 1:
+                    stack[row + top.card_id + 1] = 1
+        
+        by_suit_value = {(f.suit_index, f.value): f.card_id for f in faces}
+        self.faces = faces
+        self.width = width
+        self.stack = bytes(stack)
+        self.foundation_next = tuple(
+            by_suit_value.get((f.suit_index, f.value + 1), -1) for f in faces
+        )
+        self.suits = tuple(f.suit_index for f in faces)
+        self.aces = tuple(
+            by_suit_value[(suit, 1)] for suit in sorted({f.suit_index for f in faces})
+        )
+        self.ace_codes: FrozenSet[int] = frozenset(self.aces)
+        self.king_codes: FrozenSet[int] = frozenset(
+            f.card_id for f in faces if f.value == king_value
+        )
+    
+    @classmethod
+    def for_deck(cls, deck: ProtoDeck) -> "CompatibilityTables":
+        """Get the shared tables for a deck's type.
+        
+        Args:
+            deck: FrenchDeck or NeapolitanDeck instance
+            
+        Returns:
+            Cached CompatibilityTables for the deck class
+        """
+        key = type(deck)
+        tables = cls._cache.get(key)
+        if tables is None:
+            tables = cls(deck.card_faces(), deck.FIGURE_VALUES.get("Re"))
+            cls._cache[key] = tables
+        return tables
 
 
 class SolitaireRules:
@@ -28,6 +106,8 @@ class SolitaireRules:
     
     Attributes:
         deck: The deck type being used (for polymorphic checks)
+        encoding: Integer card encoding for compact-state checks
+        tables: Precomputed compatibility tables for the deck type
     """
     
     def __init__(self, deck: ProtoDeck) -> None:
@@ -37,6 +117,26 @@ class SolitaireRules:
             deck: The deck to use for polymorphic rule checks (e.g., is_king)
         """
         self.deck = deck
+        self.encoding = CardEncoding.for_deck(deck)
+        self.tables = CompatibilityTables.for_deck(deck)
+        # Hot-path aliases
+        self._faces = self.tables.faces
+        self._stack = self.tables.stack
+        self._width = self.tables.width
+    
+    def _code(self, card: Card) -> int:
+        """Card code of a card dealt from this deck type, else -1.
+        
+        Cards bound to an interned identity of the deck are answered by
+        table lookups only; other cards (built by hand, or from another
+        deck type) use the legacy string comparisons.
+        """
+        face = card.face
+        if face is None:
+            return -1
+        card_id = face.card_id
+        faces = self._faces
+        return card_id if card_id < len(faces) and faces[card_id] is face else -1
     
     # ========================================
     # TABLEAU RULES (Pile Base)
@@ -65,8 +165,12 @@ class SolitaireRules:
             >>> rules.can_place_on_tableau(black_6, pile)  # True (alternating)
             >>> rules.can_place_on_tableau(red_6, pile)    # False (same color)
         """
+        code = self._code(card)
+        
         # CRITICAL: Empty pile accepts only Kings
         if target_pile.is_empty():
+            if code >= 0:
+                return self._stack[code * self._width] == 1
             return self.deck.is_king(card)
         
         # Non-empty pile: get top card
@@ -74,6 +178,10 @@ class SolitaireRules:
         if top_card is None:
             return False
         
+        top = self._code(top_card)
+        if code >= 0 and top >= 0:
+            return self._stack[code * self._width + top + 1] == 1
+        
         # Must alternate colors AND descend by 1
         return (
             card.get_color != top_card.get_color and
@@ -131,6 +239,12 @@ class SolitaireRules:
             current = cards[i]
             next_card = cards[i + 1]
             
+            code, next_code = self._code(current), self._code(next_card)
+            if code >= 0 and next_code >= 0:
+                if not self._stack[next_code * self._width + code + 1]:
+                    return False
+                continue
+            
             # Must alternate colors
             if current.get_color == next_card.get_color:
                 return False
@@ -173,8 +287,12 @@ class SolitaireRules:
             >>> rules.can_place_on_foundation(two_spades, pile_ace)   # False
         """
         # CRITICAL: Empty foundation accepts only Aces OF CORRECT SUIT (v1.4.2.1)
+        code = self._code(card)
         if target_pile.is_empty():
-            is_ace = card.get_value == 1
+            if code >= 0:
+                is_ace = code in self.tables.ace_codes
+            else:
+                is_ace = card.get_value == 1
             
             # NEW (v1.4.2.1): Validate suit if pile has assigned suit
             if hasattr(target_pile, 'assigned_suit') and target_pile.assigned_suit is not None:
@@ -189,6 +307,10 @@ class SolitaireRules:
         if top_card is None:
             return False
         
+        top = self._code(top_card)
+        if code >= 0 and top >= 0:
+            return self.tables.foundation_next[top] == code
+        
         # Must be same suit AND ascend by 1
         return (
             card.get_suit == top_card.get_suit and
@@ -281,6 +403,42 @@ class SolitaireRules:
         """
         return stock.is_empty() and not waste.is_empty()
     
+    # ========================================
+    # COMPACT STATE RULES (CompactTable codes)
+    # ========================================
+    
+    def can_stack_code(self, code: int, top: int) -> bool:
+        """Tableau rule on card codes (see CompactTable).
+        
+        Args:
+            code: Code of the card to place (without FACE_UP bit)
+            top: Code of the target top card (without FACE_UP bit),
+                or -1 for an empty pile
+            
+        Returns:
+            True if the card can be placed on the tableau pile
+        """
+        return self._stack[code * self._width + top + 1] == 1
+    
+    def can_found_code(self, code: int, foundation_index: int, top: int) -> bool:
+        """Foundation rule on card codes (see CompactTable).
+        
+        Foundation ``i`` holds suit ``i`` (assigned suit, deck.SUITES order).
+        
+        Args:
+            code: Code of the card to place (without FACE_UP bit)
+            foundation_index: Foundation index (0-3)
+            top: Code of the foundation top card (without FACE_UP bit),
+                or -1 if empty
+            
+        Returns:
+            True if the card can be placed on the foundation
+        """
+        tables = self.tables
+        if top < 0:
+            return tables.aces[foundation_index] == code
+        return tables.foundation_next[top] == code and tables.suits[code] == foundation_index
+    
     # ========================================
     # UTILITY METHODS
     # ========================================
@@ -299,20 +457,13 @@ class SolitaireRules:
         if pile.is_empty():
             return []
         
-        all_cards = pile.get_all_cards()
-        
-        # Find first uncovered card
-        first_uncovered_idx = -1
-        for i, card in enumerate(all_cards):
-            if not card.get_covered:
-                first_uncovered_idx = i
-                break
-        
-        if first_uncovered_idx == -1:
+        # First uncovered card (tracked by the pile, O(1))
+        first_uncovered_idx = pile.get_first_face_up_index()
+        if first_uncovered_idx == pile.get_size():
             return []  # No uncovered cards
         
         # Get sequence from first uncovered to end
-        sequence = all_cards[first_uncovered_idx:]
+        sequence = pile.cards[first_uncovered_idx:]
         
         # Validate sequence
         if self._is_valid_tableau_sequence(sequence):
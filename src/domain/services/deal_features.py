@@ -0,0 +1,359 @@
+"""Vectorised structural features and difficulty score of deals.
+
+Rates deals without solving them: a batch of seeds becomes an (N x 52)
+array of deals (N x 40 for the Neapolitan deck) and every feature is a
+handful of NumPy operations over the whole batch, so a million deals
+are rated in seconds on one core. Used to calibrate the deals of the
+DifficultyPreset levels (see scripts/rate_deals.py).
+
+The deals are exactly those of ``GameService.deal(seed)``: Python's
+Mersenne Twister seeding and ``random.shuffle`` are reproduced column
+by column over the batch.
+
+NumPy is optional (analysis tools only): the functions raise
+ImportError when it is missing.
+
+Deal layout (``deals[n, p]`` is the card id at deal position p):
+- positions 0-27: tableau, pile by pile (pile i holds positions
+  i*(i+1)/2 .. i*(i+1)/2+i, the last one face up)
+- positions 28+: stock, bottom to top (the last position is drawn first)
+
+Example:
+    >>> deals = deals_from_seeds(range(1_000_000))
+    >>> features = deal_features(deals, draw_count=3)
+    >>> scores = difficulty_scores(features)
+    >>> thresholds = level_thresholds(scores, levels=5)
+"""
+
+import random
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+from src.domain.models.deck import FrenchDeck, NeapolitanDeck
+from src.domain.rules.solitaire_rules import SolitaireRules
+
+
+NUMPY_AVAILABLE = np is not None
+
+TABLEAU_CARDS = 28
+
+# Heuristic weights of the difficulty score (positive = harder)
+DIFFICULTY_WEIGHTS: Dict[str, float] = {
+    "ace_depth": 1.0,
+    "two_depth": 0.5,
+    "king_depth": 0.4,
+    "same_colour_blockers": 0.6,
+    "stock_low_hidden": 0.8,
+    "stock_low_reachable": 0.3,
+    "face_up_low": -1.5,
+    "initial_moves": -1.0,
+}
+
+# Mersenne Twister (MT19937) constants, as in CPython's _random module
+_MT_N = 624
+_MT_M = 397
+_MT_SEED = 19650218
+_MT_OUTPUTS = 192        # Outputs precomputed per deal (a shuffle uses ~70)
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Analisi smazzate: numpy non installato (pip install numpy)")
+
+
+def _deck_layout(deck_type: str) -> Tuple[int, int, Tuple[bool, ...]]:
+    """Deck size, ranks per suit and red suits of a deck type."""
+    deck_class = {"french": FrenchDeck, "neapolitan": NeapolitanDeck}.get(deck_type)
+    if deck_class is None:
+        raise ValueError(f"Mazzo sconosciuto: {deck_type}")
+    deck = deck_class()
+    ranks = len(deck.VALUES)
+    return ranks * len(deck.SUITES), ranks, SolitaireRules(deck).encoding.red_suits
+
+
+def _tableau_positions() -> Tuple[List[int], List[int]]:
+    """Pile and height (cards below) of every tableau deal position."""
+    piles, heights = [], []
+    for pile in range(7):
+        for height in range(pile + 1):
+            piles.append(pile)
+            heights.append(height)
+    return piles, heights
+
+
+# ========================================
+# DEALS FROM SEEDS
+# ========================================
+
+def _mt_seed_states(seeds: "npt.NDArray[np.int64]") -> "npt.NDArray[np.uint32]":
+    """MT19937 states of ``random.Random(seed)`` for 32-bit seeds.
+
+    Returns:
+        (624, C) uint32 array, one column per seed (init_by_array with a
+        one-word key, run for all seeds at once)
+    """
+    base = [_MT_SEED]
+    for i in range(1, _MT_N):
+        prev = base[-1]
+        base.append((1812433253 * (prev ^ (prev >> 30)) + i) & 0xFFFFFFFF)
+    mt = np.repeat(np.array(base, dtype=np.uint32)[:, None], len(seeds), axis=1)
+    key = seeds.astype(np.uint32)
+    tmp = np.empty(len(seeds), dtype=np.uint32)
+    mult1, mult2 = np.uint32(1664525), np.uint32(1566083941)
+
+    i = 1
+    for _ in range(_MT_N):
+        prev, row = mt[i - 1], mt[i]
+        np.right_shift(prev, 30, out=tmp)
+        np.bitwise_xor(tmp, prev, out=tmp)
+        np.multiply(tmp, mult1, out=tmp)
+        np.bitwise_xor(row, tmp, out=row)
+        np.add(row, key, out=row)
+        i += 1
+        if i >= _MT_N:
+            mt[0] = mt[_MT_N - 1]
+            i = 1
+    for _ in range(_MT_N - 1):
+        prev, row = mt[i - 1], mt[i]
+        np.right_shift(prev, 30, out=tmp)
+        np.bitwise_xor(tmp, prev, out=tmp)
+        np.multiply(tmp, mult2, out=tmp)
+        np.bitwise_xor(row, tmp, out=row)
+        np.subtract(row, np.uint32(i), out=row)
+        i += 1
+        if i >= _MT_N:
+            mt[0] = mt[_MT_N - 1]
+            i = 1
+    mt[0] = 0x80000000
+    return mt
+
+
+def _mt_outputs(mt: "npt.NDArray[np.uint32]", count: int) -> "npt.NDArray[np.uint32]":
+    """First ``count`` tempered 32-bit outputs of fresh states.
+
+    Only valid for count <= 624 - 397: the twisted words then depend on
+    untwisted words only.
+    """
+    y = (mt[:count] & np.uint32(0x80000000)) | (mt[1:count + 1] & np.uint32(0x7FFFFFFF))
+    one = np.uint32(1)
+    out = mt[_MT_M:_MT_M + count] ^ (y >> one)
+    out ^= (y & one) * np.uint32(0x9908B0DF)
+    out ^= out >> np.uint32(11)
+    out ^= (out << np.uint32(7)) & np.uint32(0x9D2C5680)
+    out ^= (out << np.uint32(15)) & np.uint32(0xEFC60000)
+    out ^= out >> np.uint32(18)
+    return out
+
+
+def _shuffle_chunk(seeds: "npt.NDArray[np.int64]", size: int) -> "npt.NDArray[np.uint8]":
+    """Deals of a chunk of seeds (``random.Random(seed).shuffle`` of ids)."""
+    count = len(seeds)
+    outputs = _mt_outputs(_mt_seed_states(seeds), _MT_OUTPUTS)
+    deals = np.tile(np.arange(size, dtype=np.uint8), (count, 1))
+    rows = np.arange(count)
+    cursor = np.zeros(count, dtype=np.intp)
+    exhausted = np.zeros(count, dtype=bool)
+
+    for i in range(size - 1, 0, -1):
+        # _randbelow(i + 1): top k bits of one output, retried while >= i + 1
+        bound = i + 1
+        shift = np.uint32(32 - bound.bit_length())
+        exhausted |= cursor >= _MT_OUTPUTS
+        pick = outputs[np.minimum(cursor, _MT_OUTPUTS - 1), rows] >> shift
+        cursor += 1
+        retry = np.flatnonzero(pick >= bound)
+        while retry.size:
+            exhausted[retry[cursor[retry] >= _MT_OUTPUTS]] = True
+            retry = retry[cursor[retry] < _MT_OUTPUTS]
+            pick[retry] = outputs[cursor[retry], retry] >> shift
+            cursor[retry] += 1
+            retry = retry[pick[retry] >= bound]
+        pick = np.minimum(pick, i).astype(np.intp)
+        swapped = deals[rows, i].copy()
+        deals[rows, i] = deals[rows, pick]
+        deals[rows, pick] = swapped
+
+    # Deals needing more random words than precomputed (very rare)
+    for row in np.flatnonzero(exhausted):
+        cards = list(range(size))
+        random.Random(int(seeds[row])).shuffle(cards)
+        deals[row] = cards
+    return deals
+
+
+def deals_from_seeds(
+    seeds: Iterable[int],
+    deck_type: str = "french",
+    chunk_size: int = 16384
+) -> "npt.NDArray[np.uint8]":
+    """Deals of ``GameService.deal(seed)`` for a batch of seeds.
+
+    Args:
+        seeds: Deal numbers in [0, 2**32)
+        deck_type: "french" or "neapolitan"
+        chunk_size: Seeds processed together (memory: 2.5 KB per seed)
+
+    Returns:
+        (N, deck size) uint8 array of card ids in deal order
+
+    Raises:
+        ImportError: If NumPy is not installed
+        ValueError: If the deck type is unknown or a seed is out of range
+    """
+    _require_numpy()
+    size, _, _ = _deck_layout(deck_type)
+    # Read the seeds once into an array (they may be a one-shot iterator)
+    seed_array = np.fromiter(seeds, dtype=np.int64)
+    if seed_array.size and (seed_array.min() < 0 or seed_array.max() >= 2 ** 32):
+        raise ValueError("Seed fuori intervallo: ammessi 0 .. 2**32-1")
+    deals = np.empty((len(seed_array), size), dtype=np.uint8)
+    for start in range(0, len(seed_array), chunk_size):
+        chunk = seed_array[start:start + chunk_size]
+        deals[start:start + len(chunk)] = _shuffle_chunk(chunk, size)
+    return deals
+
+
+# ========================================
+# FEATURES
+# ========================================
+
+def deal_features(
+    deals: "npt.NDArray[np.uint8]",
+    deck_type: str = "french",
+    draw_count: int = 3
+) -> Dict[str, "npt.NDArray[np.int16]"]:
+    """Structural features of a batch of deals.
+
+    Features (one int16 array of length N each):
+    - ace_depth / two_depth: cards lying on the tableau Aces / 2s
+    - king_depth: cards under tableau Kings (only an empty column frees them)
+    - same_colour_blockers: tableau cards lying above a lower card of
+      the same colour in their pile
+    - stock_low_reachable / stock_low_hidden: Aces and 2s of the stock
+      that the first pass of draw-``draw_count`` shows / hides
+    - face_up_low: face-up tableau Aces and 2s
+    - initial_moves: face-up tableau cards that can go on another
+      face-up tableau card
+
+    Args:
+        deals: (N, deck size) array from ``deals_from_seeds``
+        deck_type: "french" or "neapolitan"
+        draw_count: Cards drawn per click (1-3)
+
+    Returns:
+        Dict of feature name -> (N,) int16 array
+
+    Raises:
+        ImportError: If NumPy is not installed
+        ValueError: If the deck type is unknown or the deals do not match it
+    """
+    _require_numpy()
+    size, ranks, red_suits = _deck_layout(deck_type)
+    if deals.ndim != 2 or deals.shape[1] != size:
+        raise ValueError(f"Attese smazzate di {size} carte, ricevuto {deals.shape}")
+
+    ids = deals.astype(np.int16)
+    rank = ids % ranks                                  # 0 = Ace
+    red = np.array(red_suits, dtype=bool)[ids // ranks]
+
+    piles, heights = _tableau_positions()
+    pile_of = np.array(piles)
+    above = np.array([pile - height for pile, height in zip(piles, heights)], dtype=np.int16)
+    tableau_rank = rank[:, :TABLEAU_CARDS]
+    tops = np.array([i * (i + 1) // 2 + i for i in range(7)])
+
+    # Pairs of tableau positions (upper above lower) in the same pile
+    pairs = np.array([
+        (p, q) for p in range(TABLEAU_CARDS) for q in range(TABLEAU_CARDS)
+        if pile_of[p] == pile_of[q] and heights[p] > heights[q]
+    ])
+    upper, lower = pairs[:, 0], pairs[:, 1]
+
+    # Stock positions shown by the first pass (every draw_count-th card)
+    stock_size = size - TABLEAU_CARDS
+    drawn = np.arange(stock_size)                        # Draw order
+    shown = ((drawn + 1) % draw_count == 0) | (drawn == stock_size - 1)
+    stock_shown = np.zeros(stock_size, dtype=bool)
+    stock_shown[stock_size - 1 - drawn[shown]] = True    # Back to stock positions
+    stock_low = rank[:, TABLEAU_CARDS:] <= 1
+
+    top_rank, top_red = tableau_rank[:, tops], red[:, tops]
+    fits = (top_rank[:, :, None] + 1 == top_rank[:, None, :]) & (top_red[:, :, None] != top_red[:, None, :])
+
+    return {
+        "ace_depth": ((tableau_rank == 0) * above).sum(axis=1, dtype=np.int16),
+        "two_depth": ((tableau_rank == 1) * above).sum(axis=1, dtype=np.int16),
+        "king_depth": ((tableau_rank == ranks - 1) * np.array(heights, dtype=np.int16)).sum(
+            axis=1, dtype=np.int16),
+        "same_colour_blockers": (
+            (red[:, upper] == red[:, lower]) & (rank[:, upper] > rank[:, lower])
+        ).sum(axis=1, dtype=np.int16),
+        "stock_low_reachable": (stock_low & stock_shown).sum(axis=1, dtype=np.int16),
+        "stock_low_hidden": (stock_low & ~stock_shown).sum(axis=1, dtype=np.int16),
+        "face_up_low": (top_rank <= 1).sum(axis=1, dtype=np.int16),
+        "initial_moves": fits.any(axis=2).sum(axis=1, dtype=np.int16),
+    }
+
+
+# ========================================
+# DIFFICULTY SCORE
+# ========================================
+
+def difficulty_scores(
+    features: Dict[str, "npt.NDArray[np.int16]"],
+    weights: Optional[Dict[str, float]] = None
+) -> "npt.NDArray[np.float32]":
+    """Heuristic difficulty of each deal (higher = harder).
+
+    Args:
+        features: Output of ``deal_features``
+        weights: Feature weights (default DIFFICULTY_WEIGHTS)
+
+    Returns:
+        (N,) float32 array of scores
+
+    Raises:
+        ValueError: If no weight is given
+    """
+    _require_numpy()
+    weights = DIFFICULTY_WEIGHTS if weights is None else weights
+    if not weights:
+        raise ValueError("Nessun peso di difficoltà")
+    names = iter(weights)
+    first = next(names)
+    scores = features[first].astype(np.float32) * np.float32(weights[first])
+    for name in names:
+        scores += features[name].astype(np.float32) * np.float32(weights[name])
+    return scores
+
+
+def level_thresholds(scores: "npt.NDArray[np.float32]", levels: int = 5) -> "npt.NDArray[np.float32]":
+    """Score boundaries splitting the deals into equally sized levels.
+
+    Args:
+        scores: Difficulty scores of a representative sample
+        levels: Number of difficulty levels
+
+    Returns:
+        (levels - 1,) ascending array of upper bounds of levels 1..levels-1
+    """
+    _require_numpy()
+    return np.quantile(scores, np.arange(1, levels) / levels).astype(np.float32)
+
+
+def assign_levels(
+    scores: "npt.NDArray[np.float32]",
+    thresholds: "npt.NDArray[np.float32]"
+) -> "npt.NDArray[np.int8]":
+    """Difficulty level (1 = easiest) of each score."""
+    _require_numpy()
+    levels = np.searchsorted(thresholds, scores, side="right").astype(np.int8)
+    levels += 1
+    return levels
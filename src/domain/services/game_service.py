@@ -5,14 +5,26 @@ rules (SolitaireRules). Maintains game state including move count,
 timer, and score tracking.
 """
 
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Callable
+import random
 import time
 
 from src.domain.models.table import GameTable
 from src.domain.models.card import Card
 from src.domain.models.pile import Pile
+from src.domain.models.talon import Talon, TalonPile
+from src.domain.models.compact_table import CODE_MASK, STOCK_SLOT, WASTE_SLOT, CompactTable
+from src.domain.models.game_events import (
+    CardRevealed, CardsMoved, FoundationCompleted, GameEvent, StockDrawn,
+    TableReset, WasteRecycled
+)
+from src.domain.models.move_history import DeltaKind, MoveDelta, MoveHistory
+from src.domain.models.zobrist import ZobristHasher
 from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.rules.move_generator import LegalMoveGenerator, Move
 from src.domain.services.scoring_service import ScoringService
+from src.domain.services.replay import ReplayAction, ReplayOp, ReplayRecorder
+from src.domain.services.stall_detector import StallDetector, StallStatus
 from src.domain.models.scoring import ScoreEventType
 from src.infrastructure.logging import game_logger as log
 
@@ -34,6 +46,16 @@ class GameService:
         start_time: Game start timestamp (None if not started)
         draw_count: Number of times drawn from stock
         scoring: Optional scoring service for tracking points
+        deal_seed: Seed of the current deal (None if not seeded)
+        rng: Per-game generator (deal shuffle and shuffled recycles)
+        history: Undo/redo stacks of the actions of the current game
+        covered_count: Face-down tableau cards (kept up to date by every
+            flip, so auto-complete is detected in O(1))
+        stall: Detector of stock cycles without progress
+    
+    Every table change is published as a GameEvent to the callbacks
+    registered with ``subscribe()``; suit statistics are updated from
+    the same changes (only the foundations a move touched).
     """
     
     def __init__(
@@ -56,6 +78,7 @@ class GameService:
         self.start_time: Optional[float] = None
         self.draw_count = 0
         self.scoring = scoring
+        self.move_generator = LegalMoveGenerator(rules)
         
         # ✨ NEW v1.6.0: Live suit statistics tracking
         self.carte_per_seme: List[int] = [0, 0, 0, 0]
@@ -76,6 +99,25 @@ class GameService:
         # Recycle count tracking (for statistics)
         self.recycle_count: int = 0
         
+        # Per-game RNG: seeded by deal(), drives shuffled recycles too
+        self.deal_seed: Optional[int] = None
+        self.rng: random.Random = random.Random()
+        
+        # Undo/redo: one reversible delta per move, draw and recycle
+        self.history = MoveHistory()
+        
+        # Replay of the game (set by GameEngine, None = not recorded)
+        self.replay: Optional[ReplayRecorder] = None
+        
+        # Face-down tableau cards (recounted on deal/load, then incremental)
+        self.covered_count: int = self._count_covered()
+        
+        # Stock cycles without progress (checked at every recycle)
+        self.stall = StallDetector()
+        
+        # Callbacks receiving one GameEvent per table change
+        self._subscribers: List[Callable[[GameEvent], None]] = []
+        
         # ========================================
         # TIMER STATE (NEW v2.7.0)
         # ========================================
@@ -95,6 +137,30 @@ class GameService:
         if self.start_time is None:
             self.start_time = time.time()
     
+    def deal(self, seed: int) -> None:
+        """Deal the table from a seed.
+        
+        The same seed on the same deck type always gives the same deal
+        and the same sequence of shuffled recycles. The seed survives
+        ``reset_game()`` (it identifies the deal, not the session).
+        
+        Args:
+            seed: Deal number (see ``new_deal_seed()``)
+        
+        Example:
+            >>> service.deal(1234)
+            >>> service.deal_seed
+            1234
+        """
+        self.deal_seed = seed
+        self.rng = random.Random(seed)
+        self.table.ridistribuisci(self.rng)
+        self.covered_count = self._count_covered()
+        self._update_suit_statistics()
+        self.history.clear()
+        self.stall.reset()
+        self._emit(TableReset())
+    
     def reset_game(self) -> None:
         """Reset game state for new game.
         
@@ -121,6 +187,9 @@ class GameService:
         self.timer_expired = False
         self.overtime_start = None
         
+        self.history.clear()
+        self.stall.reset()
+        
         if self.scoring:
             self.scoring.reset()
     
@@ -205,6 +274,8 @@ class GameService:
         if source_pile.is_empty():
             return False, "Pila di origine vuota"
         
+        score_mark = self._score_mark()
+        
         # Get card(s) to move
         if card_count == 1:
             card = source_pile.get_top_card()
@@ -222,12 +293,13 @@ class GameService:
             # Check if source pile will reveal a card after move
             will_reveal_card = (
                 source_pile.get_card_count() > 1 and
-                len([c for c in source_pile.get_all_cards()[:-1] if not c.get_covered]) == 0
+                source_pile.get_first_face_up_index() >= source_pile.get_card_count() - 1
             )
             
             # Execute move
             source_pile.remove_last_card()
             target_pile.aggiungi_carta(card)
+            moved_cards = [card]
             
             # Record scoring events
             if self.scoring and is_foundation_target:
@@ -256,7 +328,7 @@ class GameService:
             # Check if source pile will reveal a card after move
             will_reveal_card = (
                 source_pile.get_card_count() > card_count and
-                len([c for c in source_pile.get_all_cards()[:-card_count] if not c.get_covered]) == 0
+                source_pile.get_first_face_up_index() >= source_pile.get_card_count() - card_count
             )
             
             # Execute sequence move
@@ -264,17 +336,15 @@ class GameService:
                 source_pile.remove_last_card()
             for card in cards:
                 target_pile.aggiungi_carta(card)
+            moved_cards = cards
         
         # Update game state
         self.move_count += 1
+        self._hash_transfer(moved_cards, source_pile, target_pile)
+        self._moved(source_pile, target_pile, card_count)
         
         # Check if a card was revealed
-        card_was_revealed = False
-        if not source_pile.is_empty():
-            top = source_pile.get_top_card()
-            if top and top.get_covered:
-                top.set_uncover()
-                card_was_revealed = True
+        card_was_revealed = self._uncover_top_card(source_pile)
         
         # Record card revealed event
         if self.scoring and card_was_revealed:
@@ -283,10 +353,10 @@ class GameService:
                 f"{source_pile.get_top_card()}"
             )
         
-        # ✨ NEW v1.6.0: Update suit statistics after foundation move
-        if is_foundation_target:
-            self._update_suit_statistics()
-        
+        self._record(
+            DeltaKind.MOVE, source_pile, target_pile, card_count,
+            card_was_revealed, score_mark
+        )
         return True, f"Mossa eseguita (#{self.move_count})"
     
     def _get_movable_sequence(
@@ -306,20 +376,18 @@ class GameService:
         if count <= 0 or count > pile.get_card_count():
             return []
         
-        # Get last N cards
-        all_cards = pile.get_all_cards()
-        sequence = all_cards[-count:]
-        
         # All cards must be uncovered
-        if any(card.get_covered for card in sequence):
+        if pile.get_face_up_count() < count:
             return []
         
-        return sequence
+        # Get last N cards
+        return pile.cards[-count:]
     
     def _update_suit_statistics(self) -> None:
         """Update live suit statistics by scanning foundation piles.
         
-        Called after every successful move to foundation.
+        Called when the whole table changes (deal, loaded position);
+        moves update only the foundations they touch (see ``_moved``).
         Recalculates from scratch (idempotent operation).
         
         Foundation pile indices: 7, 8, 9, 10
@@ -349,6 +417,44 @@ class GameService:
             if num_cards == cards_per_suit:
                 self.semi_completati += 1
     
+    def _moved(self, source: Pile, target: Pile, count: int) -> None:
+        """Publish a card move and update the statistics it changed.
+        
+        Called after the cards left ``source`` and are on top of
+        ``target``. Only the foundations involved are recounted, and a
+        FoundationCompleted event follows the move when one of them got
+        (or lost) its last card.
+        
+        Args:
+            source: Pile the cards left
+            target: Pile the cards moved onto
+            count: Cards moved
+        """
+        source_slot = self._pile_slot(source)
+        target_slot = self._pile_slot(target)
+        completed: List[FoundationCompleted] = []
+        for pile, slot, delta in ((source, source_slot, -count), (target, target_slot, count)):
+            if not 7 <= slot <= 10:
+                continue
+            cards_per_suit = len(self.table.mazzo.VALUES)
+            num_cards = pile.get_card_count()
+            self.carte_per_seme[slot - 7] = num_cards
+            was_complete = num_cards - delta == cards_per_suit
+            is_complete = num_cards == cards_per_suit
+            if is_complete != was_complete:
+                self.semi_completati += 1 if is_complete else -1
+                completed.append(FoundationCompleted(slot, is_complete))
+        
+        if self._subscribers:
+            self._emit(CardsMoved(source_slot, target_slot, count))
+            for event in completed:
+                self._emit(event)
+    
+    def _revealed(self, pile: Pile, card: Card, covered: bool = False) -> None:
+        """Publish the flip of the top card of a tableau pile."""
+        if self._subscribers:
+            self._emit(CardRevealed(self._pile_slot(pile), card, covered))
+    
     def _snapshot_statistics(self) -> None:
         """Snapshot current statistics before reset.
         
@@ -366,16 +472,61 @@ class GameService:
         self.final_carte_per_seme = self.carte_per_seme.copy()
         self.final_semi_completati = self.semi_completati
     
-    def _uncover_top_card(self, pile: Pile) -> None:
+    def _uncover_top_card(self, pile: Pile) -> bool:
         """Uncover top card of pile if it's covered.
         
         Args:
             pile: Pile to check
+        
+        Returns:
+            True if a card was turned face up
         """
         if not pile.is_empty():
             top = pile.get_top_card()
             if top and top.get_covered:
                 top.set_uncover()
+                self.covered_count -= 1
+                self._hash_flip(pile)
+                self._revealed(pile, top)
+                return True
+        return False
+    
+    # ========================================
+    # EVENTS
+    # ========================================
+    
+    def subscribe(self, callback: Callable[[GameEvent], None]) -> None:
+        """Register a callback for the table change events.
+        
+        The callback receives every GameEvent right after the change,
+        in order (see ``src.domain.models.game_events``). A callback
+        already registered is not added twice.
+        
+        Args:
+            callback: Function taking one event
+        
+        Example:
+            >>> service.subscribe(board.on_game_event)
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+    
+    def unsubscribe(self, callback: Callable[[GameEvent], None]) -> None:
+        """Remove a callback registered with ``subscribe()`` (no-op if absent)."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+    
+    def _emit(self, event: GameEvent) -> None:
+        """Deliver an event to the subscribers.
+        
+        A failing subscriber is logged and skipped: the game state is
+        already changed and the other subscribers still get the event.
+        """
+        for callback in tuple(self._subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                log.error_occurred("GameService", f"Event subscriber failed on {type(event).__name__}", e)
     
     # ========================================
     # STOCK/WASTE MANAGEMENT
@@ -412,26 +563,101 @@ class GameService:
                 return False, "Tallone vuoto - riciclo automatico fallito", []
         
         # Draw cards
+        score_mark = self._score_mark()
         drawn_cards: List[Card] = []
         for _ in range(min(count, stock.get_card_count())):
-            card = stock.remove_last_card()
-            if card:
-                card.set_uncover()
-                waste.aggiungi_carta(card)
-                drawn_cards.append(card)
-                
-                # ✅ FIX v2.6.0: Record scoring event per ogni carta pescata
-                # This enables progressive penalties at thresholds 21/41
-                if self.scoring:
-                    self.scoring.record_event(ScoreEventType.STOCK_DRAW)
+            card = self._draw_one(stock, waste)
+            drawn_cards.append(card)
+            
+            # ✅ FIX v2.6.0: Record scoring event per ogni carta pescata
+            # This enables progressive penalties at thresholds 21/41
+            if self.scoring:
+                self.scoring.record_event(ScoreEventType.STOCK_DRAW)
         
         # INVARIANT: draw_count (actions) vs stock_draw_count (cards)
         # - self.draw_count = numero AZIONI di pescata (statistiche legacy)
         # - self.scoring.stock_draw_count = numero CARTE pescate (scoring v2.0)
         # Esempio draw-3: dopo 7 azioni -> draw_count=7, stock_draw_count=21
         self.draw_count += 1
+        self.stall.on_draw(self._is_playable(drawn_cards[-1]), len(drawn_cards))
+        self._emit(StockDrawn(len(drawn_cards)))
+        self._record(DeltaKind.DRAW, stock, waste, len(drawn_cards), False, score_mark)
         return True, f"Pescate {len(drawn_cards)} carte", drawn_cards
     
+    def _is_playable(self, card: Card) -> bool:
+        """Whether a card fits its foundation or a tableau top (O(1))."""
+        rules = self.rules
+        code = card.get_id
+        if code is None:
+            return False
+        foundation = code // rules.encoding.ranks_per_suit
+        if rules.can_found_code(code, foundation, self._top_code(self.table.pile_semi[foundation])):
+            return True
+        for pile in self.table.pile_base:
+            if rules.can_stack_code(code, self._top_code(pile)):
+                return True
+        return False
+    
+    @staticmethod
+    def _top_code(pile: Pile) -> int:
+        """Id of the top card of a pile (-1 if empty or without id)."""
+        top = pile.get_top_card()
+        code = top.get_id if top is not None else None
+        return -1 if code is None else code
+    
+    @staticmethod
+    def _talon(stock: Pile, waste: Pile) -> Optional[Talon]:
+        """Talon shared by stock and waste (None for piles built by hand)."""
+        if isinstance(stock, TalonPile) and stock.talon.waste is waste:
+            return stock.talon
+        return None
+    
+    def _draw_one(self, stock: Pile, waste: Pile) -> Card:
+        """Turn the top stock card face up onto the waste.
+        
+        Raises:
+            ValueError: If the stock is empty
+        """
+        talon = self._talon(stock, waste)
+        if talon is not None:
+            split = talon.split
+            card = talon.cards[split]
+            self._hash_toggle(card, 12, len(talon.cards) - split - 1)
+            talon.draw()
+            self._hash_toggle(card, 11, split)
+            return card
+        top = stock.remove_last_card()
+        if top is None:
+            raise ValueError("Mazzo vuoto: nessuna carta da pescare")
+        self._hash_toggle(top, 12, stock.get_card_count())
+        top.set_uncover()
+        waste.aggiungi_carta(top)
+        self._hash_toggle(top, 11, waste.get_card_count() - 1)
+        return top
+    
+    def _undraw_one(self, stock: Pile, waste: Pile) -> None:
+        """Put the top waste card back face down on the stock (undo of a draw).
+        
+        Raises:
+            ValueError: If the waste is empty
+        """
+        talon = self._talon(stock, waste)
+        if talon is not None:
+            card = talon.undraw()
+            split = talon.split
+            card.set_uncover()
+            self._hash_toggle(card, 11, split)
+            card.set_cover()
+            self._hash_toggle(card, 12, len(talon.cards) - split - 1)
+            return
+        top = waste.remove_last_card()
+        if top is None:
+            raise ValueError("Scarti vuoti: nessuna carta da rimettere nel mazzo")
+        self._hash_toggle(top, 11, waste.get_card_count())
+        top.set_cover()
+        stock.aggiungi_carta(top)
+        self._hash_toggle(top, 12, stock.get_card_count() - 1)
+    
     def recycle_waste(
         self,
         shuffle: bool = False
@@ -454,37 +680,198 @@ class GameService:
         if not self.rules.can_recycle_waste(waste, stock):
             return False, "Impossibile riciclare tallone"
         
+        self._close_stock_cycle(shuffle)
+        score_mark = self._score_mark()
+        order: Optional[Tuple[int, ...]] = None
+        if shuffle:
+            # Shuffle (F5 toggle mode), reproducible for seeded deals.
+            # The permutation is kept for undo/redo.
+            positions = list(range(waste.get_card_count()))
+            self.rng.shuffle(positions)
+            order = tuple(positions)
+        count = self._recycle_cards(stock, waste, order)
+        self._emit(WasteRecycled(count, shuffle))
+        
+        # ✨ NEW v1.6.0: Increment recycle counter
+        self.recycle_count += 1
+        
+        # Log waste recycle for analytics
+        log.waste_recycled(recycle_count=self.recycle_count)
+        
+        # Record scoring event
+        if self.scoring:
+            self.scoring.record_event(ScoreEventType.RECYCLE_WASTE)
+        
+        self._record(DeltaKind.RECYCLE, waste, stock, count, False, score_mark, order)
+        return True, f"Tallone riciclato ({count} carte)"
+    
+    def _close_stock_cycle(self, shuffle: bool) -> None:
+        """Update the stall detector before a recycle (once per cycle).
+        
+        The board is only checked when the cycle moved no card and
+        showed no playable waste card; the check reads the live table
+        and stops at the first board move.
+        """
+        board_moves = 1
+        if self.stall.needs_board_moves:
+            try:
+                board_moves = int(self._has_board_move())
+            except ValueError:
+                return  # Cards built by hand (no id): not tracked
+        status = self.stall.on_recycle(self.get_position_hash(), board_moves, shuffle)
+        if status.is_stuck:
+            log.debug_state("stall", {"status": status.value, "cycles": self.stall.stalled_cycles})
+    
+    def _has_board_move(self) -> bool:
+        """Whether any move other than a stock action is legal.
+        
+        Same board moves as LegalMoveGenerator, read from the live
+        table without building a CompactTable or a move list.
+        
+        Raises:
+            ValueError: If a card has no id (not created by a deck)
+        """
+        rules = self.rules
+        can_stack = rules.can_stack_code
+        can_found = rules.can_found_code
+        ranks = rules.encoding.ranks_per_suit
+        encode = CompactTable.encode_card
+        tableau = self.table.pile_base
+        tops = [encode(pile.cards[-1]) & CODE_MASK if pile.cards else -1 for pile in tableau]
+        foundation_tops = [
+            encode(pile.cards[-1]) & CODE_MASK if pile.cards else -1 for pile in self.table.pile_semi
+        ]
+        
+        for source, pile in enumerate(tableau):
+            cards = pile.cards
+            if not cards or cards[-1].get_covered:
+                continue
+            top = tops[source]
+            if can_found(top, top // ranks, foundation_tops[top // ranks]):
+                return True
+            # Walk down the valid face-up run, one candidate base per card
+            index = len(cards) - 1
+            card_code = top
+            while True:
+                for target, target_top in enumerate(tops):
+                    if target == source or (target_top < 0 and index == 0):
+                        continue  # Whole column onto an empty one: no-op
+                    if can_stack(card_code, target_top):
+                        return True
+                if index == 0:
+                    break
+                below = cards[index - 1]
+                below_code = encode(below) & CODE_MASK
+                if below.get_covered or not can_stack(card_code, below_code):
+                    break
+                card_code = below_code
+                index -= 1
+        
+        waste = self.table.pile_scarti
+        waste_top = waste.get_top_card() if waste is not None else None
+        if waste_top is not None and self._is_playable(waste_top):
+            return True
+        return any(
+            can_stack(foundation_top, top)
+            for foundation_top in foundation_tops if foundation_top >= 0
+            for top in tops
+        )
+    
+    def _recycle_cards(
+        self,
+        stock: Pile,
+        waste: Pile,
+        order: Optional[Tuple[int, ...]]
+    ) -> int:
+        """Move all waste cards face down onto the stock.
+        
+        On a talon (stock empty, see ``Talon.recycle``) no list is
+        rebuilt: only the split pointer moves and the cards are covered.
+        
+        Args:
+            stock: Stock pile
+            waste: Waste pile
+            order: Waste position of each new stock card, None to invert
+        
+        Returns:
+            Number of recycled cards
+        """
+        zobrist = self._zobrist()
+        talon = self._talon(stock, waste)
+        if talon is not None and stock.is_empty():
+            # The talon list holds only the waste (bottom to top)
+            if zobrist is not None:
+                zobrist.toggle_run(talon.cards, 11, 0)
+            count = talon.recycle(order)
+            if zobrist is not None:
+                zobrist.toggle_run(reversed(talon.cards), 12, 0)
+                zobrist.recycle_count += 1
+            return count
+        
         # Get all waste cards
         cards = waste.get_all_cards()
+        if zobrist is not None:
+            zobrist.toggle_run(cards, 11, 0)
         waste.clear()
         
         # Cover all cards
         for card in cards:
             card.set_cover()
         
-        if shuffle:
-            # Shuffle (F5 toggle mode)
-            import random
-            random.shuffle(cards)
-        else:
+        if order is None:
             # Invert order (default)
             cards.reverse()
+        else:
+            cards = [cards[position] for position in order]
         
         # Move to stock
+        stock_depth = stock.get_card_count()
         for card in cards:
             stock.aggiungi_carta(card)
-        
-        # ✨ NEW v1.6.0: Increment recycle counter
-        self.recycle_count += 1
-        
-        # Log waste recycle for analytics
-        log.waste_recycled(recycle_count=self.recycle_count)
-        
-        # Record scoring event
-        if self.scoring:
-            self.scoring.record_event(ScoreEventType.RECYCLE_WASTE)
-        
-        return True, f"Tallone riciclato ({len(cards)} carte)"
+        if zobrist is not None:
+            zobrist.toggle_run(cards, 12, stock_depth)
+            zobrist.recycle_count += 1
+        return len(cards)
+    
+    def _unrecycle_cards(
+        self,
+        stock: Pile,
+        waste: Pile,
+        count: int,
+        order: Optional[Tuple[int, ...]]
+    ) -> None:
+        """Put recycled cards back face up on the waste (undo of a recycle)."""
+        zobrist = self._zobrist()
+        talon = self._talon(stock, waste)
+        if talon is not None and waste.is_empty() and stock.get_card_count() == count:
+            if zobrist is not None:
+                zobrist.toggle_run(reversed(talon.cards), 12, 0)
+            talon.unrecycle(count, order)
+            if zobrist is not None:
+                zobrist.toggle_run(talon.cards[:count], 11, 0)
+                zobrist.recycle_count -= 1
+            return
+        
+        cards = stock.cards[-count:]
+        if zobrist is not None:
+            zobrist.toggle_run(cards, 12, stock.get_card_count() - count)
+        for _ in range(count):
+            stock.remove_last_card()
+        
+        if order is None:
+            waste_cards = cards[::-1]
+        else:
+            waste_cards = list(cards)
+            for card, position in zip(cards, order):
+                waste_cards[position] = card
+        
+        depth = waste.get_card_count()
+        for card in waste_cards:
+            card.set_uncover()
+            waste.aggiungi_carta(card)
+        if zobrist is not None:
+            zobrist.toggle_run(waste_cards, 11, depth)
+            zobrist.recycle_count -= 1
     
     # ========================================
     # AUTO-MOVE LOGIC
@@ -507,7 +894,13 @@ class GameService:
                     if self.rules.can_place_on_foundation(card, foundation):
                         self.table.pile_scarti.remove_last_card()
                         foundation.aggiungi_carta(card)
+                        self._hash_transfer([card], self.table.pile_scarti, foundation)
+                        self._moved(self.table.pile_scarti, foundation, 1)
                         self.move_count += 1
+                        self._record(
+                            DeltaKind.MOVE, self.table.pile_scarti, foundation, 1,
+                            False, self._score_mark()
+                        )
                         return True, "Carta spostata automaticamente", card
         
         # Check tableau piles
@@ -521,12 +914,430 @@ class GameService:
                     if self.rules.can_place_on_foundation(card, foundation):
                         tableau_pile.remove_last_card()
                         foundation.aggiungi_carta(card)
+                        self._hash_transfer([card], tableau_pile, foundation)
+                        self._moved(tableau_pile, foundation, 1)
                         self.move_count += 1
-                        self._uncover_top_card(tableau_pile)
+                        revealed = self._uncover_top_card(tableau_pile)
+                        self._record(
+                            DeltaKind.MOVE, tableau_pile, foundation, 1,
+                            revealed, self._score_mark()
+                        )
                         return True, "Carta spostata automaticamente", card
         
         return False, "Nessuna mossa automatica disponibile", None
     
+    # ========================================
+    # AUTO-COMPLETE
+    # ========================================
+    
+    def _count_covered(self) -> int:
+        """Count the face-down tableau cards (full scan, 0 for stub tables)."""
+        piles = getattr(self.table, "pile_base", None) or []
+        return sum(1 for pile in piles for card in pile.cards if card.get_covered)
+    
+    def can_auto_complete(self) -> bool:
+        """Check in O(1) if the game can be finished by foundation moves only.
+        
+        True when stock and waste are empty, no tableau card is face down
+        and cards are left on the tableau: every column is then a
+        descending run, so the lowest card left is always on top of one.
+        
+        Returns:
+            True if ``auto_complete()`` would win the game
+        """
+        table = self.table
+        return (
+            self.covered_count == 0
+            and table.pile[STOCK_SLOT].is_empty()
+            and table.pile[WASTE_SLOT].is_empty()
+            and any(not pile.is_empty() for pile in table.pile_base)
+        )
+    
+    def auto_complete(self) -> List[Card]:
+        """Move every tableau card to the foundations in one batch.
+        
+        Each card is a normal move (move count, scoring event, undo
+        entry, events). Callers announce once for the whole batch.
+        
+        Returns:
+            Cards moved, in order (empty if ``can_auto_complete()`` is False)
+        """
+        if not self.can_auto_complete():
+            return []
+        
+        moved: List[Card] = []
+        foundations = self.table.pile_semi
+        progress = True
+        while progress:
+            progress = False
+            for pile in self.table.pile_base:
+                while pile.cards:
+                    card = pile.cards[-1]
+                    target = next(
+                        (f for f in foundations if self.rules.can_place_on_foundation(card, f)),
+                        None
+                    )
+                    if target is None:
+                        break
+                    self._send_to_foundation(pile, target)
+                    moved.append(card)
+                    progress = True
+        
+        return moved
+    
+    def _is_safe_for_foundation(self, suit: int, value: int, heights: List[int]) -> bool:
+        """Check if a card can never be needed again on the tableau.
+        
+        Classic rule: Aces and twos are always safe; any other card is
+        safe once both opposite-colour suits reached value - 1, so no
+        card that could be placed on it is still off the foundations.
+        Constant time from the foundation heights.
+        
+        Args:
+            suit: Suit index of the card
+            value: Card value (1 = Ace)
+            heights: Cards per foundation, by suit index
+        """
+        if value <= 2:
+            return True
+        red = self.rules.encoding.red_suits
+        return all(
+            heights[other] >= value - 1
+            for other in range(len(heights)) if red[other] != red[suit]
+        )
+    
+    def auto_play_safe(self) -> List[Card]:
+        """Send to the foundations every card for which it can never hurt.
+        
+        Repeats until no waste or tableau top card is both playable and
+        safe (see ``_is_safe_for_foundation``). Each card is a normal
+        move (move count, scoring, undo entry, events).
+        
+        Returns:
+            Cards moved, in order (empty if none)
+        
+        Example:
+            >>> cards = service.auto_play_safe()
+            >>> [str(c) for c in cards]
+            ['Asso di Cuori', '2 di Cuori']
+        """
+        table = self.table
+        foundations = table.pile_semi
+        ranks = len(table.mazzo.VALUES)
+        heights = [f.get_card_count() for f in foundations]
+        sources = [table.pile[WASTE_SLOT]] + list(table.pile_base)
+        moved: List[Card] = []
+        
+        progress = True
+        while progress:
+            progress = False
+            for pile in sources:
+                while pile.cards:
+                    card = pile.cards[-1]
+                    card_id = card.get_id
+                    if card.get_covered or card_id is None:
+                        break
+                    suit, value = divmod(card_id, ranks)
+                    value += 1
+                    if heights[suit] != value - 1 or not self._is_safe_for_foundation(suit, value, heights):
+                        break
+                    if not self.rules.can_place_on_foundation(card, foundations[suit]):
+                        break
+                    self._send_to_foundation(pile, foundations[suit])
+                    heights[suit] += 1
+                    moved.append(card)
+                    progress = True
+        
+        return moved
+    
+    def _send_to_foundation(self, pile: Pile, foundation: Pile) -> None:
+        """Move the top card of a waste/tableau pile to a foundation.
+        
+        Records the move like ``move_card`` (move count, scoring events,
+        revealed card, undo entry, events).
+        """
+        card = pile.get_top_card()
+        score_mark = self._score_mark()
+        self._shift(pile, foundation, 1)
+        self.move_count += 1
+        
+        from_waste = pile is self.table.pile_scarti
+        revealed = False if from_waste else self._uncover_top_card(pile)
+        if self.scoring:
+            self.scoring.record_event(
+                ScoreEventType.WASTE_TO_FOUNDATION if from_waste
+                else ScoreEventType.TABLEAU_TO_FOUNDATION,
+                f"{card}"
+            )
+            if revealed:
+                self.scoring.record_event(ScoreEventType.CARD_REVEALED, f"{pile.get_top_card()}")
+        self._record(DeltaKind.MOVE, pile, foundation, 1, revealed, score_mark)
+    
+    # ========================================
+    # UNDO / REDO
+    # ========================================
+    
+    def _score_mark(self) -> int:
+        """Number of scoring events recorded so far (0 without scoring)."""
+        return len(self.scoring.events) if self.scoring else 0
+    
+    def _record(
+        self,
+        kind: DeltaKind,
+        source: Pile,
+        target: Pile,
+        count: int,
+        revealed: bool,
+        score_mark: int,
+        order: Optional[Tuple[int, ...]] = None
+    ) -> None:
+        """Record a completed action in the undo history.
+        
+        Actions on piles that are not part of the table cannot be
+        replayed: the history is dropped instead.
+        """
+        if kind == DeltaKind.MOVE:
+            self.stall.on_move()
+        source_slot = self._pile_slot(source)
+        target_slot = self._pile_slot(target)
+        if source_slot < 0 or target_slot < 0:
+            self.history.clear()
+            return
+        events = tuple(self.scoring.events[score_mark:]) if self.scoring else ()
+        delta = MoveDelta(kind, source_slot, target_slot, count, revealed, events, order)
+        self.history.record(delta)
+        if self.replay is not None:
+            self.replay.record_delta(delta)
+    
+    def _shift(self, source: Pile, target: Pile, count: int) -> None:
+        """Move the top ``count`` cards between piles keeping their order."""
+        cards = source.cards[-count:]
+        for _ in range(count):
+            source.remove_last_card()
+        for card in cards:
+            target.aggiungi_carta(card)
+        self._hash_transfer(cards, source, target)
+        self._moved(source, target, count)
+    
+    def undo(self) -> Tuple[bool, str]:
+        """Undo the last move, draw or recycle.
+        
+        Cards, counters, score events and suit statistics go back to the
+        state before the action, in O(k) for k cards involved.
+        
+        Returns:
+            Tuple of (success, message)
+        
+        Example:
+            >>> service.move_card(tableau1, tableau2)
+            >>> service.undo()
+            (True, 'Mossa annullata')
+        """
+        delta = self.history.pop_undo()
+        if delta is None:
+            return False, "Nessuna mossa da annullare"
+        
+        piles = self.table.pile
+        source, target = piles[delta.source], piles[delta.target]
+        if delta.kind == DeltaKind.MOVE:
+            if delta.revealed:
+                self._hash_flip(source)
+                card = source.cards[-1]
+                card.set_cover()
+                self.covered_count += 1
+                self._revealed(source, card, covered=True)
+            self._shift(target, source, delta.card_count)
+            self.move_count -= 1
+        elif delta.kind == DeltaKind.DRAW:
+            for _ in range(delta.card_count):
+                self._undraw_one(source, target)
+            self.draw_count -= 1
+            self._emit(StockDrawn(delta.card_count, undone=True))
+        else:
+            self._unrecycle_cards(target, source, delta.card_count, delta.order)
+            self.recycle_count -= 1
+            self._emit(WasteRecycled(delta.card_count, delta.order is not None, undone=True))
+        
+        if self.scoring:
+            self.scoring.rollback_events(delta.score_events)
+        
+        self.history.push_redo(delta)
+        self.stall.reset()
+        if self.replay is not None:
+            self.replay.record(ReplayAction(ReplayOp.UNDO))
+        return True, "Mossa annullata"
+    
+    def redo(self) -> Tuple[bool, str]:
+        """Redo the last undone action.
+        
+        Shuffled recycles are replayed with the same card order.
+        
+        Returns:
+            Tuple of (success, message)
+        """
+        delta = self.history.pop_redo()
+        if delta is None:
+            return False, "Nessuna mossa da ripetere"
+        
+        piles = self.table.pile
+        source, target = piles[delta.source], piles[delta.target]
+        if delta.kind == DeltaKind.MOVE:
+            self._shift(source, target, delta.card_count)
+            if delta.revealed:
+                card = source.cards[-1]
+                card.set_uncover()
+                self.covered_count -= 1
+                self._hash_flip(source)
+                self._revealed(source, card)
+            self.move_count += 1
+        elif delta.kind == DeltaKind.DRAW:
+            for _ in range(delta.card_count):
+                self._draw_one(source, target)
+            self.draw_count += 1
+            self._emit(StockDrawn(delta.card_count))
+        else:
+            count = self._recycle_cards(target, source, delta.order)
+            self.recycle_count += 1
+            self._emit(WasteRecycled(count, delta.order is not None))
+        
+        if self.scoring:
+            self.scoring.replay_events(delta.score_events)
+        
+        self.history.push_undo(delta)
+        self.stall.reset()
+        if self.replay is not None:
+            self.replay.record(ReplayAction(ReplayOp.REDO))
+        return True, "Mossa ripetuta"
+    
+    # ========================================
+    # COMPACT STATE
+    # ========================================
+    
+    def get_compact_state(self) -> CompactTable:
+        """Get an integer-encoded snapshot of the current table.
+        
+        The snapshot is independent from the live table: solvers and
+        simulations can mutate it freely.
+        
+        Returns:
+            CompactTable with current card order and face-up state
+        """
+        return CompactTable.from_table(self.table)
+    
+    def load_compact_state(self, state: CompactTable) -> None:
+        """Replace the table content with a compact state.
+        
+        Card objects on the table are reused; suit statistics are
+        recalculated from the new foundations.
+        
+        Args:
+            state: Compact state for the same deck type
+        """
+        state.to_table(self.table)
+        zobrist = self._zobrist()
+        if zobrist is not None:
+            zobrist.rebuild_compact(state.piles)
+        self._update_suit_statistics()
+        self.covered_count = self._count_covered()
+        self.history.clear()
+        self.stall.reset()
+        self._emit(TableReset())
+    
+    def get_legal_moves(
+        self,
+        draw_count: int = 1,
+        allow_recycle: bool = True
+    ) -> List[Move]:
+        """List every legal move on the current table.
+        
+        Args:
+            draw_count: Cards drawn per stock action (1 or 3)
+            allow_recycle: False if no waste recycles are left
+            
+        Returns:
+            List of Move records (see LegalMoveGenerator)
+        """
+        return self.move_generator.generate(
+            self.get_compact_state(), draw_count, allow_recycle
+        )
+    
+    # ========================================
+    # POSITION HASHING
+    # ========================================
+    
+    def _zobrist(self) -> Optional[ZobristHasher]:
+        """Position hasher of the table (None for tables built by hand)."""
+        zobrist = getattr(self.table, "zobrist", None)
+        return zobrist if isinstance(zobrist, ZobristHasher) else None
+    
+    def _pile_slot(self, pile: Pile) -> int:
+        """Unified slot of a table pile (see GameTable.pile), -1 if unknown."""
+        table = self.table
+        if isinstance(table, GameTable):
+            return table.pile_slot(pile)
+        # Table stand-ins (tests): search the pile groups
+        if pile is table.pile_scarti:
+            return 11
+        if pile is table.pile_mazzo:
+            return 12
+        for i, candidate in enumerate(table.pile_base):
+            if candidate is pile:
+                return i
+        for i, candidate in enumerate(table.pile_semi):
+            if candidate is pile:
+                return 7 + i
+        return -1
+    
+    def _hash_toggle(self, card: Card, slot: int, depth: int) -> None:
+        """Toggle one card in the position hash."""
+        zobrist = self._zobrist()
+        if zobrist is not None:
+            zobrist.toggle(card, slot, depth)
+    
+    def _hash_transfer(self, cards: List[Card], source: Pile, target: Pile) -> None:
+        """Update the position hash after cards moved from source to target.
+        
+        Called after the move: the cards are on top of ``target``.
+        """
+        zobrist = self._zobrist()
+        if zobrist is None:
+            return
+        source_slot = self._pile_slot(source)
+        target_slot = self._pile_slot(target)
+        if source_slot < 0 or target_slot < 0:
+            zobrist.rebuild(self.table.pile)
+            return
+        zobrist.transfer(
+            cards,
+            source_slot, source.get_card_count(),
+            target_slot, target.get_card_count() - len(cards)
+        )
+    
+    def _hash_flip(self, pile: Pile) -> None:
+        """Update the position hash after the top card of a pile was flipped."""
+        zobrist = self._zobrist()
+        if zobrist is None:
+            return
+        slot = self._pile_slot(pile)
+        if slot < 0:
+            zobrist.rebuild(self.table.pile)
+            return
+        zobrist.flip(pile.cards[-1], slot, pile.get_card_count() - 1)
+    
+    def get_position_hash(self, canonical: bool = False) -> Optional[int]:
+        """Get the Zobrist hash of the current position.
+        
+        Args:
+            canonical: Ignore the order of tableau columns
+            
+        Returns:
+            64-bit hash, or None if the table has no hasher
+        """
+        zobrist = self._zobrist()
+        if zobrist is None:
+            return None
+        return zobrist.canonical if canonical else zobrist.value
+    
     # ========================================
     # GAME STATUS CHECKS
     # ========================================
@@ -538,6 +1349,7 @@ class GameService:
             Tuple of (is_game_over, status_message)
             - (True, "Vittoria!") if all foundations complete
             - (True, "Tempo scaduto") if timer expired
+            - (False, "Partita bloccata...") after a dead-end stock cycle
             - (False, "In corso") if still playable
         """
         # Check victory
@@ -545,6 +1357,12 @@ class GameService:
             elapsed = self.get_elapsed_time()
             return True, f"Vittoria! Completato in {int(elapsed)}s con {self.move_count} mosse"
         
+        # Stuck positions do not end the game: the player decides
+        if self.stall.status == StallStatus.DEAD_END:
+            return False, "Partita bloccata: nessuna mossa possibile"
+        if self.stall.status == StallStatus.NO_PROGRESS:
+            return False, "Partita in corso: nessun progresso nell'ultimo giro del mazzo"
+        
         # Game continues
         return False, "Partita in corso"
     
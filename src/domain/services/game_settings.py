@@ -57,6 +57,9 @@ class GameSettings:
         max_time_game: Timer in seconds (-1=OFF, or 300-3600)
         shuffle_discards: True=random shuffle, False=invert order
         command_hints_enabled: (v1.5.0) Enable/disable contextual voice hints
+        safe_auto_play: Send safe cards to the foundations after every move
+        offer_stuck_loss: Offer to end the game as a loss when a stock
+            cycle passes with no possible move
         scoring_enabled: (v2.0.0) Enable/disable scoring system
         timer_strict_mode: (v1.5.2.2) Timer expiration behavior
             - True: STRICT mode (auto-stop at timeout, legacy behavior)
@@ -87,6 +90,12 @@ class GameSettings:
         # Feature v1.5.0: Command hints
         self.command_hints_enabled = True  # Enable/disable command hints during gameplay
         
+        # Safe auto-play: cards that can never be needed again go to the foundations
+        self.safe_auto_play = False
+        
+        # Stuck positions: offer to close the game as lost after a dead-end cycle
+        self.offer_stuck_loss = False
+        
         # Feature v2.0.0: Scoring system
         self.scoring_enabled = True  # Enable/disable scoring system
         
@@ -678,6 +687,72 @@ class GameSettings:
         """
         return "Attivi" if self.command_hints_enabled else "Disattivati"
     
+    # ========================================
+    # SAFE AUTO-PLAY
+    # ========================================
+    
+    def toggle_safe_auto_play(self) -> Tuple[bool, str]:
+        """Toggle safe auto-play on/off.
+        
+        When active, after every move the cards that can never be
+        needed again on the tableau go to the foundations by themselves.
+        Cannot be modified during active game.
+        
+        Returns:
+            Tuple[bool, str]: (success, message)
+        """
+        if not self.validate_not_running():
+            return (False, "Non puoi modificare questa opzione durante una partita!")
+        
+        old_value = self.safe_auto_play
+        self.safe_auto_play = not self.safe_auto_play
+        log.settings_changed("safe_auto_play", old_value, self.safe_auto_play)
+        
+        if self.safe_auto_play:
+            return (True, "Spostamento automatico sicuro attivo.")
+        return (True, "Spostamento automatico sicuro disattivato.")
+    
+    def get_safe_auto_play_display(self) -> str:
+        """Get human-readable safe auto-play status.
+        
+        Returns:
+            "Attivo" if enabled, "Disattivato" if disabled
+        """
+        return "Attivo" if self.safe_auto_play else "Disattivato"
+    
+    # ========================================
+    # STUCK POSITIONS
+    # ========================================
+    
+    def toggle_offer_stuck_loss(self) -> Tuple[bool, str]:
+        """Toggle the loss offer for stuck positions on/off.
+        
+        When active, a stock cycle that ends with no possible move asks
+        whether to close the game as lost. Cannot be modified during
+        active game.
+        
+        Returns:
+            Tuple[bool, str]: (success, message)
+        """
+        if not self.validate_not_running():
+            return (False, "Non puoi modificare questa opzione durante una partita!")
+        
+        old_value = self.offer_stuck_loss
+        self.offer_stuck_loss = not self.offer_stuck_loss
+        log.settings_changed("offer_stuck_loss", old_value, self.offer_stuck_loss)
+        
+        if self.offer_stuck_loss:
+            return (True, "Proposta di resa per partita bloccata attiva.")
+        return (True, "Proposta di resa per partita bloccata disattivata.")
+    
+    def get_offer_stuck_loss_display(self) -> str:
+        """Get human-readable stuck loss offer status.
+        
+        Returns:
+            "Attiva" if enabled, "Disattivata" if disabled
+        """
+        return "Attiva" if self.offer_stuck_loss else "Disattivata"
+    
     # ========================================
     # TIMER STRICT MODE (v1.5.2.2)
     # ========================================
@@ -846,6 +921,8 @@ class GameSettings:
             "max_time_game": self.max_time_game,
             "shuffle_discards": self.shuffle_discards,
             "command_hints_enabled": self.command_hints_enabled,
+            "safe_auto_play": self.safe_auto_play,
+            "offer_stuck_loss": self.offer_stuck_loss,
             "scoring_enabled": self.scoring_enabled,
             "timer_strict_mode": self.timer_strict_mode,
             "display_mode": self.display_mode,
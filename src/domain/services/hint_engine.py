@@ -0,0 +1,264 @@
+"""Anytime move hints searched on a worker thread.
+
+HintEngine suggests a move without blocking the caller: ``start()``
+snapshots the position and ranks its legal moves with a cheap heuristic,
+so a hint is available at once, then launches a worker thread running
+KlondikeSolver with growing node budgets. A solve that finds a winning
+line replaces the hint with the first move of that line; ``best()``
+returns the best hint found so far at any moment. Starting a new search
+or calling ``cancel()`` stops the running one at its next clock check,
+and a hint is only returned for the position it was computed on.
+
+Like the solver, the search knows the face-down cards ("thoughtful"
+analysis): a WINNABLE hint may rely on cards the player has not seen,
+so the spoken hint says the line was found knowing the face-down cards
+(see GameFormatter.format_hint). It also assumes recycles invert the
+waste: with shuffled recycles the first move is still legal, the rest
+of the line may not be.
+
+Example:
+    >>> engine = HintEngine(rules, draw_count=3)
+    >>> engine.start(service.get_compact_state())   # Heuristic hint
+    >>> engine.wait(0.25)                           # Optional short wait
+    >>> hint = engine.best(service.get_compact_state())
+    >>> hint.status == SolverStatus.WINNABLE        # On a winning line
+"""
+
+import threading
+import time
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from src.domain.models.compact_table import FACE_UP, CompactTable
+from src.domain.rules.move_generator import LegalMoveGenerator, Move, MoveKind
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.solver import KlondikeSolver, SolverStatus
+from src.infrastructure.logging import game_logger as log
+
+
+# Heuristic move priorities (lower = better)
+_FOUNDATION = 0
+_REVEAL = 1
+_WASTE_TO_TABLEAU = 2
+_DRAW = 3
+_RECYCLE = 4
+_TABLEAU_SHIFT = 5
+_FOUNDATION_DOWN = 6
+
+
+class Hint(NamedTuple):
+    """Suggested move.
+
+    Attributes:
+        move: Move to play (unified pile slots, see LegalMoveGenerator)
+        status: WINNABLE if the move starts a winning line, UNWINNABLE
+            if the search proved no line wins, UNKNOWN for a heuristic
+            hint (search running, cancelled or out of budget)
+        nodes: Positions searched so far
+    """
+
+    move: Move
+    status: SolverStatus = SolverStatus.UNKNOWN
+    nodes: int = 0
+
+
+def rank_moves(state: CompactTable, moves: Sequence[Move]) -> List[Move]:
+    """Order legal moves from most to least promising.
+
+    Foundation moves first, then moves revealing a face-down card (from
+    the column with the most face-down cards), waste plays, stock
+    actions, and last the moves that only shift cards around.
+
+    Args:
+        state: Position of the moves
+        moves: Legal moves of the position
+
+    Returns:
+        New list, best move first
+    """
+    piles = state.piles
+
+    def key(move: Move) -> Tuple[int, int]:
+        kind = move.kind
+        if kind in (MoveKind.TABLEAU_TO_FOUNDATION, MoveKind.WASTE_TO_FOUNDATION):
+            return _FOUNDATION, 0
+        if kind == MoveKind.WASTE_TO_TABLEAU:
+            return _WASTE_TO_TABLEAU, 0
+        if kind == MoveKind.DRAW:
+            return _DRAW, 0
+        if kind == MoveKind.RECYCLE:
+            return _RECYCLE, 0
+        if kind == MoveKind.FOUNDATION_TO_TABLEAU:
+            return _FOUNDATION_DOWN, 0
+        pile = piles[move.source]
+        below = len(pile) - move.card_count
+        hidden = sum(1 for byte in pile[:below] if not byte & FACE_UP)
+        if below and not pile[below - 1] & FACE_UP:
+            return _REVEAL, -hidden
+        return _TABLEAU_SHIFT, 0
+
+    return sorted(moves, key=key)
+
+
+class HintEngine:
+    """Background best-move search for the current position.
+
+    Attributes:
+        rules: Rules of the deck being played
+        draw_count: Cards drawn per stock action (1-3)
+        budgets: Node budgets of the successive solves
+        time_limit: Wall-clock budget of a whole search in seconds
+    """
+
+    BUDGETS = (2_000, 20_000, 200_000)
+
+    def __init__(
+        self,
+        rules: SolitaireRules,
+        draw_count: int = 1,
+        budgets: Sequence[int] = BUDGETS,
+        time_limit: float = 5.0
+    ) -> None:
+        """Initialize an idle engine.
+
+        Args:
+            rules: Rules of the deck being played
+            draw_count: Cards drawn per stock action (1-3)
+            budgets: Increasing node budgets (each solve restarts with
+                the next budget until one gives a definite answer)
+            time_limit: Maximum seconds of search per position
+        """
+        self.rules = rules
+        self.draw_count = draw_count
+        self.budgets = tuple(budgets)
+        self.time_limit = time_limit
+        self._generator = LegalMoveGenerator(rules)
+        self._lock = threading.Lock()
+        self._key: Optional[bytes] = None
+        self._hint: Optional[Hint] = None
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ========================================
+    # PUBLIC API
+    # ========================================
+
+    def start(self, state: CompactTable) -> Optional[Hint]:
+        """Start searching a position, cancelling any running search.
+
+        Args:
+            state: Position to search (copied, the caller keeps it)
+
+        Returns:
+            Heuristic hint available at once (None if no legal move)
+        """
+        self.cancel()
+        state = state.copy()
+        moves = self._generator.generate_compact(state, self.draw_count)
+        hint = Hint(rank_moves(state, moves)[0]) if moves else None
+        key = state.key()
+        cancel = threading.Event()
+
+        with self._lock:
+            self._key = key
+            self._hint = hint
+            self._cancel = cancel
+        if hint is None:
+            return None
+
+        self._thread = threading.Thread(
+            target=self._search,
+            args=(state, key, moves, cancel),
+            name="hint-search",
+            daemon=True,
+        )
+        self._thread.start()
+        return hint
+
+    def best(self, state: Optional[CompactTable] = None) -> Optional[Hint]:
+        """Best hint found so far.
+
+        Args:
+            state: Current position; if given and different from the
+                searched one, the stale search is cancelled and None is
+                returned
+
+        Returns:
+            Hint, or None if none is available for the position
+        """
+        with self._lock:
+            key, hint = self._key, self._hint
+        if state is not None and state.key() != key:
+            if key is not None:
+                self.cancel()
+            return None
+        return hint
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the running search to end.
+
+        Args:
+            timeout: Maximum seconds to wait (None = until it ends)
+
+        Returns:
+            True if no search is running any more
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return not self.searching
+
+    def cancel(self) -> None:
+        """Stop the running search and forget the position."""
+        with self._lock:
+            self._cancel.set()
+            self._key = None
+            self._hint = None
+
+    @property
+    def searching(self) -> bool:
+        """Whether a search is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    # ========================================
+    # WORKER
+    # ========================================
+
+    def _publish(self, key: bytes, hint: Hint, cancel: threading.Event) -> None:
+        """Replace the hint unless the search was cancelled meanwhile."""
+        with self._lock:
+            if not cancel.is_set() and self._key == key:
+                self._hint = hint
+
+    def _search(
+        self,
+        state: CompactTable,
+        key: bytes,
+        moves: List[Move],
+        cancel: threading.Event
+    ) -> None:
+        """Solve with growing budgets until an answer or the deadline."""
+        deadline = time.monotonic() + self.time_limit
+        nodes = 0
+        try:
+            for budget in self.budgets:
+                remaining = deadline - time.monotonic()
+                if cancel.is_set() or remaining <= 0:
+                    return
+                solver = KlondikeSolver(
+                    self.rules, self.draw_count,
+                    max_nodes=budget, time_limit=remaining, cancel_event=cancel
+                )
+                result = solver.solve(state)
+                nodes += result.nodes
+                if result.status == SolverStatus.WINNABLE:
+                    if result.moves and result.moves[0] in moves:
+                        self._publish(key, Hint(result.moves[0], result.status, nodes), cancel)
+                    return
+                if result.status == SolverStatus.UNWINNABLE:
+                    with self._lock:
+                        heuristic = self._hint
+                    if heuristic is not None:
+                        self._publish(key, heuristic._replace(status=result.status, nodes=nodes), cancel)
+                    return
+        except Exception as e:
+            log.error_occurred("HintEngine", "Hint search failed", e)
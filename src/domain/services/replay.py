@@ -0,0 +1,314 @@
+"""Compact replay format of a whole game.
+
+A replay is the deal (deck type, cards per draw, recycle mode, seed)
+followed by the stream of player actions, so replaying the actions on
+the same seeded deal rebuilds every position of the game. Shuffled
+recycles need no card order: they draw from the per-game RNG, which the
+seed makes reproducible.
+
+Byte layout:
+- header: magic ``b"SCRP"``, version (u8), deck code (u8), flags (u8),
+  cards per draw (u8), deal seed (varint, flag HAS_SEED)
+- actions: one unsigned LEB128 varint ``payload << 3 | op`` each,
+  followed by the card count (varint) for moves. The payload is
+  ``source * 13 + target`` for moves, the cards drawn for draws and
+  1/0 (shuffled or not) for recycles.
+
+Moves take 3 bytes, draws, undos and recycles 1 byte: a full game is a
+few hundred bytes. Actions are appended as they happen (see
+``ReplayRecorder``); a stream cut short by a crash decodes up to its
+last complete action.
+"""
+
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from src.domain.models.compact_table import PILE_COUNT
+from src.domain.models.move_history import DeltaKind, MoveDelta
+
+
+MAGIC = b"SCRP"
+VERSION = 1
+
+# Header flags
+HAS_SEED = 0x01
+SHUFFLE_ON_RECYCLE = 0x02
+
+_HEADER_SIZE = 8
+_OP_BITS = 3
+_OP_MASK = (1 << _OP_BITS) - 1
+
+DECK_CODES = {"french": 0, "neapolitan": 1}
+_DECK_NAMES = {code: name for name, code in DECK_CODES.items()}
+
+
+class ReplayOp(IntEnum):
+    """Kind of a recorded player action."""
+
+    MOVE = 0
+    DRAW = 1
+    RECYCLE = 2
+    UNDO = 3
+    REDO = 4
+    END = 5
+
+
+class ReplayAction(NamedTuple):
+    """One recorded action.
+
+    Attributes:
+        op: ReplayOp of the action
+        source: Source pile slot (moves only, see GameTable.pile)
+        target: Target pile slot (moves only)
+        card_count: Cards moved or drawn; 1 for a shuffled recycle
+    """
+
+    op: ReplayOp
+    source: int = 0
+    target: int = 0
+    card_count: int = 0
+
+
+def action_from_delta(delta: MoveDelta) -> ReplayAction:
+    """Replay action of a recorded undo-history delta."""
+    if delta.kind == DeltaKind.MOVE:
+        return ReplayAction(ReplayOp.MOVE, delta.source, delta.target, delta.card_count)
+    if delta.kind == DeltaKind.DRAW:
+        return ReplayAction(ReplayOp.DRAW, card_count=delta.card_count)
+    return ReplayAction(ReplayOp.RECYCLE, card_count=int(delta.order is not None))
+
+
+# ========================================
+# VARINT CODEC
+# ========================================
+
+def write_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read an unsigned LEB128 varint.
+
+    Returns:
+        Tuple of (value, position after the varint)
+
+    Raises:
+        IndexError: If the data ends inside the varint
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode_action(out: bytearray, action: ReplayAction) -> None:
+    """Append the encoding of one action."""
+    op = action.op
+    if op == ReplayOp.MOVE:
+        write_varint(out, (action.source * PILE_COUNT + action.target) << _OP_BITS | op)
+        write_varint(out, action.card_count)
+    elif op in (ReplayOp.DRAW, ReplayOp.RECYCLE):
+        write_varint(out, action.card_count << _OP_BITS | op)
+    else:
+        out.append(op)
+
+
+# ========================================
+# REPLAY
+# ========================================
+
+@dataclass
+class Replay:
+    """Decoded replay of a game.
+
+    Attributes:
+        deck_type: "french" or "neapolitan"
+        draw_per_click: Cards drawn per click in the game
+        shuffle_on_recycle: Recycle mode of the game
+        deal_seed: Deal number (None if the game was not seeded)
+        actions: Recorded actions, in order (END excluded)
+        finished: Whether the game reached its end (END recorded)
+
+    Example:
+        >>> replay = Replay.from_bytes(blob)
+        >>> replay.deal_seed, len(replay.actions)
+        (1234, 148)
+    """
+
+    deck_type: str
+    draw_per_click: int = 1
+    shuffle_on_recycle: bool = False
+    deal_seed: Optional[int] = None
+    actions: List[ReplayAction] = field(default_factory=list)
+    finished: bool = False
+
+    def header_bytes(self) -> bytes:
+        """Encoded header (everything before the first action)."""
+        flags = (HAS_SEED if self.deal_seed is not None else 0) | (
+            SHUFFLE_ON_RECYCLE if self.shuffle_on_recycle else 0
+        )
+        out = bytearray(MAGIC)
+        out += bytes((VERSION, DECK_CODES[self.deck_type], flags, self.draw_per_click))
+        if self.deal_seed is not None:
+            write_varint(out, self.deal_seed)
+        return bytes(out)
+
+    def to_bytes(self) -> bytes:
+        """Encode the whole replay."""
+        out = bytearray(self.header_bytes())
+        for action in self.actions:
+            encode_action(out, action)
+        if self.finished:
+            encode_action(out, ReplayAction(ReplayOp.END))
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        """Decode a replay, keeping the complete actions of a cut stream.
+
+        Args:
+            data: Replay bytes
+
+        Returns:
+            Decoded Replay
+
+        Raises:
+            ValueError: If the header is missing or invalid
+        """
+        if len(data) < _HEADER_SIZE or data[:4] != MAGIC:
+            raise ValueError("Replay non valido")
+        version, deck_code, flags, draw_per_click = data[4:_HEADER_SIZE]
+        if version != VERSION:
+            raise ValueError(f"Versione replay non supportata: {version}")
+        if deck_code not in _DECK_NAMES:
+            raise ValueError(f"Tipo di mazzo sconosciuto: {deck_code}")
+
+        pos = _HEADER_SIZE
+        seed = None
+        try:
+            if flags & HAS_SEED:
+                seed, pos = read_varint(data, pos)
+        except IndexError:
+            raise ValueError("Replay troncato nell'intestazione") from None
+
+        replay = cls(
+            deck_type=_DECK_NAMES[deck_code],
+            draw_per_click=draw_per_click,
+            shuffle_on_recycle=bool(flags & SHUFFLE_ON_RECYCLE),
+            deal_seed=seed,
+        )
+        actions = replay.actions
+        end = len(data)
+        while pos < end:
+            try:
+                head, pos = read_varint(data, pos)
+                op = head & _OP_MASK
+                payload = head >> _OP_BITS
+                if op == ReplayOp.MOVE:
+                    count, pos = read_varint(data, pos)
+                    source, target = divmod(payload, PILE_COUNT)
+                    actions.append(ReplayAction(ReplayOp.MOVE, source, target, count))
+                elif op in (ReplayOp.DRAW, ReplayOp.RECYCLE):
+                    actions.append(ReplayAction(ReplayOp(op), card_count=payload))
+                elif op in (ReplayOp.UNDO, ReplayOp.REDO):
+                    actions.append(ReplayAction(ReplayOp(op)))
+                elif op == ReplayOp.END:
+                    replay.finished = True
+                    break
+                else:
+                    raise ValueError(f"Azione replay sconosciuta: {op}")
+            except IndexError:
+                break  # Last action cut short (crash while writing)
+        return replay
+
+
+# ========================================
+# RECORDER
+# ========================================
+
+class ReplayRecorder:
+    """Records the actions of one game as a stream of replay bytes.
+
+    Encoded actions wait in a small buffer and go to the sink when the
+    buffer reaches ``buffer_limit`` bytes, on ``flush()`` and when the
+    game ends, so a crash loses at most the buffered actions. GameService
+    feeds the recorder from its undo history (see ``GameService.replay``).
+
+    Attributes:
+        replay: Header of the recorded game (actions are not kept)
+        bytes_written: Bytes handed to the sink so far
+        action_count: Actions recorded so far
+        closed: Whether recording has stopped
+
+    Example:
+        >>> recorder = ReplayRecorder(storage.appender(replay_id), Replay("french", deal_seed=7))
+        >>> service.replay = recorder
+        >>> ...                       # Play the game
+        >>> recorder.finish()
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[bytes], None],
+        replay: Replay,
+        buffer_limit: int = 64
+    ) -> None:
+        """Start recording: the header is written right away.
+
+        Args:
+            sink: Receives the encoded bytes (appends them to the file)
+            replay: Deal of the game (its actions are ignored)
+            buffer_limit: Buffered bytes that trigger a flush
+        """
+        self.replay = replay
+        self.buffer_limit = buffer_limit
+        self.bytes_written = 0
+        self.action_count = 0
+        self.closed = False
+        self._sink = sink
+        self._buffer = bytearray(replay.header_bytes())
+        self.flush()
+
+    def record(self, action: ReplayAction) -> None:
+        """Append one action (ignored once the recorder is closed)."""
+        if self.closed:
+            return
+        encode_action(self._buffer, action)
+        self.action_count += 1
+        if len(self._buffer) >= self.buffer_limit:
+            self.flush()
+
+    def record_delta(self, delta: MoveDelta) -> None:
+        """Append the action of a recorded undo-history delta."""
+        self.record(action_from_delta(delta))
+
+    def flush(self) -> None:
+        """Hand the buffered bytes to the sink."""
+        if self._buffer:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            self._sink(data)
+            self.bytes_written += len(data)
+
+    def finish(self) -> None:
+        """Mark the game as ended, flush and stop recording."""
+        if self.closed:
+            return
+        encode_action(self._buffer, ReplayAction(ReplayOp.END))
+        self.close()
+
+    def close(self) -> None:
+        """Flush and stop recording without marking the end (game left open)."""
+        if not self.closed:
+            self.flush()
+            self.closed = True
@@ -0,0 +1,198 @@
+"""Playback of recorded games with fast seek.
+
+ReplayPlayer replays the actions of a Replay (see replay.py) on a
+GameService dealt from the replay seed. While loading it plays the
+whole game once and keeps a checkpoint every ``checkpoint_interval``
+actions (table, counters, recycle RNG and undo stacks), so seeking to
+any action restores the nearest earlier checkpoint and replays at most
+``checkpoint_interval`` actions.
+
+Example:
+    >>> player = ReplayPlayer(service, Replay.from_bytes(blob))
+    >>> player.seek(120)      # Position after 120 actions
+    >>> player.step()         # Play the 121st
+    >>> player.step_back()    # Back to 120
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.domain.models.move_history import MoveDelta
+from src.domain.services.game_service import GameService
+from src.domain.services.replay import Replay, ReplayAction, ReplayOp
+from src.domain.services.saved_game import SavedGame
+from src.infrastructure.logging import game_logger as log
+
+
+def apply_action(service: GameService, action: ReplayAction) -> bool:
+    """Play one recorded action on a service.
+
+    Args:
+        service: Game service in the position before the action
+        action: Recorded action
+
+    Returns:
+        True if the action was legal and played
+    """
+    op = action.op
+    if op == ReplayOp.MOVE:
+        piles = service.table.pile
+        return service.move_card(
+            piles[action.source], piles[action.target], action.card_count,
+            7 <= action.target <= 10
+        )[0]
+    if op == ReplayOp.DRAW:
+        return service.draw_cards(action.card_count)[0]
+    if op == ReplayOp.RECYCLE:
+        return service.recycle_waste(bool(action.card_count))[0]
+    if op == ReplayOp.UNDO:
+        return service.undo()[0]
+    if op == ReplayOp.REDO:
+        return service.redo()[0]
+    return False
+
+
+class _Checkpoint(NamedTuple):
+    """Service state after a number of actions."""
+
+    state: SavedGame
+    history: Tuple[Tuple[MoveDelta, ...], Tuple[MoveDelta, ...]]
+
+
+class ReplayPlayer:
+    """Steps through a recorded game on a GameService.
+
+    The service is dedicated to the replay while the player is in use:
+    its undo history is driven by the replayed actions and it records no
+    replay of its own.
+
+    Attributes:
+        service: Game service showing the replayed position
+        replay: Replay being played
+        actions: Playable actions (a replay that stops applying is cut
+            at its first illegal action)
+        position: Actions played so far (0 = the deal)
+        checkpoint_interval: Actions between two checkpoints
+    """
+
+    def __init__(
+        self,
+        service: GameService,
+        replay: Replay,
+        checkpoint_interval: int = 25
+    ) -> None:
+        """Deal the replay seed, index the game and go back to the deal.
+
+        Args:
+            service: Game service with a table of the replay deck type
+            replay: Replay to play
+            checkpoint_interval: Actions between two checkpoints (the
+                most actions a seek replays)
+
+        Raises:
+            ValueError: If the replay has no seed, the deck type differs
+                or the interval is not positive
+        """
+        deck_type = "neapolitan" if service.table.mazzo.is_neapolitan_deck() else "french"
+        if replay.deal_seed is None:
+            raise ValueError("Replay senza seed: smazzata non ricostruibile")
+        if replay.deck_type != deck_type:
+            raise ValueError(f"Replay per mazzo {replay.deck_type}, tavolo {deck_type}")
+        if checkpoint_interval <= 0:
+            raise ValueError("Intervallo dei checkpoint non valido")
+
+        self.service = service
+        self.replay = replay
+        self.checkpoint_interval = checkpoint_interval
+        self.actions: List[ReplayAction] = list(replay.actions)
+        self.position = 0
+        self._checkpoints: List[_Checkpoint] = []
+
+        service.replay = None
+        service.deal(replay.deal_seed)
+        service.reset_game()
+        service.start_game()
+        self._index()
+
+    def _index(self) -> None:
+        """Play the whole game once, saving the checkpoints."""
+        service = self.service
+        interval = self.checkpoint_interval
+        for index, action in enumerate(self.actions):
+            if index % interval == 0:
+                self._checkpoints.append(self._capture())
+            if not apply_action(service, action):
+                log.warning_issued(
+                    "ReplayPlayer", f"Replay stops applying at action {index}: {action}"
+                )
+                del self.actions[index:]
+                break
+        self._restore(0)
+
+    def _capture(self) -> _Checkpoint:
+        """Checkpoint of the current service state."""
+        return _Checkpoint(SavedGame.capture(self.service), self.service.history.snapshot())
+
+    def _restore(self, index: int) -> None:
+        """Go back to checkpoint ``index``."""
+        checkpoint = self._checkpoints[index]
+        checkpoint.state.restore(self.service)
+        self.service.history.restore(checkpoint.history)
+        self.position = index * self.checkpoint_interval
+
+    # ========================================
+    # PLAYBACK
+    # ========================================
+
+    @property
+    def length(self) -> int:
+        """Number of playable actions."""
+        return len(self.actions)
+
+    @property
+    def at_end(self) -> bool:
+        """Whether every action has been played."""
+        return self.position >= len(self.actions)
+
+    def step(self) -> Optional[ReplayAction]:
+        """Play the next action.
+
+        Returns:
+            Action played, or None at the end of the replay
+        """
+        if self.at_end:
+            return None
+        action = self.actions[self.position]
+        apply_action(self.service, action)
+        self.position += 1
+        return action
+
+    def step_back(self) -> bool:
+        """Go back one action.
+
+        Returns:
+            False if already at the deal
+        """
+        if self.position == 0:
+            return False
+        self.seek(self.position - 1)
+        return True
+
+    def seek(self, position: int) -> int:
+        """Show the position after ``position`` actions.
+
+        Replays at most ``checkpoint_interval`` actions: forward from the
+        current position when it is close enough, otherwise from the
+        nearest earlier checkpoint.
+
+        Args:
+            position: Target action count (clamped to the replay)
+
+        Returns:
+            Position reached
+        """
+        position = max(0, min(position, len(self.actions)))
+        if not self.position <= position <= self.position + self.checkpoint_interval:
+            self._restore(position // self.checkpoint_interval)
+        while self.position < position:
+            self.step()
+        return position
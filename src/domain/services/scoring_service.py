@@ -10,7 +10,7 @@ All calculations are pure (no I/O, no side effects).
 """
 
 import math
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from src.domain.models.scoring import (
     ScoreEvent,
@@ -200,6 +200,47 @@ class ScoringService:
         
         return penalty
     
+    # ========================================
+    # UNDO SUPPORT
+    # ========================================
+    
+    def rollback_events(self, events: Iterable[ScoreEvent]) -> None:
+        """Remove the events recorded by an action (undo of a game action).
+        
+        The events are matched by identity, latest first, so events
+        recorded after the action that belong to no action (HINT_USED)
+        stay in place. Progressive penalty counters are rolled back with
+        them, so the next draw or recycle gets the same penalty as the
+        first time.
+        
+        Args:
+            events: Events recorded by the undone action
+        """
+        for event in reversed(tuple(events)):
+            for index in range(len(self.events) - 1, -1, -1):
+                if self.events[index] is event:
+                    del self.events[index]
+                    break
+            else:
+                continue
+            if event.event_type == ScoreEventType.STOCK_DRAW:
+                self.stock_draw_count -= 1
+            elif event.event_type == ScoreEventType.RECYCLE_WASTE:
+                self.recycle_count -= 1
+    
+    def replay_events(self, events: Iterable[ScoreEvent]) -> None:
+        """Record again events removed by ``rollback_events`` (redo).
+        
+        Args:
+            events: Events of the redone action, with their original points
+        """
+        for event in events:
+            self.events.append(event)
+            if event.event_type == ScoreEventType.STOCK_DRAW:
+                self.stock_draw_count += 1
+            elif event.event_type == ScoreEventType.RECYCLE_WASTE:
+                self.recycle_count += 1
+    
     # ========================================
     # NUMERIC HELPERS (v2.0)
     # ========================================
@@ -298,7 +339,8 @@ class ScoringService:
         elapsed_seconds: float,
         move_count: int,
         is_victory: bool,
-        timer_strict_mode: bool = True
+        timer_strict_mode: bool = True,
+        deal_seed: Optional[int] = None
     ) -> FinalScore:
         """Calculate final score at game end (v2.0).
         
@@ -309,6 +351,7 @@ class ScoringService:
             timer_strict_mode: Timer expiration behavior
                 - True: STRICT mode (game stops at timeout)
                 - False: PERMISSIVE mode (overtime allowed with penalty)
+            deal_seed: Seed of the deal played, recorded with the score
             
         Returns:
             FinalScore with complete breakdown
@@ -365,7 +408,8 @@ class ScoringService:
             draw_count=self.draw_count,
             recycle_count=self.recycle_count,
             move_count=move_count,
-            victory_quality_multiplier=quality_multiplier  # v2.0 NEW: persisted
+            victory_quality_multiplier=quality_multiplier,  # v2.0 NEW: persisted
+            deal_seed=deal_seed
         )
     
     def _calculate_time_bonus(self, elapsed_seconds: float, timer_strict_mode: bool = True) -> int:
@@ -0,0 +1,505 @@
+"""Klondike solver for French and Neapolitan deals.
+
+Depth-first search over integer-encoded positions with:
+- Transposition table keyed on a canonical position (tableau column
+  order ignored), so equivalent positions are explored once
+- Move ordering: foundation moves first, then moves that reveal
+  face-down cards, then waste plays, then the rest
+- Safe auto-moves to the foundations (cards no longer needed as holders)
+- Node and wall-clock budgets (UNKNOWN when exhausted), and an optional
+  cancel event for searches running on a worker thread
+
+Stock and waste are handled as one "talon" sequence ``T = waste +
+reversed(stock)`` with a split ``w`` (waste size): drawing N cards sets
+``w = min(w + N, len(T))`` and recycling resets ``w`` to 0 without
+changing ``T``. Every card reachable by drawing (and at most one
+recycle) becomes a single macro move, expanded to primitive DRAW and
+RECYCLE moves in the returned solution.
+
+Assumptions:
+- Face-down cards are known to the solver ("thoughtful" analysis)
+- Recycling inverts the waste (shuffle_discards=False) and is unlimited
+- The search is pruned: partial run moves are only tried when the
+  exposed card can go to its foundation, columns are only emptied when a
+  King is waiting, foundation cards only come back down to hold a
+  waiting card. A search that ends without a win is UNWINNABLE only if
+  none of these rules skipped a legal move, UNKNOWN otherwise
+
+Example:
+    >>> solver = KlondikeSolver(rules, draw_count=1)
+    >>> result = solver.solve(table)
+    >>> if result.status == SolverStatus.WINNABLE:
+    ...     print(len(result.moves))
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Optional, Set, Tuple, Union
+
+from src.domain.models.compact_table import (
+    CODE_MASK,
+    FACE_UP,
+    STOCK_SLOT,
+    WASTE_SLOT,
+    CompactTable,
+)
+from src.domain.models.table import GameTable
+from src.domain.rules.move_generator import Move, MoveKind
+from src.domain.rules.solitaire_rules import SolitaireRules
+
+
+# Search position: (tableau columns, foundation heights, talon, waste size)
+_State = Tuple[Tuple[bytes, ...], Tuple[int, ...], bytes, int]
+
+# Child descriptor: (priority..., kind, operands...), sortable
+_Child = Tuple[int, ...]
+
+# Child descriptor kinds
+_COL_TO_FOUNDATION = 0
+_COL_TO_COL = 1
+_TALON_TO_FOUNDATION = 2
+_TALON_TO_COL = 3
+_FOUNDATION_TO_COL = 4
+
+# Budget check interval (nodes)
+_CLOCK_INTERVAL = 256
+
+
+class SolverStatus(Enum):
+    """Outcome of a solver run."""
+
+    WINNABLE = "winnable"
+    UNWINNABLE = "unwinnable"
+    UNKNOWN = "unknown"
+
+
+@dataclass
+class SolverResult:
+    """Result of a solver run.
+
+    Attributes:
+        status: WINNABLE, UNWINNABLE (exhaustive search) or UNKNOWN
+            (budget exhausted, or pruned moves left untried)
+        moves: Primitive moves of the winning line (empty otherwise)
+        nodes: Positions expanded
+        elapsed: Wall-clock seconds spent
+    """
+
+    status: SolverStatus
+    moves: List[Move] = field(default_factory=list)
+    nodes: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def is_winnable(self) -> bool:
+        """True if a winning line was found."""
+        return self.status == SolverStatus.WINNABLE
+
+
+class _BudgetExceeded(Exception):
+    """Raised internally when the node or time budget runs out."""
+
+
+class KlondikeSolver:
+    """Depth-first Klondike solver.
+
+    Attributes:
+        rules: Rules for the deck type (compatibility tables are used)
+        draw_count: Cards drawn per stock action (1-3)
+        max_nodes: Node budget per solve
+        time_limit: Wall-clock budget per solve in seconds (None = no limit)
+        cancel_event: Event stopping a running solve (UNKNOWN) when set
+    """
+
+    def __init__(
+        self,
+        rules: SolitaireRules,
+        draw_count: int = 1,
+        max_nodes: int = 200_000,
+        time_limit: Optional[float] = 10.0,
+        cancel_event: Optional[threading.Event] = None
+    ) -> None:
+        """Initialize the solver.
+
+        Args:
+            rules: Rules for the deck being played
+            draw_count: Cards drawn per stock action (1-3)
+            max_nodes: Maximum positions to expand
+            time_limit: Maximum seconds per solve (None = no limit)
+            cancel_event: Optional event checked during the search
+                (set it from another thread to stop the solve)
+
+        Raises:
+            ValueError: If draw_count is not between 1 and 3
+        """
+        if not 1 <= draw_count <= 3:
+            raise ValueError(f"draw_count non valido: {draw_count}")
+        self.rules = rules
+        self.draw_count = draw_count
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.cancel_event = cancel_event
+
+        encoding = rules.encoding
+        tables = rules.tables
+        self._ranks = encoding.ranks_per_suit
+        self._card_count = encoding.card_count
+        self._width = tables.width
+        self._stack = tables.stack
+        self._suit = tables.suits
+        self._value = tuple(encoding.value_of(c) for c in range(encoding.card_count))
+        self._kings = tables.king_codes
+        red = encoding.red_suits
+        self._opposite = tuple(
+            tuple(o for o in range(encoding.suit_count) if red[o] != red[s])
+            for s in range(encoding.suit_count)
+        )
+
+        # Per-solve state
+        self._seen: Set[bytes] = set()
+        self._nodes = 0
+        self._deadline: Optional[float] = None
+        self._pruned = False
+
+    # ========================================
+    # PUBLIC API
+    # ========================================
+
+    def solve(self, table: Union[GameTable, CompactTable]) -> SolverResult:
+        """Search a winning line from a position.
+
+        Args:
+            table: Live GameTable or CompactTable snapshot (not modified)
+
+        Returns:
+            SolverResult with status and primitive move list
+        """
+        state = table if isinstance(table, CompactTable) else CompactTable.from_table(table)
+        start = time.monotonic()
+        self._seen = set()
+        self._nodes = 0
+        self._pruned = False
+        self._deadline = start + self.time_limit if self.time_limit is not None else None
+
+        path: List[Move] = []
+        try:
+            found = self._search(self._from_compact(state), path)
+            if found:
+                status = SolverStatus.WINNABLE
+            else:
+                # A pruned move might have led to a win
+                status = SolverStatus.UNKNOWN if self._pruned else SolverStatus.UNWINNABLE
+        except _BudgetExceeded:
+            status = SolverStatus.UNKNOWN
+            path = []
+        finally:
+            self._seen = set()
+
+        return SolverResult(
+            status=status,
+            moves=path if status == SolverStatus.WINNABLE else [],
+            nodes=self._nodes,
+            elapsed=time.monotonic() - start,
+        )
+
+    # ========================================
+    # STATE CONVERSION
+    # ========================================
+
+    def _from_compact(self, state: CompactTable) -> _State:
+        """Build the internal search position from a compact table."""
+        piles = state.piles
+        cols = tuple(bytes(piles[i]) for i in range(7))
+        found = tuple(len(piles[7 + s]) for s in range(4))
+        waste = bytes(b & CODE_MASK for b in piles[WASTE_SLOT])
+        stock = bytes(b & CODE_MASK for b in reversed(piles[STOCK_SLOT]))
+        return cols, found, waste + stock, len(waste)
+
+    def _key(self, state: _State) -> bytes:
+        """Transposition key (tableau column order ignored).
+
+        With draw 1 every talon card is reachable from any waste size, so
+        the split is left out of the key.
+        """
+        cols, found, talon, w = state
+        if self.draw_count == 1:
+            w = 0
+        return b"".join((
+            bytes(found), bytes((w,)), talon, b"\xfe", b"\xff".join(sorted(cols))
+        ))
+
+    # ========================================
+    # SEARCH
+    # ========================================
+
+    def _search(self, state: _State, path: List[Move]) -> bool:
+        """Recursive DFS; appends the winning line to ``path``."""
+        self._nodes += 1
+        if self._nodes > self.max_nodes:
+            raise _BudgetExceeded()
+        if self._nodes % _CLOCK_INTERVAL == 0:
+            if self._deadline is not None and time.monotonic() > self._deadline:
+                raise _BudgetExceeded()
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                raise _BudgetExceeded()
+
+        mark = len(path)
+        state = self._auto_moves(state, path)
+        if sum(state[1]) == self._card_count:
+            return True
+
+        key = self._key(state)
+        if key in self._seen:
+            del path[mark:]
+            return False
+        self._seen.add(key)
+
+        for child in sorted(self._children(state)):
+            child_mark = len(path)
+            child_state = self._apply(state, child, path)
+            if self._search(child_state, path):
+                return True
+            del path[child_mark:]
+
+        del path[mark:]
+        return False
+
+    def _prune(self, skipped: List[int]) -> None:
+        """Note legal moves skipped by a pruning rule (result inexact)."""
+        if skipped:
+            self._pruned = True
+
+    def _can_found(self, code: int, found: Tuple[int, ...]) -> bool:
+        """True if the card is the next one on its (assigned-suit) foundation."""
+        return found[self._suit[code]] == self._value[code] - 1
+
+    def _is_safe(self, code: int, found: Tuple[int, ...]) -> bool:
+        """True if the card will never be needed as a tableau holder."""
+        value = self._value[code]
+        if value <= 2:
+            return True
+        return all(found[o] >= value - 1 for o in self._opposite[self._suit[code]])
+
+    def _auto_moves(self, state: _State, path: List[Move]) -> _State:
+        """Apply safe foundation moves until none is left."""
+        cols, found, talon, w = state
+        changed = True
+        while changed:
+            changed = False
+            for i, col in enumerate(cols):
+                if not col:
+                    continue
+                code = col[-1] & CODE_MASK
+                if self._can_found(code, found) and self._is_safe(code, found):
+                    suit = self._suit[code]
+                    cols = self._replace_col(cols, i, self._reveal(col[:-1]))
+                    found = self._add_found(found, suit, 1)
+                    path.append(Move(MoveKind.TABLEAU_TO_FOUNDATION, i, 7 + suit, 1))
+                    changed = True
+            if w:
+                code = talon[w - 1]
+                if self._can_found(code, found) and self._is_safe(code, found):
+                    suit = self._suit[code]
+                    talon = talon[:w - 1] + talon[w:]
+                    w -= 1
+                    found = self._add_found(found, suit, 1)
+                    path.append(Move(MoveKind.WASTE_TO_FOUNDATION, WASTE_SLOT, 7 + suit, 1))
+                    changed = True
+        return cols, found, talon, w
+
+    def _talon_positions(self, talon: bytes, w: int) -> List[Tuple[int, bool]]:
+        """Waste sizes reachable by drawing, with the recycle flag.
+
+        Returns:
+            List of (waste size, needs recycle) for each playable position
+        """
+        length = len(talon)
+        step = self.draw_count
+        positions: List[Tuple[int, bool]] = []
+        same_pass = set()
+        if w:
+            positions.append((w, False))
+            same_pass.add(w)
+        pos = w
+        while pos < length:
+            pos = min(pos + step, length)
+            positions.append((pos, False))
+            same_pass.add(pos)
+        pos = 0
+        while pos < length:
+            pos = min(pos + step, length)
+            if pos not in same_pass:
+                positions.append((pos, True))
+        return positions
+
+    def _children(self, state: _State) -> List[_Child]:
+        """Child descriptors, sortable by priority."""
+        cols, found, talon, w = state
+        stack = self._stack
+        width = self._width
+        suit_of = self._suit
+        kings = self._kings
+        tops = [col[-1] & CODE_MASK if col else -1 for col in cols]
+        first_empty = tops.index(-1) if -1 in tops else -1
+        children: List[_Child] = []
+
+        def targets(code: int, source: int = -1) -> List[int]:
+            """Tableau columns accepting ``code`` (one empty column at most)."""
+            row = code * width + 1
+            result = [
+                j for j in range(7)
+                if j != source and tops[j] >= 0 and stack[row + tops[j]]
+            ]
+            if first_empty >= 0 and first_empty != source and code in kings:
+                result.append(first_empty)
+            return result
+
+        # A King that could use an empty column (in the talon, or heading
+        # a face-up run that is not already at the bottom of its column)
+        king_waiting = any(code in kings for code in talon) or any(
+            b & FACE_UP and (b & CODE_MASK) in kings and i > 0
+            for col in cols for i, b in enumerate(col)
+        )
+
+        # ---- Tableau sources ----
+        for i, col in enumerate(cols):
+            if not col:
+                continue
+            size = len(col)
+            top = tops[i]
+            if self._can_found(top, found):
+                reveals = size > 1 and not col[-2] & FACE_UP
+                children.append((0, -reveals, _COL_TO_FOUNDATION, i, suit_of[top]))
+
+            start = size - 1
+            while (start > 0 and col[start - 1] & FACE_UP
+                   and stack[(col[start] & CODE_MASK) * width + (col[start - 1] & CODE_MASK) + 1]):
+                start -= 1
+            face_down = sum(1 for b in col if not b & FACE_UP)
+
+            for index in range(start, size):
+                code = col[index] & CODE_MASK
+                if index == 0:
+                    # Emptying a column: pointless for a King (column swap)
+                    # and only useful if a King is waiting for the space
+                    if code in kings:
+                        continue
+                    if not king_waiting:
+                        self._prune(targets(code, i))
+                        continue
+                    priority = (4, 0)
+                elif not col[index - 1] & FACE_UP:
+                    priority = (2, -face_down)
+                else:
+                    exposed = col[index - 1] & CODE_MASK
+                    if not self._can_found(exposed, found):
+                        self._prune(targets(code, i))
+                        continue
+                    priority = (5, 0)
+                for j in targets(code, i):
+                    if tops[j] < 0 and index == 0:
+                        continue
+                    children.append((*priority, _COL_TO_COL, i, index, j))
+
+        # ---- Talon sources ----
+        for pos, recycle in self._talon_positions(talon, w):
+            code = talon[pos - 1]
+            draws = (pos - w) if not recycle else (len(talon) - w + pos)
+            if self._can_found(code, found):
+                children.append((1, draws, _TALON_TO_FOUNDATION, pos, recycle))
+            for j in targets(code):
+                children.append((3, draws, _TALON_TO_COL, pos, recycle, j))
+
+        # ---- Foundation sources (only to hold a card that is waiting) ----
+        playable = set(talon)
+        for col in cols:
+            playable.update(b & CODE_MASK for b in col if b & FACE_UP)
+        for suit, height in enumerate(found):
+            if height <= 2:
+                continue
+            code = suit * self._ranks + height - 1
+            if not any(stack[c * width + code + 1] for c in playable):
+                self._prune(targets(code))
+                continue
+            for j in targets(code):
+                children.append((6, 0, _FOUNDATION_TO_COL, suit, j))
+
+        return children
+
+    # ========================================
+    # MOVE APPLICATION
+    # ========================================
+
+    @staticmethod
+    def _reveal(col: bytes) -> bytes:
+        """Turn the new top of a tableau column face-up."""
+        if col and not col[-1] & FACE_UP:
+            return col[:-1] + bytes((col[-1] | FACE_UP,))
+        return col
+
+    @staticmethod
+    def _replace_col(cols: Tuple[bytes, ...], index: int, col: bytes) -> Tuple[bytes, ...]:
+        """Copy of ``cols`` with one column replaced."""
+        return cols[:index] + (col,) + cols[index + 1:]
+
+    @staticmethod
+    def _add_found(found: Tuple[int, ...], suit: int, delta: int) -> Tuple[int, ...]:
+        """Copy of foundation heights with one suit changed."""
+        return found[:suit] + (found[suit] + delta,) + found[suit + 1:]
+
+    def _draw_moves(self, talon: bytes, w: int, pos: int, recycle: bool, path: List[Move]) -> None:
+        """Append the primitive DRAW/RECYCLE moves bringing ``w`` to ``pos``."""
+        length = len(talon)
+        step = self.draw_count
+        if recycle:
+            while w < length:
+                path.append(Move(MoveKind.DRAW, STOCK_SLOT, WASTE_SLOT, min(step, length - w)))
+                w = min(w + step, length)
+            path.append(Move(MoveKind.RECYCLE, WASTE_SLOT, STOCK_SLOT, length))
+            w = 0
+        while w < pos:
+            path.append(Move(MoveKind.DRAW, STOCK_SLOT, WASTE_SLOT, min(step, length - w)))
+            w = min(w + step, length)
+
+    def _apply(self, state: _State, child: _Child, path: List[Move]) -> _State:
+        """Apply a child descriptor, appending its primitive moves."""
+        cols, found, talon, w = state
+        kind = child[2]
+
+        if kind == _COL_TO_FOUNDATION:
+            _, _, _, i, suit = child
+            cols = self._replace_col(cols, i, self._reveal(cols[i][:-1]))
+            path.append(Move(MoveKind.TABLEAU_TO_FOUNDATION, i, 7 + suit, 1))
+            return cols, self._add_found(found, suit, 1), talon, w
+
+        if kind == _COL_TO_COL:
+            _, _, _, i, index, j = child
+            source = cols[i]
+            cols = self._replace_col(cols, j, cols[j] + source[index:])
+            cols = self._replace_col(cols, i, self._reveal(source[:index]))
+            path.append(Move(MoveKind.TABLEAU_TO_TABLEAU, i, j, len(source) - index))
+            return cols, found, talon, w
+
+        if kind == _FOUNDATION_TO_COL:
+            _, _, _, suit, j = child
+            code = suit * self._ranks + found[suit] - 1
+            cols = self._replace_col(cols, j, cols[j] + bytes((code | FACE_UP,)))
+            path.append(Move(MoveKind.FOUNDATION_TO_TABLEAU, 7 + suit, j, 1))
+            return cols, self._add_found(found, suit, -1), talon, w
+
+        # Talon plays
+        pos, recycle = child[3], bool(child[4])
+        self._draw_moves(talon, w, pos, recycle, path)
+        code = talon[pos - 1]
+        new_talon = talon[:pos - 1] + talon[pos:]
+        if kind == _TALON_TO_FOUNDATION:
+            suit = self._suit[code]
+            path.append(Move(MoveKind.WASTE_TO_FOUNDATION, WASTE_SLOT, 7 + suit, 1))
+            return cols, self._add_found(found, suit, 1), new_talon, pos - 1
+
+        j = child[5]
+        cols = self._replace_col(cols, j, cols[j] + bytes((code | FACE_UP,)))
+        path.append(Move(MoveKind.WASTE_TO_TABLEAU, WASTE_SLOT, j, 1))
+        return cols, found, new_talon, pos - 1
@@ -0,0 +1,128 @@
+"""Detection of stock cycles that make no progress.
+
+A stock cycle runs from one waste recycle to the next. At every recycle
+the detector compares the position with the one of the previous recycle
+(Zobrist hash taken just before recycling) and combines it with what it
+saw during the cycle:
+
+- NO_PROGRESS: the cycle ended exactly where the previous one did (same
+  tableau, foundations and waste), so the player only cycled the stock
+- DEAD_END: no card was moved during the cycle, no waste card shown was
+  playable and the board has no legal move left: with the same stock
+  order, every further cycle is identical
+
+Drawing costs O(1): GameService reports whether the new waste top is
+playable. The board is only checked at a recycle that closes a cycle
+without moves or playable waste cards (see ``needs_board_moves``).
+
+Example:
+    >>> detector = StallDetector()
+    >>> detector.on_draw(playable=False)
+    >>> detector.on_recycle(position_hash, board_moves=0)
+    <StallStatus.DEAD_END: 'dead_end'>
+"""
+
+from enum import Enum
+from typing import Optional
+
+
+class StallStatus(Enum):
+    """Outcome of the last completed stock cycle."""
+
+    NONE = "none"
+    NO_PROGRESS = "no_progress"
+    DEAD_END = "dead_end"
+
+    @property
+    def is_stuck(self) -> bool:
+        """Whether the last cycle made no progress."""
+        return self is not StallStatus.NONE
+
+
+class StallDetector:
+    """Tracks stock cycles of one game.
+
+    Attributes:
+        status: Outcome of the last completed cycle
+        stalled_cycles: Consecutive cycles without progress
+    """
+
+    __slots__ = (
+        "status", "stalled_cycles", "_cycle_hash", "_waste_playable", "_moved", "_draw_size"
+    )
+
+    def __init__(self) -> None:
+        """Initialize for a new game."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every cycle (new deal, loaded position, undo)."""
+        self.status = StallStatus.NONE
+        self.stalled_cycles = 0
+        self._cycle_hash: Optional[int] = None
+        self._waste_playable = False
+        self._moved = False
+        self._draw_size = 1
+
+    def on_draw(self, playable: bool, count: int = 1) -> None:
+        """Record a draw.
+
+        Args:
+            playable: Whether the new waste top can go on a foundation
+                or tableau pile
+            count: Cards drawn
+        """
+        if playable:
+            self._waste_playable = True
+        if count > self._draw_size:
+            self._draw_size = count
+
+    @property
+    def needs_board_moves(self) -> bool:
+        """Whether the next ``on_recycle`` depends on its board moves.
+
+        Only a cycle that moved no card and showed no playable waste
+        card can be a dead end; for any other cycle the board moves
+        passed to ``on_recycle`` are ignored.
+        """
+        return not self._moved and not self._waste_playable
+
+    def on_move(self) -> None:
+        """Record a card move (anything but a draw or a recycle)."""
+        self._moved = True
+
+    def on_recycle(
+        self,
+        position_hash: Optional[int],
+        board_moves: int,
+        shuffled: bool = False
+    ) -> StallStatus:
+        """Close the current cycle (called just before the recycle).
+
+        Args:
+            position_hash: Exact position hash before recycling (None if
+                the table has no hasher: repetitions are not detected)
+            board_moves: Legal moves of the position other than stock
+                actions
+            shuffled: Whether the recycle shuffles the waste (with more
+                than one card per draw the next cycle shows other cards,
+                so a dead end is only reported as no progress)
+
+        Returns:
+            Status of the completed cycle
+        """
+        repeated = position_hash is not None and position_hash == self._cycle_hash
+        dead = self.needs_board_moves and board_moves == 0
+
+        if dead and (not shuffled or self._draw_size == 1):
+            self.status = StallStatus.DEAD_END
+        elif dead or repeated:
+            self.status = StallStatus.NO_PROGRESS
+        else:
+            self.status = StallStatus.NONE
+        self.stalled_cycles = self.stalled_cycles + 1 if self.status.is_stuck else 0
+
+        self._cycle_hash = position_hash
+        self._waste_playable = False
+        self._moved = False
+        return self.status
@@ -0,0 +1,33 @@
+"""Headless game simulation (benchmarks and scoring validation)."""
+
+from src.domain.simulation.policies import (
+    GreedyPolicy,
+    Policy,
+    RandomPolicy,
+    SolverPolicy,
+    create_policy,
+)
+from src.domain.simulation.runner import (
+    GameSimulator,
+    SimulationConfig,
+    run_simulation,
+)
+from src.domain.simulation.stats import GameResult, LatencyHistogram, SimulationReport
+from src.domain.simulation.win_estimator import WinEstimate, WinEstimator, wilson_interval
+
+__all__ = [
+    "Policy",
+    "RandomPolicy",
+    "GreedyPolicy",
+    "SolverPolicy",
+    "create_policy",
+    "GameSimulator",
+    "SimulationConfig",
+    "run_simulation",
+    "GameResult",
+    "LatencyHistogram",
+    "SimulationReport",
+    "WinEstimate",
+    "WinEstimator",
+    "wilson_interval",
+]
@@ -0,0 +1,176 @@
+"""Move-selection policies for headless game simulation.
+
+A policy picks one move among the legal moves of a position. Policies
+read the CompactTable state (never the Card objects), so choosing a
+move costs about as much as generating the moves.
+
+Available policies (see ``create_policy``):
+- ``random``: uniform choice among the legal moves
+- ``greedy``: foundation moves first, then moves revealing face-down
+  cards, then waste plays, then the stock; never undoes progress
+- ``solver``: plays the KlondikeSolver line of the deal, greedy when
+  the deal is not solved within budget or the line stops applying
+"""
+
+import random
+from typing import Dict, List, Optional, Type
+
+from src.domain.models.compact_table import FACE_UP, CompactTable
+from src.domain.rules.move_generator import Move, MoveKind
+from src.domain.services.game_service import GameService
+from src.domain.services.solver import KlondikeSolver
+
+
+class Policy:
+    """Base class of simulation policies.
+
+    Attributes:
+        name: Policy name used by ``create_policy``
+    """
+
+    name = "base"
+
+    def reset(self, service: GameService, draw_count: int) -> None:
+        """Prepare for a new game (called after the deal).
+
+        Args:
+            service: Game service holding the dealt table
+            draw_count: Cards drawn per stock action
+        """
+
+    def choose(
+        self,
+        state: CompactTable,
+        moves: List[Move],
+        rng: random.Random
+    ) -> Optional[Move]:
+        """Pick the next move.
+
+        Args:
+            state: Current position (not to be modified)
+            moves: Legal moves of the position (not empty)
+            rng: Per-game random generator
+
+        Returns:
+            Move to play, or None to give up the game
+        """
+        raise NotImplementedError
+
+
+class RandomPolicy(Policy):
+    """Uniform random choice among the legal moves."""
+
+    name = "random"
+
+    def choose(self, state: CompactTable, moves: List[Move], rng: random.Random) -> Optional[Move]:
+        return moves[rng.randrange(len(moves))]
+
+
+class GreedyPolicy(Policy):
+    """One-ply heuristic: take the move with the best immediate gain.
+
+    Tableau moves that reveal nothing and foundation-to-tableau moves are
+    never played, so the policy cannot cycle between two positions; it
+    draws from the stock when nothing better is available.
+    """
+
+    name = "greedy"
+
+    def _rate(self, state: CompactTable, move: Move) -> int:
+        """Priority of a move (0 = never play it)."""
+        kind = move.kind
+        if kind == MoveKind.TABLEAU_TO_FOUNDATION:
+            pile = state.piles[move.source]
+            reveals = len(pile) > 1 and not pile[-2] & FACE_UP
+            return 110 if reveals else 100
+        if kind == MoveKind.WASTE_TO_FOUNDATION:
+            return 100
+        if kind == MoveKind.TABLEAU_TO_TABLEAU:
+            pile = state.piles[move.source]
+            base = len(pile) - move.card_count
+            if base > 0 and not pile[base - 1] & FACE_UP:
+                return 50 + base  # Prefer uncovering the deepest columns
+            return 0
+        if kind == MoveKind.WASTE_TO_TABLEAU:
+            return 30
+        if kind in (MoveKind.DRAW, MoveKind.RECYCLE):
+            return 1
+        return 0
+
+    def choose(self, state: CompactTable, moves: List[Move], rng: random.Random) -> Optional[Move]:
+        best: Optional[Move] = None
+        best_rating = 0
+        for move in moves:
+            rating = self._rate(state, move)
+            if rating > best_rating:
+                best, best_rating = move, rating
+        return best
+
+
+class SolverPolicy(GreedyPolicy):
+    """Follows the solver line of the deal, greedy as fallback.
+
+    The line assumes recycles that invert the waste: with shuffled
+    recycles it stops applying at the first recycle and the rest of the
+    game is played greedily.
+
+    Attributes:
+        max_nodes: Solver node budget per deal
+        time_limit: Solver time budget per deal in seconds
+    """
+
+    name = "solver"
+
+    def __init__(self, max_nodes: int = 50_000, time_limit: float = 2.0) -> None:
+        """Initialize the policy.
+
+        Args:
+            max_nodes: Solver node budget per deal
+            time_limit: Solver time budget per deal in seconds
+        """
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self._solver: Optional[KlondikeSolver] = None
+        self._plan: List[Move] = []
+
+    def reset(self, service: GameService, draw_count: int) -> None:
+        solver = self._solver
+        if solver is None or solver.rules is not service.rules or solver.draw_count != draw_count:
+            solver = KlondikeSolver(service.rules, draw_count, self.max_nodes, self.time_limit)
+            self._solver = solver
+        result = solver.solve(service.get_compact_state())
+        self._plan = list(reversed(result.moves))
+
+    def choose(self, state: CompactTable, moves: List[Move], rng: random.Random) -> Optional[Move]:
+        if self._plan:
+            planned = self._plan[-1]
+            if planned in moves:
+                self._plan.pop()
+                return planned
+            self._plan = []
+        return super().choose(state, moves, rng)
+
+
+POLICIES: Dict[str, Type[Policy]] = {
+    RandomPolicy.name: RandomPolicy,
+    GreedyPolicy.name: GreedyPolicy,
+    SolverPolicy.name: SolverPolicy,
+}
+
+
+def create_policy(name: str) -> Policy:
+    """Create a policy by name.
+
+    Args:
+        name: "random", "greedy" or "solver"
+
+    Returns:
+        New policy instance
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    policy_class = POLICIES.get(name)
+    if policy_class is None:
+        raise ValueError(f"Politica sconosciuta: {name} (valide: {', '.join(POLICIES)})")
+    return policy_class()
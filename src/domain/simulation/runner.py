@@ -0,0 +1,289 @@
+"""Headless game simulation runner.
+
+Plays complete games through GameService, SolitaireRules and
+ScoringService (no UI, audio or TTS) and aggregates the outcomes. Each
+process reuses one GameSimulator: the table is re-dealt in place for
+every seed, so a game costs only its moves.
+
+Example:
+    >>> config = SimulationConfig(policy="greedy", draw_count=3)
+    >>> report = run_simulation(config, range(10_000), workers=8)
+    >>> report.win_rate, report.games_per_second
+"""
+
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.domain.models.compact_table import STOCK_SLOT, WASTE_SLOT
+from src.domain.models.deck import FrenchDeck, NeapolitanDeck
+from src.domain.models.scoring import ScoringConfig
+from src.domain.models.table import GameTable
+from src.domain.rules.move_generator import Move, MoveKind
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+from src.domain.services.scoring_service import ScoringService
+from src.domain.simulation.policies import create_policy
+from src.domain.simulation.stats import GameResult, LatencyHistogram, SimulationReport
+
+
+DECK_TYPES: Dict[str, type] = {"french": FrenchDeck, "neapolitan": NeapolitanDeck}
+
+_FOUNDATION_KINDS = (MoveKind.TABLEAU_TO_FOUNDATION, MoveKind.WASTE_TO_FOUNDATION)
+_STOCK_KINDS = (MoveKind.DRAW, MoveKind.RECYCLE)
+
+
+@dataclass
+class SimulationConfig:
+    """Parameters of a simulation run.
+
+    Attributes:
+        deck_type: "french" or "neapolitan"
+        draw_count: Cards drawn per stock action (1-3)
+        policy: Policy name (see policies.create_policy)
+        shuffle_on_recycle: Shuffle the waste when recycling
+        max_actions: Action budget per game
+        scoring_enabled: Record scoring events and compute final scores
+        difficulty_level: Difficulty level used for scoring (1-5)
+        seconds_per_action: Simulated play time per action, used for
+            the time bonus of the final score
+        scoring_config: Scoring configuration (defaults to ScoringConfig())
+    """
+
+    deck_type: str = "french"
+    draw_count: int = 1
+    policy: str = "greedy"
+    shuffle_on_recycle: bool = False
+    max_actions: int = 1000
+    scoring_enabled: bool = True
+    difficulty_level: int = 1
+    seconds_per_action: float = 3.0
+    scoring_config: Optional[ScoringConfig] = None
+
+
+class GameSimulator:
+    """Plays simulated games on one reusable table.
+
+    Attributes:
+        config: Simulation parameters
+        service: Game service of the simulated table
+        policy: Move-selection policy
+    """
+
+    def __init__(self, config: SimulationConfig) -> None:
+        """Build the table, services and policy.
+
+        Args:
+            config: Simulation parameters
+
+        Raises:
+            ValueError: If the deck type or policy is unknown
+        """
+        deck_class = DECK_TYPES.get(config.deck_type)
+        if deck_class is None:
+            raise ValueError(f"Mazzo sconosciuto: {config.deck_type}")
+        self.config = config
+        self.policy = create_policy(config.policy)
+
+        deck = deck_class()
+        scoring = None
+        if config.scoring_enabled:
+            scoring = ScoringService(
+                config=config.scoring_config or ScoringConfig(),
+                difficulty_level=config.difficulty_level,
+                deck_type=config.deck_type,
+                draw_count=config.draw_count,
+            )
+        self.service = GameService(GameTable(deck), SolitaireRules(deck), scoring)
+
+    def _execute(self, move: Move) -> bool:
+        """Play a generated move through GameService."""
+        service = self.service
+        kind = move.kind
+        if kind == MoveKind.DRAW:
+            return service.draw_cards(move.card_count)[0]
+        if kind == MoveKind.RECYCLE:
+            return service.recycle_waste(self.config.shuffle_on_recycle)[0]
+        piles = service.table.pile
+        return service.move_card(
+            piles[move.source], piles[move.target], move.card_count, kind in _FOUNDATION_KINDS
+        )[0]
+
+    def play(
+        self,
+        seed: int,
+        latency: Optional[LatencyHistogram] = None,
+        deal_latency: Optional[LatencyHistogram] = None
+    ) -> GameResult:
+        """Play one game to the end.
+
+        The game ends when it is won, when the policy gives up or only
+        stock actions are played for a whole pass over the stock and
+        waste ("stuck"), or when the action budget runs out ("limit").
+
+        Args:
+            seed: Deal number (see GameService.deal)
+            latency: Histogram receiving the duration of every action
+            deal_latency: Histogram receiving the duration of the new
+                game (deal, reset and start)
+
+        Returns:
+            GameResult of the game
+        """
+        config = self.config
+        service = self.service
+        clock = time.perf_counter_ns
+        started = clock()
+        service.deal(seed)
+        service.reset_game()
+        service.start_game()
+        if deal_latency is not None:
+            deal_latency.add(clock() - started)
+        self.policy.reset(service, config.draw_count)
+
+        rng = random.Random(seed)
+        generate = service.move_generator.generate_compact
+        choose = self.policy.choose
+        outcome = "limit"
+        actions = 0
+        idle = 0
+
+        while actions < config.max_actions:
+            started = clock()
+            state = service.get_compact_state()
+            moves = generate(state, config.draw_count)
+            move = choose(state, moves, rng) if moves else None
+            if move is None or not self._execute(move):
+                outcome = "stuck"
+                break
+            if latency is not None:
+                latency.add(clock() - started)
+            actions += 1
+
+            if move.kind in _STOCK_KINDS:
+                idle += 1
+                talon = len(state.piles[STOCK_SLOT]) + len(state.piles[WASTE_SLOT])
+                if idle > talon + 1:
+                    outcome = "stuck"
+                    break
+            else:
+                idle = 0
+                if move.kind in _FOUNDATION_KINDS and service.is_victory():
+                    outcome = "won"
+                    break
+
+        score = 0
+        if service.scoring:
+            score = service.scoring.calculate_final_score(
+                elapsed_seconds=actions * config.seconds_per_action,
+                move_count=service.move_count,
+                is_victory=outcome == "won",
+                deal_seed=seed,
+            ).total_score
+
+        return GameResult(
+            seed=seed,
+            outcome=outcome,
+            actions=actions,
+            moves=service.move_count,
+            recycles=service.recycle_count,
+            foundation_cards=sum(service.carte_per_seme),
+            score=score,
+        )
+
+    def play_many(self, seeds: Iterable[int]) -> SimulationReport:
+        """Play a batch of games into one report."""
+        report = SimulationReport()
+        started = time.perf_counter()
+        for seed in seeds:
+            report.add(self.play(seed, report.latency, report.deal_latency))
+        report.busy_seconds = time.perf_counter() - started
+        return report
+
+
+# Simulator reused by the calls in the same process
+_SIMULATOR: Optional[GameSimulator] = None
+
+
+def simulate_batch(task: Tuple[SimulationConfig, Sequence[int]]) -> SimulationReport:
+    """Play a batch of seeds (runs in worker processes).
+
+    Args:
+        task: (config, seeds)
+
+    Returns:
+        Report of the batch
+    """
+    global _SIMULATOR
+    config, seeds = task
+    if _SIMULATOR is None or _SIMULATOR.config != config:
+        _SIMULATOR = GameSimulator(config)
+    return _SIMULATOR.play_many(seeds)
+
+
+def run_simulation(
+    config: SimulationConfig,
+    seeds: Iterable[int],
+    workers: int = 1,
+    batch_size: int = 200,
+    progress: Optional[Callable[[SimulationReport], None]] = None,
+    initializer: Optional[Callable[[], None]] = None
+) -> SimulationReport:
+    """Play many games, optionally on a process pool.
+
+    Args:
+        config: Simulation parameters
+        seeds: Deal numbers to play
+        workers: Worker processes (1 = play in this process)
+        batch_size: Games per task sent to a worker
+        progress: Called with the running report after every batch
+        initializer: Called once in this process or in every worker
+            before the first game (e.g. to configure logging)
+
+    Returns:
+        Report of all games, with wall-clock time
+    """
+    started = time.perf_counter()
+    report = SimulationReport()
+    batches = _batches(seeds, batch_size)
+
+    if workers <= 1:
+        if initializer:
+            initializer()
+        for batch in batches:
+            report.merge(simulate_batch((config, batch)))
+            if progress:
+                progress(report)
+    else:
+        window = workers * 2
+        with ProcessPoolExecutor(max_workers=workers, initializer=initializer) as executor:
+            pending = set()
+            for batch in batches:
+                pending.add(executor.submit(simulate_batch, (config, batch)))
+                if len(pending) >= window:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        report.merge(future.result())
+                        if progress:
+                            progress(report)
+            for future in pending:
+                report.merge(future.result())
+                if progress:
+                    progress(report)
+
+    report.wall_seconds = time.perf_counter() - started
+    return report
+
+
+def _batches(seeds: Iterable[int], size: int) -> Iterable[List[int]]:
+    """Split seeds into lists of ``size`` items."""
+    batch: List[int] = []
+    for seed in seeds:
+        batch.append(seed)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
@@ -0,0 +1,222 @@
+"""Aggregated results of simulated games.
+
+Reports are mergeable, so each worker process sends back one small
+report per batch of games instead of per-game or per-move records.
+Move latencies go into a log-scale histogram (8 buckets per power of
+two, about 10% resolution) with constant size whatever the number of
+moves recorded.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+# Sub-buckets per power of two (3 bits of mantissa)
+_SUB_BITS = 3
+_SUB_COUNT = 1 << _SUB_BITS
+_BUCKETS = 64 * _SUB_COUNT
+
+
+class LatencyHistogram:
+    """Log-scale histogram of durations in nanoseconds.
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> histogram.add(12_500)
+        >>> histogram.percentile(50)   # Upper bound of the bucket, in ns
+    """
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts: List[int] = [0] * _BUCKETS
+        self.total = 0
+
+    @staticmethod
+    def _bucket(ns: int) -> int:
+        """Bucket index of a duration."""
+        if ns < _SUB_COUNT:
+            return max(ns, 0)
+        exponent = ns.bit_length() - 1
+        mantissa = (ns >> (exponent - _SUB_BITS)) & (_SUB_COUNT - 1)
+        return (exponent - _SUB_BITS + 1) * _SUB_COUNT + mantissa
+
+    @staticmethod
+    def _upper_bound(bucket: int) -> int:
+        """Largest duration falling in a bucket."""
+        if bucket < _SUB_COUNT:
+            return bucket
+        exponent = bucket // _SUB_COUNT + _SUB_BITS - 1
+        mantissa = bucket % _SUB_COUNT
+        return ((_SUB_COUNT + mantissa + 1) << (exponent - _SUB_BITS)) - 1
+
+    def add(self, ns: int) -> None:
+        """Record one duration."""
+        self.counts[self._bucket(ns)] += 1
+        self.total += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the counts of another histogram."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.total += other.total
+
+    def percentile(self, percent: float) -> int:
+        """Duration below which ``percent``% of the samples fall.
+
+        Args:
+            percent: 0-100
+
+        Returns:
+            Upper bound of the bucket in nanoseconds (0 if empty)
+        """
+        if self.total == 0:
+            return 0
+        rank = max(1, -(-self.total * percent // 100))
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self._upper_bound(bucket)
+        return self._upper_bound(_BUCKETS - 1)
+
+
+@dataclass
+class GameResult:
+    """Outcome of one simulated game.
+
+    Attributes:
+        seed: Deal number
+        outcome: "won", "stuck" (no useful move left) or "limit"
+            (action budget exhausted)
+        actions: Actions played (moves, draws and recycles)
+        moves: Moves counted by GameService
+        recycles: Waste recycles
+        foundation_cards: Cards on the foundations at the end
+        score: Final score (0 if scoring is disabled)
+    """
+
+    seed: int
+    outcome: str
+    actions: int
+    moves: int
+    recycles: int
+    foundation_cards: int
+    score: int = 0
+
+    @property
+    def won(self) -> bool:
+        """True if the game was won."""
+        return self.outcome == "won"
+
+
+@dataclass
+class SimulationReport:
+    """Aggregated outcome of a batch of simulated games.
+
+    Attributes:
+        games: Games played
+        outcomes: Games per outcome ("won", "stuck", "limit")
+        actions: Total actions played
+        moves: Total moves counted by GameService
+        recycles: Total waste recycles
+        foundation_cards: Total cards brought to the foundations
+        score_total: Sum of final scores
+        score_min: Lowest final score
+        score_max: Highest final score
+        busy_seconds: CPU time spent playing (summed over workers)
+        wall_seconds: Wall-clock time of the run (set by the runner)
+        latency: Per-action latency histogram (policy choice + execution)
+        deal_latency: New game latency histogram (deal, reset and start)
+    """
+
+    games: int = 0
+    outcomes: Dict[str, int] = field(default_factory=dict)
+    actions: int = 0
+    moves: int = 0
+    recycles: int = 0
+    foundation_cards: int = 0
+    score_total: int = 0
+    score_min: int = 0
+    score_max: int = 0
+    busy_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    deal_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def add(self, result: GameResult) -> None:
+        """Add one game result."""
+        if self.games == 0:
+            self.score_min = self.score_max = result.score
+        else:
+            self.score_min = min(self.score_min, result.score)
+            self.score_max = max(self.score_max, result.score)
+        self.games += 1
+        self.outcomes[result.outcome] = self.outcomes.get(result.outcome, 0) + 1
+        self.actions += result.actions
+        self.moves += result.moves
+        self.recycles += result.recycles
+        self.foundation_cards += result.foundation_cards
+        self.score_total += result.score
+
+    def merge(self, other: "SimulationReport") -> None:
+        """Add another report (wall time is not summed)."""
+        if other.games == 0:
+            return
+        if self.games == 0:
+            self.score_min, self.score_max = other.score_min, other.score_max
+        else:
+            self.score_min = min(self.score_min, other.score_min)
+            self.score_max = max(self.score_max, other.score_max)
+        self.games += other.games
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + count
+        self.actions += other.actions
+        self.moves += other.moves
+        self.recycles += other.recycles
+        self.foundation_cards += other.foundation_cards
+        self.score_total += other.score_total
+        self.busy_seconds += other.busy_seconds
+        self.latency.merge(other.latency)
+        self.deal_latency.merge(other.deal_latency)
+
+    @property
+    def wins(self) -> int:
+        """Games won."""
+        return self.outcomes.get("won", 0)
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of games won (0.0-1.0)."""
+        return self.wins / self.games if self.games else 0.0
+
+    @property
+    def games_per_second(self) -> float:
+        """Throughput over the wall-clock time (busy time if not set)."""
+        seconds = self.wall_seconds or self.busy_seconds
+        return self.games / seconds if seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary as a JSON-serialisable dict (latencies in microseconds)."""
+        games = self.games or 1
+        return {
+            "games": self.games,
+            "outcomes": dict(self.outcomes),
+            "win_rate": round(self.win_rate, 4),
+            "mean_actions": round(self.actions / games, 1),
+            "mean_moves": round(self.moves / games, 1),
+            "mean_recycles": round(self.recycles / games, 2),
+            "mean_foundation_cards": round(self.foundation_cards / games, 1),
+            "mean_score": round(self.score_total / games, 1),
+            "score_min": self.score_min,
+            "score_max": self.score_max,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "games_per_second": round(self.games_per_second, 1),
+            "latency_us": {
+                f"p{p}": round(self.latency.percentile(p) / 1000, 1)
+                for p in (50, 90, 99, 99.9)
+            },
+            "deal_latency_us": {
+                f"p{p}": round(self.deal_latency.percentile(p) / 1000, 1)
+                for p in (50, 90, 99)
+            },
+        }
@@ -0,0 +1,493 @@
+"""Win probability of the current position by Monte Carlo rollouts.
+
+The player does not know the face-down cards. WinEstimator samples
+arrangements of them consistent with what the player has seen (the
+cards still unseen are dealt at random over the unseen face-down
+positions), plays every sample to the end and reports the fraction of
+won samples with a Wilson confidence interval.
+
+Each sample is a full-information position: it is solved by
+KlondikeSolver with a small node budget, and played by the greedy
+simulation policy when the budget runs out. The solver knows every
+card of the sample, so the estimate is optimistic for a player who
+still has to guess; an exhausted budget counted as a greedy game makes
+it pessimistic. Like the solver, rollouts assume recycles that invert
+the waste.
+
+Rollouts run in batches on a process pool, driven by a coordinator
+thread: ``start()`` returns at once, ``estimate()`` returns the running
+figures at any moment, and ``cancel()`` (or starting on a new position)
+stops the work. The estimator never calls back into the caller, so a UI
+polls it from its own thread. Batches already running in a worker
+process end within the per-batch deadline and their results are
+dropped.
+
+Example:
+    >>> estimator = WinEstimator("french", draw_count=1, time_limit=2.0)
+    >>> estimator.start(service.get_compact_state(), seen=seen_codes)
+    >>> estimator.wait(0.5)
+    >>> estimate = estimator.estimate(service.get_compact_state())
+    >>> estimate.probability, estimate.low, estimate.high
+"""
+
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from src.domain.models.compact_table import FACE_UP, STOCK_SLOT, WASTE_SLOT, CompactTable
+from src.domain.rules.move_generator import LegalMoveGenerator, MoveKind, apply_move
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.solver import KlondikeSolver, SolverStatus
+from src.domain.simulation.policies import GreedyPolicy
+from src.domain.simulation.runner import DECK_TYPES
+from src.infrastructure.logging import game_logger as log
+
+
+_STOCK_KINDS = (MoveKind.DRAW, MoveKind.RECYCLE)
+
+# Pile positions (slot, index) whose cards are shuffled among themselves
+_Group = Tuple[Tuple[int, int], ...]
+
+
+class WinEstimate(NamedTuple):
+    """Running result of an estimate.
+
+    Attributes:
+        wins: Samples won
+        samples: Samples played
+        low: Lower bound of the 95% confidence interval
+        high: Upper bound of the 95% confidence interval
+        finished: True when no more samples will be played (sample or
+            time budget spent, or nothing left to sample)
+    """
+
+    wins: int
+    samples: int
+    low: float
+    high: float
+    finished: bool = False
+
+    @property
+    def probability(self) -> float:
+        """Fraction of won samples (0.0 before the first one)."""
+        return self.wins / self.samples if self.samples else 0.0
+
+
+class RolloutTask(NamedTuple):
+    """Batch of samples sent to a worker process.
+
+    Attributes:
+        deck_type: "french" or "neapolitan"
+        draw_count: Cards drawn per stock action (1-3)
+        piles: Position (13 piles, see CompactTable)
+        groups: Positions whose cards are shuffled for each sample
+        seeds: One sample seed per rollout
+        max_nodes: Solver node budget per rollout
+        deadline: Wall-clock time (``time.time()``) ending the batch
+    """
+
+    deck_type: str
+    draw_count: int
+    piles: Tuple[bytes, ...]
+    groups: Tuple[_Group, ...]
+    seeds: Tuple[int, ...]
+    max_nodes: int
+    deadline: float
+
+
+def wilson_interval(wins: int, samples: int, z: float = 1.96) -> Tuple[float, float]:
+    """Wilson score interval of a win rate.
+
+    Unlike the normal approximation it stays inside [0, 1] and is
+    meaningful for few samples or rates close to 0 or 1.
+
+    Args:
+        wins: Successes
+        samples: Trials
+        z: Normal quantile of the confidence level (1.96 = 95%)
+
+    Returns:
+        (low, high), (0.0, 1.0) without samples
+    """
+    if samples <= 0:
+        return 0.0, 1.0
+    rate = wins / samples
+    z2 = z * z
+    center = (rate + z2 / (2 * samples)) / (1 + z2 / samples)
+    margin = z * math.sqrt(rate * (1 - rate) / samples + z2 / (4 * samples * samples)) / (1 + z2 / samples)
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def hidden_groups(
+    state: CompactTable,
+    seen: Iterable[int] = (),
+    shuffled_stock: bool = False
+) -> Tuple[_Group, ...]:
+    """Face-down positions whose cards the player cannot know.
+
+    Face-down tableau and stock cards never seen are interchangeable:
+    they form one group. Stock cards already seen keep their place,
+    unless recycles shuffle the waste: then their order is unknown and
+    they form a second group.
+
+    Args:
+        state: Current position
+        seen: Codes of the cards the player has seen (e.g. drawn)
+        shuffled_stock: Whether recycles shuffle the waste
+
+    Returns:
+        Groups of (slot, index) positions (empty groups left out)
+    """
+    seen_codes = set(seen)
+    unseen: List[Tuple[int, int]] = []
+    seen_stock: List[Tuple[int, int]] = []
+    for slot in (*range(7), STOCK_SLOT):
+        for index, byte in enumerate(state.piles[slot]):
+            if byte & FACE_UP:
+                continue
+            if byte not in seen_codes:
+                unseen.append((slot, index))
+            elif slot == STOCK_SLOT and shuffled_stock:
+                seen_stock.append((slot, index))
+    return tuple(tuple(group) for group in (unseen, seen_stock) if len(group) > 1)
+
+
+def sample_position(state: CompactTable, groups: Sequence[_Group], rng: random.Random) -> CompactTable:
+    """Copy of a position with the cards of each group shuffled.
+
+    Args:
+        state: Current position (not modified)
+        groups: Positions to shuffle (see ``hidden_groups``)
+        rng: Random generator of the sample
+
+    Returns:
+        New CompactTable
+    """
+    sample = state.copy()
+    piles = sample.piles
+    for group in groups:
+        codes = [piles[slot][index] for slot, index in group]
+        rng.shuffle(codes)
+        for (slot, index), code in zip(group, codes):
+            piles[slot][index] = code
+    return sample
+
+
+class _Roller:
+    """Plays samples of one deck type and draw count (one per process)."""
+
+    def __init__(self, deck_type: str, draw_count: int) -> None:
+        deck = DECK_TYPES[deck_type]()
+        self.key = (deck_type, draw_count)
+        self.rules = SolitaireRules(deck)
+        self.draw_count = draw_count
+        self.generator = LegalMoveGenerator(self.rules)
+        self.policy = GreedyPolicy()
+
+    def play(
+        self,
+        state: CompactTable,
+        max_nodes: int,
+        time_limit: float,
+        rng: random.Random,
+        cancel: Optional[threading.Event] = None
+    ) -> bool:
+        """Whether a full-information sample is won (solver, then greedy)."""
+        solver = KlondikeSolver(self.rules, self.draw_count, max_nodes, time_limit, cancel)
+        status = solver.solve(state).status
+        if status != SolverStatus.UNKNOWN:
+            return status == SolverStatus.WINNABLE
+        return self._play_greedy(state, rng)
+
+    def _play_greedy(self, state: CompactTable, rng: random.Random, max_actions: int = 1000) -> bool:
+        """Play the greedy policy until a win, a dead end or a stock loop."""
+        generate = self.generator.generate_compact
+        choose = self.policy.choose
+        piles = state.piles
+        idle = 0
+        for _ in range(max_actions):
+            moves = generate(state, self.draw_count)
+            move = choose(state, moves, rng) if moves else None
+            if move is None:
+                return False
+            talon = len(piles[STOCK_SLOT]) + len(piles[WASTE_SLOT])
+            apply_move(state, move)
+            if move.kind in _STOCK_KINDS:
+                idle += 1
+                if idle > talon + 1:
+                    return False
+            else:
+                idle = 0
+                if state.is_won():
+                    return True
+        return False
+
+
+# Roller reused by the batches in the same process
+_ROLLER: Optional[_Roller] = None
+
+
+def rollout_batch(task: RolloutTask, cancel: Optional[threading.Event] = None) -> Tuple[int, int]:
+    """Play a batch of samples (runs in worker processes).
+
+    Args:
+        task: Position, groups and sample seeds
+        cancel: Event stopping the batch when set (in-process only)
+
+    Returns:
+        (wins, samples played before the deadline)
+    """
+    global _ROLLER
+    if _ROLLER is None or _ROLLER.key != (task.deck_type, task.draw_count):
+        _ROLLER = _Roller(task.deck_type, task.draw_count)
+    state = CompactTable(_ROLLER.rules.encoding, [bytearray(pile) for pile in task.piles])
+
+    wins = samples = 0
+    for seed in task.seeds:
+        remaining = task.deadline - time.time()
+        if remaining <= 0 or (cancel is not None and cancel.is_set()):
+            break
+        rng = random.Random(seed)
+        sample = sample_position(state, task.groups, rng)
+        wins += _ROLLER.play(sample, task.max_nodes, remaining, rng, cancel)
+        samples += 1
+    return wins, samples
+
+
+class WinEstimator:
+    """Background Monte Carlo estimate of the chance to win.
+
+    Attributes:
+        deck_type: "french" or "neapolitan"
+        draw_count: Cards drawn per stock action (1-3)
+        workers: Worker processes (1 = rollouts on the coordinator thread)
+        time_limit: Wall-clock budget of an estimate in seconds
+        max_samples: Samples after which the estimate is finished
+        batch_size: Samples per task sent to a worker
+        max_nodes: Solver node budget per sample
+        shuffle_on_recycle: Whether recycles shuffle the waste
+    """
+
+    def __init__(
+        self,
+        deck_type: str = "french",
+        draw_count: int = 1,
+        workers: Optional[int] = None,
+        time_limit: float = 3.0,
+        max_samples: int = 400,
+        batch_size: int = 4,
+        max_nodes: int = 2_000,
+        shuffle_on_recycle: bool = False
+    ) -> None:
+        """Initialize an idle estimator (the pool starts on first use).
+
+        Args:
+            deck_type: "french" or "neapolitan"
+            draw_count: Cards drawn per stock action (1-3)
+            workers: Worker processes (None = CPU count - 1, at most 4)
+            time_limit: Maximum seconds per estimate
+            max_samples: Samples per estimate
+            batch_size: Samples per worker task (smaller batches stop
+                sooner after a cancel)
+            max_nodes: Solver node budget per sample
+            shuffle_on_recycle: Whether recycles shuffle the waste (the
+                order of the stock cards already seen is then unknown)
+
+        Raises:
+            ValueError: If the deck type is unknown
+        """
+        if deck_type not in DECK_TYPES:
+            raise ValueError(f"Mazzo sconosciuto: {deck_type}")
+        if workers is None:
+            workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+        self.deck_type = deck_type
+        self.draw_count = draw_count
+        self.workers = workers
+        self.time_limit = time_limit
+        self.max_samples = max_samples
+        self.batch_size = batch_size
+        self.max_nodes = max_nodes
+        self.shuffle_on_recycle = shuffle_on_recycle
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Set["Future[Tuple[int, int]]"] = set()
+        self._lock = threading.Lock()
+        self._key: Optional[bytes] = None
+        self._estimate: Optional[WinEstimate] = None
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ========================================
+    # PUBLIC API
+    # ========================================
+
+    def start(self, state: CompactTable, seen: Iterable[int] = ()) -> None:
+        """Start estimating a position, cancelling any running estimate.
+
+        Args:
+            state: Position to estimate (copied, the caller keeps it)
+            seen: Codes of the face-down cards the player has seen
+        """
+        self.cancel()
+        state = state.copy()
+        key = state.key()
+        groups = hidden_groups(state, seen, self.shuffle_on_recycle)
+        cancel = threading.Event()
+
+        with self._lock:
+            self._key = key
+            self._estimate = WinEstimate(0, 0, *wilson_interval(0, 0))
+            self._cancel = cancel
+
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(state, key, groups, cancel),
+            name="win-estimate",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def estimate(self, state: Optional[CompactTable] = None) -> Optional[WinEstimate]:
+        """Figures of the running (or last) estimate.
+
+        Args:
+            state: Current position; if given and different from the
+                estimated one, the stale estimate is cancelled and None
+                is returned
+
+        Returns:
+            WinEstimate, or None if none is available for the position
+        """
+        with self._lock:
+            key, estimate = self._key, self._estimate
+        if state is not None and state.key() != key:
+            if key is not None:
+                self.cancel()
+            return None
+        return estimate
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the running estimate to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None = until it ends)
+
+        Returns:
+            True if no estimate is running any more
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return not self.running
+
+    def cancel(self) -> None:
+        """Stop the running estimate and forget the position."""
+        with self._lock:
+            self._cancel.set()
+            self._key = None
+            self._estimate = None
+
+    def close(self) -> None:
+        """Cancel and shut the worker processes down."""
+        self.cancel()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            # shutdown(cancel_futures=True) needs Python 3.9
+            for future in list(self._pending):
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    @property
+    def running(self) -> bool:
+        """Whether an estimate is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    # ========================================
+    # COORDINATOR
+    # ========================================
+
+    def _publish(self, key: bytes, wins: int, samples: int, finished: bool, cancel: threading.Event) -> None:
+        """Replace the figures unless the estimate was cancelled meanwhile."""
+        with self._lock:
+            if not cancel.is_set() and self._key == key:
+                self._estimate = WinEstimate(wins, samples, *wilson_interval(wins, samples), finished)
+
+    def _tasks(self, state: CompactTable, groups: Tuple[_Group, ...], deadline: float) -> Iterable[RolloutTask]:
+        """Batches of fresh sample seeds up to ``max_samples``."""
+        piles = tuple(bytes(pile) for pile in state.piles)
+        # Nothing hidden: every sample is the same position
+        total = self.max_samples if groups else 1
+        rng = random.Random()
+        for start in range(0, total, self.batch_size):
+            seeds = tuple(rng.getrandbits(32) for _ in range(min(self.batch_size, total - start)))
+            yield RolloutTask(
+                self.deck_type, self.draw_count, piles, groups, seeds, self.max_nodes, deadline
+            )
+
+    def _run(
+        self,
+        state: CompactTable,
+        key: bytes,
+        groups: Tuple[_Group, ...],
+        cancel: threading.Event
+    ) -> None:
+        """Play batches until the sample or time budget is spent."""
+        deadline = time.time() + self.time_limit
+        wins = samples = 0
+        try:
+            tasks = self._tasks(state, groups, deadline)
+            if self.workers <= 1:
+                for task in tasks:
+                    if cancel.is_set() or time.time() >= deadline:
+                        break
+                    won, played = rollout_batch(task, cancel)
+                    wins, samples = wins + won, samples + played
+                    self._publish(key, wins, samples, False, cancel)
+            else:
+                wins, samples = self._run_pool(tasks, key, deadline, cancel)
+        except Exception as e:
+            log.error_occurred("WinEstimator", "Win estimate failed", e)
+        self._publish(key, wins, samples, True, cancel)
+
+    def _run_pool(
+        self,
+        tasks: Iterable[RolloutTask],
+        key: bytes,
+        deadline: float,
+        cancel: threading.Event
+    ) -> Tuple[int, int]:
+        """Spread the batches over the worker processes."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        executor = self._executor
+        window = self.workers * 2
+        pending: Set["Future[Tuple[int, int]]"] = set()
+        self._pending = pending
+        wins = samples = 0
+        tasks = iter(tasks)
+        exhausted = False
+        try:
+            while True:
+                stopping = cancel.is_set() or time.time() >= deadline
+                while not exhausted and not stopping and len(pending) < window:
+                    task = next(tasks, None)
+                    if task is None:
+                        exhausted = True
+                    else:
+                        pending.add(executor.submit(rollout_batch, task))
+                if not pending or cancel.is_set():
+                    break
+                finished, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                pending -= finished
+                for future in finished:
+                    won, played = future.result()
+                    wins, samples = wins + won, samples + played
+                if finished:
+                    self._publish(key, wins, samples, False, cancel)
+        finally:
+            for future in pending:
+                future.cancel()
+        return wins, samples
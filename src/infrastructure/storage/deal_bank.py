@@ -0,0 +1,255 @@
+"""Binary bank of verified-winnable deals.
+
+The bank is filled offline by ``scripts/generate_deal_bank.py`` and read
+at game start through a memory map: only the small header is parsed, a
+deal is drawn in O(1) by random index.
+
+File layout (little-endian):
+- header: magic ``b"SCDB"``, version (u16), section count (u16)
+- section table: deck code (u8), draw count (u8), 2 pad bytes,
+  first record index (u32), record count (u32)
+- records, grouped by section: seed (u32), deck code (u8),
+  draw count (u8), solution length (u16), difficulty rating (u8), pad
+
+Storage location: <runtime root>/config/deal_bank.bin
+"""
+
+import mmap
+import os
+import random
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.infrastructure.config.runtime_root import get_runtime_root
+from src.infrastructure.logging import game_logger as log
+
+
+MAGIC = b"SCDB"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")
+_SECTION = struct.Struct("<BB2xII")
+_RECORD = struct.Struct("<IBBHBx")
+
+DECK_CODES: Dict[str, int] = {"french": 0, "neapolitan": 1}
+_DECK_NAMES: Dict[int, str] = {code: name for name, code in DECK_CODES.items()}
+
+DEFAULT_BANK_PATH = get_runtime_root() / "config" / "deal_bank.bin"
+
+
+@dataclass(frozen=True)
+class DealBankEntry:
+    """One verified-winnable deal.
+
+    Attributes:
+        seed: Deal number (see ``GameService.deal``)
+        deck_type: "french" or "neapolitan"
+        draw_count: Cards drawn per click the deal was solved with
+        solution_length: Moves of the solver solution
+        difficulty: Rating 1 (trivial) - 10 (large search needed)
+    """
+
+    seed: int
+    deck_type: str
+    draw_count: int
+    solution_length: int
+    difficulty: int
+
+
+def difficulty_rating(nodes: int) -> int:
+    """Rate a deal from the solver effort (nodes expanded).
+
+    Args:
+        nodes: Nodes expanded by the solver to find the solution
+
+    Returns:
+        Rating 1-10, one step per doubling above 64 nodes
+    """
+    return max(1, min(10, nodes.bit_length() - 6))
+
+
+def write_deal_bank(path: Path, entries: Iterable[DealBankEntry]) -> int:
+    """Write a bank file atomically (temp file + rename).
+
+    Args:
+        path: Destination file
+        entries: Deals to store (any order)
+
+    Returns:
+        Number of records written
+    """
+    sections: Dict[Tuple[int, int], List[DealBankEntry]] = {}
+    for entry in entries:
+        key = (DECK_CODES[entry.deck_type], entry.draw_count)
+        sections.setdefault(key, []).append(entry)
+
+    table = bytearray(_HEADER.pack(MAGIC, VERSION, len(sections)))
+    records = bytearray()
+    start = 0
+    for (deck_code, draw_count), group in sorted(sections.items()):
+        table += _SECTION.pack(deck_code, draw_count, start, len(group))
+        for entry in group:
+            records += _RECORD.pack(
+                entry.seed, deck_code, draw_count,
+                min(entry.solution_length, 0xFFFF), entry.difficulty
+            )
+        start += len(group)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(table)
+        f.write(records)
+    os.replace(temp_path, path)
+    return start
+
+
+class DealBank:
+    """Memory-mapped reader of a deal bank file.
+
+    Deals are drawn without repetition: every section keeps a sparse
+    Fisher-Yates permutation, so each draw is O(1) in time and the
+    memory grows only with the number of deals drawn.
+
+    Attributes:
+        path: Bank file path
+
+    Example:
+        >>> bank = DealBank.open()
+        >>> entry = bank.draw("french", 1) if bank else None
+        >>> seed = entry.seed if entry else new_deal_seed()
+    """
+
+    def __init__(self, path: Path):
+        """Map a bank file and read its section table.
+
+        Args:
+            path: Bank file path
+
+        Raises:
+            OSError: If the file cannot be opened or mapped
+            ValueError: If the file is not a valid deal bank
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, section_count = _HEADER.unpack_from(self._map, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Not a deal bank (v{VERSION}): {self.path}")
+
+            self._records_offset = _HEADER.size + section_count * _SECTION.size
+            self._sections: Dict[Tuple[int, int], Tuple[int, int]] = {}
+            for i in range(section_count):
+                deck_code, draw_count, start, count = _SECTION.unpack_from(
+                    self._map, _HEADER.size + i * _SECTION.size
+                )
+                self._sections[(deck_code, draw_count)] = (start, count)
+
+            end = self._records_offset + sum(c for _, c in self._sections.values()) * _RECORD.size
+            if end > len(self._map):
+                raise ValueError(f"Truncated deal bank: {self.path}")
+        except (struct.error, ValueError):
+            self._map.close()
+            raise
+
+        # Per-section draw state: (remaining, swapped positions)
+        self._draws: Dict[Tuple[int, int], Tuple[int, Dict[int, int]]] = {}
+
+    @classmethod
+    def open(cls, path: Optional[Path] = None) -> Optional["DealBank"]:
+        """Open a bank, returning None if it is missing or invalid.
+
+        Args:
+            path: Bank file path (defaults to DEFAULT_BANK_PATH)
+
+        Returns:
+            DealBank instance, or None (callers fall back to random deals)
+        """
+        path = Path(path) if path else DEFAULT_BANK_PATH
+        if not path.is_file():
+            return None
+        try:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            log.error_occurred("DealBank", f"Failed to open: {path}", e)
+            return None
+
+    def _section(self, deck_type: str, draw_count: int) -> Optional[Tuple[int, int]]:
+        deck_code = DECK_CODES.get(deck_type)
+        return self._sections.get((deck_code, draw_count)) if deck_code is not None else None
+
+    def count(self, deck_type: str, draw_count: int) -> int:
+        """Number of deals stored for a deck type and draw count."""
+        section = self._section(deck_type, draw_count)
+        return section[1] if section else 0
+
+    def remaining(self, deck_type: str, draw_count: int) -> int:
+        """Number of deals not yet drawn in this session."""
+        key = (DECK_CODES.get(deck_type, -1), draw_count)
+        if key in self._draws:
+            return self._draws[key][0]
+        return self.count(deck_type, draw_count)
+
+    def entry(self, deck_type: str, draw_count: int, index: int) -> DealBankEntry:
+        """Read one record of a section.
+
+        Args:
+            deck_type: "french" or "neapolitan"
+            draw_count: Cards drawn per click
+            index: Record index within the section
+
+        Returns:
+            Stored deal
+
+        Raises:
+            IndexError: If the section has no such record
+        """
+        section = self._section(deck_type, draw_count)
+        if section is None or not 0 <= index < section[1]:
+            raise IndexError(f"No deal {index} for {deck_type}/{draw_count}")
+        offset = self._records_offset + (section[0] + index) * _RECORD.size
+        seed, deck_code, draw, length, difficulty = _RECORD.unpack_from(self._map, offset)
+        return DealBankEntry(seed, _DECK_NAMES[deck_code], draw, length, difficulty)
+
+    def draw(
+        self,
+        deck_type: str,
+        draw_count: int,
+        rng: Optional[random.Random] = None
+    ) -> Optional[DealBankEntry]:
+        """Draw a random deal not drawn before by this reader.
+
+        Args:
+            deck_type: "french" or "neapolitan"
+            draw_count: Cards drawn per click
+            rng: Generator for the index (defaults to the global one)
+
+        Returns:
+            Deal, or None if the section is missing or exhausted
+        """
+        key = (DECK_CODES.get(deck_type, -1), draw_count)
+        remaining, swaps = self._draws.get(key, (self.count(deck_type, draw_count), {}))
+        if remaining == 0:
+            return None
+
+        pick = (rng or random).randrange(remaining)
+        remaining -= 1
+        index = swaps.get(pick, pick)
+        swaps[pick] = swaps.pop(remaining, remaining)
+        self._draws[key] = (remaining, swaps)
+        return self.entry(deck_type, draw_count, index)
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._map.close()
+
+    def __enter__(self) -> "DealBank":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,94 @@
+"""Binary storage of the in-progress game with atomic write safety.
+
+Holds a single save blob (see src/domain/services/saved_game.py) that is
+rewritten after every move, so the write path does no logging on success
+and no directory checks beyond the first save.
+
+Storage location: ~/.solitario/saved_game.bin
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+from src.infrastructure.logging import game_logger as log
+
+
+class GameSaveStorage:
+    """Persistent storage of the in-progress game blob.
+
+    Attributes:
+        save_path: Path of the save file
+
+    Example:
+        >>> storage = GameSaveStorage()
+        >>> storage.save(blob)
+        >>> blob = storage.load()  # None if there is no saved game
+    """
+
+    def __init__(self, save_path: Optional[Path] = None):
+        """Initialize game save storage.
+
+        Args:
+            save_path: Custom save file path (optional).
+                      Defaults to ~/.solitario/saved_game.bin
+        """
+        self.save_path = Path(save_path) if save_path else (
+            Path.home() / ".solitario" / "saved_game.bin"
+        )
+        self._dir_ready = False
+
+    def save(self, blob: bytes) -> bool:
+        """Write the save blob atomically (temp file + rename).
+
+        Args:
+            blob: Encoded saved game
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        temp_path = self.save_path.with_suffix(self.save_path.suffix + ".tmp")
+        try:
+            if not self._dir_ready:
+                self.save_path.parent.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
+            with open(temp_path, "wb") as f:
+                f.write(blob)
+            os.replace(temp_path, self.save_path)
+            return True
+        except OSError as e:
+            if temp_path.exists():
+                temp_path.unlink()
+            log.error_occurred("GameSaveStorage", f"Failed to save game: {self.save_path}", e)
+            return False
+
+    def load(self) -> Optional[bytes]:
+        """Read the save blob.
+
+        Returns:
+            Saved bytes, or None if there is no saved game or it cannot be read
+        """
+        try:
+            return self.save_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            log.error_occurred("GameSaveStorage", f"Failed to load game: {self.save_path}", e)
+            return None
+
+    def delete(self) -> bool:
+        """Remove the saved game (finished or abandoned).
+
+        Returns:
+            True if removed or already absent, False on error
+        """
+        try:
+            self.save_path.unlink(missing_ok=True)
+            return True
+        except OSError as e:
+            log.error_occurred("GameSaveStorage", f"Failed to delete game: {self.save_path}", e)
+            return False
+
+    def exists(self) -> bool:
+        """Check if there is a saved game."""
+        return self.save_path.is_file()
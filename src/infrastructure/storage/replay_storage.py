@@ -0,0 +1,113 @@
+"""Append-only storage of game replays.
+
+One file per game (see src/domain/services/replay.py), named after the
+replay id stored in the session record. Bytes are appended as the game
+is played: every append is flushed to the OS, so a crash of the app
+leaves a readable replay of the game up to the last flush.
+
+Storage location: ~/.solitario/replays/<replay_id>.rpl
+"""
+
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from src.infrastructure.logging import game_logger as log
+
+
+class ReplayStorage:
+    """Persistent storage of replay files.
+
+    Attributes:
+        replay_dir: Directory of the replay files
+
+    Example:
+        >>> storage = ReplayStorage()
+        >>> append = storage.appender(replay_id)
+        >>> append(header_bytes)
+        >>> blob = storage.load(replay_id)
+    """
+
+    SUFFIX = ".rpl"
+
+    def __init__(self, replay_dir: Optional[Path] = None):
+        """Initialize replay storage.
+
+        Args:
+            replay_dir: Custom replay directory (optional).
+                       Defaults to ~/.solitario/replays
+        """
+        self.replay_dir = Path(replay_dir) if replay_dir else (
+            Path.home() / ".solitario" / "replays"
+        )
+        self._dir_ready = False
+
+    def path_for(self, replay_id: str) -> Path:
+        """Path of a replay file."""
+        return self.replay_dir / f"{replay_id}{self.SUFFIX}"
+
+    def appender(self, replay_id: str) -> Callable[[bytes], None]:
+        """Create the sink appending bytes to a replay file.
+
+        Write errors are logged once and the rest of the replay is
+        dropped, so a full disk never interrupts the game.
+
+        Args:
+            replay_id: Replay to write (created on the first append)
+
+        Returns:
+            Callable appending and flushing the given bytes
+        """
+        path = self.path_for(replay_id)
+        failed = False
+
+        def append(data: bytes) -> None:
+            nonlocal failed
+            if failed:
+                return
+            try:
+                if not self._dir_ready:
+                    self.replay_dir.mkdir(parents=True, exist_ok=True)
+                    self._dir_ready = True
+                with open(path, "ab") as f:
+                    f.write(data)
+            except OSError as e:
+                failed = True
+                log.error_occurred("ReplayStorage", f"Failed to write replay: {path}", e)
+
+        return append
+
+    def load(self, replay_id: str) -> Optional[bytes]:
+        """Read a replay.
+
+        Returns:
+            Replay bytes, or None if missing or unreadable
+        """
+        path = self.path_for(replay_id)
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            log.error_occurred("ReplayStorage", f"Failed to load replay: {path}", e)
+            return None
+
+    def delete(self, replay_id: str) -> bool:
+        """Remove a replay.
+
+        Returns:
+            True if removed or already absent, False on error
+        """
+        path = self.path_for(replay_id)
+        try:
+            path.unlink(missing_ok=True)
+            return True
+        except OSError as e:
+            log.error_occurred("ReplayStorage", f"Failed to delete replay: {path}", e)
+            return False
+
+    def list_ids(self) -> List[str]:
+        """Ids of the stored replays (oldest first)."""
+        if not self.replay_dir.is_dir():
+            return []
+        files = sorted(self.replay_dir.glob(f"*{self.SUFFIX}"), key=lambda p: p.stat().st_mtime)
+        return [p.stem for p in files]
@@ -110,6 +110,8 @@ class OptionsDialog(wx.Dialog):
             draw_count_radio: RadioBox for draw count (1/2/3)
             timer_combo: TimerComboBox for timer duration (0=disabled, 5-60 min)
             shuffle_radio: RadioBox for shuffle mode (Inversione/Mescolata)
+            safe_auto_play_check: CheckBox for safe auto-play (ON/OFF)
+            offer_stuck_loss_check: CheckBox for the stuck game loss offer (ON/OFF)
             command_hints_check: CheckBox for command hints (ON/OFF)
             scoring_check: CheckBox for scoring system (ON/OFF)
             timer_strict_radio: RadioBox for timer strict mode (STRICT/PERMISSIVE)
@@ -225,6 +227,18 @@ class OptionsDialog(wx.Dialog):
         )
         self._add_group(gameplay_sizer, gameplay_page, "Riciclo Scarti", self.shuffle_radio)
 
+        self.safe_auto_play_check = wx.CheckBox(
+            gameplay_page,
+            label="Spostamento automatico sicuro (manda alle fondazioni le carte che non servono più)",
+        )
+        self._add_group(gameplay_sizer, gameplay_page, "Spostamento Automatico", self.safe_auto_play_check)
+
+        self.offer_stuck_loss_check = wx.CheckBox(
+            gameplay_page,
+            label="Proponi di chiudere come persa una partita senza più mosse possibili",
+        )
+        self._add_group(gameplay_sizer, gameplay_page, "Partita Bloccata", self.offer_stuck_loss_check)
+
         self.command_hints_check = wx.CheckBox(
             audio_page,
             label="Suggerimenti comandi attivi (mostra aiuto per comandi disponibili)",
@@ -375,6 +389,8 @@ class OptionsDialog(wx.Dialog):
         - draw_count: 1/2/3 -> RadioBox selection 0/1/2
         - max_time_game: seconds -> TimerComboBox (minutes: 0=disabled, 5-60)
         - shuffle_discards: False -> 0 (Inversione), True -> 1 (Mescolata)
+        - safe_auto_play: boolean -> CheckBox
+        - offer_stuck_loss: boolean -> CheckBox
         - command_hints_enabled: boolean -> CheckBox
         - scoring_enabled: boolean -> CheckBox
         - timer_strict_mode: True -> 0 (STRICT), False -> 1 (PERMISSIVE)
@@ -401,6 +417,10 @@ class OptionsDialog(wx.Dialog):
         shuffle_selection = 1 if settings.shuffle_discards else 0
         self.shuffle_radio.SetSelection(shuffle_selection)
         
+        # 5b. Spostamento automatico sicuro e proposta di resa
+        self.safe_auto_play_check.SetValue(settings.safe_auto_play)
+        self.offer_stuck_loss_check.SetValue(settings.offer_stuck_loss)
+        
         # 6. Suggerimenti Comandi
         self._load_audio_to_widgets()
         self.command_hints_check.SetValue(settings.command_hints_enabled)
@@ -466,6 +486,8 @@ class OptionsDialog(wx.Dialog):
         # CheckBox widgets
         self.command_hints_check.Bind(wx.EVT_CHECKBOX, self.on_setting_changed)
         self.scoring_check.Bind(wx.EVT_CHECKBOX, self.on_setting_changed)
+        self.safe_auto_play_check.Bind(wx.EVT_CHECKBOX, self.on_setting_changed)
+        self.offer_stuck_loss_check.Bind(wx.EVT_CHECKBOX, self.on_setting_changed)
         self.music_volume_slider.Bind(wx.EVT_SLIDER, self.on_setting_changed)
         self.effects_volume_slider.Bind(wx.EVT_SLIDER, self.on_setting_changed)
         self.music_volume_slider.Bind(wx.EVT_SET_FOCUS, self.on_volume_slider_focus)
@@ -654,6 +676,8 @@ class OptionsDialog(wx.Dialog):
         - draw_count_radio: 0/1/2 -> draw_count 1/2/3
         - timer_combo: minutes (0=disabled, 5-60) -> max_time_game seconds
         - shuffle_radio: 0->False (Inversione), 1->True (Mescolata)
+        - safe_auto_play_check: boolean -> safe_auto_play
+        - offer_stuck_loss_check: boolean -> offer_stuck_loss
         - command_hints_check: boolean -> command_hints_enabled
         - scoring_check: boolean -> scoring_enabled
         - timer_strict_radio: 0->True (STRICT), 1->False (PERMISSIVE)
@@ -680,6 +704,10 @@ class OptionsDialog(wx.Dialog):
         # 5. Riciclo Scarti (0->False, 1->True)
         settings.shuffle_discards = (self.shuffle_radio.GetSelection() == 1)
         
+        # 5b. Spostamento automatico sicuro e proposta di resa
+        settings.safe_auto_play = self.safe_auto_play_check.GetValue()
+        settings.offer_stuck_loss = self.offer_stuck_loss_check.GetValue()
+        
         # 6. Suggerimenti Comandi
         settings.command_hints_enabled = self.command_hints_check.GetValue()
         
@@ -857,6 +885,10 @@ class OptionsDialog(wx.Dialog):
         # Note: This option is NEVER locked by any preset (always user-configurable)
         self.score_warning_radio.Enable(True)  # Always enabled
         
+        # Safe auto-play and stuck loss offer: never locked either
+        self.safe_auto_play_check.Enable(True)
+        self.offer_stuck_loss_check.Enable(True)
+        
         # Deck type and difficulty are NEVER locked
         # (always allow user to change these)
         self.deck_type_radio.Enable(True)
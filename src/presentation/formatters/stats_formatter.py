@@ -140,7 +140,8 @@ class StatsFormatter:
             EndReason.ABANDON_NEW_GAME: "Abbandono (nuova partita)",
             EndReason.ABANDON_EXIT: "Abbandono volontario",
             EndReason.ABANDON_APP_CLOSE: "Chiusura app durante partita",
-            EndReason.TIMEOUT_STRICT: "Tempo scaduto"
+            EndReason.TIMEOUT_STRICT: "Tempo scaduto",
+            EndReason.DEAD_END: "Partita bloccata"
         }
         return labels.get(reason, reason.value)
     
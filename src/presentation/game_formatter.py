@@ -130,7 +130,7 @@ class GameFormatter:
             return f"{pile_name}: vuota"
         
         # Count visible (uncovered) cards
-        visible_cards = [c for c in pile.get_all_cards() if not c.get_covered]
+        visible_cards = pile.cards[pile.get_first_face_up_index():]
         visible_count = len(visible_cards)
         
         if visible_count == 0:
@@ -443,6 +443,103 @@ class GameFormatter:
         
         return msg
     
+    @staticmethod
+    def format_hint(
+        moved_cards: List[Card],
+        origin_pile: Pile,
+        dest_pile: Pile,
+        winning: Optional[bool] = None
+    ) -> str:
+        """Format a suggested move.
+        
+        Args:
+            moved_cards: Cards the move takes (empty for stock actions)
+            origin_pile: Source pile (the stock for a draw)
+            dest_pile: Destination pile (the stock for a recycle)
+            winning: True if the move starts a winning line, False if
+                the position is lost, None if unknown. The solver behind
+                the hint sees the face-down cards, so the announcement
+                says so
+        
+        Returns:
+            Hint announcement in Italian
+        
+        Examples:
+            >>> GameFormatter.format_hint([card], pila_base_3, pila_semi_cuori, True)
+            "Suggerimento: sposta Asso di cuori da Pila base 3 a Pila semi Cuori. Conoscendo le carte coperte, questa mossa porta alla vittoria."
+            
+            >>> GameFormatter.format_hint([], mazzo, scarti)
+            "Suggerimento: pesca dal mazzo."
+        """
+        if origin_pile.pile_type == "mazzo":
+            msg = "Suggerimento: pesca dal mazzo."
+        elif dest_pile.pile_type == "mazzo":
+            msg = "Suggerimento: rimetti gli scarti nel mazzo."
+        else:
+            cards = moved_cards[0].get_display_name() if moved_cards else "carte"
+            if len(moved_cards) > 1:
+                cards += f" e altre {len(moved_cards) - 1} carte"
+            msg = f"Suggerimento: sposta {cards} da {origin_pile.name} a {dest_pile.name}."
+        
+        if winning is True:
+            msg += " Conoscendo le carte coperte, questa mossa porta alla vittoria."
+        elif winning is False:
+            msg += " Nemmeno conoscendo le carte coperte esiste una soluzione: la partita non è più vincibile."
+        return msg
+    
+    @staticmethod
+    def format_stuck_position(dead_end: bool) -> str:
+        """Format the announcement of a stock cycle without progress.
+        
+        Args:
+            dead_end: True if no move is possible at all, False if the
+                cycle only repeated the previous position
+        
+        Returns:
+            Stuck position announcement in Italian
+        
+        Examples:
+            >>> GameFormatter.format_stuck_position(True)
+            "Partita bloccata: nessuna mossa possibile, ogni giro del mazzo sarà uguale."
+        """
+        if dead_end:
+            return "Partita bloccata: nessuna mossa possibile, ogni giro del mazzo sarà uguale."
+        return "Nessun progresso: la posizione è la stessa del giro di mazzo precedente."
+    
+    @staticmethod
+    def format_win_estimate(
+        probability: float,
+        low: float,
+        high: float,
+        samples: int,
+        finished: bool = True
+    ) -> str:
+        """Format the estimated chance to win the current position.
+        
+        Args:
+            probability: Estimated win probability (0-1)
+            low: Lower bound of the confidence interval
+            high: Upper bound of the confidence interval
+            samples: Simulated games behind the estimate (0 = none yet)
+            finished: False while the estimate is still being refined
+        
+        Returns:
+            Win probability announcement in Italian
+        
+        Examples:
+            >>> GameFormatter.format_win_estimate(0.62, 0.55, 0.68, 200)
+            "Probabilità di vittoria stimata: 62 per cento, tra 55 e 68 per cento su 200 partite simulate."
+        """
+        if samples <= 0:
+            return "Stima della probabilità di vittoria in corso."
+        msg = (
+            f"Probabilità di vittoria stimata: {round(probability * 100)} per cento, "
+            f"tra {round(low * 100)} e {round(high * 100)} per cento su {samples} partite simulate."
+        )
+        if not finished:
+            msg += " Stima ancora in corso: il valore finale sarà annunciato al termine."
+        return msg
+    
     @staticmethod
     def format_reshuffle_message(
         shuffle_mode: str,
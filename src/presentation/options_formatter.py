@@ -31,7 +31,9 @@ class OptionsFormatter:
         "Suggerimenti Comandi",
         "Sistema Punti",
         "Modalità Timer",
-        "Avvisi Soglie Punteggio"  # v2.6.1
+        "Avvisi Soglie Punteggio",  # v2.6.1
+        "Spostamento automatico sicuro",
+        "Proposta di resa per partita bloccata"
     ]
     
     @staticmethod
@@ -42,11 +44,11 @@ class OptionsFormatter:
             first_option_value: Current value of first option (Tipo mazzo)
         
         Returns:
-            "Finestra opzioni. 1 di 9: Tipo mazzo, Carte Francesi. Premi H per aiuto."
+            "Finestra opzioni. 1 di 11: Tipo mazzo, Carte Francesi. Premi H per aiuto."
         """
         return (
             f"Finestra opzioni. "
-            f"1 di 9: Tipo mazzo, {first_option_value}. "
+            f"1 di {len(OptionsFormatter.OPTION_NAMES)}: Tipo mazzo, {first_option_value}. "
             f"Premi H per aiuto."
         )
     
@@ -65,24 +67,24 @@ class OptionsFormatter:
         """Format single option for navigation (arrows/numbers).
         
         Args:
-            index: Option position (0-8)
+            index: Option position (0-10)
             name: Option name
             value: Current value
             include_hint: Add navigation hint (default True)
         
         Returns:
-            Concise format: "4 di 9: Timer, Disattivato."
-            With hint: "4 di 9: Timer, Disattivato. Premi INVIO per modificare."
+            Concise format: "4 di 11: Timer, Disattivato."
+            With hint: "4 di 11: Timer, Disattivato. Premi INVIO per modificare."
         
         Examples:
             >>> format_option_item(0, "Tipo mazzo", "Carte Francesi", True)
-            "1 di 9: Tipo mazzo, Carte Francesi. Premi INVIO per modificare."
+            "1 di 11: Tipo mazzo, Carte Francesi. Premi INVIO per modificare."
             
             >>> format_option_item(3, "Timer", "10 minuti", False)
-            "4 di 9: Timer, 10 minuti."
+            "4 di 11: Timer, 10 minuti."
         """
         position = index + 1
-        msg = f"{position} di 9: {name}, {value}."
+        msg = f"{position} di {len(OptionsFormatter.OPTION_NAMES)}: {name}, {value}."
         
         if include_hint:
             # Special hint for Timer (has extra keys) - v1.5.1 updated (now at index 3)
@@ -117,7 +119,7 @@ class OptionsFormatter:
             "Tipo mazzo impostato a: Carte Napoletane."
         """
         # Gender agreement for Italian
-        if name in ["Difficoltà", "Modalità riciclo scarti"]:
+        if name in ["Difficoltà", "Modalità riciclo scarti", "Proposta di resa per partita bloccata"]:
             return f"{name} impostata a: {new_value}."
         else:
             return f"{name} impostato a: {new_value}."
@@ -66,3 +66,11 @@ def test_async_abandon_wraps_audio(dummy_audio):
     # the audio close event should also have been emitted
     assert dummy_audio.events[-1].event_type == AudioEventType.UI_CONFIRM
 
+
+
+def test_async_resume_prompt_passes_answer():
+    for answer in (True, False):
+        dm = SolitarioDialogManager(dialog_provider=DummyDialog(result=answer))
+        called = []
+        dm.show_resume_game_prompt_async(called.append)
+        assert called == [answer]
@@ -182,6 +182,224 @@ class TestGameLifecycle:
         # Assert
         assert engine.service.start_time is not None
     
+    def test_new_game_with_seed_is_reproducible(self) -> None:
+        """Test new_game(seed) deals the same game and records the seed."""
+        engine = GameEngine.create(audio_enabled=False)
+        
+        engine.new_game(seed=1234)
+        first = [[c.get_id for c in p.cards] for p in engine.table.pile]
+        engine.new_game()
+        engine.new_game(seed=1234)
+        
+        assert engine.service.deal_seed == 1234
+        assert [[c.get_id for c in p.cards] for p in engine.table.pile] == first
+    
+    def test_new_game_draws_from_deal_bank(self, tmp_path) -> None:
+        """Test new_game(use_deal_bank=True) plays a bank deal, then falls back."""
+        from src.infrastructure.storage.deal_bank import DealBank, DealBankEntry, write_deal_bank
+        path = tmp_path / "deal_bank.bin"
+        write_deal_bank(path, [DealBankEntry(4321, "french", 1, 90, 2)])
+        engine = GameEngine.create(audio_enabled=False)
+        engine.deal_bank = DealBank(path)
+        
+        engine.new_game(use_deal_bank=True)
+        assert engine.service.deal_seed == 4321
+        engine.new_game(use_deal_bank=True)  # Bank exhausted: random deal
+        assert engine.table.pile_mazzo.get_card_count() == 24
+    
+    def test_save_and_resume_game(self, tmp_path) -> None:
+        """Test actions autosave the game and resume_game() restores it."""
+        from src.infrastructure.storage.game_save_storage import GameSaveStorage
+        storage = GameSaveStorage(tmp_path / "saved_game.bin")
+        engine = GameEngine.create(audio_enabled=False)
+        engine.save_storage = storage
+        engine.new_game(seed=42)
+        engine.draw_count = 3
+        engine.draw_from_stock()
+        piles = [[(c.get_id, c.get_covered) for c in p.cards] for p in engine.table.pile]
+        
+        resumed = GameEngine.create(audio_enabled=False)
+        resumed.save_storage = storage
+        assert resumed.resume_game()
+        
+        assert [[(c.get_id, c.get_covered) for c in p.cards] for p in resumed.table.pile] == piles
+        assert resumed.draw_count == 3
+        assert resumed.service.draw_count == 1
+        assert resumed.service.deal_seed == 42
+        assert resumed.is_game_running()
+        
+        resumed.discard_saved_game()
+        assert not resumed.has_saved_game()
+        assert not resumed.resume_game()
+    
+    def test_game_is_recorded_and_linked_to_session(self, tmp_path) -> None:
+        """Test a finished game leaves a complete replay named in its session."""
+        from src.domain.services.replay import Replay, ReplayOp
+        from src.domain.services.profile_service import ProfileService
+        from src.infrastructure.storage.profile_storage import ProfileStorage
+        from src.infrastructure.storage.replay_storage import ReplayStorage
+        storage = ReplayStorage(tmp_path / "replays")
+        profiles = ProfileService(storage=ProfileStorage(data_dir=tmp_path / "profiles"))
+        profiles.load_profile(profiles.create_profile("Replay").profile_id)
+        engine = GameEngine.create(audio_enabled=False, profile_service=profiles)
+        engine.save_storage = None
+        engine.replay_storage = storage
+        engine.new_game(seed=42)
+        engine.draw_count = 1
+        engine.draw_from_stock()
+        engine.service.undo()
+        
+        engine.end_game(is_victory=False)
+        
+        session = profiles.recent_sessions[-1]
+        assert session.replay_id is not None
+        assert engine.service.replay is None
+        replay = Replay.from_bytes(storage.load(session.replay_id))
+        assert replay.deal_seed == 42
+        assert [a.op for a in replay.actions] == [ReplayOp.DRAW, ReplayOp.UNDO]
+        assert replay.finished
+    
+    def test_last_waste_card_triggers_auto_complete(self) -> None:
+        """Test emptying the waste with all cards face up finishes the game."""
+        from src.domain.models.compact_table import FACE_UP
+        engine = GameEngine.create(audio_enabled=False)
+        engine.save_storage = None
+        state = engine.service.get_compact_state()
+        state.piles = [bytearray() for _ in range(13)]
+        for suit in range(4):
+            state.piles[7 + suit] = bytearray((suit * 13 + v) | FACE_UP for v in range(11))
+            state.piles[suit] = bytearray([(suit * 13 + 12) | FACE_UP])
+            if suit:
+                state.piles[suit].append((suit * 13 + 11) | FACE_UP)
+        state.piles[11] = bytearray([11 | FACE_UP])  # Queen of the first suit
+        engine.service.load_compact_state(state)
+        
+        with patch.object(engine, "end_game") as end_game:
+            success, _ = engine.move_card(11, 7)
+        
+        assert success
+        assert engine.service.is_victory()
+        assert engine.service.move_count == 8
+        end_game.assert_called_once_with(is_victory=True)
+    
+    def test_safe_auto_play_after_draw(self) -> None:
+        """Test drawing a safe Ace sends it to its foundation when enabled."""
+        from src.domain.models.compact_table import FACE_UP
+        engine = GameEngine.create(audio_enabled=False)
+        engine.save_storage = None
+        engine.safe_auto_play = True
+        state = engine.service.get_compact_state()
+        state.piles = [bytearray() for _ in range(13)]
+        state.piles[0] = bytearray([12 | FACE_UP])  # Re di Cuori
+        state.piles[12] = bytearray(c for c in range(52) if c != 12)
+        state.piles[12].remove(0)
+        state.piles[12].append(0)  # Asso di Cuori in cima al mazzo
+        engine.service.load_compact_state(state)
+        engine.screen_reader = Mock()
+        
+        success, _ = engine.draw_from_stock(1)
+        
+        assert success
+        assert engine.service.carte_per_seme[0] == 1
+        assert engine.service.table.pile_scarti.is_empty()
+        engine.screen_reader.tts.speak.assert_called_with(
+            "Spostate automaticamente nelle fondazioni: Asso di cuori.", interrupt=False
+        )
+    
+    def test_hint_is_spoken_and_scored(self) -> None:
+        """Test a hint names the move and records a HINT_USED event."""
+        from src.domain.models.compact_table import FACE_UP
+        from src.domain.models.scoring import ScoreEventType
+        from src.domain.services.game_settings import GameSettings
+        settings = GameSettings()
+        settings.scoring_enabled = True
+        engine = GameEngine.create(settings=settings, audio_enabled=False)
+        engine.save_storage = None
+        engine.new_game(seed=3)
+        state = engine.service.get_compact_state()
+        state.piles = [bytearray() for _ in range(13)]
+        state.piles[0] = bytearray([30, 0 | FACE_UP])  # Asso di cuori su una coperta
+        state.piles[12] = bytearray(c for c in range(1, 52) if c != 30)
+        engine.service.load_compact_state(state)
+        engine.screen_reader = Mock()
+        
+        success, msg = engine.request_hint()
+        
+        assert success
+        assert msg == "Suggerimento: sposta Asso di cuori da Pila base 1 a Pila semi Cuori."
+        engine.screen_reader.tts.speak.assert_called_with(msg, interrupt=True)
+        events = [e.event_type for e in engine.service.scoring.events]
+        assert events.count(ScoreEventType.HINT_USED) == 1
+        
+        # The search result is announced from the timer tick, not awaited
+        assert engine._hint_engine.wait(10)
+        refined = engine.poll_hint()
+        assert refined.startswith(msg + " Conoscendo le carte coperte")
+        engine.screen_reader.tts.speak.assert_called_with(refined, interrupt=False)
+        assert engine.poll_hint() is None
+        events = [e.event_type for e in engine.service.scoring.events]
+        assert events.count(ScoreEventType.HINT_USED) == 1
+        engine._cancel_hint()
+    
+    def test_win_probability_is_spoken(self) -> None:
+        """Test drawn cards count as seen and the estimate is announced."""
+        from src.domain.simulation.win_estimator import WinEstimator
+        engine = GameEngine.create(audio_enabled=False)
+        engine.save_storage = None
+        engine.new_game(seed=3)
+        engine.draw_from_stock(1)
+        assert engine._seen_cards == {engine.service.table.pile_scarti.get_top_card().get_id}
+        engine._win_estimator = WinEstimator(
+            "french", engine.draw_count, workers=1, time_limit=5.0, max_samples=8,
+            max_nodes=300, shuffle_on_recycle=engine.shuffle_on_recycle
+        )
+        engine.screen_reader = Mock()
+        
+        success, msg = engine.request_win_probability()
+        assert not success
+        assert msg == "Stima della probabilità di vittoria in corso."
+        assert engine._win_estimator.wait(10)
+        msg = engine.poll_win_estimate()
+        
+        assert msg.startswith("Probabilità di vittoria stimata:")
+        assert msg.endswith("su 8 partite simulate.")
+        engine.screen_reader.tts.speak.assert_called_with(msg, interrupt=False)
+        assert engine.poll_win_estimate() is None
+        success, again = engine.request_win_probability()
+        assert success and again == msg
+        engine.shutdown()
+    
+    def test_dead_end_offers_loss(self) -> None:
+        """Test a dead-end recycle is announced and offers to end the game."""
+        from src.domain.models.compact_table import FACE_UP
+        from src.domain.services.game_settings import GameSettings
+        from src.presentation.game_formatter import GameFormatter
+        settings = GameSettings()
+        settings.offer_stuck_loss = True
+        engine = GameEngine.create(settings=settings, audio_enabled=False)
+        engine.save_storage = None
+        engine.new_game(seed=3)
+        state = engine.service.get_compact_state()
+        state.piles = [bytearray() for _ in range(13)]
+        state.piles[0] = bytearray([4 | FACE_UP])     # 5 di cuori
+        state.piles[12] = bytearray([1, 2, 45, 34])   # Nessuna carta giocabile
+        engine.service.load_compact_state(state)
+        engine.screen_reader = Mock()
+        engine.dialogs = Mock()
+        while not engine.service.table.pile_mazzo.is_empty():
+            engine.service.draw_cards(1)
+        
+        engine.recycle_waste(shuffle=False)
+        
+        engine.screen_reader.tts.speak.assert_any_call(
+            GameFormatter.format_stuck_position(True), interrupt=False
+        )
+        engine.dialogs.show_yes_no_async.assert_called_once()
+        title, message, _ = engine.dialogs.show_yes_no_async.call_args[0]
+        assert title == "Partita bloccata"
+        assert message.endswith("Vuoi chiudere la partita come persa?")
+        engine._cancel_hint()
+    
     def test_new_game_covers_all_cards_before_redistribution(self):
         """Test Bug #54 fix: Cards retain covered state from previous game.
         
@@ -187,6 +187,18 @@ class TestBuildBoardState:
                     f"Top card of tableau pile {i} should be face-up"
                 )
 
+    def test_only_changed_piles_are_rebuilt(self) -> None:
+        ctrl = _make_controller()
+        ctrl.engine.new_game()
+        before = ctrl._build_board_state()
+        ctrl.engine.service.draw_cards(1)
+        after = ctrl._build_board_state()
+        # Untouched piles keep their cached lists, stock and waste are new
+        assert all(after.piles[i] is before.piles[i] for i in range(11))
+        assert len(after.piles[11]) == len(before.piles[11]) + 1
+        assert len(after.piles[12]) == len(before.piles[12]) - 1
+        assert after.piles[11][-1].face_up is True
+
 
 # ---------------------------------------------------------------------------
 # handle_wx_key_event integration test
@@ -0,0 +1,64 @@
+"""Unit tests for the safe auto-play and stuck loss options.
+
+Options #10 (Spostamento automatico sicuro) and #11 (Proposta di resa
+per partita bloccata) in the options window controller.
+"""
+
+import pytest
+
+from src.domain.services.game_settings import GameSettings, GameState
+from src.application.options_controller import OptionsWindowController
+from src.presentation.options_formatter import OptionsFormatter
+
+
+@pytest.fixture
+def controller():
+    """Open options window with no active game."""
+    state = GameState()
+    state.is_running = False
+    controller = OptionsWindowController(GameSettings(game_state=state))
+    controller.open_window()
+    return controller
+
+
+@pytest.mark.unit
+class TestAssistOptions:
+    """Test navigation, toggling and discard of the assist options."""
+
+    def test_navigation_reaches_new_options(self, controller):
+        """Test arrows wrap over all 11 options, the last two included."""
+        assert len(OptionsFormatter.OPTION_NAMES) == 11
+        controller.navigate_up()
+        assert controller.cursor_position == 10
+        msg = controller.navigate_up()
+        assert msg.startswith("10 di 11: Spostamento automatico sicuro, Disattivato.")
+        assert controller.jump_to_option(10).startswith("11 di 11: Proposta di resa")
+
+    def test_toggle_marks_dirty(self, controller):
+        """Test ENTER toggles each setting and marks the window modified."""
+        controller.jump_to_option(9)
+        msg = controller.modify_current_option()
+        assert controller.settings.safe_auto_play is True
+        assert msg == "Spostamento automatico sicuro impostato a: Attivo."
+        assert controller.state == "OPEN_DIRTY"
+
+        controller.jump_to_option(10)
+        msg = controller.modify_current_option()
+        assert controller.settings.offer_stuck_loss is True
+        assert msg == "Proposta di resa per partita bloccata impostata a: Attiva."
+
+    def test_discard_restores_values(self, controller):
+        """Test discarding the changes restores both settings."""
+        for index in (9, 10):
+            controller.jump_to_option(index)
+            controller.modify_current_option()
+
+        controller.discard_and_close()
+        assert controller.settings.safe_auto_play is False
+        assert controller.settings.offer_stuck_loss is False
+
+    def test_recap_lists_new_options(self, controller):
+        """Test the settings recap (I) reads both options."""
+        recap = controller.read_all_settings()
+        assert "Spostamento automatico sicuro" in recap
+        assert "Proposta di resa per partita bloccata" in recap
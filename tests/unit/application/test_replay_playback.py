@@ -0,0 +1,275 @@
+"""Unit tests for timed replay playback."""
+
+import pygame
+import pytest
+
+from src.application.game_engine import GameEngine
+from src.application.gameplay_controller import GamePlayController
+from src.application.replay_playback import ReplayPlayback
+from src.domain.models.deck import FrenchDeck
+from src.domain.models.table import GameTable
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+from src.domain.services.game_settings import GameSettings
+from src.domain.services.replay import Replay, ReplayAction, ReplayOp
+from src.domain.services.replay_player import ReplayPlayer
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class DummyTTS:
+    def __init__(self) -> None:
+        self.spoken = []
+
+    def speak(self, text: str, interrupt: bool = True) -> None:
+        self.spoken.append(text)
+
+
+class DummySR:
+    def __init__(self) -> None:
+        self.tts = DummyTTS()
+
+
+def _replay(draws: int = 20) -> Replay:
+    return Replay("french", deal_seed=9, actions=[
+        ReplayAction(ReplayOp.DRAW, card_count=1) for _ in range(draws)
+    ])
+
+
+def _playback(speed: float):
+    deck = FrenchDeck()
+    player = ReplayPlayer(GameService(GameTable(deck), SolitaireRules(deck)), _replay())
+    clock = FakeClock()
+    spoken = []
+    playback = ReplayPlayback(player, spoken.append, speed=speed, clock=clock)
+    return playback, clock, spoken
+
+
+@pytest.mark.unit
+class TestReplayPlayback:
+    """Test speed, throttling and seeking."""
+
+    def test_speed_sets_actions_per_second(self) -> None:
+        """Test 1x plays one action per second and 10x ten."""
+        playback, clock, _ = _playback(speed=1)
+        playback.play()
+        clock.now = 0.5
+        assert playback.update() == 0
+        clock.now = 1.0
+        assert playback.update() == 1
+
+        playback.speed = 10
+        clock.now = 2.0
+        assert playback.update() == 10
+        assert playback.player.position == 11
+
+    def test_speed_is_clamped(self) -> None:
+        """Test speeds outside 1-50x are clamped."""
+        playback, _, _ = _playback(speed=500)
+        assert playback.speed == 50
+        playback.speed = 0.1
+        assert playback.speed == 1
+
+    def test_announcements_are_throttled(self) -> None:
+        """Test fast playback speaks at most once per interval, end always."""
+        playback, clock, spoken = _playback(speed=40)
+        playback.play()
+        for tick in range(1, 4):
+            clock.now = tick * 0.125  # 5 actions per tick
+            playback.update()
+        assert playback.player.position == 15
+        assert len(spoken) == 1
+        assert spoken[0].startswith("Mossa 5 di 20: pescata")
+
+        clock.now = 0.5
+        playback.update()
+        assert playback.player.at_end
+        assert not playback.playing
+        assert spoken[-1].endswith("Fine del replay.")
+
+    def test_seek_announces_position(self) -> None:
+        """Test seeking jumps and announces even right after another message."""
+        playback, _, spoken = _playback(speed=1)
+        steps = []
+        playback._on_step = lambda: steps.append(playback.player.position)
+
+        assert playback.seek(12) == 12
+        assert playback.seek(3) == 3
+        assert spoken == ["Mossa 12 di 20", "Mossa 3 di 20"]
+        assert steps == [12, 3]
+
+
+@pytest.mark.unit
+class TestControllerReplay:
+    """Test replay playback through GamePlayController."""
+
+    def test_start_tick_and_stop(self) -> None:
+        """Test the controller opens the replay on the engine table and plays it."""
+        engine = GameEngine.create(audio_enabled=False, settings=GameSettings())
+        engine.save_storage = None
+        engine.replay_storage = None
+        screen_reader = DummySR()
+        controller = GamePlayController(engine, screen_reader, settings=GameSettings())
+
+        assert controller.start_replay(_replay(), speed=50)
+        assert engine.service.deal_seed == 9
+        assert screen_reader.tts.spoken[-1] == "Replay di 20 mosse, velocità 50x."
+
+        controller.replay_playback._last_tick -= 1.0
+        controller.replay_tick()
+        assert engine.service.draw_count == 20
+
+        controller.stop_replay()
+        assert controller.replay_playback is None
+        controller.replay_tick()  # No-op without replay
+
+    def test_unplayable_replay_is_announced(self) -> None:
+        """Test a replay without seed is refused."""
+        engine = GameEngine.create(audio_enabled=False, settings=GameSettings())
+        engine.save_storage = None
+        screen_reader = DummySR()
+        controller = GamePlayController(engine, screen_reader, settings=GameSettings())
+
+        assert not controller.start_replay(Replay("french"))
+        assert screen_reader.tts.spoken[-1] == "Replay non disponibile."
+
+    def test_timer_runs_at_step_interval_while_playing(self) -> None:
+        """Test the replay timer follows speed, pause and the end of the replay."""
+        engine = GameEngine.create(audio_enabled=False, settings=GameSettings())
+        engine.save_storage = None
+        engine.replay_storage = None
+        controller = GamePlayController(engine, DummySR(), settings=GameSettings())
+        intervals = []
+        controller.set_on_replay_timer(intervals.append)
+
+        controller.start_replay(_replay(), speed=2)
+        controller.set_replay_speed(10)
+        controller.toggle_replay_pause()
+        controller.toggle_replay_pause()
+        assert intervals == [0.5, 0.1, None, 0.1]
+
+        controller.replay_playback._last_tick -= 10.0
+        controller.replay_tick()
+        assert controller.replay_playback.player.at_end
+        assert intervals[-1] is None
+
+    def test_replay_keys(self) -> None:
+        """Test SHIFT replay keys open the last game, step, change speed and close."""
+        engine = GameEngine.create(audio_enabled=False, settings=GameSettings())
+        engine.save_storage = None
+        screen_reader = DummySR()
+        controller = GamePlayController(engine, screen_reader, settings=GameSettings())
+
+        class Storage:
+            def list_ids(self):
+                return ["old", "last"]
+
+        loaded = []
+        engine.replay_storage = Storage()
+        engine.load_replay = lambda replay_id: loaded.append(replay_id) or _replay()
+
+        controller._replay_step_key(1)  # No-op without replay
+        assert controller.replay_playback is None
+
+        controller._toggle_replay()
+        assert loaded == ["last"]
+        controller.toggle_replay_pause()
+        assert not controller.replay_playback.playing
+        controller._replay_edge_key(end=True)
+        controller._replay_step_key(-1)
+        assert controller.replay_playback.player.position == 19
+        controller._replay_speed_key(2.0)
+        assert controller.replay_playback.speed == 2
+
+        controller._toggle_replay()
+        assert controller.replay_playback is None
+        assert screen_reader.tts.spoken[-1] == "Replay chiuso."
+
+    def test_replay_refused_while_game_running(self) -> None:
+        """Test SHIFT+R never replaces a running game without confirmation."""
+        engine = GameEngine.create(audio_enabled=False, settings=GameSettings())
+        engine.save_storage = None
+        engine.replay_storage = None
+        engine.new_game()
+        screen_reader = DummySR()
+        controller = GamePlayController(engine, screen_reader, settings=GameSettings())
+        engine.load_replay = lambda replay_id: _replay()
+
+        controller._toggle_replay()
+        assert controller.replay_playback is None
+        assert engine.is_game_running()
+        assert screen_reader.tts.spoken[-1].startswith("Partita in corso")
+
+        requests = []
+        controller.on_replay_request = lambda: requests.append(True)
+        controller._toggle_replay()
+        assert requests == [True]
+        assert controller.replay_playback is None
+
+
+@pytest.mark.unit
+class TestShiftKeyGating:
+    """Test SHIFT commands fall through to the plain commands when they do not apply."""
+
+    @pytest.fixture(autouse=True)
+    def init_pygame(self):
+        pygame.init()
+        yield
+        pygame.quit()
+
+    def _press(self, controller, key: int) -> None:
+        pygame.key.set_mods(pygame.KMOD_SHIFT)
+        controller.handle_keyboard_events(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+    def test_shift_keys_fall_through_without_replay(self) -> None:
+        """Test SHIFT+arrow moves the cursor and SHIFT+R reports outside a replay."""
+        engine = GameEngine.create(audio_enabled=False, settings=GameSettings())
+        engine.save_storage = None
+        engine.replay_storage = None
+        controller = GamePlayController(engine, DummySR(), settings=GameSettings())
+        calls = []
+        for key in (pygame.K_DOWN, pygame.K_LEFT, pygame.K_HOME, pygame.K_p, pygame.K_r):
+            controller.callback_dict[key] = lambda key=key: calls.append(key)
+
+        for key in (pygame.K_DOWN, pygame.K_LEFT, pygame.K_HOME, pygame.K_p, pygame.K_r):
+            self._press(controller, key)
+        assert calls == [pygame.K_DOWN, pygame.K_LEFT, pygame.K_HOME, pygame.K_p, pygame.K_r]
+
+    def test_shift_h_is_help_without_game(self) -> None:
+        """Test SHIFT+H asks for a hint only while a game is running."""
+        engine = GameEngine.create(audio_enabled=False, settings=GameSettings())
+        engine.save_storage = None
+        engine.replay_storage = None
+        controller = GamePlayController(engine, DummySR(), settings=GameSettings())
+        calls = []
+        controller.callback_dict[pygame.K_h] = lambda: calls.append("help")
+        engine.request_hint = lambda: calls.append("hint")
+
+        self._press(controller, pygame.K_h)
+        engine.new_game()
+        self._press(controller, pygame.K_h)
+        assert calls == ["help", "hint"]
+
+    def test_shift_keys_drive_open_replay(self) -> None:
+        """Test SHIFT+arrow steps the replay instead of moving the cursor."""
+        engine = GameEngine.create(audio_enabled=False, settings=GameSettings())
+        engine.save_storage = None
+        engine.replay_storage = None
+        controller = GamePlayController(engine, DummySR(), settings=GameSettings())
+        calls = []
+        controller.callback_dict[pygame.K_RIGHT] = lambda: calls.append(pygame.K_RIGHT)
+        controller.start_replay(_replay())
+
+        self._press(controller, pygame.K_RIGHT)
+        assert calls == []
+        assert controller.replay_playback.player.position == 1
+        self._press(controller, pygame.K_r)
+        assert controller.replay_playback is None
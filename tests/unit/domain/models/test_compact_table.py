@@ -0,0 +1,172 @@
+"""Unit tests for CompactTable and CardEncoding."""
+
+import pytest
+
+from src.domain.models.compact_table import (
+    CardEncoding,
+    CompactTable,
+    FACE_UP,
+    CODE_MASK,
+    STOCK_SLOT,
+    WASTE_SLOT,
+)
+from src.domain.models.deck import FrenchDeck, NeapolitanDeck
+from src.domain.models.table import GameTable
+from src.domain.models.card import Card
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+
+
+def _snapshot(table: GameTable):
+    """Plain (id, covered) snapshot of every pile for comparisons."""
+    return [[(c.get_id, c.get_covered) for c in pile.cards] for pile in table.pile]
+
+
+class TestCardEncoding:
+    """Test integer card encoding."""
+
+    def test_encoding_is_shared_per_deck_type(self) -> None:
+        """Encoding instances are cached per deck class."""
+        assert CardEncoding.for_deck(FrenchDeck()) is CardEncoding.for_deck(FrenchDeck())
+        assert CardEncoding.for_deck(FrenchDeck()) is not CardEncoding.for_deck(NeapolitanDeck())
+
+    def test_french_encoding_matches_deck_ids(self) -> None:
+        """Card codes match the ids assigned by FrenchDeck.crea()."""
+        deck = FrenchDeck()
+        enc = CardEncoding.for_deck(deck)
+        assert enc.card_count == 52
+        for card in deck.cards:
+            suit_index = deck.SUITES.index(card._seme)
+            assert enc.encode(suit_index, card.get_value) == card.get_id
+            assert enc.value_of(card.get_id) == card.get_value
+            assert enc.suit_of(card.get_id) == suit_index
+
+    def test_neapolitan_colors(self) -> None:
+        """Neapolitan coppe/denari are red, bastoni/spade black."""
+        enc = CardEncoding.for_deck(NeapolitanDeck())
+        # bastoni, coppe, denari, spade
+        assert enc.red_suits == (False, True, True, False)
+        assert enc.card_count == 40
+
+
+class TestCompactConversion:
+    """Test lossless conversion to and from GameTable."""
+
+    @pytest.mark.parametrize("deck_cls", [FrenchDeck, NeapolitanDeck])
+    def test_roundtrip_is_lossless(self, deck_cls) -> None:
+        """from_table/to_table preserves card order and face-up state."""
+        table = GameTable(deck_cls())
+        before = _snapshot(table)
+
+        state = CompactTable.from_table(table)
+        for pile in table.pile:
+            for card in pile.cards:
+                card.flip()
+        state.to_table(table)
+
+        assert _snapshot(table) == before
+
+    def test_face_up_bit(self) -> None:
+        """Face-up cards carry the FACE_UP bit, stock cards do not."""
+        table = GameTable(FrenchDeck())
+        state = CompactTable.from_table(table)
+        top = table.pile_base[3].get_top_card()
+        assert state.top(3) == top.get_id | FACE_UP
+        assert state.first_face_up(3) == 3
+        assert all(not b & FACE_UP for b in state.piles[STOCK_SLOT])
+
+    def test_to_table_reuses_card_objects(self) -> None:
+        """Writing back reuses the Card instances already on the table."""
+        table = GameTable(FrenchDeck())
+        cards = {id(c) for pile in table.pile for c in pile.cards}
+        state = CompactTable.from_table(table)
+        state.move(0, 7, 1)
+        state.to_table(table)
+        assert {id(c) for pile in table.pile for c in pile.cards} == cards
+
+    def test_card_without_id_rejected(self) -> None:
+        """Cards not created by a deck cannot be encoded."""
+        with pytest.raises(ValueError):
+            CompactTable.encode_card(Card("7", "cuori"))
+
+
+class TestCompactMutations:
+    """Test unchecked compact mutations."""
+
+    def test_move_reveals_tableau_card(self) -> None:
+        """Moving the top card uncovers the new tableau top."""
+        table = GameTable(FrenchDeck())
+        state = CompactTable.from_table(table)
+        revealed = state.move(2, 0, 1)
+        assert revealed is True
+        assert state.top(2) & FACE_UP
+        assert len(state.piles[0]) == 2
+
+    def test_draw_and_recycle_preserve_cycle_order(self) -> None:
+        """A full draw cycle plus recycle restores the stock order."""
+        table = GameTable(FrenchDeck())
+        state = CompactTable.from_table(table)
+        stock_before = bytes(state.piles[STOCK_SLOT])
+
+        assert state.draw(3) == 3
+        assert all(b & FACE_UP for b in state.piles[WASTE_SLOT])
+        while state.draw(3):
+            pass
+        assert state.recycle() == 24
+        assert bytes(state.piles[STOCK_SLOT]) == stock_before
+        assert not state.piles[WASTE_SLOT]
+
+    def test_copy_is_independent(self) -> None:
+        """Mutating a copy does not affect the original."""
+        state = CompactTable.from_table(GameTable(FrenchDeck()))
+        clone = state.copy()
+        clone.draw(1)
+        assert state.key() != clone.key()
+
+
+class TestCompactRules:
+    """Test SolitaireRules predicates on card codes."""
+
+    def test_can_stack_code(self) -> None:
+        """Alternating colours, descending values, kings on empty piles."""
+        deck = FrenchDeck()
+        rules = SolitaireRules(deck)
+        enc = rules.encoding
+        red_seven = enc.encode(0, 7)      # 7 cuori
+        black_six = enc.encode(3, 6)      # 6 picche
+        red_six = enc.encode(1, 6)        # 6 quadri
+        king = enc.encode(2, 13)
+        assert rules.can_stack_code(black_six, red_seven) is True
+        assert rules.can_stack_code(red_six, red_seven) is False
+        assert rules.can_stack_code(king, -1) is True
+        assert rules.can_stack_code(black_six, -1) is False
+
+    def test_can_found_code_respects_assigned_suit(self) -> None:
+        """Foundation i only accepts suit i, starting from the ace."""
+        deck = NeapolitanDeck()
+        rules = SolitaireRules(deck)
+        enc = rules.encoding
+        ace_coppe = enc.encode(1, 1)
+        two_coppe = enc.encode(1, 2)
+        assert rules.can_found_code(ace_coppe, 1, -1) is True
+        assert rules.can_found_code(ace_coppe, 0, -1) is False
+        assert rules.can_found_code(two_coppe, 1, ace_coppe) is True
+        assert rules.can_found_code(two_coppe, 1, -1) is False
+
+    def test_game_service_compact_roundtrip(self) -> None:
+        """GameService loads a compact state and refreshes suit stats."""
+        deck = FrenchDeck()
+        table = GameTable(deck)
+        service = GameService(table, SolitaireRules(deck))
+
+        state = service.get_compact_state()
+        ace = state.encoding.encode(0, 1) | FACE_UP
+        # Put the ace of hearts on its foundation
+        for pile in state.piles:
+            if ace & CODE_MASK in (b & CODE_MASK for b in pile):
+                pile[:] = bytes(b for b in pile if b & CODE_MASK != ace & CODE_MASK)
+        state.piles[7].append(ace)
+
+        service.load_compact_state(state)
+        assert table.pile_semi[0].get_card_count() == 1
+        assert service.carte_per_seme[0] == 1
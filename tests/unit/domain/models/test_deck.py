@@ -341,3 +341,45 @@ class TestKingValidationBugFix:
         
         # They should be different
         assert french.FIGURE_VALUES["Re"] != neapolitan.FIGURE_VALUES["Re"]
+
+
+class TestCardFaces:
+    """Test interned card identities (flyweight)."""
+    
+    def test_faces_are_interned_per_deck_type(self) -> None:
+        """Every deck of a type shares the same CardFace instances."""
+        assert FrenchDeck.card_faces() is FrenchDeck.card_faces()
+        assert len(FrenchDeck.card_faces()) == 52
+        assert len(NeapolitanDeck.card_faces()) == 40
+        first = FrenchDeck().cards
+        second = FrenchDeck().cards
+        faces_first = {c.get_id: c.face for c in first}
+        assert all(faces_first[c.get_id] is c.face for c in second)
+    
+    @pytest.mark.parametrize("deck_cls", [FrenchDeck, NeapolitanDeck])
+    def test_faces_match_legacy_fields(self, deck_cls: Type[ProtoDeck]) -> None:
+        """Precomputed fields agree with the legacy Card attributes."""
+        deck = deck_cls()
+        for card in deck.cards:
+            card.set_uncover()
+            face = card.face
+            assert face.card_id == card.get_id
+            assert face.value == card.get_value
+            assert face.nome == card.get_name
+            assert face.colore == card.get_color
+            assert face.color_bit == (1 if card.get_color == "rosso" else 0)
+            assert deck.SUITES[face.suit_index] == card.get_suit
+    
+    def test_face_is_immutable(self) -> None:
+        """CardFace rejects attribute assignment."""
+        face = FrenchDeck.card_faces()[0]
+        with pytest.raises(AttributeError):
+            face.value = 5
+        with pytest.raises(AttributeError):
+            face.extra = 1
+    
+    def test_setter_detaches_face(self) -> None:
+        """Changing a card's value drops its shared identity."""
+        card = FrenchDeck().cards[0]
+        card.set_int_value(7)
+        assert card.face is None
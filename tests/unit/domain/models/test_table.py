@@ -1,10 +1,14 @@
 """Unit tests for GameTable model."""
 
+import random
+
 import pytest
 
 from src.domain.models.table import GameTable
+from src.domain.models.zobrist import ZobristHasher
 from src.domain.models.deck import FrenchDeck, NeapolitanDeck
 from src.domain.models.card import Card
+from src.domain.models.pile import Pile
 
 
 class TestGameTableInitialization:
@@ -377,6 +381,21 @@ class TestGameTableAPI:
         pile = table.get_pile(7)  # Only 7 tableau piles (0-6)
         assert pile is None
     
+    def test_unified_piles_cached_with_slots(self) -> None:
+        """Test the unified pile array is cached and slots invert it."""
+        table = GameTable(FrenchDeck())
+        piles = table.pile
+        
+        assert table.pile is piles
+        assert [table.pile_slot(pile) for pile in piles] == list(range(13))
+        assert table.pile_slot(Pile()) == -1
+        assert table.pile_slot(None) == -1
+        
+        waste = Pile(name="Scarti", pile_type="scarti")
+        table.pile_scarti = waste
+        assert table.pile is not piles
+        assert table.pile[11] is waste and table.pile_slot(waste) == 11
+    
     def test_reset(self) -> None:
         """Test resetting the table."""
         deck = FrenchDeck()
@@ -460,3 +479,77 @@ class TestPutToFoundation:
         
         result = table.put_to_foundation(two, 0)
         assert result is True
+
+
+class TestFaceUpBoundary:
+    """Test the first face-up index tracked by tableau piles."""
+    
+    def test_dealt_piles_report_boundary(self) -> None:
+        """Tableau pile i has i face-down cards under one face-up card."""
+        table = GameTable(FrenchDeck())
+        for i, pile in enumerate(table.pile_base):
+            assert pile.get_first_face_up_index() == i
+            assert pile.get_face_up_count() == 1
+        assert table.pile_mazzo.get_face_up_count() == 0
+    
+    def test_boundary_follows_remove_and_reveal(self) -> None:
+        """Removing the top card and flipping the new top is picked up."""
+        table = GameTable(FrenchDeck())
+        pile = table.pile_base[3]
+        pile.rimuovi_carta()
+        assert pile.get_first_face_up_index() == 3
+        pile.get_top_card().set_uncover()
+        assert pile.get_first_face_up_index() == 2
+        assert pile.get_face_up_count() == 1
+    
+    def test_boundary_survives_direct_list_edits(self) -> None:
+        """Edits made straight on pile.cards are detected on read."""
+        table = GameTable(FrenchDeck())
+        pile = table.pile_base[6]
+        pile.cards.clear()
+        assert pile.get_first_face_up_index() == 0
+        card = Card("Re", "cuori")
+        card.set_uncover()
+        pile.aggiungi_carta(card)
+        assert pile.get_face_up_count() == 1
+
+
+class TestSeededDeal:
+    """Test reproducible deals driven by a seeded generator."""
+    
+    @staticmethod
+    def _layout(table: GameTable) -> list:
+        return [[(c.get_id, c.get_covered) for c in p.cards] for p in table.pile]
+    
+    def test_same_seed_same_deal(self) -> None:
+        """Same seed gives the same layout whatever the previous order."""
+        first = GameTable(FrenchDeck())
+        second = GameTable(FrenchDeck())
+        first.ridistribuisci(random.Random(7))
+        second.pile_base[6].cards[-1].set_cover()
+        second.ridistribuisci(random.Random(7))
+        assert self._layout(first) == self._layout(second)
+        
+        second.ridistribuisci(random.Random(8))
+        assert self._layout(first) != self._layout(second)
+    
+    def test_redeal_keeps_every_card(self) -> None:
+        """Redealing reuses all cards with a regular layout."""
+        table = GameTable(NeapolitanDeck())
+        table.ridistribuisci(random.Random(1))
+        ids = sorted(c.get_id for p in table.pile for c in p.cards)
+        assert ids == list(range(40))
+        assert [p.get_face_up_count() for p in table.pile_base] == [1] * 7
+    
+    def test_redeal_reuses_cards_piles_and_hasher(self) -> None:
+        """A new deal reuses the Card objects, the talon and the hasher."""
+        table = GameTable(FrenchDeck())
+        cards = {id(c) for p in table.pile for c in p.cards}
+        stock, zobrist = table.pile_mazzo, table.zobrist
+        table.ridistribuisci(random.Random(5))
+        
+        assert {id(c) for p in table.pile for c in p.cards} == cards
+        assert table.pile_mazzo is stock and table.zobrist is zobrist
+        assert table.mazzo.cards == []
+        assert table.pile_mazzo.get_face_up_count() == 0
+        assert zobrist.value == ZobristHasher.for_piles(table.pile, 52).value
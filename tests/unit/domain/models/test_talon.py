@@ -0,0 +1,165 @@
+"""Unit tests for the Talon (stock and waste in one sequence)."""
+
+import copy
+from typing import List, MutableSequence
+
+import pytest
+
+from src.domain.models.card import Card
+from src.domain.models.deck import FrenchDeck
+from src.domain.models.table import GameTable
+from src.domain.models.talon import Talon, TalonPile
+
+
+def _cards(count: int) -> List[Card]:
+    """Face-down cards 1..count of hearts."""
+    deck = FrenchDeck()
+    deck.crea()
+    cards = deck.cards[:count]
+    for card in cards:
+        card.set_cover()
+    return cards
+
+
+def _filled(count: int) -> Talon:
+    """Talon with ``count`` cards on the stock (first card at the bottom)."""
+    talon = Talon()
+    for card in _cards(count):
+        talon.stock.aggiungi_carta(card)
+    return talon
+
+
+class TestTalon:
+    """Test draws and recycles on the shared sequence."""
+
+    def test_draw_moves_stock_top_to_waste(self) -> None:
+        """Test a draw turns the stock top face up onto the waste."""
+        talon = _filled(3)
+        top = talon.stock.get_top_card()
+
+        assert talon.draw() is top
+        assert talon.waste.get_top_card() is top
+        assert not top.get_covered
+        assert talon.stock.get_card_count() == 2
+        assert talon.waste.get_card_count() == 1
+
+    def test_recycle_inverts_waste(self) -> None:
+        """Test the first drawn card is the stock top after a recycle."""
+        talon = _filled(4)
+        drawn = [talon.draw() for _ in range(4)]
+
+        assert talon.recycle() == 4
+        assert talon.waste.is_empty()
+        assert talon.stock.get_all_cards() == drawn[::-1]
+        assert all(card.get_covered for card in drawn)
+        assert [talon.draw() for _ in range(4)] == drawn
+
+    def test_shuffled_recycle_and_undo(self) -> None:
+        """Test recycle order and unrecycle restore the waste."""
+        talon = _filled(4)
+        for _ in range(4):
+            talon.draw()
+        waste = talon.waste.get_all_cards()
+        order = (2, 0, 3, 1)
+
+        talon.recycle(order)
+        assert talon.stock.get_all_cards() == [waste[p] for p in order]
+        talon.unrecycle(4, order)
+        assert talon.waste.get_all_cards() == waste
+        assert talon.stock.is_empty()
+
+    def test_undraw(self) -> None:
+        """Test undraw puts the waste top back face down."""
+        talon = _filled(2)
+        card = talon.draw()
+
+        assert talon.undraw() is card
+        assert card.get_covered
+        assert talon.stock.get_top_card() is card
+
+
+class TestTalonPiles:
+    """Test the Pile views of the talon."""
+
+    def test_cards_view_is_bottom_to_top(self) -> None:
+        """Test both views list cards from bottom to top."""
+        cards = _cards(5)
+        talon = Talon()
+        for card in cards:
+            talon.stock.aggiungi_carta(card)
+        talon.draw()
+        talon.draw()
+
+        assert talon.stock.cards == cards[:3]
+        assert talon.stock.cards[-1] is cards[2]
+        assert talon.waste.cards[-2:] == [cards[4], cards[3]]
+        assert list(talon.waste.cards) == [cards[4], cards[3]]
+
+    def test_list_edits_through_view(self) -> None:
+        """Test mutations of ``cards`` reach the talon."""
+        cards = _cards(3)
+        talon = Talon()
+        talon.stock.cards = cards
+
+        bottom = talon.stock.cards.pop(0)
+        talon.waste.aggiungi_carta(bottom)
+
+        assert bottom is cards[0]
+        assert talon.stock.cards == cards[1:]
+        assert talon.waste.get_top_card() is bottom
+        assert talon.waste.rimuovi_carta() is bottom
+        assert talon.waste.is_empty()
+
+    def test_view_reads_talon_in_place(self) -> None:
+        """Test the view is a sequence walked and sliced from the talon."""
+        cards = _cards(6)
+        talon = Talon()
+        talon.stock.cards = cards
+        talon.draw()
+        talon.draw()
+        stock = talon.stock.cards
+
+        assert isinstance(stock, MutableSequence)
+        assert list(reversed(stock)) == cards[3::-1]
+        assert stock[::2] == cards[:4:2]
+        assert stock[-1:0:-1] == cards[3:0:-1]
+        assert stock.index(cards[2]) == 2 and cards[0] in stock
+        assert stock + [cards[5]] == cards[:4] + [cards[5]]
+        talon.draw()
+        assert len(stock) == 3 and stock[-1] is cards[2]
+
+    def test_view_concatenates_and_copies_as_list(self) -> None:
+        """Test a list built from the view holds its cards, not an empty list."""
+        cards = _cards(4)
+        talon = Talon()
+        talon.stock.cards = cards
+        talon.draw()
+
+        assert [] + talon.stock.cards == cards[:3]
+        assert [cards[3]] + talon.stock.cards == [cards[3]] + cards[:3]
+        assert talon.waste.cards + talon.stock.cards == [cards[3]] + cards[:3]
+        assert copy.copy(talon.stock.cards) == cards[:3]
+        assert type(copy.copy(talon.stock.cards)) is list
+        assert cards[:3] == talon.stock.cards
+
+    def test_talon_pile_is_abstract(self) -> None:
+        """Test only the stock and waste views can be built."""
+        with pytest.raises(TypeError):
+            TalonPile(Talon(), "Pila", "mazzo")
+
+    def test_face_up_boundaries(self) -> None:
+        """Test the stock is all face down and the waste all face up."""
+        talon = _filled(3)
+        talon.draw()
+
+        assert talon.stock.get_face_up_count() == 0
+        assert talon.waste.get_face_up_count() == 1
+
+    def test_table_deal_uses_talon(self) -> None:
+        """Test the dealt stock is a talon view."""
+        table = GameTable(FrenchDeck())
+
+        assert table.pile_mazzo is table.talon.stock
+        assert table.pile_scarti is table.talon.waste
+        assert table.pile[12].get_card_count() == 24
+        assert table.pile[11].is_empty()
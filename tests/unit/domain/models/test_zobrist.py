@@ -0,0 +1,94 @@
+"""Unit tests for Zobrist position hashing."""
+
+import random
+
+import pytest
+
+from src.domain.models.deck import FrenchDeck, NeapolitanDeck
+from src.domain.models.table import GameTable
+from src.domain.models.zobrist import ZobristHasher
+from src.domain.rules.move_generator import MoveKind
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+
+
+def _fresh_value(table: GameTable) -> int:
+    """Hash recomputed from scratch for the current table."""
+    card_count = len(table.mazzo.SUITES) * len(table.mazzo.VALUES)
+    return ZobristHasher.for_piles(table.pile, card_count).value
+
+
+def _play_random(service: GameService, rng: random.Random, steps: int) -> None:
+    """Play random legal moves through GameService."""
+    table = service.table
+    for _ in range(steps):
+        moves = service.get_legal_moves()
+        if not moves:
+            return
+        move = rng.choice(moves)
+        if move.kind == MoveKind.DRAW:
+            service.draw_cards(1)
+        elif move.kind == MoveKind.RECYCLE:
+            service.recycle_waste()
+        else:
+            service.move_card(
+                table.pile[move.source],
+                table.pile[move.target],
+                move.card_count,
+                is_foundation_target=7 <= move.target <= 10,
+            )
+        assert table.zobrist.value == _fresh_value(table)
+
+
+class TestZobristHasher:
+    """Test incremental and canonical hashing."""
+
+    @pytest.mark.parametrize("deck_cls", [FrenchDeck, NeapolitanDeck])
+    def test_incremental_matches_rebuild(self, deck_cls) -> None:
+        """Hash updated by GameService equals a full recomputation."""
+        deck = deck_cls()
+        table = GameTable(deck)
+        service = GameService(table, SolitaireRules(deck))
+        _play_random(service, random.Random(7), 300)
+
+    def test_auto_move_updates_hash(self) -> None:
+        """auto_move_to_foundation keeps the hash in sync."""
+        deck = FrenchDeck()
+        table = GameTable(deck)
+        service = GameService(table, SolitaireRules(deck))
+        rng = random.Random(3)
+        for _ in range(200):
+            service.auto_move_to_foundation()
+            assert table.zobrist.value == _fresh_value(table)
+            _play_random(service, rng, 1)
+
+    def test_draw_changes_and_identifies_positions(self) -> None:
+        """Different positions hash differently, equal ones the same."""
+        deck = FrenchDeck()
+        table = GameTable(deck)
+        service = GameService(table, SolitaireRules(deck))
+        start = service.get_position_hash()
+        service.draw_cards(1)
+        assert service.get_position_hash() != start
+        state = service.get_compact_state()
+        service.draw_cards(1)
+        service.load_compact_state(state)
+        assert table.zobrist.value == _fresh_value(table)
+
+    def test_canonical_ignores_column_order(self) -> None:
+        """Swapping two tableau columns keeps the canonical hash."""
+        table = GameTable(FrenchDeck())
+        hasher = ZobristHasher.for_piles(table.pile, 52)
+        piles = list(table.pile)
+        piles[2], piles[5] = piles[5], piles[2]
+        swapped = ZobristHasher.for_piles(piles, 52)
+        assert swapped.canonical == hasher.canonical
+        assert swapped.value != hasher.value
+
+    def test_recycle_count_is_optional(self) -> None:
+        """Recycles only matter for value_with_recycles()."""
+        hasher = ZobristHasher.for_piles(GameTable(FrenchDeck()).pile, 52)
+        before = hasher.value_with_recycles()
+        hasher.recycle_count += 1
+        assert hasher.value_with_recycles() != before
+        assert hasher.copy().value == hasher.value
@@ -0,0 +1,125 @@
+"""Unit tests for LegalMoveGenerator."""
+
+import pytest
+
+from src.domain.models.compact_table import (
+    CompactTable,
+    FACE_UP,
+    STOCK_SLOT,
+    WASTE_SLOT,
+)
+from src.domain.models.deck import FrenchDeck
+from src.domain.models.table import GameTable
+from src.domain.rules.move_generator import (
+    LegalMoveGenerator,
+    Move,
+    MoveKind,
+    apply_move,
+)
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+
+
+@pytest.fixture
+def rules() -> SolitaireRules:
+    """French-deck rules."""
+    return SolitaireRules(FrenchDeck())
+
+
+@pytest.fixture
+def generator(rules: SolitaireRules) -> LegalMoveGenerator:
+    """Generator bound to French rules."""
+    return LegalMoveGenerator(rules)
+
+
+def _empty_state(rules: SolitaireRules) -> CompactTable:
+    """Compact state with all piles empty."""
+    return CompactTable(rules.encoding)
+
+
+def _up(rules: SolitaireRules, suit: int, value: int) -> int:
+    """Face-up byte for a card (suits: 0 cuori, 1 quadri, 2 fiori, 3 picche)."""
+    return rules.encoding.encode(suit, value) | FACE_UP
+
+
+class TestLegalMoveGenerator:
+    """Test move enumeration on hand-built positions."""
+
+    def test_sequences_of_every_length(self, rules, generator) -> None:
+        """Each valid sub-sequence of a face-up run is a separate move."""
+        state = _empty_state(rules)
+        state.piles[0] += bytes([
+            rules.encoding.encode(0, 2),          # face-down
+            _up(rules, 0, 9), _up(rules, 3, 8), _up(rules, 1, 7),
+        ])
+        state.piles[1].append(_up(rules, 2, 10))   # black 10 takes red 9
+        state.piles[2].append(_up(rules, 3, 9))    # black 9: only red 8 fits
+        state.piles[3].append(_up(rules, 2, 8))    # black 8 takes red 7
+
+        moves = generator.generate(state)
+        tableau = {(m.source, m.target, m.card_count) for m in moves
+                   if m.kind == MoveKind.TABLEAU_TO_TABLEAU}
+        assert (0, 1, 3) in tableau
+        assert (0, 3, 1) in tableau
+        assert (0, 2, 2) not in tableau            # black 8 on black 9
+
+    def test_foundation_moves(self, rules, generator) -> None:
+        """Aces go to their own foundation, followed by the next value."""
+        state = _empty_state(rules)
+        state.piles[0].append(_up(rules, 2, 1))
+        state.piles[7 + 1].append(_up(rules, 1, 1))
+        state.piles[WASTE_SLOT].append(_up(rules, 1, 2))
+
+        moves = generator.generate(state)
+        assert Move(MoveKind.TABLEAU_TO_FOUNDATION, 0, 9, 1) in moves
+        assert Move(MoveKind.WASTE_TO_FOUNDATION, WASTE_SLOT, 8, 1) in moves
+
+    def test_foundation_to_tableau(self, rules, generator) -> None:
+        """A foundation top can come back onto a matching tableau card."""
+        state = _empty_state(rules)
+        state.piles[7] += bytes([_up(rules, 0, v) for v in range(1, 6)])
+        state.piles[4].append(_up(rules, 3, 6))
+
+        moves = generator.generate(state)
+        assert Move(MoveKind.FOUNDATION_TO_TABLEAU, 7, 4, 1) in moves
+
+    def test_lone_king_not_moved_between_empty_columns(self, rules, generator) -> None:
+        """Moving a bottom King onto an empty column is skipped."""
+        state = _empty_state(rules)
+        state.piles[0].append(_up(rules, 0, 13))
+        moves = generator.generate(state)
+        assert not [m for m in moves if m.kind == MoveKind.TABLEAU_TO_TABLEAU]
+
+    def test_stock_actions(self, rules, generator) -> None:
+        """Draw while the stock has cards, recycle only when allowed."""
+        state = _empty_state(rules)
+        state.piles[STOCK_SLOT] += bytes([0, 1])
+        assert generator.generate(state, draw_count=3)[-1] == Move(
+            MoveKind.DRAW, STOCK_SLOT, WASTE_SLOT, 2
+        )
+
+        state.draw(2)
+        assert generator.generate(state)[-1].kind == MoveKind.RECYCLE
+        assert not [
+            m for m in generator.generate(state, allow_recycle=False)
+            if m.kind == MoveKind.RECYCLE
+        ]
+
+    def test_generated_moves_are_valid_on_live_table(self, rules) -> None:
+        """Moves from a dealt table pass the object-level rules."""
+        deck = FrenchDeck()
+        table = GameTable(deck)
+        service = GameService(table, SolitaireRules(deck))
+
+        for move in service.get_legal_moves():
+            if move.kind == MoveKind.TABLEAU_TO_TABLEAU:
+                cards = table.pile[move.source].cards[-move.card_count:]
+                assert service.rules.can_move_sequence(cards, table.pile[move.target])
+
+    def test_apply_move(self, rules, generator) -> None:
+        """apply_move executes draws and card moves on the state."""
+        state = CompactTable.from_table(GameTable(FrenchDeck()))
+        draw = generator.generate(state)[-1]
+        apply_move(state, draw)
+        assert len(state.piles[WASTE_SLOT]) == 1
+        assert len(state.piles[STOCK_SLOT]) == 23
@@ -670,3 +670,73 @@ class TestEdgeCases:
         pile = Pile()
         
         assert rules.is_foundation_complete(pile) is False
+
+
+class TestCompatibilityTables:
+    """Test table-driven validation against the legacy card comparisons."""
+    
+    @staticmethod
+    def _legacy_copy(card: Card) -> Card:
+        """Ad-hoc card with the same fields but no interned identity."""
+        copy = Card(card._valore, card._seme)
+        copy.set_int_value(card.get_value)
+        copy.set_color(card._colore)
+        copy.set_uncover()
+        return copy
+    
+    @pytest.mark.parametrize("deck_cls", [FrenchDeck, NeapolitanDeck])
+    def test_tableau_table_matches_legacy(self, deck_cls) -> None:
+        """Every card pair gives the same answer with and without tables."""
+        deck = deck_cls()
+        rules = SolitaireRules(deck)
+        for card in deck.cards:
+            card.set_uncover()
+        for top in deck.cards:
+            pile = Pile()
+            pile.aggiungi_carta(top)
+            legacy_pile = Pile()
+            legacy_pile.aggiungi_carta(self._legacy_copy(top))
+            for card in deck.cards:
+                assert rules.can_place_on_tableau(card, pile) == \
+                    rules.can_place_on_tableau(self._legacy_copy(card), legacy_pile)
+    
+    @pytest.mark.parametrize("deck_cls", [FrenchDeck, NeapolitanDeck])
+    def test_foundation_table_matches_legacy(self, deck_cls) -> None:
+        """Foundation successors agree with the legacy comparisons."""
+        deck = deck_cls()
+        rules = SolitaireRules(deck)
+        for card in deck.cards:
+            card.set_uncover()
+        for top in deck.cards:
+            pile = Pile()
+            pile.aggiungi_carta(top)
+            legacy_pile = Pile()
+            legacy_pile.aggiungi_carta(self._legacy_copy(top))
+            for card in deck.cards:
+                assert rules.can_place_on_foundation(card, pile) == \
+                    rules.can_place_on_foundation(self._legacy_copy(card), legacy_pile)
+    
+    def test_deck_cards_use_tables_only(self) -> None:
+        """Deck cards are judged by identity, whatever their cover state."""
+        deck = FrenchDeck()
+        rules = SolitaireRules(deck)
+        by_id = {card.get_id: card for card in deck.cards}
+        red_seven, black_six, red_six = by_id[6], by_id[26 + 5], by_id[5]
+        pile = Pile()
+        pile.aggiungi_carta(red_seven)
+        
+        assert black_six.get_covered and red_seven.get_covered
+        assert rules.can_place_on_tableau(black_six, pile) is True
+        assert rules.can_place_on_tableau(red_six, pile) is False
+    
+    def test_tables_shared_per_deck_type(self) -> None:
+        """Tables are built once per deck class."""
+        assert SolitaireRules(FrenchDeck()).tables is SolitaireRules(FrenchDeck()).tables
+        assert SolitaireRules(FrenchDeck()).tables is not SolitaireRules(NeapolitanDeck()).tables
+    
+    def test_king_and_ace_sets(self) -> None:
+        """King and Ace code sets have one card per suit."""
+        tables = SolitaireRules(NeapolitanDeck()).tables
+        assert len(tables.king_codes) == 4
+        assert len(tables.ace_codes) == 4
+        assert all(tables.foundation_next[k] == -1 for k in tables.king_codes)
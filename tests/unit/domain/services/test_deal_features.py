@@ -0,0 +1,122 @@
+"""Unit tests for vectorised deal features and difficulty scoring."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.domain.models.compact_table import CODE_MASK, STOCK_SLOT
+from src.domain.models.deck import FrenchDeck, NeapolitanDeck
+from src.domain.models.table import GameTable
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services import deal_features
+from src.domain.services.deal_features import (
+    assign_levels,
+    deal_features as compute_features,
+    deals_from_seeds,
+    difficulty_scores,
+    level_thresholds,
+)
+from src.domain.services.game_service import GameService
+
+
+def _service_deal(deck_class, seed: int) -> list:
+    """Card ids of ``GameService.deal(seed)`` in deal order."""
+    deck = deck_class()
+    service = GameService(GameTable(deck), SolitaireRules(deck))
+    service.deal(seed)
+    piles = service.get_compact_state().piles
+    tableau = [byte & CODE_MASK for pile in piles[:7] for byte in pile]
+    return tableau + [byte & CODE_MASK for byte in piles[STOCK_SLOT]]
+
+
+class TestDealsFromSeeds:
+    """Test the vectorised shuffle against Python's random module."""
+
+    @pytest.mark.parametrize("deck_type,size", [("french", 52), ("neapolitan", 40)])
+    def test_matches_random_shuffle(self, deck_type: str, size: int) -> None:
+        """Test every deal equals random.Random(seed).shuffle of the ids."""
+        seeds = list(range(300)) + [2 ** 31, 2 ** 32 - 1]
+        deals = deals_from_seeds(seeds, deck_type, chunk_size=128)
+
+        for seed, deal in zip(seeds, deals):
+            expected = list(range(size))
+            random.Random(seed).shuffle(expected)
+            assert deal.tolist() == expected, seed
+
+    def test_exhausted_rows_fall_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test deals needing more random words than precomputed stay exact."""
+        monkeypatch.setattr(deal_features, "_MT_OUTPUTS", 52)
+        deals = deals_from_seeds(range(50))
+
+        for seed, deal in enumerate(deals):
+            expected = list(range(52))
+            random.Random(seed).shuffle(expected)
+            assert deal.tolist() == expected
+
+    @pytest.mark.parametrize("deck_class,deck_type", [
+        (FrenchDeck, "french"), (NeapolitanDeck, "neapolitan")
+    ])
+    def test_layout_matches_game_service(self, deck_class, deck_type: str) -> None:
+        """Test deal positions are the tableau and stock of GameService.deal."""
+        deals = deals_from_seeds([7, 4242], deck_type)
+
+        assert deals[0].tolist() == _service_deal(deck_class, 7)
+        assert deals[1].tolist() == _service_deal(deck_class, 4242)
+
+    def test_invalid_input_raises(self) -> None:
+        """Test out-of-range seeds and unknown decks are rejected."""
+        with pytest.raises(ValueError):
+            deals_from_seeds([-1])
+        with pytest.raises(ValueError):
+            deals_from_seeds([2 ** 32])
+        with pytest.raises(ValueError):
+            deals_from_seeds([1], "spanish")
+
+
+class TestDealFeatures:
+    """Test features, scores and levels."""
+
+    def test_features_of_known_deal(self) -> None:
+        """Test features on a hand-built deal."""
+        # Identity deal: ids 0..27 on the tableau, 28..51 in the stock
+        deal = np.arange(52, dtype=np.uint8)[None, :]
+
+        features = compute_features(deal, "french", draw_count=3)
+
+        # Aces 0, 13, 26 at positions 0 (pile 1 top), 13 (pile 5, one
+        # card above), 26 (pile 7, one card above); Ace 39 in the stock
+        assert features["ace_depth"][0] == 2
+        # Kings 12 and 25 at height 2 of pile 5 and height 4 of pile 7
+        assert features["king_depth"][0] == 6
+        # Face-up tops 0, 2, 5, 9, 14, 20, 27: one Ace and two 2s
+        assert features["face_up_low"][0] == 3
+        # Ace 39 and 2 40 in the stock
+        assert features["stock_low_reachable"][0] + features["stock_low_hidden"][0] == 2
+
+    def test_draw_one_shows_whole_stock(self) -> None:
+        """Test draw-1 hides no stock card."""
+        deals = deals_from_seeds(range(200))
+
+        features = compute_features(deals, "french", draw_count=1)
+
+        assert not features["stock_low_hidden"].any()
+        assert features["stock_low_reachable"].sum() > 0
+
+    def test_wrong_deal_shape_raises(self) -> None:
+        """Test deals of another deck size are rejected."""
+        with pytest.raises(ValueError):
+            compute_features(deals_from_seeds(range(3), "neapolitan"), "french")
+
+    def test_levels_split_evenly(self) -> None:
+        """Test thresholds are ascending and levels roughly balanced."""
+        scores = difficulty_scores(compute_features(deals_from_seeds(range(5000))))
+
+        thresholds = level_thresholds(scores, levels=5)
+        levels = assign_levels(scores, thresholds)
+
+        assert (np.diff(thresholds) >= 0).all()
+        assert levels.min() == 1 and levels.max() == 5
+        counts = np.bincount(levels, minlength=6)[1:]
+        assert counts.min() > 600
@@ -0,0 +1,115 @@
+"""Unit tests for the GameService event stream."""
+
+from typing import List
+
+from src.domain.models.compact_table import FACE_UP
+from src.domain.models.deck import FrenchDeck
+from src.domain.models.game_events import (
+    CardRevealed, CardsMoved, FoundationCompleted, GameEvent, StockDrawn,
+    TableReset, WasteRecycled
+)
+from src.domain.models.table import GameTable
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+
+
+def _service(piles: List[bytearray]) -> GameService:
+    """Service loaded with the given compact piles (unlisted piles empty)."""
+    deck = FrenchDeck()
+    service = GameService(GameTable(deck), SolitaireRules(deck))
+    state = service.get_compact_state()
+    state.piles = piles + [bytearray() for _ in range(13 - len(piles))]
+    service.load_compact_state(state)
+    return service
+
+
+def _record(service: GameService) -> List[GameEvent]:
+    """Subscribe a list collecting the events of the service."""
+    events: List[GameEvent] = []
+    service.subscribe(events.append)
+    return events
+
+
+class TestGameEvents:
+    """Test one event per table change, in order."""
+
+    def test_deal_publishes_table_reset(self):
+        """Test a new deal tells subscribers to rescan the table."""
+        deck = FrenchDeck()
+        service = GameService(GameTable(deck), SolitaireRules(deck))
+        events = _record(service)
+
+        service.deal(7)
+
+        assert events == [TableReset()]
+
+    def test_move_reveal_and_undo(self):
+        """Test a revealing move and its undo publish mirrored events."""
+        # K♠ face down under A♥ on column 0
+        service = _service([bytearray([3 * 13 + 12, 0 | FACE_UP])])
+        events = _record(service)
+        table = service.table
+        king = table.pile[0].cards[0]
+
+        service.move_card(table.pile[0], table.pile[7], 1, True)
+        service.undo()
+
+        assert events == [
+            CardsMoved(0, 7, 1),
+            CardRevealed(0, king),
+            CardRevealed(0, king, covered=True),
+            CardsMoved(7, 0, 1),
+        ]
+
+    def test_stock_events(self):
+        """Test draws, recycles and their undo."""
+        service = _service([bytearray()] * 12 + [bytearray([5, 6])])
+        events = _record(service)
+
+        service.draw_cards(2)
+        service.recycle_waste()
+        service.undo()
+        service.redo()
+
+        assert events == [
+            StockDrawn(2),
+            WasteRecycled(2),
+            WasteRecycled(2, undone=True),
+            WasteRecycled(2),
+        ]
+
+    def test_foundation_completed_and_undone(self):
+        """Test the last card of a suit completes the foundation."""
+        # Hearts A-Q on the foundation, K♥ on column 0
+        service = _service(
+            [bytearray([12 | FACE_UP])] + [bytearray()] * 6
+            + [bytearray(v | FACE_UP for v in range(12))]
+        )
+        events = _record(service)
+        table = service.table
+
+        service.move_card(table.pile[0], table.pile[7], 1, True)
+        assert events[-1] == FoundationCompleted(7)
+        assert service.semi_completati == 1
+        assert service.carte_per_seme[0] == 13
+
+        service.undo()
+        assert events[-1] == FoundationCompleted(7, completed=False)
+        assert service.semi_completati == 0
+        assert service.carte_per_seme[0] == 12
+
+    def test_unsubscribe_and_failing_subscriber(self):
+        """Test removed callbacks get nothing and errors do not stop the game."""
+        service = _service([bytearray()] * 12 + [bytearray([5])])
+        events = _record(service)
+
+        def broken(event: GameEvent) -> None:
+            raise RuntimeError("boom")
+
+        service.subscribe(broken)
+        ok, _, _ = service.draw_cards(1)
+        service.unsubscribe(events.append)
+        service.undo()
+
+        assert ok
+        assert events == [StockDrawn(1)]
@@ -7,6 +7,7 @@ from src.domain.models.table import GameTable
 from src.domain.models.deck import FrenchDeck
 from src.domain.models.card import Card
 from src.domain.models.pile import Pile
+from src.domain.models.compact_table import FACE_UP
 from src.domain.rules.solitaire_rules import SolitaireRules
 
 
@@ -255,6 +256,21 @@ class TestStockWasteManagement:
         assert success is True
         assert table.pile_scarti.get_card_count() == 0
         assert table.pile_mazzo.get_card_count() == 5
+    
+    def test_seeded_game_replays_shuffled_recycles(self) -> None:
+        """A seed fixes both the deal and the shuffled recycle order."""
+        def play(seed: int) -> list:
+            deck = FrenchDeck()
+            service = GameService(GameTable(deck), SolitaireRules(deck))
+            service.deal(seed)
+            service.reset_game()
+            while service.table.pile_mazzo.get_card_count():
+                service.draw_cards(1)
+            service.recycle_waste(shuffle=True)
+            return [c.get_id for p in service.table.pile for c in p.cards]
+        
+        assert play(42) == play(42)
+        assert play(42) != play(43)
 
 
 class TestAutoMove:
@@ -336,6 +352,98 @@ class TestAutoMove:
         assert moved_card is None
 
 
+class TestAutoComplete:
+    """Test batch auto-complete of a won position."""
+    
+    @staticmethod
+    def _endgame_service() -> GameService:
+        """All cards face up: J on the foundations, K and Q on the tableau."""
+        deck = FrenchDeck()
+        service = GameService(GameTable(deck), SolitaireRules(deck))
+        state = service.get_compact_state()
+        piles = [bytearray() for _ in range(13)]
+        for suit in range(4):
+            piles[7 + suit] = bytearray((suit * 13 + v) | FACE_UP for v in range(11))
+            # Each King is covered by the Queen of the next suit
+            piles[suit] = bytearray([(suit * 13 + 12) | FACE_UP, ((suit + 1) % 4 * 13 + 11) | FACE_UP])
+        state.piles = piles
+        service.load_compact_state(state)
+        return service
+    
+    def test_auto_complete_wins_in_one_batch(self):
+        """Test every remaining card goes to the foundations, undoably."""
+        service = self._endgame_service()
+        
+        assert service.covered_count == 0
+        assert service.can_auto_complete()
+        moved = service.auto_complete()
+        
+        assert len(moved) == 8
+        assert service.is_victory()
+        assert service.move_count == 8
+        assert service.semi_completati == 4
+        assert not service.can_auto_complete()
+        
+        service.undo()
+        assert not service.is_victory()
+        assert service.can_auto_complete()
+    
+    def test_not_available_with_covered_or_stock_cards(self):
+        """Test a fresh deal cannot be auto-completed."""
+        deck = FrenchDeck()
+        service = GameService(GameTable(deck), SolitaireRules(deck))
+        service.deal(1)
+        
+        assert service.covered_count == 21
+        assert not service.can_auto_complete()
+        assert service.auto_complete() == []
+
+
+class TestSafeAutoPlay:
+    """Test safe auto-play of low cards to the foundations."""
+    
+    @staticmethod
+    def _service() -> GameService:
+        """A♥ and 2♥ (over the face-down K♠) playable, 3♥ not yet safe."""
+        deck = FrenchDeck()
+        service = GameService(GameTable(deck), SolitaireRules(deck))
+        state = service.get_compact_state()
+        piles = [bytearray() for _ in range(13)]
+        piles[0] = bytearray([0 | FACE_UP])            # Asso di Cuori
+        piles[1] = bytearray([3 * 13 + 12, 1 | FACE_UP])  # Re di Picche coperto, 2 di Cuori
+        piles[2] = bytearray([2 | FACE_UP])            # 3 di Cuori
+        used = {0, 1, 2, 3 * 13 + 12}
+        piles[12] = bytearray(c for c in range(52) if c not in used)
+        state.piles = piles
+        service.load_compact_state(state)
+        return service
+    
+    def test_moves_only_safe_cards(self):
+        """Test Ace and 2 go up, the 3 waits for the black foundations."""
+        service = self._service()
+        
+        moved = service.auto_play_safe()
+        
+        assert [card.get_id for card in moved] == [0, 1]
+        assert service.move_count == 2
+        assert service.carte_per_seme[0] == 2
+        assert service.table.pile_base[2].get_card_count() == 1
+        assert not service.table.pile_base[1].get_top_card().get_covered
+        assert service.covered_count == 0
+        assert service.auto_play_safe() == []
+    
+    def test_safe_moves_are_undoable(self):
+        """Test each auto-played card is its own undo step."""
+        service = self._service()
+        service.auto_play_safe()
+        
+        service.undo()
+        
+        assert service.table.pile_semi[0].get_card_count() == 1
+        assert service.table.pile_base[1].get_top_card().get_id == 1
+        assert service.covered_count == 1
+
+
 class TestGameStatus:
     """Test game over and victory checks."""
     
@@ -0,0 +1,145 @@
+"""Unit tests for GameService undo/redo."""
+
+import random
+import sys
+
+from src.domain.models.compact_table import CompactTable
+from src.domain.models.deck import FrenchDeck
+from src.domain.models.move_history import DeltaKind
+from src.domain.models.scoring import ScoreEventType, ScoringConfig
+from src.domain.models.table import GameTable
+from src.domain.rules.move_generator import MoveKind
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+from src.domain.services.scoring_service import ScoringService
+
+
+def _service(seed: int) -> GameService:
+    """Seeded game with scoring enabled."""
+    deck = FrenchDeck()
+    scoring = ScoringService(ScoringConfig(), difficulty_level=1, deck_type="french", draw_count=1)
+    service = GameService(GameTable(deck), SolitaireRules(deck), scoring)
+    service.deal(seed)
+    service.reset_game()
+    return service
+
+
+def _snapshot(service: GameService) -> tuple:
+    """Everything undo must restore."""
+    scoring = service.scoring
+    return (
+        CompactTable.from_table(service.table).key(),
+        service.get_position_hash(),
+        service.move_count,
+        service.draw_count,
+        service.recycle_count,
+        service.covered_count,
+        list(service.carte_per_seme),
+        scoring.get_base_score(),
+        scoring.stock_draw_count,
+        scoring.recycle_count,
+    )
+
+
+def _play_random(service: GameService, rng: random.Random, steps: int) -> list:
+    """Play random legal actions, returning the snapshot before each one."""
+    snapshots = []
+    for _ in range(steps):
+        moves = service.get_legal_moves()
+        if not moves:
+            break
+        move = rng.choice(moves)
+        snapshots.append(_snapshot(service))
+        if move.kind == MoveKind.DRAW:
+            ok = service.draw_cards(1)[0]
+        elif move.kind == MoveKind.RECYCLE:
+            ok = service.recycle_waste(shuffle=rng.random() < 0.5)[0]
+        else:
+            ok = service.move_card(
+                service.table.pile[move.source],
+                service.table.pile[move.target],
+                move.card_count,
+                is_foundation_target=7 <= move.target <= 10,
+            )[0]
+        assert ok, move
+    return snapshots
+
+
+class TestUndoRedo:
+    """Test undo/redo restores the full game state."""
+    
+    def test_undo_all_then_redo_all(self) -> None:
+        """Undoing every action walks back through every earlier state."""
+        service = _service(5)
+        snapshots = _play_random(service, random.Random(1), 300)
+        final = _snapshot(service)
+        assert service.covered_count == service._count_covered()
+        
+        for expected in reversed(snapshots):
+            assert service.undo() == (True, "Mossa annullata")
+            assert _snapshot(service) == expected
+        assert service.undo()[0] is False
+        
+        for expected in snapshots[1:] + [final]:
+            assert service.redo()[0] is True
+            assert _snapshot(service) == expected
+        assert service.redo()[0] is False
+    
+    def test_new_action_clears_redo(self) -> None:
+        """A new action after undo discards the redo stack."""
+        service = _service(2)
+        service.draw_cards(1)
+        service.undo()
+        assert service.history.can_redo
+        service.draw_cards(1)
+        assert not service.history.can_redo
+        assert len(service.history) == 1
+    
+    def test_auto_move_is_undoable(self) -> None:
+        """Automatic foundation moves are recorded too."""
+        service = _service(3)
+        for _ in range(200):
+            if service.auto_move_to_foundation()[0]:
+                break
+            if not service.draw_cards(1)[0]:
+                service.recycle_waste()
+        before = len(service.history)
+        service.undo()
+        assert len(service.history) == before - 1
+        assert service.history.pop_redo().kind == DeltaKind.MOVE
+    
+    def test_hint_survives_undo_and_redo(self) -> None:
+        """Undo removes only the action's events, not a later hint."""
+        service = _service(4)
+        service.draw_cards(1)
+        service.scoring.record_event(ScoreEventType.HINT_USED, "hint")
+        
+        service.undo()
+        assert [e.event_type for e in service.scoring.events] == [ScoreEventType.HINT_USED]
+        assert service.scoring.stock_draw_count == 0
+        assert len(service.table.pile_mazzo.cards) == 24
+        
+        service.redo()
+        assert [e.event_type for e in service.scoring.events] == [
+            ScoreEventType.HINT_USED, ScoreEventType.STOCK_DRAW
+        ]
+        assert service.scoring.stock_draw_count == 1
+        assert len(service.table.pile_mazzo.cards) == 23
+    
+    def test_history_stays_small(self) -> None:
+        """Every delta holds a few integers, never table or card copies."""
+        service = _service(9)
+        rng = random.Random(0)
+        while len(service.history) < 1000:
+            if service.draw_cards(1)[0] is False:
+                service.recycle_waste(shuffle=rng.random() < 0.1)
+        
+        for delta in service.history._undo:
+            *numbers, events, order = delta
+            assert all(type(value) in (int, bool, DeltaKind) for value in numbers)
+            # Events are the scoring service's own objects, not copies
+            assert all(any(e is event for e in service.scoring.events) for event in events)
+            assert order is None or all(type(i) is int for i in order)
+            size = sys.getsizeof(delta) + sys.getsizeof(events) + sys.getsizeof(order)
+            size += sum(sys.getsizeof(value) for value in numbers + list(order or ()))
+            assert size < 1_500
@@ -0,0 +1,96 @@
+"""Unit tests for the background hint engine."""
+
+from src.domain.models.compact_table import FACE_UP, STOCK_SLOT
+from src.domain.models.deck import FrenchDeck
+from src.domain.models.table import GameTable
+from src.domain.rules.move_generator import LegalMoveGenerator, Move, MoveKind
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+from src.domain.services.hint_engine import HintEngine, rank_moves
+from src.domain.services.solver import SolverStatus
+
+
+def _dealt_service(seed: int) -> GameService:
+    """Game service on a fixed deal."""
+    deck = FrenchDeck()
+    service = GameService(GameTable(deck), SolitaireRules(deck))
+    service.deal(seed)
+    service.start_game()
+    return service
+
+
+class TestRankMoves:
+    """Test the heuristic move order."""
+
+    def test_foundation_then_reveal_then_stock(self) -> None:
+        """Test foundation moves lead and bare shifts come after the stock."""
+        state = _dealt_service(0).get_compact_state()
+        state.piles = [bytearray() for _ in range(13)]
+        state.piles[0] = bytearray([0 | FACE_UP])                   # Asso di cuori
+        state.piles[1] = bytearray([30, 7 | FACE_UP])               # coperta, 8 di cuori
+        state.piles[2] = bytearray([34 | FACE_UP])                  # 9 di fiori
+        state.piles[3] = bytearray([46 | FACE_UP])                  # 8 di picche
+        state.piles[4] = bytearray([8 | FACE_UP])                   # 9 di cuori
+        state.piles[STOCK_SLOT] = bytearray([5])
+        moves = LegalMoveGenerator(SolitaireRules(FrenchDeck())).generate_compact(state)
+
+        ranked = rank_moves(state, moves)
+
+        assert ranked[0].kind == MoveKind.TABLEAU_TO_FOUNDATION
+        assert ranked[1] == Move(MoveKind.TABLEAU_TO_TABLEAU, 1, 2, 1)   # Scopre una carta
+        assert ranked[2].kind == MoveKind.DRAW
+        assert ranked[-1] == Move(MoveKind.TABLEAU_TO_TABLEAU, 3, 4, 1)
+
+
+class TestHintEngine:
+    """Test anytime search, cancellation and position matching."""
+
+    def test_search_finds_winning_first_move(self) -> None:
+        """Test the worker upgrades the hint to the start of a winning line."""
+        service = _dealt_service(1)
+        state = service.get_compact_state()
+        engine = HintEngine(service.rules, draw_count=3)
+
+        first = engine.start(state)
+        assert first is not None and first.status == SolverStatus.UNKNOWN
+        assert engine.wait(10.0)
+
+        hint = engine.best(state)
+        assert hint.status == SolverStatus.WINNABLE
+        assert hint.nodes > 0
+        assert hint.move in LegalMoveGenerator(service.rules).generate_compact(state, 3)
+
+    def test_changed_board_cancels_search(self) -> None:
+        """Test a hint is never given for another position."""
+        service = _dealt_service(0)
+        state = service.get_compact_state()
+        engine = HintEngine(service.rules, draw_count=3, budgets=(10 ** 9,), time_limit=60.0)
+        engine.start(state)
+
+        service.draw_cards(3)
+        assert engine.best(service.get_compact_state()) is None
+
+        assert engine.wait(5.0)
+        assert engine.best(state) is None
+
+    def test_cancel_stops_worker(self) -> None:
+        """Test cancel() ends a long search promptly."""
+        service = _dealt_service(0)
+        engine = HintEngine(service.rules, draw_count=3, budgets=(10 ** 9,), time_limit=60.0)
+        engine.start(service.get_compact_state())
+        assert engine.searching
+
+        engine.cancel()
+
+        assert engine.wait(5.0)
+        assert engine.best() is None
+
+    def test_no_legal_move_gives_no_hint(self) -> None:
+        """Test an empty table has nothing to suggest and starts no thread."""
+        service = _dealt_service(0)
+        state = service.get_compact_state()
+        state.piles = [bytearray() for _ in range(13)]
+        engine = HintEngine(service.rules)
+
+        assert engine.start(state) is None
+        assert not engine.searching
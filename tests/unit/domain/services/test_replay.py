@@ -0,0 +1,142 @@
+"""Unit tests for the compact game replay format and recorder."""
+
+import pytest
+
+from src.domain.models.deck import FrenchDeck
+from src.domain.models.table import GameTable
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+from src.domain.services.replay import (
+    Replay,
+    ReplayAction,
+    ReplayOp,
+    ReplayRecorder,
+    read_varint,
+    write_varint,
+)
+from src.domain.simulation import GameSimulator, SimulationConfig
+
+
+def _apply(service: GameService, action: ReplayAction) -> None:
+    """Play one recorded action on a service."""
+    piles = service.table.pile
+    if action.op == ReplayOp.MOVE:
+        ok = service.move_card(
+            piles[action.source], piles[action.target], action.card_count, 7 <= action.target <= 10
+        )[0]
+    elif action.op == ReplayOp.DRAW:
+        ok = service.draw_cards(action.card_count)[0]
+    elif action.op == ReplayOp.RECYCLE:
+        ok = service.recycle_waste(bool(action.card_count))[0]
+    elif action.op == ReplayOp.UNDO:
+        ok = service.undo()[0]
+    else:
+        ok = service.redo()[0]
+    assert ok, action
+
+
+class TestReplayCodec:
+    """Test varints and replay round trips."""
+
+    @pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2 ** 32 - 1])
+    def test_varint_round_trip(self, value: int) -> None:
+        """Test values survive encoding, small ones in one byte."""
+        out = bytearray()
+        write_varint(out, value)
+        assert read_varint(bytes(out), 0) == (value, len(out))
+        if value < 128:
+            assert len(out) == 1
+
+    def test_replay_round_trip(self) -> None:
+        """Test header, actions and end marker are preserved."""
+        replay = Replay(
+            deck_type="neapolitan",
+            draw_per_click=3,
+            shuffle_on_recycle=True,
+            deal_seed=123456789,
+            actions=[
+                ReplayAction(ReplayOp.DRAW, card_count=3),
+                ReplayAction(ReplayOp.MOVE, 11, 4, 1),
+                ReplayAction(ReplayOp.MOVE, 6, 2, 5),
+                ReplayAction(ReplayOp.UNDO),
+                ReplayAction(ReplayOp.REDO),
+                ReplayAction(ReplayOp.RECYCLE, card_count=1),
+            ],
+            finished=True,
+        )
+
+        assert Replay.from_bytes(replay.to_bytes()) == replay
+
+    def test_truncated_stream_keeps_complete_actions(self) -> None:
+        """Test a stream cut inside an action decodes up to the previous one."""
+        replay = Replay("french", deal_seed=5, actions=[
+            ReplayAction(ReplayOp.DRAW, card_count=1),
+            ReplayAction(ReplayOp.MOVE, 12, 3, 1),
+        ])
+        blob = replay.to_bytes()
+
+        decoded = Replay.from_bytes(blob[:-1])
+
+        assert decoded.actions == replay.actions[:1]
+        assert not decoded.finished
+
+    def test_invalid_header_raises(self) -> None:
+        """Test foreign data is rejected."""
+        with pytest.raises(ValueError):
+            Replay.from_bytes(b"SCSG\x01\x00\x00\x01")
+        with pytest.raises(ValueError):
+            Replay.from_bytes(b"SCRP")
+
+
+class TestReplayRecorder:
+    """Test recording games through GameService."""
+
+    def test_buffer_flushes_at_limit(self) -> None:
+        """Test bytes reach the sink in bounded chunks."""
+        chunks = []
+        recorder = ReplayRecorder(chunks.append, Replay("french", deal_seed=1), buffer_limit=8)
+        assert len(chunks) == 1  # Header written right away
+
+        for _ in range(7):
+            recorder.record(ReplayAction(ReplayOp.DRAW, card_count=1))
+        assert len(chunks) == 1
+        recorder.record(ReplayAction(ReplayOp.DRAW, card_count=1))
+        assert len(chunks) == 2
+
+        recorder.finish()
+        recorder.record(ReplayAction(ReplayOp.DRAW, card_count=1))  # Ignored
+        replay = Replay.from_bytes(b"".join(chunks))
+        assert len(replay.actions) == 8
+        assert replay.finished
+        assert recorder.bytes_written == sum(len(c) for c in chunks)
+
+    def test_recorded_game_replays_to_same_position(self) -> None:
+        """Test replaying a recorded game (shuffled recycles, undo) on its seed."""
+        seed = 11
+        simulator = GameSimulator(SimulationConfig(
+            draw_count=3, shuffle_on_recycle=True, scoring_enabled=False
+        ))
+        chunks = []
+        recorder = ReplayRecorder(chunks.append, Replay("french", 3, True, seed))
+        service = simulator.service
+        service.replay = recorder
+
+        simulator.play(seed)
+        assert service.undo()[0]
+        assert service.undo()[0]
+        assert service.redo()[0]
+        recorder.finish()
+        final = service.get_compact_state().piles
+
+        blob = b"".join(chunks)
+        replay = Replay.from_bytes(blob)
+        assert any(a.op == ReplayOp.RECYCLE and a.card_count for a in replay.actions)
+        assert len(blob) < 1024
+
+        deck = FrenchDeck()
+        replayed = GameService(GameTable(deck), SolitaireRules(deck))
+        replayed.deal(replay.deal_seed)
+        replayed.start_game()
+        for action in replay.actions:
+            _apply(replayed, action)
+        assert replayed.get_compact_state().piles == final
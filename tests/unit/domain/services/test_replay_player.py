@@ -0,0 +1,111 @@
+"""Unit tests for checkpointed replay playback."""
+
+import pytest
+
+from src.domain.models.deck import FrenchDeck, NeapolitanDeck
+from src.domain.models.table import GameTable
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services import replay_player
+from src.domain.services.game_service import GameService
+from src.domain.services.replay import Replay, ReplayAction, ReplayOp, ReplayRecorder
+from src.domain.services.replay_player import ReplayPlayer
+from src.domain.simulation import GameSimulator, SimulationConfig
+
+
+def _recorded_game(seed: int = 3):
+    """Greedy draw-3 game with shuffled recycles plus undo/redo at the end.
+
+    Returns:
+        Tuple of (replay, compact piles after every action)
+    """
+    simulator = GameSimulator(SimulationConfig(
+        draw_count=3, shuffle_on_recycle=True, scoring_enabled=False
+    ))
+    service = simulator.service
+    positions = []
+    chunks = []
+    recorder = ReplayRecorder(chunks.append, Replay("french", 3, True, seed))
+    record = recorder.record
+
+    def record_with_position(action: ReplayAction) -> None:
+        record(action)
+        positions.append(service.get_compact_state().piles)
+
+    recorder.record = record_with_position
+    service.replay = recorder
+    simulator.play(seed)
+    service.undo()
+    service.undo()
+    service.redo()
+    recorder.finish()
+    return Replay.from_bytes(b"".join(chunks)), positions
+
+
+def _service(deck_class=FrenchDeck) -> GameService:
+    deck = deck_class()
+    return GameService(GameTable(deck), SolitaireRules(deck))
+
+
+class TestReplayPlayer:
+    """Test stepping and seeking through a recorded game."""
+
+    def test_seek_matches_recorded_positions(self) -> None:
+        """Test every seek (forward, backward, far) shows the recorded position."""
+        replay, positions = _recorded_game()
+        player = ReplayPlayer(_service(), replay, checkpoint_interval=10)
+        assert player.length == len(positions)
+        deal = player.service.get_compact_state().piles
+
+        for target in (len(positions), 5, 37, 36, 0, 80, len(positions) - 1):
+            assert player.seek(target) == target
+            expected = positions[target - 1] if target else deal
+            assert player.service.get_compact_state().piles == expected
+
+    def test_seek_replays_at_most_interval_actions(self, monkeypatch) -> None:
+        """Test seeking restores the nearest checkpoint instead of replaying."""
+        replay, _ = _recorded_game()
+        player = ReplayPlayer(_service(), replay, checkpoint_interval=10)
+        applied = []
+        original = replay_player.apply_action
+        monkeypatch.setattr(
+            replay_player, "apply_action",
+            lambda service, action: applied.append(action) or original(service, action)
+        )
+
+        for target in (player.length, 3, player.length - 2, 50):
+            applied.clear()
+            player.seek(target)
+            assert len(applied) <= 10
+
+    def test_step_and_step_back(self) -> None:
+        """Test single steps forward and back, and the ends of the replay."""
+        replay, positions = _recorded_game()
+        player = ReplayPlayer(_service(), replay)
+
+        assert not player.step_back()
+        assert player.step() == replay.actions[0]
+        assert player.service.get_compact_state().piles == positions[0]
+        player.seek(player.length)
+        assert player.at_end
+        assert player.step() is None
+        assert player.step_back()
+        assert player.service.get_compact_state().piles == positions[-2]
+
+    def test_illegal_action_cuts_replay(self) -> None:
+        """Test a replay that stops applying is played up to that action."""
+        replay = Replay("french", deal_seed=1, actions=[
+            ReplayAction(ReplayOp.DRAW, card_count=1),
+            ReplayAction(ReplayOp.REDO),  # Nothing to redo
+            ReplayAction(ReplayOp.DRAW, card_count=1),
+        ])
+
+        player = ReplayPlayer(_service(), replay)
+
+        assert player.length == 1
+
+    def test_rejects_unplayable_replays(self) -> None:
+        """Test replays without seed or for another deck are refused."""
+        with pytest.raises(ValueError):
+            ReplayPlayer(_service(), Replay("french"))
+        with pytest.raises(ValueError):
+            ReplayPlayer(_service(NeapolitanDeck), Replay("french", deal_seed=1))
@@ -0,0 +1,126 @@
+"""Unit tests for the compact binary saved game."""
+
+import random
+import time
+
+import pytest
+
+from src.domain.models.compact_table import CompactTable
+from src.domain.models.deck import FrenchDeck, NeapolitanDeck
+from src.domain.models.scoring import ScoringConfig
+from src.domain.models.table import GameTable
+from src.domain.rules.move_generator import MoveKind
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+from src.domain.services.saved_game import SavedGame
+from src.domain.services.scoring_service import ScoringService
+
+
+def _service(deck_class=FrenchDeck, seed: int = 7) -> GameService:
+    """Seeded running game with scoring enabled."""
+    deck = deck_class()
+    deck_type = "neapolitan" if deck_class is NeapolitanDeck else "french"
+    scoring = ScoringService(ScoringConfig(), difficulty_level=2, deck_type=deck_type, draw_count=1)
+    service = GameService(GameTable(deck), SolitaireRules(deck), scoring)
+    service.deal(seed)
+    service.reset_game()
+    service.start_game()
+    return service
+
+
+def _play(service: GameService, steps: int) -> None:
+    """Play random legal actions, with shuffled recycles."""
+    rng = random.Random(3)
+    for _ in range(steps):
+        moves = service.get_legal_moves()
+        if not moves:
+            break
+        move = rng.choice(moves)
+        if move.kind == MoveKind.DRAW:
+            service.draw_cards(1)
+        elif move.kind == MoveKind.RECYCLE:
+            service.recycle_waste(shuffle=True)
+        else:
+            service.move_card(
+                service.table.pile[move.source],
+                service.table.pile[move.target],
+                move.card_count,
+                7 <= move.target <= 10,
+            )
+
+
+class TestSavedGame:
+    """Test capture, encoding and restore."""
+
+    def test_round_trip_restores_game(self) -> None:
+        """A restored game has the same table, counters, score and RNG."""
+        source = _service()
+        _play(source, 150)
+        blob = SavedGame.capture(source, draw_per_click=3, shuffle_on_recycle=True).to_bytes()
+
+        target = _service(seed=99)
+        saved = SavedGame.from_bytes(blob)
+        saved.restore(target)
+
+        assert saved.draw_per_click == 3 and saved.shuffle_on_recycle
+        assert CompactTable.from_table(target.table).key() == CompactTable.from_table(source.table).key()
+        assert target.get_position_hash() == source.get_position_hash()
+        assert (target.move_count, target.draw_count, target.recycle_count) == (
+            source.move_count, source.draw_count, source.recycle_count
+        )
+        assert target.carte_per_seme == source.carte_per_seme
+        assert target.deal_seed == 7
+        assert target.scoring.get_base_score() == source.scoring.get_base_score()
+        assert [(e.event_type, e.points, e.context) for e in target.scoring.events] == [
+            (e.event_type, e.points, e.context) for e in source.scoring.events
+        ]
+        assert target.scoring.stock_draw_count == source.scoring.stock_draw_count
+        assert target.rng.random() == source.rng.random()
+        assert abs(target.get_elapsed_time() - source.get_elapsed_time()) < 1.0
+        assert not target.history.can_undo
+
+    def test_timer_state_round_trip(self) -> None:
+        """Elapsed time and overtime are rebased on the current clock."""
+        source = _service()
+        source.start_time = time.time() - 600
+        source.timer_expired = True
+        source.overtime_start = time.time() - 30
+
+        target = _service()
+        SavedGame.from_bytes(SavedGame.capture(source).to_bytes()).restore(target)
+
+        assert target.timer_expired
+        assert abs(target.get_elapsed_time() - 600) < 1.0
+        assert abs(target.get_overtime_duration() - 30) < 1.0
+
+    def test_neapolitan_without_scoring(self) -> None:
+        """Other deck types and disabled scoring are supported."""
+        deck = NeapolitanDeck()
+        source = GameService(GameTable(deck), SolitaireRules(deck))
+        source.deal(5)
+        saved = SavedGame.from_bytes(SavedGame.capture(source).to_bytes())
+
+        assert saved.deck_type == "neapolitan"
+        assert saved.scoring is None
+        assert not saved.started
+        with pytest.raises(ValueError):
+            saved.restore(_service(FrenchDeck))
+
+    def test_blob_is_small_and_fast(self) -> None:
+        """Saving is cheap enough to run after every move."""
+        service = _service()
+        _play(service, 200)
+        started = time.perf_counter()
+        for _ in range(100):
+            blob = SavedGame.capture(service).to_bytes()
+        per_save = (time.perf_counter() - started) / 100
+
+        assert len(blob) < 8192
+        assert per_save < 0.005
+
+    def test_invalid_blob_rejected(self) -> None:
+        """Foreign or truncated data raises ValueError."""
+        blob = SavedGame.capture(_service()).to_bytes()
+        for bad in (b"", b"XXXX" + blob[4:], blob[:40], blob[:-3]):
+            with pytest.raises(ValueError):
+                SavedGame.from_bytes(bad)
@@ -0,0 +1,130 @@
+"""Unit tests for KlondikeSolver."""
+
+import random
+import threading
+
+import pytest
+
+from src.domain.models.compact_table import CompactTable, FACE_UP, STOCK_SLOT
+from src.domain.models.deck import FrenchDeck, NeapolitanDeck
+from src.domain.models.table import GameTable
+from src.domain.rules.move_generator import MoveKind, apply_move
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+from src.domain.services.solver import KlondikeSolver, SolverStatus
+
+
+def _deal(deck_cls, seed: int):
+    """Deterministic deal (deck shuffled with the global random seed)."""
+    random.seed(seed)
+    deck = deck_cls()
+    return deck, GameTable(deck)
+
+
+def _replay(state: CompactTable, moves) -> CompactTable:
+    """Apply a move list to a copy of a compact state."""
+    state = state.copy()
+    for move in moves:
+        apply_move(state, move)
+    return state
+
+
+class TestKlondikeSolver:
+    """Test solver outcomes and solution validity."""
+
+    @pytest.mark.parametrize("deck_cls,draw_count", [
+        (FrenchDeck, 1), (FrenchDeck, 3), (NeapolitanDeck, 1), (NeapolitanDeck, 3),
+    ])
+    def test_solutions_replay_to_victory(self, deck_cls, draw_count) -> None:
+        """Every WINNABLE result replays to a won compact state."""
+        for seed in range(3):
+            deck, table = _deal(deck_cls, seed)
+            solver = KlondikeSolver(SolitaireRules(deck), draw_count, max_nodes=5_000)
+            result = solver.solve(table)
+            if result.is_winnable:
+                assert _replay(CompactTable.from_table(table), result.moves).is_won()
+
+    def test_solution_plays_on_game_service(self) -> None:
+        """The primitive moves are accepted by GameService and win the game."""
+        deck, table = _deal(FrenchDeck, 0)
+        rules = SolitaireRules(deck)
+        result = KlondikeSolver(rules, draw_count=1).solve(table)
+        assert result.status == SolverStatus.WINNABLE
+
+        service = GameService(table, rules)
+        for move in result.moves:
+            if move.kind == MoveKind.DRAW:
+                ok, _, _ = service.draw_cards(move.card_count)
+            elif move.kind == MoveKind.RECYCLE:
+                ok, _ = service.recycle_waste(shuffle=False)
+            else:
+                ok, _ = service.move_card(
+                    table.pile[move.source],
+                    table.pile[move.target],
+                    move.card_count,
+                    is_foundation_target=7 <= move.target <= 10,
+                )
+            assert ok, move
+        assert service.is_victory()
+
+    def test_solve_does_not_modify_table(self) -> None:
+        """Solving works on a snapshot."""
+        deck, table = _deal(FrenchDeck, 1)
+        before = CompactTable.from_table(table).key()
+        KlondikeSolver(SolitaireRules(deck)).solve(table)
+        assert CompactTable.from_table(table).key() == before
+
+    def test_dead_position_is_unwinnable(self) -> None:
+        """A blocked position is proven unwinnable."""
+        rules = SolitaireRules(FrenchDeck())
+        enc = rules.encoding
+        state = CompactTable(enc)
+        # Clubs, diamonds and spades complete on their foundations
+        for suit in (1, 2, 3):
+            state.piles[7 + suit] += bytes(enc.encode(suit, v) | FACE_UP for v in range(1, 14))
+        # A/3 and 2/4 of hearts crossed, high hearts filling every column
+        # (no black card can come down), the rest in the stock
+        state.piles[0] += bytes([enc.encode(0, 1), enc.encode(0, 3) | FACE_UP])
+        state.piles[1] += bytes([enc.encode(0, 2), enc.encode(0, 4) | FACE_UP])
+        for column, value in enumerate(range(9, 14), start=2):
+            state.piles[column].append(enc.encode(0, value) | FACE_UP)
+        state.piles[STOCK_SLOT] += bytes(enc.encode(0, v) for v in range(5, 9))
+
+        result = KlondikeSolver(rules).solve(state)
+        assert result.status == SolverStatus.UNWINNABLE
+        assert result.moves == []
+
+    def test_pruned_dead_position_is_unknown(self) -> None:
+        """A dead end is not proven unwinnable if pruning skipped moves."""
+        rules = SolitaireRules(FrenchDeck())
+        enc = rules.encoding
+        state = CompactTable(enc)
+        # Two cards left on the table: the only move empties a column
+        # with no King waiting for it, which the pruning skips
+        state.piles[0].append(enc.encode(3, 5) | FACE_UP)
+        state.piles[1].append(enc.encode(0, 6) | FACE_UP)
+
+        result = KlondikeSolver(rules).solve(state)
+        assert result.status == SolverStatus.UNKNOWN
+        assert result.moves == []
+
+    def test_budget_exhaustion_is_unknown(self) -> None:
+        """Running out of nodes reports UNKNOWN."""
+        deck, table = _deal(FrenchDeck, 2)
+        result = KlondikeSolver(SolitaireRules(deck), max_nodes=5).solve(table)
+        assert result.status == SolverStatus.UNKNOWN
+        assert result.nodes == 6
+
+    def test_cancelled_solve_is_unknown(self) -> None:
+        """A set cancel event stops the search at the next clock check."""
+        deck, table = _deal(FrenchDeck, 2)
+        cancel = threading.Event()
+        cancel.set()
+        result = KlondikeSolver(SolitaireRules(deck), cancel_event=cancel).solve(table)
+        assert result.status == SolverStatus.UNKNOWN
+        assert result.nodes <= 256
+
+    def test_invalid_draw_count_rejected(self) -> None:
+        """Draw counts outside 1-3 are rejected."""
+        with pytest.raises(ValueError):
+            KlondikeSolver(SolitaireRules(FrenchDeck()), draw_count=4)
@@ -0,0 +1,128 @@
+"""Unit tests for stock cycle stall detection."""
+
+import random
+
+from src.domain.models.compact_table import FACE_UP
+from src.domain.models.deck import FrenchDeck
+from src.domain.models.table import GameTable
+from src.domain.rules.move_generator import MoveKind, apply_move
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+from src.domain.services.stall_detector import StallDetector, StallStatus
+
+
+def _blocked_service() -> GameService:
+    """Service whose only moves are draws and recycles.
+
+    5 di cuori alone on the tableau; in the stock only cards that fit
+    neither a foundation nor the 5 (2 e 3 di cuori, 7 di picche, 9 di fiori).
+    """
+    deck = FrenchDeck()
+    service = GameService(GameTable(deck), SolitaireRules(deck))
+    state = service.get_compact_state()
+    state.piles = [bytearray() for _ in range(13)]
+    state.piles[0] = bytearray([4 | FACE_UP])
+    state.piles[12] = bytearray([1, 2, 45, 34])
+    service.load_compact_state(state)
+    service.start_game()
+    return service
+
+
+def _cycle(service: GameService, count: int = 1, shuffle: bool = False) -> StallStatus:
+    """Draw the whole stock, then recycle."""
+    while not service.table.pile_mazzo.is_empty():
+        service.draw_cards(count)
+    assert service.recycle_waste(shuffle)[0]
+    return service.stall.status
+
+
+class TestStallDetector:
+    """Test cycle classification."""
+
+    def test_repeated_position_is_no_progress(self) -> None:
+        """Test a cycle ending on the previous cycle's position."""
+        detector = StallDetector()
+        assert detector.on_recycle(1234, board_moves=3) == StallStatus.NONE
+        detector.on_draw(playable=True)
+        assert detector.on_recycle(1234, board_moves=3) == StallStatus.NO_PROGRESS
+        assert detector.on_recycle(1234, board_moves=3) == StallStatus.NO_PROGRESS
+        assert detector.stalled_cycles == 2
+        assert detector.on_recycle(99, board_moves=3) == StallStatus.NONE
+        assert detector.stalled_cycles == 0
+
+    def test_playable_card_or_move_prevents_dead_end(self) -> None:
+        """Test a dead end needs no playable waste card and no move."""
+        detector = StallDetector()
+        detector.on_draw(playable=True)
+        assert detector.on_recycle(None, board_moves=0) == StallStatus.NONE
+        detector.on_move()
+        assert detector.on_recycle(None, board_moves=0) == StallStatus.NONE
+        assert detector.on_recycle(None, board_moves=0) == StallStatus.DEAD_END
+
+    def test_shuffled_multi_card_draws_are_not_dead_ends(self) -> None:
+        """Test shuffling with draw-3 may show other cards next cycle."""
+        detector = StallDetector()
+        detector.on_draw(playable=False, count=3)
+        assert detector.on_recycle(None, 0, shuffled=True) == StallStatus.NO_PROGRESS
+
+
+class TestGameServiceStall:
+    """Test stall detection through GameService."""
+
+    def test_blocked_position_is_dead_end(self) -> None:
+        """Test a full cycle without any possible move."""
+        service = _blocked_service()
+
+        assert _cycle(service) == StallStatus.DEAD_END
+        assert service.check_game_over() == (False, "Partita bloccata: nessuna mossa possibile")
+
+    def test_drawing_only_repeats_position(self) -> None:
+        """Test cycling a dealt game without moves reports no progress."""
+        deck = FrenchDeck()
+        service = GameService(GameTable(deck), SolitaireRules(deck))
+        service.deal(5)
+        service.start_game()
+
+        assert _cycle(service, 3) == StallStatus.NONE
+        assert _cycle(service, 3) == StallStatus.NO_PROGRESS
+
+        service.reset_game()
+        service.deal(5)
+        assert service.stall.status == StallStatus.NONE
+
+    def test_undo_forgets_cycles(self) -> None:
+        """Test the detector restarts after undo."""
+        service = _blocked_service()
+        _cycle(service)
+
+        service.undo()
+        assert service.stall.status == StallStatus.NONE
+        assert service.stall.stalled_cycles == 0
+
+    def test_board_check_matches_legal_moves(self) -> None:
+        """Test the live-table board check agrees with the move generator."""
+        deck = FrenchDeck()
+        service = GameService(GameTable(deck), SolitaireRules(deck))
+        rng = random.Random(3)
+        checked = {True: 0, False: 0}
+        for seed in range(20):
+            service.deal(seed)
+            state = service.get_compact_state()
+            for _ in range(80):
+                service.load_compact_state(state)
+                moves = service.get_legal_moves()
+                expected = any(m.kind not in (MoveKind.DRAW, MoveKind.RECYCLE) for m in moves)
+                assert service._has_board_move() == expected
+                checked[expected] += 1
+                if not moves:
+                    break
+                apply_move(state, rng.choice(moves))
+        assert min(checked.values()) > 0
+
+    def test_cycle_with_moves_skips_board_check(self) -> None:
+        """Test the board is not checked after a cycle that moved cards."""
+        service = _blocked_service()
+        service.stall.on_move()
+        service._has_board_move = None  # Must not be called
+
+        assert _cycle(service) == StallStatus.NONE
@@ -0,0 +1 @@
+"""Domain simulation unit tests."""
@@ -0,0 +1,98 @@
+"""Unit tests for the headless game simulation harness."""
+
+import random
+
+import pytest
+
+from src.domain.models.compact_table import CompactTable
+from src.domain.rules.move_generator import Move, MoveKind
+from src.domain.simulation import (
+    GameSimulator,
+    LatencyHistogram,
+    SimulationConfig,
+    SimulationReport,
+    create_policy,
+    run_simulation,
+)
+from src.domain.simulation.runner import simulate_batch
+
+
+class TestLatencyHistogram:
+    """Test the log-scale latency histogram."""
+
+    def test_percentiles_within_bucket_resolution(self) -> None:
+        """Percentiles are upper bounds within about 12% of the true value."""
+        histogram = LatencyHistogram()
+        for ns in range(1, 100_001):
+            histogram.add(ns)
+        for percent, exact in ((50, 50_000), (90, 90_000), (99, 99_000)):
+            value = histogram.percentile(percent)
+            assert exact <= value <= exact * 1.13
+
+    def test_merge_and_empty(self) -> None:
+        """Merging adds counts; an empty histogram reports 0."""
+        a, b = LatencyHistogram(), LatencyHistogram()
+        assert a.percentile(50) == 0
+        a.add(5)
+        b.add(5_000)
+        b.add(5_000)
+        a.merge(b)
+        assert a.total == 3
+        assert a.percentile(10) == 5
+        assert 5_000 <= a.percentile(100) < 5_700
+
+
+class TestPolicies:
+    """Test policy selection."""
+
+    def test_unknown_policy_rejected(self) -> None:
+        """An unknown policy name raises ValueError."""
+        with pytest.raises(ValueError):
+            create_policy("minimax")
+
+    def test_greedy_prefers_foundation_then_never_regresses(self) -> None:
+        """Greedy plays foundation moves first and skips foundation-to-tableau."""
+        policy = create_policy("greedy")
+        state = CompactTable.from_table(GameSimulator(SimulationConfig()).service.table)
+        draw = Move(MoveKind.DRAW, 12, 11, 1)
+        found = Move(MoveKind.WASTE_TO_FOUNDATION, 11, 7, 1)
+        back = Move(MoveKind.FOUNDATION_TO_TABLEAU, 7, 0, 1)
+        rng = random.Random(0)
+        assert policy.choose(state, [draw, found], rng) == found
+        assert policy.choose(state, [back], rng) is None
+
+
+class TestGameSimulator:
+    """Test complete simulated games."""
+
+    def test_games_are_reproducible(self) -> None:
+        """The same seed and policy give the same game."""
+        simulator = GameSimulator(SimulationConfig(policy="random", max_actions=300))
+        first = simulator.play(11)
+        simulator.play(12)
+        assert simulator.play(11) == first
+        assert first.actions <= 300
+
+    def test_solver_policy_wins_solved_deals(self) -> None:
+        """The solver policy wins the deals the solver solves."""
+        report = GameSimulator(SimulationConfig(policy="solver", draw_count=3)).play_many(range(5))
+        assert report.wins >= 1
+        assert report.foundation_cards >= 52 * report.wins
+        assert report.score_max > 0
+
+    def test_report_aggregation(self) -> None:
+        """Run reports aggregate every game, batched or not."""
+        config = SimulationConfig(deck_type="neapolitan", draw_count=3, shuffle_on_recycle=True)
+        report = run_simulation(config, range(20), batch_size=6)
+        direct = simulate_batch((config, list(range(20))))
+
+        assert report.games == 20
+        assert sum(report.outcomes.values()) == 20
+        assert (report.outcomes, report.score_total) == (direct.outcomes, direct.score_total)
+        assert report.latency.total == report.actions
+        assert report.deal_latency.total == 20
+        assert report.wall_seconds > 0
+
+        merged = SimulationReport()
+        merged.merge(report)
+        assert merged.to_dict()["games"] == 20
@@ -0,0 +1,136 @@
+"""Unit tests for the Monte Carlo win probability estimator."""
+
+import random
+import time
+
+from src.domain.models.compact_table import FACE_UP, STOCK_SLOT, CompactTable
+from src.domain.models.deck import FrenchDeck
+from src.domain.models.table import GameTable
+from src.domain.rules.solitaire_rules import SolitaireRules
+from src.domain.services.game_service import GameService
+from src.domain.simulation import WinEstimator, wilson_interval
+from src.domain.simulation.win_estimator import hidden_groups, sample_position
+
+
+def _dealt(seed: int = 5) -> CompactTable:
+    """Compact state of a fresh French deal."""
+    deck = FrenchDeck()
+    service = GameService(GameTable(deck), SolitaireRules(deck))
+    service.deal(seed)
+    return service.get_compact_state()
+
+
+def _nearly_won() -> CompactTable:
+    """Every card on the foundations but the Kings, face up on the tableau."""
+    state = _dealt()
+    piles = [bytearray() for _ in range(13)]
+    for suit in range(4):
+        piles[7 + suit] = bytearray((suit * 13 + v) | FACE_UP for v in range(12))
+        piles[suit] = bytearray([(suit * 13 + 12) | FACE_UP])
+    state.piles = piles
+    return state
+
+
+class TestWilsonInterval:
+    """Test the confidence interval of the win rate."""
+
+    def test_contains_rate_and_narrows(self) -> None:
+        """The interval holds the observed rate and shrinks with samples."""
+        low, high = wilson_interval(30, 50)
+        assert low < 0.6 < high
+        wide = high - low
+        low, high = wilson_interval(300, 500)
+        assert low < 0.6 < high
+        assert high - low < wide / 2
+
+    def test_bounds(self) -> None:
+        """The interval stays inside [0, 1], even at the extremes."""
+        assert wilson_interval(0, 0) == (0.0, 1.0)
+        low, high = wilson_interval(20, 20)
+        assert 0.8 < low < high == 1.0
+        assert wilson_interval(0, 20)[0] == 0.0
+
+
+class TestSampling:
+    """Test the arrangements of the unknown cards."""
+
+    def test_only_unseen_face_down_cards_move(self) -> None:
+        """Face-up and seen cards keep their place, the rest is reshuffled."""
+        state = _dealt()
+        seen = set(state.piles[STOCK_SLOT][:5])
+        groups = hidden_groups(state, seen)
+
+        assert len(groups) == 1
+        assert len(groups[0]) == 21 + 24 - 5
+        sample = sample_position(state, groups, random.Random(1))
+        moved = 0
+        for slot in range(13):
+            assert len(sample.piles[slot]) == len(state.piles[slot])
+            for before, after in zip(state.piles[slot], sample.piles[slot]):
+                if before & FACE_UP or before in seen:
+                    assert after == before
+                moved += after != before
+        assert moved > 0
+        assert sorted(b for p in sample.piles for b in p) == sorted(b for p in state.piles for b in p)
+
+    def test_shuffled_recycles_hide_stock_order(self) -> None:
+        """Seen stock cards form their own group with shuffled recycles."""
+        state = _dealt()
+        seen = set(state.piles[STOCK_SLOT])
+
+        assert [len(g) for g in hidden_groups(state, seen)] == [21]
+        assert [len(g) for g in hidden_groups(state, seen, shuffled_stock=True)] == [21, 24]
+
+
+class TestWinEstimator:
+    """Test the background estimate."""
+
+    def test_estimates_in_process(self) -> None:
+        """A fresh deal gets a bounded estimate within the budget."""
+        estimator = WinEstimator(workers=1, time_limit=1.0, max_samples=12, max_nodes=500)
+        state = _dealt()
+
+        estimator.start(state)
+        assert estimator.wait(10)
+        estimate = estimator.estimate(state)
+
+        assert estimate.finished
+        assert 0 < estimate.samples <= 12
+        assert estimate.low <= estimate.probability <= estimate.high
+
+    def test_nothing_hidden_is_one_certain_sample(self) -> None:
+        """A position without face-down cards is played once."""
+        estimator = WinEstimator(workers=1, time_limit=5.0)
+        state = _nearly_won()
+
+        estimator.start(state)
+        estimator.wait(10)
+        estimate = estimator.estimate(state)
+
+        assert (estimate.wins, estimate.samples, estimate.finished) == (1, 1, True)
+
+    def test_new_position_cancels(self) -> None:
+        """Asking about another position drops the running estimate."""
+        estimator = WinEstimator(workers=1, time_limit=30.0, max_nodes=200_000)
+        state = _dealt()
+        estimator.start(state)
+
+        started = time.monotonic()
+        assert estimator.estimate(_nearly_won()) is None
+        assert estimator.wait(10)
+        assert time.monotonic() - started < 10
+        assert estimator.estimate(state) is None
+
+    def test_process_pool(self) -> None:
+        """Batches spread over worker processes add up."""
+        estimator = WinEstimator(workers=2, time_limit=20.0, max_samples=8, batch_size=2, max_nodes=300)
+        state = _dealt()
+        try:
+            estimator.start(state)
+            assert estimator.wait(60)
+            estimate = estimator.estimate(state)
+        finally:
+            estimator.close()
+
+        assert estimate.finished
+        assert estimate.samples == 8
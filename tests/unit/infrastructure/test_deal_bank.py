@@ -0,0 +1,68 @@
+"""Unit tests for the binary deal bank."""
+
+import random
+
+import pytest
+
+from src.infrastructure.storage.deal_bank import (
+    DealBank,
+    DealBankEntry,
+    difficulty_rating,
+    write_deal_bank,
+)
+
+
+def _entries(deck_type: str, draw_count: int, count: int) -> list:
+    return [
+        DealBankEntry(seed * 7, deck_type, draw_count, 100 + seed, seed % 10 + 1)
+        for seed in range(count)
+    ]
+
+
+@pytest.fixture
+def bank_path(tmp_path):
+    """Bank with three sections of different sizes."""
+    path = tmp_path / "deal_bank.bin"
+    entries = _entries("french", 1, 20) + _entries("neapolitan", 3, 5) + _entries("french", 2, 1)
+    random.Random(0).shuffle(entries)
+    assert write_deal_bank(path, entries) == 26
+    return path
+
+
+class TestDealBank:
+    """Test bank round trip and drawing."""
+    
+    def test_round_trip(self, bank_path) -> None:
+        """Records are read back per section."""
+        with DealBank(bank_path) as bank:
+            assert bank.count("french", 1) == 20
+            assert bank.count("neapolitan", 3) == 5
+            assert bank.count("neapolitan", 1) == 0
+            seeds = sorted(bank.entry("french", 1, i).seed for i in range(20))
+            assert seeds == [s * 7 for s in range(20)]
+            assert bank.entry("french", 2, 0) == DealBankEntry(0, "french", 2, 100, 1)
+    
+    def test_draw_without_repetition_until_exhausted(self, bank_path) -> None:
+        """Every deal is drawn once, then draw() returns None."""
+        with DealBank(bank_path) as bank:
+            rng = random.Random(3)
+            drawn = [bank.draw("neapolitan", 3, rng) for _ in range(5)]
+            assert sorted(e.seed for e in drawn) == [0, 7, 14, 21, 28]
+            assert bank.remaining("neapolitan", 3) == 0
+            assert bank.draw("neapolitan", 3, rng) is None
+            assert bank.draw("neapolitan", 2, rng) is None
+    
+    def test_missing_or_invalid_file(self, tmp_path) -> None:
+        """open() returns None instead of raising."""
+        assert DealBank.open(tmp_path / "missing.bin") is None
+        bad = tmp_path / "bad.bin"
+        bad.write_bytes(b"not a deal bank")
+        assert DealBank.open(bad) is None
+        with pytest.raises(ValueError):
+            DealBank(bad)
+    
+    def test_difficulty_rating_range(self) -> None:
+        """Ratings are clamped to 1-10 and grow with solver effort."""
+        assert difficulty_rating(0) == 1
+        assert difficulty_rating(500) < difficulty_rating(50_000)
+        assert difficulty_rating(10 ** 9) == 10
@@ -0,0 +1,22 @@
+"""Unit tests for the in-progress game save storage."""
+
+from src.infrastructure.storage.game_save_storage import GameSaveStorage
+
+
+class TestGameSaveStorage:
+    """Test save, load and delete of the save blob."""
+    
+    def test_save_load_delete(self, tmp_path) -> None:
+        """Blob round trip, overwrite and removal."""
+        storage = GameSaveStorage(tmp_path / "nested" / "saved_game.bin")
+        assert storage.load() is None
+        assert not storage.exists()
+        
+        assert storage.save(b"first")
+        assert storage.save(b"second")
+        assert storage.load() == b"second"
+        assert list(storage.save_path.parent.iterdir()) == [storage.save_path]
+        
+        assert storage.delete()
+        assert storage.delete()  # Already absent
+        assert storage.load() is None
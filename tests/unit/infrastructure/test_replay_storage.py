@@ -0,0 +1,35 @@
+"""Unit tests for the append-only replay storage."""
+
+from src.infrastructure.storage.replay_storage import ReplayStorage
+
+
+class TestReplayStorage:
+    """Test append, load, list and delete of replay files."""
+    
+    def test_append_load_delete(self, tmp_path) -> None:
+        """Appended chunks are read back whole; removal is idempotent."""
+        storage = ReplayStorage(tmp_path / "replays")
+        assert storage.load("abc") is None
+        assert storage.list_ids() == []
+        
+        append = storage.appender("abc")
+        append(b"head")
+        append(b"er")
+        assert storage.load("abc") == b"header"
+        assert storage.list_ids() == ["abc"]
+        
+        assert storage.delete("abc")
+        assert storage.delete("abc")  # Already absent
+        assert storage.load("abc") is None
+    
+    def test_write_error_drops_rest_of_replay(self, tmp_path) -> None:
+        """A failed append never raises and stops further writes."""
+        blocker = tmp_path / "replays"
+        blocker.write_bytes(b"")  # A file where the directory should be
+        storage = ReplayStorage(blocker)
+        
+        append = storage.appender("abc")
+        append(b"data")
+        append(b"more")
+        
+        assert storage.load("abc") is None
@@ -0,0 +1,113 @@
+"""Test per scripts/analyze_winnability.py"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+# Aggiungi scripts/ al path per import diretto
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "scripts"))
+
+from analyze_winnability import (
+    analyze_deal,
+    build_parser,
+    build_tasks,
+    deal_from_seed,
+    load_done,
+    main,
+    summarize,
+)
+
+
+def _run(tmp_path: Any, filename: str, *extra: str) -> str:
+    """Esegue main() su pochi seed e restituisce il path di output."""
+    output = os.path.join(str(tmp_path), filename)
+    code = main([
+        "--count", "2", "--levels", "1", "--workers", "1",
+        "--max-nodes", "2000", "--output", output, *extra,
+    ])
+    assert code == 0
+    return output
+
+
+@pytest.mark.unit
+class TestDeals:
+    """Test generazione e analisi delle smazzate."""
+
+    def test_deal_is_deterministic(self) -> None:
+        """Lo stesso seed produce la stessa smazzata."""
+        first = deal_from_seed("french", 42)
+        second = deal_from_seed("french", 42)
+        ids = lambda table: [[c.get_id for c in p.cards] for p in table.pile]
+        assert ids(first) == ids(second)
+        assert ids(first) != ids(deal_from_seed("french", 43))
+
+    def test_analyze_deal_row(self) -> None:
+        """Una smazzata produce una riga con tutti i campi."""
+        row = analyze_deal(("neapolitan", 3, 3, 7, 5.0, 2000))
+        assert row["deck"] == "neapolitan"
+        assert row["draw_count"] == 3
+        assert row["status"] in ("winnable", "unwinnable", "unknown")
+        assert row["nodes"] > 0
+
+    def test_levels_map_to_draw_count(self) -> None:
+        """Ogni livello usa il draw_count del suo DifficultyPreset."""
+        args = build_parser().parse_args(["--output", "x.csv", "--count", "1"])
+        draws = {task[1]: task[2] for task in build_tasks(args, set())}
+        assert draws == {1: 1, 2: 2, 3: 3, 4: 3, 5: 3}
+
+
+@pytest.mark.unit
+class TestOutputAndResume:
+    """Test scrittura risultati e ripresa."""
+
+    def test_csv_output_and_resume(self, tmp_path: Any) -> None:
+        """--resume salta i seed già scritti e aggiunge solo i nuovi."""
+        output = _run(tmp_path, "r.csv")
+        done, rows = load_done(output)
+        assert done == {("french", 1, 0), ("french", 1, 1)}
+
+        main(["--count", "3", "--levels", "1", "--workers", "1", "--max-nodes", "2000",
+              "--output", output, "--resume"])
+        done, rows = load_done(output)
+        assert len(rows) == 3
+        with open(output, encoding="utf-8") as f:
+            assert f.read().count("deck,") == 1  # Intestazione scritta una volta
+
+    def test_jsonl_output(self, tmp_path: Any) -> None:
+        """L'estensione .jsonl produce una riga JSON per smazzata."""
+        output = _run(tmp_path, "r.jsonl")
+        with open(output, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        assert [row["seed"] for row in sorted(rows, key=lambda r: r["seed"])] == [0, 1]
+
+    def test_truncated_line_ignored(self, tmp_path: Any) -> None:
+        """Una riga troncata da un'interruzione viene ignorata."""
+        output = _run(tmp_path, "r.csv")
+        with open(output, "a", encoding="utf-8") as f:
+            f.write("french,1,1,")
+        assert len(load_done(output)[1]) == 2
+
+    def test_summary(self) -> None:
+        """Il riepilogo calcola le percentuali per mazzo e livello."""
+        rows = [
+            {"deck": "french", "level": 1, "draw_count": 1, "status": "winnable", "moves": 100},
+            {"deck": "french", "level": 1, "draw_count": 1, "status": "unwinnable", "moves": 0},
+        ]
+        line = summarize(rows)[1].split()
+        assert line[3:] == ["2", "50.0", "50.0", "0.0", "100.0"]
+
+
+@pytest.mark.unit
+def test_no_gui_imports() -> None:
+    """Lo script non importa wx né pygame."""
+    script = os.path.join(os.path.dirname(__file__), "..", "..", "..", "scripts", "analyze_winnability.py")
+    code = (
+        "import runpy, sys; runpy.run_path(%r, run_name='check'); "
+        "print(any(m in sys.modules for m in ('wx', 'pygame')))" % script
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,44 @@
+"""Test per scripts/generate_deal_bank.py"""
+
+import os
+import sys
+from typing import Any
+
+import pytest
+
+# Aggiungi scripts/ al path per import diretto
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "scripts"))
+
+from generate_deal_bank import main
+from src.infrastructure.storage.deal_bank import DealBank
+
+
+@pytest.mark.unit
+class TestGenerateDealBank:
+    """Test generazione del banco di smazzate."""
+
+    def test_bank_contains_first_winnable_seeds(self, tmp_path: Any) -> None:
+        """Il banco contiene i primi seed vincibili, verificati dal solver."""
+        output = str(tmp_path / "bank.bin")
+        args = ["--deck", "french", "--draw", "1", "--per-section", "3",
+                "--workers", "1", "--max-nodes", "5000", "--output", output]
+        assert main(args) == 0
+        with DealBank(output) as bank:
+            entries = [bank.entry("french", 1, i) for i in range(bank.count("french", 1))]
+        assert len(entries) == 3
+        assert all(e.solution_length > 0 and 1 <= e.difficulty <= 10 for e in entries)
+
+        # Deterministico: stessa generazione, stesso banco
+        again = str(tmp_path / "again.bin")
+        main(args[:-1] + [again])
+        with open(output, "rb") as a, open(again, "rb") as b:
+            assert a.read() == b.read()
+
+    def test_incomplete_section_exit_code(self, tmp_path: Any) -> None:
+        """Se i seed finiscono prima del numero richiesto, exit code 1."""
+        output = str(tmp_path / "bank.bin")
+        code = main(["--deck", "neapolitan", "--draw", "3", "--per-section", "5",
+                     "--max-seeds", "2", "--workers", "1", "--max-nodes", "2000",
+                     "--output", output])
+        assert code == 1
+        assert DealBank.open(output) is not None
@@ -0,0 +1,35 @@
+"""Test per scripts/rate_deals.py"""
+
+import json
+import os
+import sys
+from typing import Any
+
+import pytest
+
+pytest.importorskip("numpy")
+
+# Aggiungi scripts/ al path per import diretto
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "scripts"))
+
+from rate_deals import main
+
+
+@pytest.mark.unit
+class TestRateDeals:
+    """Test della valutazione delle smazzate da riga di comando."""
+
+    def test_report_written(self, tmp_path: Any, capsys: Any) -> None:
+        """Stampa le soglie dei livelli e scrive il rapporto JSON."""
+        output = tmp_path / "rating.json"
+        code = main(["--count", "500", "--levels", "4", "--json", str(output)])
+        assert code == 0
+        assert "Livello 4" in capsys.readouterr().out
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["deals"] == 500
+        assert len(data["thresholds"]) == 3
+        assert sum(data["deals_per_level"]) == 500
+
+    def test_invalid_arguments(self) -> None:
+        """Numero di smazzate non positivo: exit code 1."""
+        assert main(["--count", "0"]) == 1
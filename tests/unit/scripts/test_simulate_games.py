@@ -0,0 +1,34 @@
+"""Test per scripts/simulate_games.py"""
+
+import json
+import os
+import sys
+from typing import Any
+
+import pytest
+
+# Aggiungi scripts/ al path per import diretto
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "..", "scripts"))
+
+from simulate_games import main
+
+
+@pytest.mark.unit
+class TestSimulateGames:
+    """Test della simulazione da riga di comando."""
+
+    def test_report_written(self, tmp_path: Any, capsys: Any) -> None:
+        """Stampa il riepilogo e scrive il rapporto JSON."""
+        output = tmp_path / "report.json"
+        code = main(["--games", "10", "--workers", "1", "--batch-size", "4",
+                     "--json", str(output), "--verbose"])
+        assert code == 0
+        assert "partite/s" in capsys.readouterr().out
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["games"] == 10
+        assert set(data["latency_us"]) == {"p50", "p90", "p99", "p99.9"}
+        assert set(data["deal_latency_us"]) == {"p50", "p90", "p99"}
+
+    def test_invalid_arguments(self) -> None:
+        """Numero di partite non positivo: exit code 1."""
+        assert main(["--games", "0"]) == 1